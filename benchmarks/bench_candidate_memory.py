@@ -0,0 +1,113 @@
+"""
+Memory benchmark: list of Element objects vs. CandidateTable
+
+Builds scanner-shaped elements (attributes from SCANNED_ATTRIBUTES, uuid4
+ids, CSS selectors, positional XPaths, one nth() locator each) and measures
+what stays allocated when they are kept as a list of Elements versus streamed
+into a CandidateTable. The locator stand-in carries the same instance state as
+a Playwright Locator (frame, selector string, loop, dispatcher fiber).
+
+Usage:
+    PYTHONPATH=src python benchmarks/bench_candidate_memory.py [--elements 20000]
+"""
+import argparse
+import gc
+import tracemalloc
+import uuid
+
+from selector_cli.core.candidate_table import CandidateTable
+from selector_cli.core.element import Element
+
+
+class FakeLocator:
+    """Instance state of playwright.async_api.Locator"""
+
+    def __init__(self, frame, selector):
+        self._frame = frame
+        self._loop = frame.loop
+        self._dispatcher_fiber = frame.fiber
+        self._selector = selector
+        self._impl_obj = self
+
+    def nth(self, index):
+        return FakeLocator(self._frame, f"{self._selector} >> nth={index}")
+
+
+class FakePage:
+    loop = object()
+    fiber = object()
+
+    def locator(self, selector):
+        return FakeLocator(self, selector)
+
+
+def make_element(i, page):
+    """One element as ElementScanner builds it"""
+    tag = ('input', 'button', 'a', 'select', 'textarea')[i % 5]
+    attributes = {'class': f'form-control field-{i % 7}'}
+    if tag == 'input':
+        attributes.update(type='text', name=f'field{i}', placeholder=f'Field {i}')
+    elif tag == 'a':
+        attributes['href'] = f'/items/{i}'
+    if i % 3 == 0:
+        attributes['id'] = f'el-{i}'
+    text = f'Item {i}' if tag in ('button', 'a') else ''
+
+    return Element(
+        index=i, uuid=str(uuid.UUID(int=i * 0x9E3779B97F4A7C15, version=4)), tag=tag,
+        type=attributes.get('type', ''), text=text, value=attributes.get('value', ''),
+        attributes=attributes, name=attributes.get('name', ''), id=attributes.get('id', ''),
+        classes=attributes['class'].split(), placeholder=attributes.get('placeholder', ''),
+        selector=f'#el-{i}' if 'id' in attributes else f'{tag}[name="field{i}"]',
+        xpath=f'/html/body/div[{i // 50 + 1}]/{tag}[{i % 50 + 1}]',
+        selector_cost=0.5, strategy_used='ID_SELECTOR',
+        visible=True, enabled=True, disabled=False,
+        locator=page.locator(tag).nth(i // 5),
+        page_url='https://example.com/catalog',
+    )
+
+
+def measure(build):
+    gc.collect()
+    tracemalloc.start()
+    result = build()
+    gc.collect()
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return result, size
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--elements', type=int, default=20000)
+    args = parser.parse_args()
+
+    page = FakePage()
+    count = args.elements
+
+    elements, list_size = measure(lambda: [make_element(i, page) for i in range(count)])
+
+    def build_table():
+        table = CandidateTable(page)
+        for i in range(count):
+            table.append_scanned(make_element(i, page))
+        return table
+
+    table, table_size = measure(build_table)
+
+    # Same data either way
+    for i in range(0, count, max(1, count // 200)):
+        row, element = table[i], elements[i]
+        assert (row.uuid, row.tag, row.attributes, row.classes, row.selector, row.xpath) == \
+               (element.uuid, element.tag, element.attributes, element.classes,
+                element.selector, element.xpath)
+        assert row.locator._selector == element.locator._selector
+
+    print(f"Elements:          {count}")
+    print(f"List[Element]:     {list_size / 1e6:8.1f} MB  ({list_size / count:6.0f} B/element)")
+    print(f"CandidateTable:    {table_size / 1e6:8.1f} MB  ({table_size / count:6.0f} B/element)")
+    print(f"Reduction:         {list_size / table_size:8.1f}x")
+
+
+if __name__ == '__main__':
+    main()
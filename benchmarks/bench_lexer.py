@@ -0,0 +1,291 @@
+"""
+Micro-benchmark: lexer throughput
+
+Compares the old character-by-character lexer (an if-chain per character,
+strings built one character at a time) with the single-pass regex lexer,
+on long WHERE clauses and on a multi-thousand-line .sel script. Both must
+produce the same tokens.
+
+Usage:
+    PYTHONPATH=src python benchmarks/bench_lexer.py [--lines 5000] [--repeat 5]
+"""
+import argparse
+import gc
+import time
+from typing import List
+
+from selector_cli.parser.lexer import Lexer, Token, TokenType
+
+
+class LegacyLexer(Lexer):
+    """Lexer as it was before the single-pass scanner"""
+
+    def tokenize(self, text: str) -> List[Token]:
+        """Convert string to tokens"""
+        self.text = text.strip()
+        self.position = 0
+        tokens = []
+
+        while self.position < len(self.text):
+            # Skip whitespace
+            if self._current_char().isspace():
+                self.position += 1
+                continue
+
+            # String
+            if self._current_char() in '"\'':
+                tokens.append(self._read_string())
+                continue
+
+            # Number
+            if self._current_char().isdigit():
+                tokens.append(self._read_number())
+                continue
+
+            # Identifier or keyword
+            if self._current_char().isalpha() or self._current_char() == '_':
+                tokens.append(self._read_identifier())
+                continue
+
+            # Operators and delimiters
+            # Greater than or equal
+            if self._current_char() == '>' and self._peek() == '=':
+                tokens.append(Token(TokenType.GTE, '>=', self.position))
+                self.position += 2
+                continue
+
+            # Greater than
+            if self._current_char() == '>':
+                tokens.append(Token(TokenType.GT, '>', self.position))
+                self.position += 1
+                continue
+
+            # Less than or equal
+            if self._current_char() == '<' and self._peek() == '=':
+                tokens.append(Token(TokenType.LTE, '<=', self.position))
+                self.position += 2
+                continue
+
+            # Less than
+            if self._current_char() == '<':
+                tokens.append(Token(TokenType.LT, '<', self.position))
+                self.position += 1
+                continue
+
+            # Equals
+            if self._current_char() == '=':
+                tokens.append(Token(TokenType.EQUALS, '=', self.position))
+                self.position += 1
+                continue
+
+            # Not equals
+            if self._current_char() == '!' and self._peek() == '=':
+                tokens.append(Token(TokenType.NOT_EQUALS, '!=', self.position))
+                self.position += 2
+                continue
+
+            # Bang (history commands: !n or !!)
+            if self._current_char() == '!':
+                tokens.append(Token(TokenType.BANG, '!', self.position))
+                self.position += 1
+                continue
+
+            # Left parenthesis
+            if self._current_char() == '(':
+                tokens.append(Token(TokenType.LPAREN, '(', self.position))
+                self.position += 1
+                continue
+
+            # Right parenthesis
+            if self._current_char() == ')':
+                tokens.append(Token(TokenType.RPAREN, ')', self.position))
+                self.position += 1
+                continue
+
+            # Left bracket
+            if self._current_char() == '[':
+                tokens.append(Token(TokenType.LBRACKET, '[', self.position))
+                self.position += 1
+                continue
+
+            # Right bracket
+            if self._current_char() == ']':
+                tokens.append(Token(TokenType.RBRACKET, ']', self.position))
+                self.position += 1
+                continue
+
+            # Left brace
+            if self._current_char() == '{':
+                tokens.append(Token(TokenType.LBRACE, '{', self.position))
+                self.position += 1
+                continue
+
+            # Right brace
+            if self._current_char() == '}':
+                tokens.append(Token(TokenType.RBRACE, '}', self.position))
+                self.position += 1
+                continue
+
+            # Comma
+            if self._current_char() == ',':
+                tokens.append(Token(TokenType.COMMA, ',', self.position))
+                self.position += 1
+                continue
+
+            # Asterisk (for wildcard like find *)
+            if self._current_char() == '*':
+                tokens.append(Token(TokenType.ALL, '*', self.position))
+                self.position += 1
+                continue
+
+            # Dash (for ranges like [1-10])
+            if self._current_char() == '-':
+                # Check for double dash (--)
+                if self._peek() == '-':
+                    tokens.append(Token(TokenType.DOUBLE_DASH, '--', self.position))
+                    self.position += 2
+                else:
+                    tokens.append(Token(TokenType.DASH, '-', self.position))
+                    self.position += 1
+                continue
+
+            # Semicolon (separates chained commands)
+            if self._current_char() == ';':
+                tokens.append(Token(TokenType.SEMICOLON, ';', self.position))
+                self.position += 1
+                continue
+
+            # Dot (for .find)
+            if self._current_char() == '.':
+                tokens.append(Token(TokenType.DOT, '.', self.position))
+                self.position += 1
+                continue
+
+            # Unknown character
+            raise ValueError(f"Unexpected character: {self._current_char()} at position {self.position}")
+
+        tokens.append(Token(TokenType.EOF, '', self.position))
+        return tokens
+
+    def _current_char(self) -> str:
+        """Get current character"""
+        if self.position >= len(self.text):
+            return ''
+        return self.text[self.position]
+
+    def _peek(self, offset: int = 1) -> str:
+        """Peek ahead"""
+        pos = self.position + offset
+        if pos >= len(self.text):
+            return ''
+        return self.text[pos]
+
+    def _read_string(self) -> Token:
+        """Read string literal"""
+        start_pos = self.position
+        quote = self._current_char()
+        self.position += 1  # Skip opening quote
+
+        value = ''
+        while self.position < len(self.text) and self._current_char() != quote:
+            value += self._current_char()
+            self.position += 1
+
+        if self._current_char() == quote:
+            self.position += 1  # Skip closing quote
+
+        return Token(TokenType.STRING, value, start_pos)
+
+    def _read_number(self) -> Token:
+        """Read number"""
+        start_pos = self.position
+        value = ''
+
+        while self.position < len(self.text) and self._current_char().isdigit():
+            value += self._current_char()
+            self.position += 1
+
+        return Token(TokenType.NUMBER, value, start_pos)
+
+    def _read_identifier(self) -> Token:
+        """Read identifier or keyword"""
+        start_pos = self.position
+        value = ''
+
+        while self.position < len(self.text) and (
+            self._current_char().isalnum() or self._current_char() in '_-.:/'
+        ):
+            value += self._current_char()
+            self.position += 1
+
+        # Check if it's a keyword
+        token_type = self.KEYWORDS.get(value.lower(), TokenType.IDENTIFIER)
+
+        return Token(token_type, value, start_pos)
+
+
+def where_clause(terms):
+    """One long WHERE clause of terms conditions"""
+    conditions = []
+    for i in range(terms):
+        conditions.append((
+            f'name = "field{i}"',
+            f'(text contains "Item {i}" or index >= {i})',
+            f'not disabled and aria-label matches \'^btn-{i}.*\'',
+        )[i % 3])
+    return 'list from candidates where ' + ' and '.join(conditions)
+
+
+def script(lines):
+    """Lines of a typical .sel script"""
+    templates = [
+        'open https://example.com/page{i}',
+        'add to workspace from candidates where tag = "input" and index > {i}',
+        'find input, button where visible --deep',
+        'list [1-{i}] > out{i}.json',
+        'export playwright > tests/generated_{i}.spec.ts',
+        'macro fill{i} {{value}} find input where name = "{{value}}"; count',
+    ]
+    return [templates[i % len(templates)].format(i=i) for i in range(lines)]
+
+
+def timed(fn, repeat):
+    """Result and best time (ms), with the collector off as in timeit"""
+    best = float('inf')
+    gc.disable()
+    try:
+        for _ in range(repeat):
+            start = time.perf_counter()
+            result = fn()
+            best = min(best, time.perf_counter() - start)
+    finally:
+        gc.enable()
+    return result, best * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--lines', type=int, default=5000)
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+
+    legacy, lexer = LegacyLexer(), Lexer()
+    workloads = [(f"WHERE clause, {terms} conditions", [where_clause(terms)])
+                 for terms in (10, 100, 1000)]
+    workloads.append((f".sel script, {args.lines} lines", script(args.lines)))
+
+    for name, texts in workloads:
+        chars = sum(len(text) for text in texts)
+        old, old_ms = timed(lambda: [legacy.tokenize(text) for text in texts], args.repeat)
+        new, new_ms = timed(lambda: [lexer.tokenize(text) for text in texts], args.repeat)
+        assert old == new
+        tokens = sum(len(t) for t in new)
+
+        print(f"\n{name}  ({chars} chars, {tokens} tokens)")
+        print(f"  char by char:  {old_ms:8.2f} ms  {chars / old_ms / 1000:6.1f} Mchar/s")
+        print(f"  single pass:   {new_ms:8.2f} ms  {chars / new_ms / 1000:6.1f} Mchar/s"
+              f"  ({old_ms / new_ms:.1f}x)")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,93 @@
+"""
+Micro-benchmark: `load` followed by `keep where` on a saved workspace
+
+Saves a collection, loads it back into a fresh workspace the way the
+`load` command does, then filters it with the compiled per-row predicates
+and with NumPy masks over columns built from the workspace
+(selector_cli.query.vectorized). The vectorized time is reported cold
+(columns built from the freshly loaded workspace) and warm. Needs NumPy.
+
+Usage:
+    PYTHONPATH=src python benchmarks/bench_load_keep.py [--rows 100000]
+"""
+import argparse
+import tempfile
+import time
+
+from selector_cli.core.collection import ElementCollection
+from selector_cli.core.element import Element
+from selector_cli.core.storage import StorageManager
+from selector_cli.parser.parser import Parser
+from selector_cli.query.compiler import filter_elements
+from selector_cli.query.vectorized import NUMPY_AVAILABLE, filter_collection
+
+
+CLAUSES = [
+    'index > 100 and visible and selector_cost < 1',
+    'tag = "input" and not enabled',
+    'visible and (index < 5000 or selector_cost >= 2)',
+    'index > 90000 and text contains "9"',
+]
+
+
+def make_elements(rows):
+    tags = ['input', 'button', 'a', 'select', 'textarea']
+    return [
+        Element(index=i, uuid=f"00000000-0000-4000-8000-{i:012d}", tag=tags[i % len(tags)],
+                text=f'Item {i}', visible=i % 7 != 0, enabled=i % 11 != 0,
+                selector_cost=(i % 5) / 2)
+        for i in range(rows)
+    ]
+
+
+def load(storage, name):
+    """Load a saved collection into a new workspace, as the `load` command does"""
+    elements, _ = storage.load_collection(name)
+    workspace = ElementCollection()
+    for elem in elements:
+        workspace.add(elem)
+    return workspace
+
+
+def timed(function, setup=lambda: None):
+    best = float('inf')
+    for _ in range(5):
+        argument = setup()
+        started = time.perf_counter()
+        result = function(argument)
+        best = min(best, time.perf_counter() - started)
+    return result, best * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--rows', type=int, default=100000)
+    args = parser.parse_args()
+
+    if not NUMPY_AVAILABLE:
+        print("NumPy is not installed (pip install selector-cli[fast])")
+        return
+
+    with tempfile.TemporaryDirectory() as directory:
+        storage = StorageManager(directory)
+        storage.save_collection('bench', make_elements(args.rows))
+        workspace, load_ms = timed(lambda _: load(storage, 'bench'))
+        fresh = lambda: load(storage, 'bench')
+
+        print(f"Rows: {args.rows}")
+        print(f"load:  {load_ms:8.1f} ms")
+        for clause in CLAUSES:
+            tree = Parser().parse(f"keep where {clause}").condition_tree
+            compiled, compiled_ms = timed(lambda ws: filter_elements(ws, tree), lambda: workspace)
+            cold, cold_ms = timed(lambda ws: filter_collection(ws, tree), fresh)
+            warm, warm_ms = timed(lambda ws: filter_collection(ws, tree), lambda: workspace)
+            assert [e.index for e in compiled] == [e.index for e in cold] == [e.index for e in warm]
+
+            print(f"\n{clause}  ({len(compiled)} matches)")
+            print(f"  compiled:           {compiled_ms:8.1f} ms")
+            print(f"  vectorized (cold):  {cold_ms:8.1f} ms")
+            print(f"  vectorized (warm):  {warm_ms:8.1f} ms")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,101 @@
+"""
+Micro-benchmark: per-element strategy dispatch overhead
+
+Compares the old per-call dispatch (filter applies_to, sort by priority,
+inspect.signature on every generator) with the engine's precompiled per-tag
+dispatch tables. Only selector generation is timed - validation needs a page
+and is the same in both cases.
+
+Usage:
+    PYTHONPATH=src python benchmarks/bench_strategy_dispatch.py [--elements 5000]
+"""
+import argparse
+import asyncio
+import inspect
+import time
+
+from selector_cli.core.element import Element
+from selector_cli.core.locator.strategy import LocationStrategyEngine
+
+
+def make_elements(count):
+    """Synthetic mix of tags/attributes similar to a form-heavy page"""
+    tags = ['input', 'button', 'a', 'select', 'textarea', 'div']
+    elements = []
+    for i in range(count):
+        tag = tags[i % len(tags)]
+        attributes = {'type': 'text', 'name': f'field{i}'} if tag == 'input' else {}
+        elements.append(Element(
+            index=i, uuid=str(i), tag=tag,
+            type=attributes.get('type', ''), text=f'Item {i}' if tag in ('button', 'a') else '',
+            value='', attributes=attributes,
+            name=attributes.get('name', ''), id=f'el-{i}' if i % 3 == 0 else '',
+            classes=['item'] if i % 2 else [], placeholder='',
+            selector='', xpath='', visible=True, enabled=True, disabled=False,
+        ))
+    return elements
+
+
+async def legacy_dispatch(engine, element, page):
+    """Dispatch as done before the tables: filter + sort + reflection per call"""
+    selectors = []
+    for strategies in (engine.css_strategies, engine.xpath_strategies):
+        applicable = [
+            s for s in strategies
+            if element.tag in s['applies_to'] or '*' in s['applies_to']
+        ]
+        applicable.sort(key=lambda s: s['priority'].value)
+        for strategy in applicable:
+            generator = strategy['generator']
+            if 'page' in inspect.signature(generator).parameters:
+                selector = await generator(element, page)
+            else:
+                selector = generator(element)
+            selectors.append(selector)
+    return selectors
+
+
+async def table_dispatch(engine, element, page):
+    """Dispatch through the precompiled per-tag tables"""
+    selectors = []
+    for dispatch in (engine._css_dispatch, engine._xpath_dispatch):
+        for name, generator, is_async in dispatch.get(element.tag, dispatch['*']):
+            selectors.append(await generator(element, page) if is_async else generator(element))
+    return selectors
+
+
+async def measure(fn, engine, elements, rounds):
+    best = float('inf')
+    for _ in range(rounds):
+        start = time.perf_counter()
+        for element in elements:
+            await fn(engine, element, None)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+async def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--elements', type=int, default=5000)
+    parser.add_argument('--rounds', type=int, default=5)
+    args = parser.parse_args()
+
+    engine = LocationStrategyEngine()
+    elements = make_elements(args.elements)
+
+    # Both paths must generate identical selectors
+    for element in elements[:50]:
+        assert await legacy_dispatch(engine, element, None) == await table_dispatch(engine, element, None)
+
+    legacy = await measure(legacy_dispatch, engine, elements, args.rounds)
+    table = await measure(table_dispatch, engine, elements, args.rounds)
+
+    per_element = lambda total: total / len(elements) * 1e6
+    print(f"Elements:            {len(elements)}")
+    print(f"Before (per call):   {legacy * 1000:8.1f} ms  ({per_element(legacy):6.1f} us/element)")
+    print(f"After (tables):      {table * 1000:8.1f} ms  ({per_element(table):6.1f} us/element)")
+    print(f"Speedup:             {legacy / table:8.1f}x")
+
+
+if __name__ == '__main__':
+    asyncio.run(main())
@@ -0,0 +1,70 @@
+"""
+Micro-benchmark: vectorized WHERE filtering over a CandidateTable
+
+Compares the compiled per-row predicates with NumPy masks
+(selector_cli.query.vectorized) on numeric and boolean clauses. Needs NumPy.
+
+Usage:
+    PYTHONPATH=src python benchmarks/bench_vectorized.py [--rows 100000]
+"""
+import argparse
+import time
+
+from selector_cli.core.candidate_table import CandidateTable
+from selector_cli.core.element import Element
+from selector_cli.parser.parser import Parser
+from selector_cli.query.compiler import filter_elements
+from selector_cli.query.vectorized import NUMPY_AVAILABLE, filter_table
+
+
+CLAUSES = [
+    'index > 100 and visible and selector_cost < 1',
+    'tag = "input" and not enabled',
+    'visible and (index < 5000 or selector_cost >= 2)',
+    'index > 90000 and text contains "9"',
+]
+
+
+def make_table(rows):
+    tags = ['input', 'button', 'a', 'select', 'textarea']
+    return CandidateTable.from_elements(
+        Element(index=i, uuid=f"00000000-0000-4000-8000-{i:012d}", tag=tags[i % len(tags)],
+                text=f'Item {i}', visible=i % 7 != 0, enabled=i % 11 != 0,
+                selector_cost=(i % 5) / 2)
+        for i in range(rows)
+    )
+
+
+def timed(function):
+    best = float('inf')
+    for _ in range(5):
+        started = time.perf_counter()
+        result = function()
+        best = min(best, time.perf_counter() - started)
+    return result, best * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--rows', type=int, default=100000)
+    args = parser.parse_args()
+
+    if not NUMPY_AVAILABLE:
+        print("NumPy is not installed (pip install selector-cli[fast])")
+        return
+
+    table = make_table(args.rows)
+    print(f"Rows: {args.rows}")
+    for clause in CLAUSES:
+        tree = Parser().parse(f"add where {clause}").condition_tree
+        compiled, compiled_ms = timed(lambda: filter_elements(table, tree))
+        vectorized, vector_ms = timed(lambda: filter_table(table, tree))
+        assert [r.index for r in compiled] == [r.index for r in vectorized]
+
+        print(f"\n{clause}  ({len(compiled)} matches)")
+        print(f"  compiled:    {compiled_ms:8.1f} ms")
+        print(f"  vectorized:  {vector_ms:8.1f} ms")
+
+
+if __name__ == '__main__':
+    main()
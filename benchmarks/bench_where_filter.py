@@ -0,0 +1,102 @@
+"""
+Micro-benchmark: WHERE-clause filtering
+
+Compares the old tree-walking evaluator (recursion, operator if/elif chain,
+re.search with the pattern string per element) with the compiled predicates
+of selector_cli.query, over a list of Elements and over a CandidateTable.
+
+Usage:
+    PYTHONPATH=src python benchmarks/bench_where_filter.py [--elements 50000]
+"""
+import argparse
+import re
+import time
+
+from selector_cli.core.candidate_table import CandidateTable
+from selector_cli.core.element import Element
+from selector_cli.parser.command import ConditionType, LogicOp, Operator
+from selector_cli.parser.parser import Parser
+from selector_cli.query.compiler import filter_elements, to_number
+
+
+CLAUSES = [
+    'visible and tag = "button"',
+    'type = "text" and name matches "field1.*" or index > 40000',
+    'text contains "99" and not disabled',
+]
+
+
+def make_elements(count):
+    tags = ['input', 'button', 'a', 'select', 'textarea']
+    elements = []
+    for i in range(count):
+        tag = tags[i % len(tags)]
+        attributes = {'type': 'text', 'name': f'field{i}'} if tag == 'input' else {}
+        elements.append(Element(
+            index=i, uuid=f"00000000-0000-4000-8000-{i:012d}", tag=tag,
+            type=attributes.get('type', ''), text=f'Item {i}' if tag in ('button', 'a') else '',
+            attributes=attributes, name=attributes.get('name', ''),
+            visible=i % 7 != 0, enabled=True,
+        ))
+    return elements
+
+
+def legacy_evaluate(elem, node):
+    """Evaluation as done before compilation (CommandExecutor semantics)"""
+    if node.type == ConditionType.SIMPLE:
+        value = getattr(elem, node.field) if hasattr(elem, node.field) \
+            else elem.attributes.get(node.field, "")
+        op = node.operator
+        if op == Operator.EQUALS:
+            return str(value) == str(node.value)
+        elif op == Operator.NOT_EQUALS:
+            return str(value) != str(node.value)
+        elif op == Operator.GT:
+            return to_number(value) > to_number(node.value)
+        elif op == Operator.LT:
+            return to_number(value) < to_number(node.value)
+        elif op == Operator.CONTAINS:
+            return str(node.value) in str(value)
+        elif op == Operator.MATCHES:
+            return bool(re.search(str(node.value), str(value)))
+        return False
+    if node.type == ConditionType.COMPOUND:
+        left = legacy_evaluate(elem, node.left)
+        right = legacy_evaluate(elem, node.right)
+        return left and right if node.logic_op == LogicOp.AND else left or right
+    return not legacy_evaluate(elem, node.operand)
+
+
+def timed(function):
+    best = float('inf')
+    for _ in range(5):
+        started = time.perf_counter()
+        result = function()
+        best = min(best, time.perf_counter() - started)
+    return result, best * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--elements', type=int, default=50000)
+    args = parser.parse_args()
+
+    elements = make_elements(args.elements)
+    table = CandidateTable.from_elements(elements)
+
+    print(f"Elements: {args.elements}")
+    for clause in CLAUSES:
+        tree = Parser().parse(f"add where {clause}").condition_tree
+        legacy, legacy_ms = timed(lambda: [e for e in elements if legacy_evaluate(e, tree)])
+        compiled, list_ms = timed(lambda: filter_elements(elements, tree))
+        rows, table_ms = timed(lambda: filter_elements(table, tree))
+        assert [e.index for e in legacy] == [e.index for e in compiled] == [r.index for r in rows]
+
+        print(f"\n{clause}  ({len(compiled)} matches)")
+        print(f"  tree walk, list:   {legacy_ms:8.1f} ms")
+        print(f"  compiled, list:    {list_ms:8.1f} ms")
+        print(f"  compiled, table:   {table_ms:8.1f} ms")
+
+
+if __name__ == '__main__':
+    main()
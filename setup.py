@@ -44,6 +44,10 @@ setup(
         'PyYAML>=6.0',
     ],
     extras_require={
+        # Vectorized WHERE filters over large candidate tables
+        'fast': [
+            'numpy>=1.17',
+        ],
         'dev': [
             'pytest>=7.0.0',
             'pytest-asyncio>=0.21.0',
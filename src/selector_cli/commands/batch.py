@@ -0,0 +1,146 @@
+"""
+Batch locator generation over saved HTML pages
+
+Usage:
+    selector batch <dir-of-html> [--workers N] [--out results.jsonl] [--types input,button]
+
+Pages are spread across a process pool. Each worker loads a page into a
+DOMSnapshot and runs ElementScanner.scan_snapshot (the full strategy engine,
+no browser). Results stream into one JSONL file in page order: one line per
+element, plus one error line per page that could not be processed.
+"""
+import argparse
+import asyncio
+import json
+import logging
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Iterator, List, Optional, TextIO
+
+from ..core.locator.snapshot import DOMSnapshot
+from ..core.scanner import ElementScanner
+from ..generators.data_exporters import JSONExporter
+
+
+HTML_EXTENSIONS = ('.html', '.htm')
+
+
+def find_html_files(directory: str) -> List[str]:
+    """All HTML files below directory, sorted for a stable output order"""
+    paths = []
+    for root, _, files in os.walk(directory):
+        for name in files:
+            if name.lower().endswith(HTML_EXTENSIONS):
+                paths.append(os.path.join(root, name))
+    return sorted(paths)
+
+
+def _init_worker():
+    """Keep workers quiet - strategy debug output would interleave on stderr"""
+    logging.getLogger('locator.strategy').setLevel(logging.WARNING)
+
+
+def process_page(path: str, element_types: Optional[List[str]] = None) -> Dict:
+    """
+    Generate locators for one saved page (runs in a worker process)
+
+    Returns:
+        {'page': path, 'url': ..., 'records': [...]} or {'page': path, 'error': ...}
+    """
+    try:
+        snapshot = DOMSnapshot.from_file(path)
+        elements = asyncio.run(ElementScanner().scan_snapshot(snapshot, element_types))
+    except Exception as e:
+        return {'page': path, 'error': f"{type(e).__name__}: {e}"}
+
+    records = []
+    for element in elements:
+        record = JSONExporter.element_record(element)
+        record['strategy'] = element.strategy_used
+        record['cost'] = element.selector_cost
+        records.append(record)
+    return {'page': path, 'url': snapshot.url, 'records': records}
+
+
+def _process_page_args(args) -> Dict:
+    return process_page(*args)
+
+
+def iter_results(paths: List[str], workers: Optional[int] = None,
+                 element_types: Optional[List[str]] = None) -> Iterator[Dict]:
+    """Process pages across a process pool, yielding results in input order"""
+    workers = workers or os.cpu_count() or 1
+    if workers == 1:
+        _init_worker()
+        for path in paths:
+            yield process_page(path, element_types)
+        return
+
+    # Several pages per task keeps IPC overhead low on large corpora
+    chunksize = max(1, min(16, len(paths) // (workers * 4)))
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker) as pool:
+        yield from pool.map(_process_page_args, ((p, element_types) for p in paths), chunksize=chunksize)
+
+
+def run_batch(directory: str, out: TextIO, workers: Optional[int] = None,
+              element_types: Optional[List[str]] = None) -> Dict[str, int]:
+    """
+    Write JSONL locator records for every page in directory
+
+    Returns:
+        Summary counts: pages, elements, failed
+    """
+    summary = {'pages': 0, 'elements': 0, 'failed': 0}
+
+    for result in iter_results(find_html_files(directory), workers, element_types):
+        page = os.path.relpath(result['page'], directory)
+        summary['pages'] += 1
+
+        if 'error' in result:
+            summary['failed'] += 1
+            out.write(json.dumps({'page': page, 'error': result['error']}, ensure_ascii=False) + '\n')
+            continue
+
+        for record in result['records']:
+            line = {'page': page, 'url': result['url']}
+            line.update(record)
+            out.write(json.dumps(line, ensure_ascii=False) + '\n')
+        summary['elements'] += len(result['records'])
+
+    out.flush()
+    return summary
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Entry point for `selector batch`; returns the process exit code"""
+    parser = argparse.ArgumentParser(
+        prog='selector batch',
+        description='Generate locators for a directory of saved HTML pages'
+    )
+    parser.add_argument('directory', help='Directory containing .html files (searched recursively)')
+    parser.add_argument('--workers', '-w', type=int, default=None,
+                        help='Worker processes (default: number of CPUs)')
+    parser.add_argument('--out', '-o', default='-', help='Output JSONL file (default: stdout)')
+    parser.add_argument('--types', default=None,
+                        help='Comma-separated element types (default: input,button,a,select,textarea)')
+    args = parser.parse_args(argv)
+
+    if not os.path.isdir(args.directory):
+        print(f"Error: not a directory: {args.directory}", file=sys.stderr)
+        return 2
+    if args.workers is not None and args.workers < 1:
+        print("Error: --workers must be at least 1", file=sys.stderr)
+        return 2
+
+    element_types = [t.strip() for t in args.types.split(',') if t.strip()] if args.types else None
+
+    if args.out == '-':
+        summary = run_batch(args.directory, sys.stdout, args.workers, element_types)
+    else:
+        with open(args.out, 'w', encoding='utf-8') as f:
+            summary = run_batch(args.directory, f, args.workers, element_types)
+
+    print(f"Processed {summary['pages']} pages, {summary['elements']} elements, "
+          f"{summary['failed']} failed", file=sys.stderr)
+    return 1 if summary['failed'] else 0
@@ -0,0 +1,181 @@
+"""
+Macros and exec scripts compiled once into Command objects
+
+Running a macro used to expand its body with str.replace, then lex and
+parse every expanded statement again, on every run. A compiled macro
+parses its body once:
+
+- statements without parameters are parsed once and reused as they are
+- a {param} inside a quoted literal is a slot: the statement is parsed
+  once with a marker there, and each run substitutes the argument into
+  the Command's strings - no lexing or parsing
+- other parameterized statements (e.g. `open {url}`) are expanded as text
+  and parsed through the parser's LRU cache
+
+Scripts are compiled per file and recompiled when the file changes.
+Statements that fail to parse stay text, so a pipeline still stops with
+the parse error at the same step.
+"""
+import os
+from dataclasses import fields, is_dataclass, replace
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
+
+from ..core.macro import Macro
+from ..parser.command import Command
+from ..parser.parser import Parser
+from ..query.planner import script_statements, split_statements
+
+# (line number, command text or precompiled Command)
+Statement = Tuple[int, Union[str, Command]]
+
+# Characters an argument may not contain to fill a slot; with them the
+# text expansion parses differently (or re-expands a placeholder)
+_UNSLOTTABLE = '"\'{'
+
+# Slot markers: private-use characters the lexer rejects outside quotes, so
+# a statement parses with a marker only where the slot is quoted
+_SLOT_OPEN, _SLOT_CLOSE = '\ue000', '\ue001'
+
+
+def _parse_all(parser: Parser, statements: List[str]) -> List[Union[str, Command]]:
+    """Commands for statements; a statement that fails to parse stays text"""
+    parsed = []
+    for statement in statements:
+        try:
+            parsed.append(parser.parse(statement))
+        except Exception:
+            parsed.append(statement)
+    return parsed
+
+
+# Fills slots: slot marker -> argument
+Binder = Callable[[Dict[str, str]], Any]
+
+
+def binder(value: Any) -> Optional[Binder]:
+    """
+    Function rebuilding value with its slot markers replaced, None if it has none
+
+    Only the parts of a Command that hold markers are copied per run; the
+    rest is shared with the compiled Command.
+    """
+    if isinstance(value, str):
+        if _SLOT_OPEN not in value:
+            return None
+
+        def fill(slots: Dict[str, str]) -> str:
+            text = value
+            for marker, argument in slots.items():
+                text = text.replace(marker, argument)
+            return text
+        return fill
+
+    if is_dataclass(value):
+        parts = [(f.name, binder(getattr(value, f.name))) for f in fields(value)]
+        parts = [(name, part) for name, part in parts if part is not None]
+        if not parts:
+            return None
+        return lambda slots: replace(value, **{name: part(slots) for name, part in parts})
+
+    if isinstance(value, (list, dict)):
+        items = list(value.items()) if isinstance(value, dict) else list(enumerate(value))
+        parts = [(key, binder(item)) for key, item in items]
+        if all(part is None for _, part in parts):
+            return None
+
+        def rebuild(slots: Dict[str, str]):
+            filled = [(key, part(slots) if part is not None else item)
+                      for (key, item), (_, part) in zip(items, parts)]
+            return dict(filled) if isinstance(value, dict) else [item for _, item in filled]
+        return rebuild
+
+    return None
+
+
+class _MacroLine:
+    """One command of a macro body"""
+
+    def __init__(self, template: str, statements: Optional[List[Union[str, Command]]] = None,
+                 binders: Optional[List[Binder]] = None):
+        self.template = template
+        self.statements = statements  # parsed once (no parameters)
+        self.binders = binders        # one per statement, filling its slots
+        # Neither: expand as text on every run
+
+
+class CompiledMacro:
+    """A macro's body, parsed once"""
+
+    def __init__(self, macro: Macro, parser: Parser):
+        self.macro = macro
+        self.parser = parser
+        self.markers = {f"{{{param}}}": f"{_SLOT_OPEN}{i}{_SLOT_CLOSE}"
+                        for i, param in enumerate(macro.parameters)}
+        self.lines = [self._compile(cmd) for cmd in macro.commands]
+
+    def _compile(self, cmd: str) -> _MacroLine:
+        if not any(placeholder in cmd for placeholder in self.markers):
+            return _MacroLine(cmd, statements=_parse_all(self.parser, split_statements(cmd)))
+
+        marked = Macro.expand_command(cmd, self.markers)
+        try:
+            commands = [self.parser.parse(s) for s in split_statements(marked)]
+        except Exception:
+            # A placeholder outside quotes (or a bad statement): text it is
+            return _MacroLine(cmd)
+        # A parsed marker can only sit in a string, but the parser may drop it
+        binders = [binder(command) or (lambda slots, command=command: command)
+                   for command in commands]
+        return _MacroLine(cmd, binders=binders)
+
+    def statements(self, arguments: List[str]) -> List[Statement]:
+        """
+        Statements for one run, numbered by macro command
+
+        Raises:
+            ValueError: If fewer arguments than parameters are given
+        """
+        param_map = self.macro.bind(arguments)
+        slots = {self.markers[placeholder]: value for placeholder, value in param_map.items()}
+        slottable = not any(char in value for value in param_map.values()
+                            for char in _UNSLOTTABLE + _SLOT_OPEN)
+
+        result: List[Statement] = []
+        for number, line in enumerate(self.lines, 1):
+            if line.statements is not None:
+                result.extend((number, command) for command in line.statements)
+            elif line.binders is not None and slottable:
+                result.extend((number, fill(slots)) for fill in line.binders)
+            else:
+                expanded = Macro.expand_command(line.template, param_map)
+                result.extend((number, s) for s in split_statements(expanded))
+        return result
+
+
+class CompiledScripts:
+    """exec scripts compiled once per file version"""
+
+    def __init__(self, parser: Parser):
+        self.parser = parser
+        self._scripts: Dict[str, Tuple[Tuple[int, int], List[Statement]]] = {}
+
+    def statements(self, filepath: str) -> List[Statement]:
+        """
+        Statements of a script file, numbered by line
+
+        Raises:
+            OSError: If the file cannot be read (FileNotFoundError if missing)
+        """
+        path = os.path.abspath(filepath)
+        stat = os.stat(path)
+        version = (stat.st_mtime_ns, stat.st_size)
+        cached = self._scripts.get(path)
+        if cached is not None and cached[0] == version:
+            return cached[1]
+
+        with open(path, 'r', encoding='utf-8') as f:
+            numbered = script_statements(f)
+        parsed = _parse_all(self.parser, [statement for _, statement in numbered])
+        compiled = [(line, command) for (line, _), command in zip(numbered, parsed)]
+        self._scripts[path] = (version, compiled)
+        return compiled
@@ -1,32 +1,52 @@
 """
 Command executor for Selector CLI
 """
-from typing import Optional, Any, List
+import os
+from typing import AsyncIterator, Dict, Optional, Any, List, Tuple
 from ..parser.command import (
-    Command, TargetType, Operator,
-    ConditionNode, ConditionType, LogicOp  # Phase 2
+    Command, TargetType, Operator, PAGE_SOURCE,
+    ConditionNode  # Phase 2
 )
 from ..parser.parser import Parser  # For parsing macro commands
 from ..core.context import Context
 from ..core.element import Element
+from ..core.collection import ElementCollection
 from ..core.scanner import ElementScanner
 from ..core.storage import StorageManager  # Phase 4
 from ..core.variable_expander import VariableExpander  # Phase 4
-from ..core.highlighter import Highlighter  # Phase 5
-# Phase 3: Import generators
-from ..generators import (
-    PlaywrightGenerator, SeleniumGenerator, PuppeteerGenerator,
-    JSONExporter, CSVExporter, YAMLExporter
+from ..core.progress import LiveCounter
+from ..core.readiness import ReadinessPolicy
+from ..core.lean import BlockStats
+from ..core.candidate_table import CandidateTable
+from ..query.compiler import compile_condition, filter_elements
+from ..query.pushdown import find_elements
+from ..query.planner import (
+    QueryPlanner, LayerCache, PlanStep, PipelineError, filter_layer, split_statements
 )
+from .compiled import CompiledMacro, CompiledScripts, Statement
+# Generators (Phase 3) and the highlighter (Phase 5) are imported where
+# used: parsing and layer commands should not load them
 
 
 class CommandExecutor:
     """Execute parsed commands"""
 
     def __init__(self):
-        self.scanner = ElementScanner()
+        self._scanner: Optional[ElementScanner] = None  # created on first scan
         self.storage = StorageManager()  # Phase 4
         self.parser = Parser()  # For parsing macro commands
+        self.planner = QueryPlanner(self.parser)
+        # Macro bodies and exec scripts, parsed once
+        self._macros: Dict[str, CompiledMacro] = {}
+        self.scripts = CompiledScripts(self.parser)
+        self._layer_cache: Optional[LayerCache] = None  # set while a pipeline runs
+
+    @property
+    def scanner(self) -> ElementScanner:
+        """Scanner shared by scan and find (builds the strategy engine on first use)"""
+        if self._scanner is None:
+            self._scanner = ElementScanner()
+        return self._scanner
 
     async def execute(self, command: Command, context: Context) -> str:
         """Execute command and return result message"""
@@ -35,6 +55,10 @@ class CommandExecutor:
             return await self._execute_open(command, context)
         elif command.verb == 'scan':
             return await self._execute_scan(command, context)
+        elif command.verb == 'open-many':
+            return await self._execute_open_many(command, context)
+        elif command.verb == 'scan-many':
+            return await self._execute_scan_many(command, context)
         elif command.verb == 'find':
             return await self._execute_find(command, context)
         elif command.verb == 'add':
@@ -71,6 +95,8 @@ class CommandExecutor:
             return await self._execute_macros(command, context)
         elif command.verb == 'exec':
             return await self._execute_exec(command, context)
+        elif command.verb == 'explain':
+            return await self._execute_explain(command, context)
         elif command.verb == 'highlight':
             return await self._execute_highlight(command, context)
         elif command.verb == 'unhighlight':
@@ -96,7 +122,7 @@ class CommandExecutor:
         elif command.verb == 'help':
             return await self._execute_help(command, context)
         else:
-            return f"Unknown command: {command.verb}"
+            return f"Error: Unknown command: {command.verb}"
 
     async def _execute_open(self, command: Command, context: Context) -> str:
         """Execute open command"""
@@ -107,17 +133,21 @@ class CommandExecutor:
         if not url:
             return "Error: No URL provided"
 
+        readiness = self._wait_policy(command)
+        if isinstance(readiness, str):
+            return readiness
+
         # Add https:// if no protocol
         if not url.startswith(('http://', 'https://', 'file://')):
             url = 'https://' + url
 
-        success = await context.browser.open(url)
+        success = await context.browser.open(url, readiness=readiness)
         if success:
             context.current_url = url
             context.is_page_loaded = True
 
             # Clear previous page's elements and collection
-            context.all_elements.clear()
+            context.all_elements = []
             context.collection.clear()
             context.last_scan_time = None
 
@@ -126,20 +156,222 @@ class CommandExecutor:
             elements = await self.scanner.scan(page)
             context.update_elements(elements)
 
-            return f"Opened: {url}\nAuto-scanned {len(elements)} elements"
+            policy = readiness if readiness is not None else context.browser.readiness
+            lines = [f"Opened: {url}",
+                     f"Ready ({policy}) after {context.browser.last_load_time:.2f}s"]
+            blocked = context.browser.blocked()
+            if blocked is not None:
+                lines.append(f"Lean: {blocked}")
+            lines.append(f"Auto-scanned {len(elements)} elements")
+            return "\n".join(lines)
         else:
-            return f"Failed to open: {url}"
+            return f"Error: Failed to open: {url}"
 
     async def _execute_scan(self, command: Command, context: Context) -> str:
         """Execute scan command"""
         if not context.browser or not context.is_page_loaded:
             return "Error: No page loaded. Use 'open <url>' first."
 
+        concurrency = command.options.get('concurrency', ElementScanner.DEFAULT_CONCURRENCY)
+        if isinstance(concurrency, bool) or not isinstance(concurrency, int) or concurrency < 1:
+            return "Error: --concurrency requires a positive integer"
+
+        incremental = command.options.get('incremental', False)
+        if incremental is not True and incremental is not False:
+            return "Error: --incremental takes no value"
+
+        out = command.options.get('out')
+        if out is not None:
+            if not isinstance(out, str) or not out:
+                return "Error: --out requires a file name"
+            if incremental:
+                return "Error: --incremental cannot be combined with --out"
+
         page = context.browser.get_page()
-        elements = await self.scanner.scan(page)
-        context.update_elements(elements)
 
-        return f"Scanned {len(elements)} elements"
+        if incremental:
+            elements = await self.scanner.scan(page, concurrency=concurrency, incremental=True)
+            context.update_elements(CandidateTable.from_scan(elements, page))
+            return f"Scanned {len(elements)} elements ({self.scanner.last_reused} unchanged)"
+
+        counter = LiveCounter("Scanning")
+        if out is not None:
+            return await self._scan_to_file(page, out, concurrency, counter)
+
+        # Rows go straight into the compact table; Elements are dropped
+        table = CandidateTable(page)
+        try:
+            async for element in self.scanner.scan_iter(page, concurrency=concurrency):
+                table.append_scanned(element)
+                counter.update(len(table))
+        finally:
+            counter.close()
+        context.update_elements(table)
+
+        return f"Scanned {len(table)} elements"
+
+    async def _scan_to_file(self, page, filename: str, concurrency: int,
+                            counter: LiveCounter) -> str:
+        """Stream scan results straight into a JSON or CSV file"""
+        from ..generators import CSVExporter, JSONExporter
+
+        exporters = {'.json': JSONExporter(), '.csv': CSVExporter()}
+        exporter = exporters.get(os.path.splitext(filename)[1].lower())
+        if exporter is None:
+            return "Error: --out file must end in .json or .csv"
+
+        async def counted():
+            count = 0
+            async for element in self.scanner.scan_iter(page, concurrency=concurrency):
+                count += 1
+                counter.update(count)
+                yield element
+
+        try:
+            with open(filename, 'w', encoding='utf-8', newline='') as f:
+                count = await exporter.stream(counted(), f)
+        except OSError as e:
+            return f"Error writing to file '{filename}': {e}"
+        finally:
+            counter.close()
+
+        return f"Scanned {count} elements to '{filename}' ({exporter.get_format_name()} format)"
+
+    async def _execute_open_many(self, command: Command, context: Context) -> str:
+        """Execute open-many command: load and scan URLs on pooled pages"""
+        if not context.browser:
+            return "Error: Browser not initialized"
+
+        urls = self._many_urls(command)
+        if isinstance(urls, str):
+            return urls
+        if not urls:
+            return "Error: No URLs provided"
+
+        # Like open, replaces the previous pages' elements
+        context.page_candidates = {}
+        return await self._scan_many(urls, command, context, "Opened")
+
+    async def _execute_scan_many(self, command: Command, context: Context) -> str:
+        """Execute scan-many command: re-scan the open-many URLs (or the given ones)"""
+        if not context.browser:
+            return "Error: Browser not initialized"
+
+        urls = self._many_urls(command)
+        if isinstance(urls, str):
+            return urls
+        if not urls:
+            urls = list(context.page_candidates)
+        if not urls:
+            return "Error: No pages opened. Use 'open-many <url> ...' first."
+
+        return await self._scan_many(urls, command, context, "Scanned")
+
+    def _many_urls(self, command: Command):
+        """URLs of an open-many/scan-many command (arguments, then --file), or an error"""
+        urls = command.argument.split("\x00") if command.argument else []
+
+        filename = command.options.get('file')
+        if filename is not None:
+            if not isinstance(filename, str) or not filename:
+                return "Error: --file requires a file name"
+            try:
+                with open(filename, 'r', encoding='utf-8') as f:
+                    urls += [line.strip() for line in f
+                             if line.strip() and not line.lstrip().startswith('#')]
+            except OSError as e:
+                return f"Error reading URL file '{filename}': {e}"
+
+        # Add https:// if no protocol; keep the first of duplicate URLs
+        normalized = []
+        for url in urls:
+            if not url.startswith(('http://', 'https://', 'file://')):
+                url = 'https://' + url
+            if url not in normalized:
+                normalized.append(url)
+        return normalized
+
+    async def _scan_many(self, urls: List[str], command: Command, context: Context,
+                         action: str) -> str:
+        """Load and scan urls concurrently on the browser's page pool"""
+        browser = context.browser
+
+        pool = command.options.get('pool', browser.pool_size)
+        if isinstance(pool, bool) or not isinstance(pool, int) or pool < 1:
+            return "Error: --pool requires a positive integer"
+        concurrency = command.options.get('concurrency', ElementScanner.DEFAULT_CONCURRENCY)
+        if isinstance(concurrency, bool) or not isinstance(concurrency, int) or concurrency < 1:
+            return "Error: --concurrency requires a positive integer"
+        readiness = self._wait_policy(command)
+        if isinstance(readiness, str):
+            return readiness
+        if pool != browser.pool_size:
+            await browser.resize_pool(pool)
+        blocked = BlockStats() if browser.lean else None
+
+        async def scan(page, url):
+            seconds = await browser.load(page, url, readiness=readiness)
+            if blocked is not None:
+                blocked.merge(browser.blocked(page))
+            # One scanner per page: the validator caches a single page's DOM state
+            table = CandidateTable()
+            async for element in ElementScanner().scan_iter(page, concurrency=concurrency):
+                # Pooled pages move on to other URLs, so locators are not kept
+                element.locator = None
+                table.append(element)
+            return table, seconds
+
+        counter = LiveCounter("Scanning pages")
+        done = 0
+
+        async def counted(page, url):
+            nonlocal done
+            try:
+                return await scan(page, url)
+            finally:
+                done += 1
+                counter.update(done)
+
+        try:
+            results = await browser.map_urls(urls, counted)
+        finally:
+            counter.close()
+
+        lines = []
+        loaded = 0
+        waited = 0.0
+        for url, result in zip(urls, results):
+            if isinstance(result, Exception):
+                context.page_candidates.pop(url, None)
+                message = str(result).strip().splitlines()
+                lines.append(f"  {url}: failed ({message[0] if message else type(result).__name__})")
+            else:
+                table, seconds = result
+                context.page_candidates[url] = table
+                loaded += 1
+                waited += seconds
+                lines.append(f"  {url}: {len(table)} elements (ready after {seconds:.2f}s)")
+
+        policy = readiness if readiness is not None else browser.readiness
+        header = (f"{action} {loaded}/{len(urls)} page(s) on "
+                  f"{min(browser.pool_size, len(urls))} pooled page(s)")
+        lines.append(f"Ready ({policy}): {waited:.2f}s total page load time")
+        if blocked is not None:
+            lines.append(f"Lean: {blocked}")
+        return "\n".join([header] + lines)
+
+    def _wait_policy(self, command: Command):
+        """ReadinessPolicy from --wait (None: the browser's default), or an error"""
+        wait = command.options.get('wait')
+        if wait is None:
+            return None
+        if not isinstance(wait, str):
+            return ("Error: --wait requires a policy: networkidle, load, domcontentloaded, "
+                    "selector:<css> or quiet[:ms]")
+        try:
+            return ReadinessPolicy.parse(wait)
+        except ValueError as e:
+            return f"Error: {e}"
 
     # ========== Phase 4: FIND Command Execution ==========
 
@@ -160,64 +392,12 @@ class CommandExecutor:
             return "Error: No page loaded. Use 'open <url>' first."
 
         try:
-            # Query DOM using browser's query_selector_all
-            elements = await context.browser.query_selector_all(element_type)
-
-            if not elements:
-                context.temp = []  # Clear temp
-                return f"Found 0 {element_type}(s) → temp"
-
-            # Convert browser elements to Element objects
-            from ..core.element import Element
-            result_elements = []
-
-            for i, elem in enumerate(elements):
-                try:
-                    # Get element properties via JavaScript evaluation
-                    props = await elem.evaluate('''(el) => ({
-                        tagName: el.tagName.toLowerCase(),
-                        id: el.id,
-                        className: el.className,
-                        name: el.getAttribute('name'),
-                        type: el.getAttribute('type'),
-                        value: el.value,
-                        text: el.textContent?.trim(),
-                        href: el.getAttribute('href'),
-                        visible: el.offsetParent !== null,
-                        enabled: !el.disabled,
-                        role: el.getAttribute('role')
-                    })''')
-
-                    # Create Element object
-                    element = Element(
-                        index=i,
-                        tag=props['tagName'],
-                        element_id=props['id'] or '',
-                        classes=props['className'] or '',
-                        name=props['name'] or '',
-                        type=props['type'] or '',
-                        value=props['value'] or '',
-                        text=props['text'] or '',
-                        href=props['href'] or '',
-                        visible=bool(props['visible']),
-                        enabled=bool(props['enabled']),
-                        role=props['role'] or ''
-                    )
-
-                    # Store raw element reference for highlighting
-                    element._raw_element = elem
-
-                    result_elements.append(element)
-
-                except Exception as e:
-                    # If eval fails, create minimal element
-                    element = Element(index=i, tag=element_type)
-                    element._raw_element = elem
-                    result_elements.append(element)
-
-            # Apply WHERE condition if present
-            if command.condition_tree:
-                result_elements = self._filter_by_condition_tree(result_elements, command.condition_tree)
+            # Query DOM with the WHERE condition pushed into the page, so only
+            # matching elements are transferred and located
+            page = context.browser.get_page()
+            result_elements = await find_elements(
+                self.scanner, page, [element_type], command.condition_tree
+            )
 
             # Store to temp layer (triggers TTL timer)
             context.temp = result_elements
@@ -238,14 +418,12 @@ class CommandExecutor:
         if not context.has_temp_results():
             return "Error: No temp results to refine. Use 'find' first."
 
-        temp_elements = context.temp
-
         # Apply WHERE condition
         if command.condition_tree:
-            filtered = self._filter_by_condition_tree(temp_elements, command.condition_tree)
+            filtered = self._select(context, 'temp', command.condition_tree)
         else:
             # No condition means list all temp
-            filtered = temp_elements
+            filtered = context.temp
 
         # Update temp (this resets the TTL timer)
         context.temp = filtered
@@ -259,35 +437,36 @@ class CommandExecutor:
         """Execute add command - enhanced with v2 features (source, append, where)"""
 
         # === v2: Determine source elements ===
-        if command.source:
-            # Use specified source layer (temp/candidates/workspace)
-            source_elements = self._get_source_elements(command.source, context)
-        else:
-            # Default: use candidates (v1 behavior compatible)
-            # But if we have no target, maybe we're adding all from source
-            source_elements = context.candidates
+        # Default: use candidates (v1 behavior compatible)
+        source = command.source or 'candidates'
+        missing = self._missing_page(source, context)
+        if missing:
+            return missing
+        source_elements = self._get_source_elements(source, context)
 
         if not source_elements:
-            layer_name = command.source or "candidates"
-            return f"No elements in {layer_name}"
+            return f"No elements in {source}"
+
+        # A type target over candidates is a tag index lookup, not an intersection
+        tag = None
+        if (command.target and command.target.type == TargetType.ELEMENT_TYPE
+                and source == 'candidates'):
+            tag = command.target.element_type
 
         # === v2: Apply WHERE condition if present ===
-        if command.condition_tree:
-            filtered_elements = self._filter_by_condition_tree(source_elements, command.condition_tree)
+        if command.condition_tree or tag:
+            filtered_elements = self._select(context, source, command.condition_tree, tag)
         elif command.condition:
             filtered_elements = self._filter_by_condition(source_elements, command.condition)
         else:
             filtered_elements = source_elements
 
         # === v2: Filter by target if present ===
-        if command.target:
+        if command.target and tag is None:
             target_filtered = self._resolve_target(command.target, context)
             # Intersect filtered_elements with target_filtered
-            target_elements = []
-            for elem in filtered_elements:
-                if any(e.uuid == elem.uuid for e in target_filtered):
-                    target_elements.append(elem)
-            elements_to_add = target_elements
+            target_uuids = {e.uuid for e in target_filtered}
+            elements_to_add = [elem for elem in filtered_elements if elem.uuid in target_uuids]
         else:
             elements_to_add = filtered_elements
 
@@ -298,14 +477,7 @@ class CommandExecutor:
 
         if destination == 'candidates':
             # Add to candidates (accumulate)
-            added_count = 0
-            existing_count = len(context.candidates)
-
-            for elem in elements_to_add:
-                if not any(e.uuid == elem.uuid for e in context.candidates):
-                    context.candidates.append(elem)
-                    added_count += 1
-
+            added_count = context.add_candidates(elements_to_add)
             new_total = len(context.candidates)
 
             if command.append_mode:
@@ -344,13 +516,9 @@ class CommandExecutor:
         if not command.target:
             return "Error: No target specified"
 
-        # Get elements to remove
-        elements_to_remove = self._resolve_target(command.target, context)
-
-        # Apply condition if present (Phase 2 or Phase 1)
-        if command.condition_tree:
-            elements_to_remove = self._filter_by_condition_tree(elements_to_remove, command.condition_tree)
-        elif command.condition:
+        # Get elements to remove, applying condition if present (Phase 2 or Phase 1)
+        elements_to_remove = self._select_target(command.target, command.condition_tree, context)
+        if command.condition:
             elements_to_remove = self._filter_by_condition(elements_to_remove, command.condition)
 
         # Remove from collection
@@ -372,14 +540,20 @@ class CommandExecutor:
         """Execute list command - enhanced with v2 features (source, where)"""
 
         # === v2: Determine source layer ===
+        layer = None
         if command.source:
             # List specific layer
+            missing = self._missing_page(command.source, context)
+            if missing:
+                return missing
+            layer = command.source
             source_elements = self._get_source_elements(command.source, context)
         elif command.target:
             # v1: list with target
             source_elements = self._resolve_target(command.target, context)
         else:
             # Default: list workspace (v1 compatible)
+            layer = 'workspace'
             source_elements = list(context.workspace.elements)
 
         # Check if temp is empty (for better user feedback)
@@ -391,8 +565,10 @@ class CommandExecutor:
             return f"0 elements in {layer_name}"
 
         # === v2: Apply WHERE condition ===
-        if command.condition_tree:
-            elements = self._filter_by_condition_tree(source_elements, command.condition_tree)
+        if command.condition_tree and layer is None:
+            elements = self._select_target(command.target, command.condition_tree, context)
+        elif command.condition_tree:
+            elements = self._select(context, layer, command.condition_tree)
         elif command.condition:
             elements = self._filter_by_condition(source_elements, command.condition)
         else:
@@ -461,6 +637,10 @@ class CommandExecutor:
         url = context.current_url if context.current_url else None
 
         # Select appropriate generator
+        from ..generators import (
+            PlaywrightGenerator, SeleniumGenerator, PuppeteerGenerator,
+            JSONExporter, CSVExporter, YAMLExporter
+        )
         generator_map = {
             'playwright': PlaywrightGenerator(),
             'selenium': SeleniumGenerator(),
@@ -646,41 +826,19 @@ class CommandExecutor:
             return f"Error defining macro: {e}"
 
     async def _execute_run(self, command: Command, context: Context) -> str:
-        """Execute run command - run a macro"""
+        """Execute run command - run a macro as one planned pipeline"""
         if not command.argument:
             return "Error: No macro name specified"
 
-        # Parse "name\x00arg1\x00arg2\x00..." format if arguments provided
-        if '\x00' in command.argument:
-            parts = command.argument.split('\x00')
-            macro_name = parts[0]
-            arguments = parts[1:]
-        else:
-            macro_name = command.argument
-            arguments = []
+        macro_name = command.argument.split('\x00')[0]
 
         try:
-            # Get macro and expand with arguments
-            macro = context.macro_manager.get(macro_name)
-            commands = macro.expand(arguments)
-
-            # Execute each command
-            results = []
-            for cmd_str in commands:
-                # Skip empty commands
-                if not cmd_str.strip():
-                    continue
-
-                # Parse and execute command
-                try:
-                    cmd = self.parser.parse(cmd_str)
-                    result = await self.execute(cmd, context)
-                    results.append(result)
-                except Exception as e:
-                    return f"Error in macro '{macro_name}': {e}\nCommand: {cmd_str}"
-
-            return "\n".join([r for r in results if r])
+            statements = self._macro_statements(command, context)
+            results = await self.execute_pipeline(statements, context)
+            return "\n".join([result for _, result in results if result])
 
+        except PipelineError as e:
+            return f"Error in macro '{macro_name}': {e.error}\nCommand: {e.step.statement}"
         except KeyError:
             return f"Error: Macro '{macro_name}' not found"
         except Exception as e:
@@ -702,44 +860,111 @@ class CommandExecutor:
         return "\n".join(lines)
 
     async def _execute_exec(self, command: Command, context: Context) -> str:
-        """Execute exec command - run script file"""
+        """Execute exec command - run script file as one planned pipeline"""
         if not command.argument:
             return "Error: No filepath specified"
 
         filepath = command.argument
 
         try:
-            # Read script file
-            with open(filepath, 'r', encoding='utf-8') as f:
-                script_lines = f.readlines()
+            statements = self._script_statements(filepath)
+            results = await self.execute_pipeline(statements, context)
+
+            lines = [f"[{step.line}] {result}" for step, result in results
+                     if result and result.strip()]
+            return "\n".join(lines) if lines else f"Executed {filepath}"
+
+        except PipelineError as e:
+            return f"Error at line {e.step.line}: {e.error}\nCommand: {e.step.statement}"
+        except FileNotFoundError:
+            return f"Error: File '{filepath}' not found"
+        except Exception as e:
+            return f"Error executing script: {e}"
+
+    async def _execute_explain(self, command: Command, context: Context) -> str:
+        """Execute explain command - show how a command or chain would run"""
+        statements = [(1, statement) for statement in split_statements(command.argument or '')]
+        if not statements:
+            return "Error: No command to explain"
+
+        # run/exec: explain the pipeline they would execute
+        if len(statements) == 1:
+            try:
+                inner = self.parser.parse(statements[0][1])
+            except Exception:
+                inner = None
+            try:
+                if inner is not None and inner.verb == 'run' and inner.argument:
+                    statements = self._macro_statements(inner, context)
+                elif inner is not None and inner.verb == 'exec' and inner.argument:
+                    statements = self._script_statements(inner.argument)
+            except KeyError as e:
+                return f"Error: {e.args[0]}"
+            except FileNotFoundError:
+                return f"Error: File '{inner.argument}' not found"
+            except Exception as e:
+                return f"Error: {e}"
+
+        return self.planner.explain(statements, context)
 
-            # Execute each line
-            results = []
-            line_num = 0
+    async def execute_pipeline(self, statements: List[Statement],
+                               context: Context) -> List[Tuple[PlanStep, str]]:
+        """
+        Plan and run commands as one pipeline
 
-            for line in script_lines:
-                line_num += 1
-                line = line.strip()
+        Filter results are cached for the pipeline and reused until a later
+        command writes their layer.
 
-                # Skip empty lines and comments
-                if not line or line.startswith('#'):
-                    continue
+        Args:
+            statements: (line number, command text or compiled Command) pairs, in order
 
+        Returns:
+            (plan step, result) for each command
+
+        Raises:
+            PipelineError: at the first command that fails to parse or run
+        """
+        steps = self.planner.plan(statements, context)
+        return [result async for result in self.iter_pipeline(steps, context)]
+
+    async def iter_pipeline(self, steps: List[PlanStep],
+                            context: Context) -> AsyncIterator[Tuple[PlanStep, str]]:
+        """
+        Run planned steps, yielding (plan step, result) as each command finishes
+
+        Raises:
+            PipelineError: at the first command that failed to parse or raises
+        """
+        outer_cache = self._layer_cache
+        self._layer_cache = LayerCache()
+        try:
+            for step in steps:
+                if step.error is not None:
+                    raise PipelineError(step, step.error)
                 try:
-                    # Parse and execute command
-                    cmd = self.parser.parse(line)
-                    result = await self.execute(cmd, context)
-                    if result and result.strip():
-                        results.append(f"[{line_num}] {result}")
+                    result = await self.execute(step.command, context)
                 except Exception as e:
-                    return f"Error at line {line_num}: {e}\nCommand: {line}"
+                    raise PipelineError(step, e) from e
+                self._layer_cache.invalidate(step.writes)
+                yield step, result
+        finally:
+            self._layer_cache = outer_cache
+
+    def _macro_statements(self, command: Command, context: Context) -> List[Statement]:
+        """Statements of a run command's macro, bound to its arguments"""
+        # Parse "name\x00arg1\x00arg2\x00..." format if arguments provided
+        parts = command.argument.split('\x00')
+        macro = context.macro_manager.get(parts[0])
 
-            return "\n".join(results) if results else f"Executed {filepath}"
+        # Recompiled when the macro is redefined
+        compiled = self._macros.get(macro.name)
+        if compiled is None or compiled.macro is not macro:
+            compiled = self._macros[macro.name] = CompiledMacro(macro, self.parser)
+        return compiled.statements(parts[1:])
 
-        except FileNotFoundError:
-            return f"Error: File '{filepath}' not found"
-        except Exception as e:
-            return f"Error executing script: {e}"
+    def _script_statements(self, filepath: str) -> List[Statement]:
+        """Statements of a script file, numbered by line"""
+        return self.scripts.statements(filepath)
 
     async def _execute_highlight(self, command: Command, context: Context) -> str:
         """Execute highlight command"""
@@ -748,6 +973,7 @@ class CommandExecutor:
 
         # Get or create highlighter
         if not hasattr(context, 'highlighter') or context.highlighter is None:
+            from ..core.highlighter import Highlighter
             context.highlighter = Highlighter(context.browser.page)
 
         # Case 1: highlight (no target) - highlight current collection
@@ -772,13 +998,9 @@ class CommandExecutor:
             return msg
 
         # Case 2: highlight <target> [where <condition>]
-        # Get elements from all_elements based on target
-        elements = self._resolve_target(command.target, context)
-
-        # Apply condition filter if present
-        if command.condition_tree:
-            elements = self._filter_by_condition_tree(elements, command.condition_tree)
-        elif command.condition:
+        # Get elements from all_elements based on target, filtered by condition
+        elements = self._select_target(command.target, command.condition_tree, context)
+        if command.condition:
             elements = self._filter_by_condition(elements, command.condition)
 
         if not elements:
@@ -904,11 +1126,8 @@ class CommandExecutor:
         if not command.condition_tree:
             return "Error: No condition specified for keep"
 
-        # Get all elements currently in collection
-        all_elements = list(context.collection.elements)
-
         # Filter elements to keep
-        elements_to_keep = self._filter_by_condition_tree(all_elements, command.condition_tree)
+        elements_to_keep = self._select(context, 'workspace', command.condition_tree)
 
         # Clear collection and re-add only matching elements
         original_count = context.collection.count()
@@ -929,11 +1148,8 @@ class CommandExecutor:
         if not command.condition_tree:
             return "Error: No condition specified for filter"
 
-        # Get all elements currently in collection
-        all_elements = list(context.collection.elements)
-
         # Filter elements to remove (find matching ones)
-        elements_to_remove = self._filter_by_condition_tree(all_elements, command.condition_tree)
+        elements_to_remove = self._select(context, 'workspace', command.condition_tree)
 
         # Remove matching elements
         removed_count = 0
@@ -1025,19 +1241,30 @@ Selector CLI - Phase 1 MVP Commands:
 
 Browser Commands:
   open <url>              Open a URL
+  open <url> --wait P     Page is ready at P: networkidle (default), load,
+                          domcontentloaded, selector:<css> or quiet[:ms]
+  open-many <url> ...     Open and scan URLs side by side on pooled pages
+                          (--pool N pages, default 4; --file "urls.txt"; --wait P)
+  scan-many               Re-scan the open-many pages (or scan-many <url> ...)
 
 Scan Commands:
   scan                    Scan page for elements
+  scan --concurrency N    Process up to N elements at once (default 8)
+  scan --incremental      Rebuild only elements changed since the last incremental scan
+  scan --out "file.json"  Stream results to a .json/.csv file instead of memory
 
 Collection Commands:
   add <target>            Add elements to collection
   add <target> where <condition>
+  add to workspace from page "<url>" [where <condition>]
+                          Add elements of one open-many page
   remove <target>         Remove elements from collection
   clear                   Clear collection
 
 Query Commands:
   list                    List collection
   list <target>           List specific elements
+  list page "<url>"       List the elements scanned from an open-many page
   show                    Show collection details
   show <target>           Show element details
   count                   Count collection elements
@@ -1060,6 +1287,11 @@ Command History (Phase 5):
   !n                      Execute command at index n
   !!                      Execute last command
 
+Query Planning:
+  explain <command>       Show where each WHERE predicate runs (browser,
+                          index or Python); also explains a;b chains,
+                          run <macro> and exec <file>
+
 Targets:
   input, button, select, textarea, a
   [5]                     Single index
@@ -1134,99 +1366,51 @@ Examples:
     # ========== Phase 2: Complex Condition Evaluation ==========
 
     def _filter_by_condition_tree(self, elements, condition_tree: ConditionNode):
-        """Filter elements by condition tree (Phase 2)"""
-        result = []
-        for elem in elements:
-            if self._evaluate_condition_tree(elem, condition_tree):
-                result.append(elem)
-        return result
+        """Filter elements by condition tree (Phase 2), compiled once per call"""
+        return filter_elements(elements, condition_tree)
 
     def _evaluate_condition_tree(self, elem, condition: ConditionNode) -> bool:
-        """Evaluate complex condition tree recursively"""
-
-        if condition.type == ConditionType.SIMPLE:
-            return self._evaluate_simple_condition(elem, condition)
-
-        elif condition.type == ConditionType.COMPOUND:
-            left_result = self._evaluate_condition_tree(elem, condition.left)
-            right_result = self._evaluate_condition_tree(elem, condition.right)
-
-            if condition.logic_op == LogicOp.AND:
-                return left_result and right_result
-            elif condition.logic_op == LogicOp.OR:
-                return left_result or right_result
-
-        elif condition.type == ConditionType.UNARY:
-            operand_result = self._evaluate_condition_tree(elem, condition.operand)
-            return not operand_result
-
-        return False
+        """Evaluate complex condition tree against one element"""
+        return compile_condition(condition)(elem)
+
+    # ========== Planned Layer Access ==========
+
+    def _select(self, context: Context, layer: str, condition: Optional[ConditionNode],
+                tag: Optional[str] = None) -> List[Element]:
+        """Elements of a layer (with tag, if given) matching condition
+
+        Uses the planner's access path (tag index or compiled filter, selective
+        predicates first) and, inside a pipeline, its layer cache.
+        """
+        cache = self._layer_cache
+        if cache is not None:
+            key = LayerCache.key(layer, condition, tag=tag)
+            cached = cache.get(key)
+            if cached is not None:
+                return cached
+
+        if layer == 'workspace':
+            source = context.workspace
+        else:
+            source = self._get_source_elements(layer, context)
+        result = filter_layer(source, condition, tag=tag)
 
-    def _evaluate_simple_condition(self, elem, condition: ConditionNode) -> bool:
-        """Evaluate simple condition with Phase 2 operators"""
-        # Get field value
-        field_value = self._get_field_value(elem, condition.field)
-        compare_value = condition.value
-        operator = condition.operator
-
-        # Comparison operators
-        if operator == Operator.EQUALS:
-            return str(field_value) == str(compare_value)
-        elif operator == Operator.NOT_EQUALS:
-            return str(field_value) != str(compare_value)
-        elif operator == Operator.GT:
-            return self._to_number(field_value) > self._to_number(compare_value)
-        elif operator == Operator.GTE:
-            return self._to_number(field_value) >= self._to_number(compare_value)
-        elif operator == Operator.LT:
-            return self._to_number(field_value) < self._to_number(compare_value)
-        elif operator == Operator.LTE:
-            return self._to_number(field_value) <= self._to_number(compare_value)
-
-        # String operators
-        elif operator == Operator.CONTAINS:
-            return str(compare_value) in str(field_value)
-        elif operator == Operator.STARTS:
-            return str(field_value).startswith(str(compare_value))
-        elif operator == Operator.ENDS:
-            return str(field_value).endswith(str(compare_value))
-        elif operator == Operator.MATCHES:
-            import re
-            return bool(re.search(str(compare_value), str(field_value)))
+        if cache is not None:
+            cache.put(key, result)
+        return result
 
-        return False
+    def _select_target(self, target, condition: Optional[ConditionNode],
+                       context: Context) -> List[Element]:
+        """Elements of a target matching condition (if any)"""
+        if target.type == TargetType.ELEMENT_TYPE:
+            return self._select(context, 'candidates', condition, target.element_type)
+        if target.type == TargetType.ALL and condition:
+            return self._select(context, 'candidates', condition)
 
-    def _get_field_value(self, elem, field: str) -> Any:
-        """Get field value from element"""
-        # Direct attribute
-        if hasattr(elem, field):
-            return getattr(elem, field)
-
-        # From attributes dict
-        if field in elem.attributes:
-            return elem.attributes[field]
-
-        # Boolean fields (treat as boolean if field name is a boolean keyword)
-        if field in ['visible', 'enabled', 'disabled', 'required', 'readonly']:
-            if field == 'visible':
-                return elem.visible if hasattr(elem, 'visible') else True
-            elif field == 'enabled':
-                return elem.enabled if hasattr(elem, 'enabled') else True
-            elif field == 'disabled':
-                return elem.disabled if hasattr(elem, 'disabled') else False
-            elif field == 'required':
-                return elem.required if hasattr(elem, 'required') else False
-            elif field == 'readonly':
-                return elem.readonly if hasattr(elem, 'readonly') else False
-
-        return ""
-
-    def _to_number(self, value: Any) -> float:
-        """Convert value to number for comparison"""
-        try:
-            return float(value)
-        except (ValueError, TypeError):
-            return 0.0
+        elements = self._resolve_target(target, context)
+        if condition:
+            elements = self._filter_by_condition_tree(elements, condition)
+        return elements
 
     # ========== Phase 4: v2 Helper Methods ==========
 
@@ -1238,11 +1422,23 @@ Examples:
             return context.candidates
         elif source == 'workspace':
             return list(context.workspace.elements)
+        elif source.startswith(PAGE_SOURCE):
+            return context.page_table(source[len(PAGE_SOURCE):]) or []
         else:
             # Default to candidates
             return context.candidates
 
+    def _missing_page(self, source: str, context: Context) -> Optional[str]:
+        """Error if source is an open-many page that was not scanned"""
+        if source.startswith(PAGE_SOURCE):
+            url = source[len(PAGE_SOURCE):]
+            if context.page_table(url) is None:
+                return f"Error: Page not opened: {url}. Use 'open-many <url> ...' first."
+        return None
+
     def _element_in_list(self, element: Element, element_list: List[Element]) -> bool:
         """Check if element is in list (by UUID)"""
+        if isinstance(element_list, (ElementCollection, CandidateTable)):
+            return element_list.contains_uuid(element.uuid)
         return any(e.uuid == element.uuid for e in element_list)
 
@@ -0,0 +1,183 @@
+"""
+Non-interactive script runner
+
+Usage:
+    selector run <script.sel | -> [--url URL] [--out results.jsonl] [--headed] [--wait P] [--lean ...]
+
+The whole script is parsed and planned before anything runs: a script with
+a syntax error fails with every error listed and the browser never starts.
+The browser is started only if the script needs one (--url, or a command
+that reads the page). Commands then run as one pipeline, like exec, and
+each result is written as a JSON line the moment its command finishes:
+
+    {"line": 3, "command": "count", "ok": true, "output": "...", "seconds": 0.001}
+
+Running stops at the first failed command.
+
+Exit codes: 0 every command succeeded, 1 a command failed, 2 the script
+could not be read or did not parse.
+"""
+import argparse
+import asyncio
+import contextlib
+import json
+import sys
+import time
+from typing import List, Optional, TextIO, Tuple
+
+from ..core.browser import BrowserManager
+from ..core.context import Context
+from ..query.planner import PipelineError, PlanStep, script_statements
+from .executor import CommandExecutor
+
+# Verbs that read or drive the page; exec and run may contain any command
+BROWSER_VERBS = frozenset({
+    'open', 'scan', 'open-many', 'scan-many', 'find', 'highlight', 'unhighlight', 'exec', 'run',
+})
+
+
+def needs_browser(steps: List[PlanStep]) -> bool:
+    """True if any step needs a started browser"""
+    return any(step.command.verb in BROWSER_VERBS
+               and not (step.command.verb == 'find' and step.command.is_refine)
+               for step in steps)
+
+
+class ScriptRunner:
+    """Run a planned script, streaming one JSON line per command"""
+
+    def __init__(self, executor: Optional[CommandExecutor] = None,
+                 context: Optional[Context] = None):
+        self.executor = executor if executor is not None else CommandExecutor()
+        self.context = context if context is not None else Context()
+
+    def plan(self, statements: List[Tuple[int, str]]) -> Tuple[List[PlanStep], List[PlanStep]]:
+        """
+        Parse and plan every statement
+
+        Returns:
+            (steps, steps that failed to parse)
+        """
+        steps = self.executor.planner.plan(statements, self.context, stop_on_error=False)
+        return steps, [step for step in steps if step.error is not None]
+
+    async def run(self, steps: List[PlanStep], out: TextIO) -> Tuple[int, int]:
+        """
+        Run steps, writing a record to out as each finishes
+
+        Returns:
+            (commands run, commands failed); running stops at the first failure
+        """
+        ran = 0
+        pipeline = self.executor.iter_pipeline(steps, self.context)
+        started = time.perf_counter()
+        try:
+            async for step, output in pipeline:
+                ran += 1
+                ok = not output.startswith("Error")
+                started = self._write(out, step, ok, output, started)
+                if not ok:
+                    return ran, 1
+        except PipelineError as e:
+            self._write(out, e.step, False, f"Execution error: {e.error}", started)
+            return ran + 1, 1
+        finally:
+            await pipeline.aclose()
+        return ran, 0
+
+    @staticmethod
+    def _write(out: TextIO, step: PlanStep, ok: bool, output: str, started: float) -> float:
+        """Write one record; returns the time it was written"""
+        finished = time.perf_counter()
+        record = {'line': step.line, 'command': step.statement, 'ok': ok,
+                  'output': output, 'seconds': round(finished - started, 6)}
+        out.write(json.dumps(record, ensure_ascii=False) + '\n')
+        out.flush()
+        return finished
+
+
+def _read_script(path: str) -> List[Tuple[int, str]]:
+    if path == '-':
+        return script_statements(sys.stdin)
+    with open(path, 'r', encoding='utf-8') as f:
+        return script_statements(f)
+
+
+async def run_script(runner: ScriptRunner, steps: List[PlanStep], out: TextIO,
+                     browser: Optional[BrowserManager], headless: bool = True) -> Tuple[int, int]:
+    """Start the browser (if given), run steps, close the browser"""
+    if browser is None:
+        return await runner.run(steps, out)
+
+    runner.context.browser = browser
+    try:
+        await browser.initialize(headless=headless)
+        return await runner.run(steps, out)
+    finally:
+        await browser.close()
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Entry point for `selector run`; returns the process exit code"""
+    from ..main import add_browser_arguments, lean_profile
+
+    parser = argparse.ArgumentParser(prog='selector run',
+                                     description='Run a selector script without the REPL')
+    parser.add_argument('script', help="Script file, one command per line ('-': stdin)")
+    parser.add_argument('--url', default=None, help='Open this page before the script runs')
+    parser.add_argument('--out', '-o', default='-', help='Output JSONL file (default: stdout)')
+    parser.add_argument('--headed', action='store_true', help='Show the browser window')
+    add_browser_arguments(parser)
+    args = parser.parse_args(argv)
+
+    try:
+        lean = lean_profile(args)
+    except ValueError as e:
+        parser.error(str(e))
+
+    try:
+        statements = _read_script(args.script)
+    except OSError as e:
+        print(f"Error: cannot read script: {e}", file=sys.stderr)
+        return 2
+    if args.url:
+        statements.insert(0, (0, f"open {args.url}"))
+
+    runner = ScriptRunner()
+    steps, invalid = runner.plan(statements)
+    if invalid:
+        for step in invalid:
+            print(f"{args.script}:{step.line}: Parse error: {step.error}\n    {step.statement}",
+                  file=sys.stderr)
+        return 2
+
+    browser = None
+    if needs_browser(steps):
+        browser = BrowserManager(readiness=args.wait, lean=lean)
+
+    out = sys.stdout
+    try:
+        if args.out != '-':
+            out = open(args.out, 'w', encoding='utf-8')
+    except OSError as e:
+        print(f"Error: cannot write results: {e}", file=sys.stderr)
+        return 2
+
+    started = time.perf_counter()
+    try:
+        # Browser and command chatter goes to stderr; stdout carries only records
+        with contextlib.redirect_stdout(sys.stderr):
+            ran, failed = asyncio.run(run_script(runner, steps, out, browser, not args.headed))
+    except KeyboardInterrupt:
+        return 1
+    except Exception as e:
+        # Browser failed to start or crashed
+        print(f"Error: {e}", file=sys.stderr)
+        return 1
+    finally:
+        if out is not sys.stdout:
+            out.close()
+
+    print(f"Ran {ran}/{len(steps)} command(s) in {time.perf_counter() - started:.2f}s"
+          + (", stopped at a failed command" if failed else ""), file=sys.stderr)
+    return 1 if failed else 0
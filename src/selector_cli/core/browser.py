@@ -1,37 +1,78 @@
 """
 Browser manager for Selector CLI
 """
-from typing import Optional
-from playwright.async_api import Browser, Page, Playwright, async_playwright
+from contextlib import asynccontextmanager
+from typing import (
+    TYPE_CHECKING, AsyncIterator, Awaitable, Callable, Dict, List, Optional, Sequence, TypeVar
+)
 import asyncio
+from .readiness import ReadinessPolicy
+from .lean import BlockStats, LeanProfile
+
+if TYPE_CHECKING:
+    from playwright.async_api import Browser, Page, Playwright
+
+T = TypeVar('T')
 
 
 class BrowserManager:
     """Manage Playwright browser and page"""
 
-    def __init__(self):
-        self.playwright: Optional[Playwright] = None
-        self.browser: Optional[Browser] = None
-        self.page: Optional[Page] = None
+    # Pooled pages used by open_many/map_urls (besides the main page)
+    DEFAULT_POOL_SIZE = 4
+
+    def __init__(self, pool_size: int = DEFAULT_POOL_SIZE,
+                 readiness: Optional[ReadinessPolicy] = None,
+                 lean: Optional[LeanProfile] = None):
+        """
+        Args:
+            pool_size: Maximum number of pooled pages loading at once
+            readiness: Default policy for when a loaded page is ready
+                       (networkidle if not given)
+            lean: Block the profile's resources on every page (None: load everything)
+        """
+        if pool_size < 1:
+            raise ValueError("pool_size must be at least 1")
+        self.playwright: Optional['Playwright'] = None
+        self.browser: Optional['Browser'] = None
+        self.page: Optional['Page'] = None
         self.current_url: Optional[str] = None
         self.is_page_loaded: bool = False
 
+        self.readiness = readiness if readiness is not None else ReadinessPolicy()
+        # Seconds the last open() took until the page was ready
+        self.last_load_time: Optional[float] = None
+
+        self.lean = lean
+        # Requests blocked on each lean page since its last load()
+        self._block_stats: Dict['Page', BlockStats] = {}
+
+        # Page pool: each pooled page has its own browser context, so pages
+        # loaded side by side do not share cookies or storage
+        self.pool_size = pool_size
+        self._pool_pages: List['Page'] = []
+        self._idle: List['Page'] = []
+        self._pool_slots: Optional[asyncio.Semaphore] = None
+
     async def initialize(self, headless: bool = False):
         """Initialize browser"""
+        # Imported on launch: Playwright costs more than the rest of startup together
+        from playwright.async_api import async_playwright
+
         self.playwright = await async_playwright().start()
         self.browser = await self.playwright.chromium.launch(headless=headless)
-        self.page = await self.browser.new_page()
-        print("Browser initialized")
+        self.page = await self._new_page()
+        print("Browser initialized" + (" (lean profile)" if self.lean else ""))
 
-    async def open(self, url: str, timeout: int = 60000) -> bool:
-        """Open URL"""
+    async def open(self, url: str, timeout: int = 60000,
+                   readiness: Optional[ReadinessPolicy] = None) -> bool:
+        """Open URL, waiting per readiness (default: self.readiness)"""
         if not self.page:
             raise RuntimeError("Browser not initialized")
 
         try:
             print(f"Opening: {url}")
-            await self.page.goto(url, timeout=timeout)
-            await self.page.wait_for_load_state('networkidle', timeout=30000)
+            self.last_load_time = await self.load(self.page, url, timeout, readiness)
             self.current_url = url
             self.is_page_loaded = True
             print(f"Page loaded: {url}")
@@ -41,14 +82,109 @@ class BrowserManager:
             self.is_page_loaded = False
             return False
 
-    async def refresh(self):
-        """Refresh current page"""
+    async def load(self, page: 'Page', url: str, timeout: int = 60000,
+                   readiness: Optional[ReadinessPolicy] = None) -> float:
+        """
+        Navigate page to url and wait until it is ready
+
+        Returns:
+            Seconds until the page was ready
+        """
+        stats = self._block_stats.get(page)
+        if stats is not None:
+            stats.clear()
+        policy = readiness if readiness is not None else self.readiness
+        return await policy.goto(page, url, timeout)
+
+    def blocked(self, page: Optional['Page'] = None) -> Optional[BlockStats]:
+        """Requests the lean profile blocked on page (default: main page) since its last load"""
+        return self._block_stats.get(page if page is not None else self.page)
+
+    @asynccontextmanager
+    async def pooled_page(self) -> AsyncIterator['Page']:
+        """
+        Borrow a page from the pool, waiting while all pool_size pages are busy
+
+        Pages are created on first use and reused afterwards; a page whose
+        work raised is closed instead of being returned to the pool.
+        """
+        if not self.browser:
+            raise RuntimeError("Browser not initialized")
+        if self._pool_slots is None:
+            self._pool_slots = asyncio.Semaphore(self.pool_size)
+
+        async with self._pool_slots:
+            page = self._idle.pop() if self._idle else await self._new_pooled_page()
+            try:
+                yield page
+            except BaseException:
+                self._pool_pages.remove(page)
+                await self._close_quietly(page)
+                raise
+            self._idle.append(page)
+
+    async def map_urls(self, urls: Sequence[str],
+                       worker: Callable[['Page', str], Awaitable[T]]) -> List[T]:
+        """
+        Run worker(page, url) for every url on pooled pages, pool_size at a time
+
+        Returns:
+            Results in url order; a url whose worker raised gets the exception
+            instead of a result, and the other urls still run
+        """
+        async def run(url):
+            try:
+                async with self.pooled_page() as page:
+                    return await worker(page, url)
+            except Exception as e:
+                return e
+
+        return list(await asyncio.gather(*(run(url) for url in urls)))
+
+    async def resize_pool(self, pool_size: int):
+        """Change the pool size; idle pages beyond the new size are closed"""
+        if pool_size < 1:
+            raise ValueError("pool_size must be at least 1")
+        if self._pool_slots is not None and len(self._idle) < len(self._pool_pages):
+            raise RuntimeError("Cannot resize the page pool while pages are in use")
+        self.pool_size = pool_size
+        self._pool_slots = None
+        while len(self._idle) > pool_size:
+            page = self._idle.pop()
+            self._pool_pages.remove(page)
+            await self._close_quietly(page)
+
+    async def _new_pooled_page(self) -> 'Page':
+        page = await self._new_page()
+        self._pool_pages.append(page)
+        return page
+
+    async def _new_page(self) -> 'Page':
+        """New page in its own context, with the lean filter installed if enabled"""
+        if not self.lean:
+            return await self.browser.new_page()
+        browser_context = await self.browser.new_context(**self.lean.context_options())
+        page = await browser_context.new_page()
+        self._block_stats[page] = await self.lean.install(page)
+        return page
+
+    async def _close_quietly(self, page: 'Page'):
+        self._block_stats.pop(page, None)
+        try:
+            # A lean page's context was created for it alone
+            await (page.context.close() if self.lean else page.close())
+        except Exception:
+            pass
+
+    async def refresh(self, readiness: Optional[ReadinessPolicy] = None) -> float:
+        """Refresh current page; returns seconds until it was ready"""
         if not self.page:
             raise RuntimeError("Browser not initialized")
 
-        await self.page.reload()
-        await self.page.wait_for_load_state('networkidle')
+        policy = readiness if readiness is not None else self.readiness
+        seconds = await policy.reload(self.page)
         print("Page refreshed")
+        return seconds
 
     async def back(self):
         """Navigate back"""
@@ -85,7 +221,12 @@ class BrowserManager:
 
     async def close(self):
         """Close browser"""
+        for page in self._pool_pages:
+            await self._close_quietly(page)
+        self._pool_pages = []
+        self._idle = []
         if self.page:
+            self._block_stats.pop(self.page, None)
             await self.page.close()
         if self.browser:
             await self.browser.close()
@@ -93,7 +234,7 @@ class BrowserManager:
             await self.playwright.stop()
         print("Browser closed")
 
-    def get_page(self) -> Page:
+    def get_page(self) -> 'Page':
         """Get current page"""
         if not self.page:
             raise RuntimeError("Browser not initialized")
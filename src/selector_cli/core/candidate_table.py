@@ -0,0 +1,536 @@
+"""
+Columnar storage for scan results
+
+A scan of a large page produces tens of thousands of Element objects, each a
+full dataclass with its own attribute dict, class list, datetime and live
+Locator. CandidateTable keeps the same data in columns instead:
+
+- tag/type/strategy/page URL are interned into small code arrays
+- attribute dicts become a shared key tuple ("shape") plus a value tuple;
+  repetitive values (class, type, role, ...) share one string
+- fields the scanner derives from attributes (type, name, id, placeholder,
+  value, classes, disabled) are not stored unless they differ
+- booleans are packed into one flag byte, numbers into typed arrays
+- locators of scanned elements are rebuilt on demand from (tag, position)
+
+Rows are exposed as CandidateRow views that read like an Element (same
+attribute names, str(), to_dict()), so ElementCollection, the exporters and
+the WHERE evaluators work on them unchanged. Tables are append-only; rows are
+read-only. Contexts hand the table itself out as their candidates layer, so
+lookups by element index or tag go through hash indexes instead of a scan.
+"""
+import math
+import uuid as uuid_module
+from array import array
+from datetime import datetime, timedelta
+from collections.abc import Sequence
+from functools import partial
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple, Union
+
+from .element import Element
+
+
+_EPOCH = datetime(1970, 1, 1)
+_NO_UUID = bytes(16)
+
+# Flag bits
+_VISIBLE = 1
+_ENABLED = 2
+_IN_SHADOW = 4
+
+# Attributes whose values repeat across a page; equal values share one string
+INTERNED_ATTRIBUTES = frozenset({
+    'type', 'class', 'role', 'disabled', 'required', 'readonly', 'title', 'aria-label'
+})
+
+# Element fields that are exposed on rows, in Element order
+FIELDS = tuple(Element.__dataclass_fields__)
+
+
+class _StringPool:
+    """Interning table for low-cardinality strings"""
+
+    __slots__ = ('values', 'codes')
+
+    def __init__(self):
+        self.values: List[Optional[str]] = []
+        self.codes: Dict[Optional[str], int] = {}
+
+    def code(self, value: Optional[str]) -> int:
+        code = self.codes.get(value)
+        if code is None:
+            code = self.codes[value] = len(self.values)
+            self.values.append(value)
+        return code
+
+
+class CandidateTable(Sequence):
+    """Append-only columnar table of scanned elements"""
+
+    def __init__(self, page=None):
+        """
+        Args:
+            page: Page the elements were scanned from; needed to rebuild the
+                  locators of rows added with append_scanned()
+        """
+        self.page = page
+
+        self._index = array('q')
+        self._uuid = bytearray()
+        self._tag = array('I')
+        self._type_pool = _StringPool()      # shared by tag, type, strategy, page URL
+        self._strategy = array('I')
+        self._page_url = array('I')
+        self._shape = array('I')
+        self._shapes = _StringPool()         # attribute key tuples
+        self._values: List[Tuple[str, ...]] = []
+        self._interned: Dict[str, str] = {}
+        self._text: List[str] = []
+        self._selector: List[str] = []
+        self._xpath: List[str] = []
+        self._cost = array('d')
+        self._flags = bytearray()
+        self._scanned_at = array('q')        # microseconds since 1970 (naive)
+        self._position = array('q')          # nth() position of the row's tag, -1 if none
+
+        # Per-row values that differ from what is derived or defaulted
+        self._extra: Dict[int, Dict[str, Any]] = {}
+        self._tag_counts: Dict[str, int] = {}
+
+        # Lookup indexes, built on first use and kept up to date by append()
+        self._rows_by_index: Optional[Dict[int, int]] = None
+        self._rows_by_tag: Optional[Dict[int, List[int]]] = None
+        self._rows_by_uuid: Optional[Dict[Union[bytes, str], int]] = None
+        self._rows_by_selector: Optional[Dict[str, int]] = None
+
+    # ------------------------------------------------------------------
+    # Construction
+    # ------------------------------------------------------------------
+
+    @classmethod
+    def from_elements(cls, elements, page=None) -> 'CandidateTable':
+        """Table holding elements as-is (locators are kept, not rebuilt)"""
+        table = cls(page)
+        for element in elements:
+            table.append(element)
+        return table
+
+    @classmethod
+    def from_scan(cls, elements, page) -> 'CandidateTable':
+        """Table of ElementScanner results in scan order (see append_scanned)"""
+        table = cls(page)
+        for element in elements:
+            table.append_scanned(element)
+        return table
+
+    def append_scanned(self, element: Element) -> 'CandidateRow':
+        """
+        Append an element produced by ElementScanner, in scan order
+
+        The scanner locates the k-th element of a type with
+        page.locator(tag).nth(k), so the locator is not stored but rebuilt
+        from the row's tag and its position among earlier rows with that tag.
+        """
+        position = self._tag_counts.get(element.tag, 0)
+        self._tag_counts[element.tag] = position + 1
+        if element.locator is None or self.page is None:
+            return self.append(element)
+        return self.append(element, position)
+
+    def append(self, element: Element, position: Optional[int] = None) -> 'CandidateRow':
+        """Append one element; returns its row view"""
+        row = len(self._index)
+        extra: Dict[str, Any] = {}
+        attributes = element.attributes or {}
+
+        self._index.append(element.index)
+        self._uuid += self._pack_uuid(element.uuid, extra)
+        self._tag.append(self._type_pool.code(element.tag))
+        self._strategy.append(self._type_pool.code(element.strategy_used))
+        self._page_url.append(self._type_pool.code(element.page_url))
+        self._shape.append(self._shapes.code(tuple(attributes)))
+        self._values.append(tuple(
+            self._interned.setdefault(value, value) if key in INTERNED_ATTRIBUTES else value
+            for key, value in attributes.items()
+        ))
+        self._text.append(element.text)
+        self._selector.append(element.selector)
+        self._xpath.append(element.xpath)
+        self._cost.append(math.nan if element.selector_cost is None else element.selector_cost)
+        self._flags.append(
+            (_VISIBLE if element.visible else 0)
+            | (_ENABLED if element.enabled else 0)
+            | (_IN_SHADOW if element.in_shadow else 0)
+        )
+
+        # Derived fields are only stored when they disagree with attributes
+        for field in ('type', 'name', 'id', 'placeholder', 'value'):
+            value = getattr(element, field)
+            if value != attributes.get(field, ''):
+                extra[field] = value
+        if list(element.classes) != self._derive_classes(attributes):
+            extra['classes'] = list(element.classes)
+        if element.disabled != (attributes.get('disabled') is not None):
+            extra['disabled'] = element.disabled
+        if not isinstance(element.visible, bool) or not isinstance(element.enabled, bool):
+            extra['visible'] = element.visible
+            extra['enabled'] = element.enabled
+
+        for field, default in (('path', ''), ('shadow_host', None), ('shadow_path', None),
+                               ('handle', None)):
+            value = getattr(element, field)
+            if value != default:
+                extra[field] = value
+
+        scanned_at = element.scanned_at
+        if isinstance(scanned_at, datetime) and scanned_at.tzinfo is None:
+            delta = scanned_at - _EPOCH
+            self._scanned_at.append(
+                (delta.days * 86400 + delta.seconds) * 1000000 + delta.microseconds
+            )
+        else:
+            self._scanned_at.append(0)
+            extra['scanned_at'] = scanned_at
+
+        if position is not None:
+            self._position.append(position)
+        else:
+            self._position.append(-1)
+            if element.locator is not None:
+                extra['locator'] = element.locator
+
+        if extra:
+            self._extra[row] = extra
+        if self._rows_by_index is not None:
+            self._rows_by_index.setdefault(element.index, row)
+        if self._rows_by_tag is not None:
+            self._rows_by_tag.setdefault(self._tag[row], []).append(row)
+        if self._rows_by_uuid is not None:
+            self._rows_by_uuid.setdefault(self._uuid_key(row), row)
+        if self._rows_by_selector is not None:
+            self._rows_by_selector.setdefault(element.selector, row)
+        return CandidateRow(self, row)
+
+    @staticmethod
+    def _pack_uuid(value: str, extra: Dict[str, Any]) -> bytes:
+        """16 bytes for canonical UUID strings; anything else goes to extra"""
+        try:
+            parsed = uuid_module.UUID(value)
+        except (ValueError, TypeError, AttributeError):
+            parsed = None
+        if parsed is not None and str(parsed) == value:
+            return parsed.bytes
+        extra['uuid'] = value
+        return _NO_UUID
+
+    @staticmethod
+    def _derive_classes(attributes: Dict[str, str]) -> List[str]:
+        return attributes.get('class', '').split() if attributes.get('class') else []
+
+    def _uuid_key(self, row: int) -> Union[bytes, str]:
+        """Hash key of a row's uuid: the packed bytes, or the raw string"""
+        extra = self._extra.get(row)
+        if extra is not None and 'uuid' in extra:
+            return extra['uuid']
+        return bytes(self._uuid[row * 16:row * 16 + 16])
+
+    # ------------------------------------------------------------------
+    # Sequence protocol
+    # ------------------------------------------------------------------
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+    def __getitem__(self, item: Union[int, slice]):
+        if isinstance(item, slice):
+            return [CandidateRow(self, row) for row in range(*item.indices(len(self)))]
+        if item < 0:
+            item += len(self)
+        if not 0 <= item < len(self):
+            raise IndexError("CandidateTable index out of range")
+        return CandidateRow(self, item)
+
+    def __iter__(self) -> Iterator['CandidateRow']:
+        for row in range(len(self)):
+            yield CandidateRow(self, row)
+
+    def __eq__(self, other) -> bool:
+        # Compares row by row with lists, tuples and other tables
+        if other is self:
+            return True
+        if not isinstance(other, Sequence) or isinstance(other, (str, bytes)):
+            return NotImplemented
+        return len(self) == len(other) and all(a == b for a, b in zip(self, other))
+
+    __hash__ = None
+
+    def copy(self) -> List['CandidateRow']:
+        """Rows as a new list (for callers that want to reorder or extend)"""
+        return list(self)
+
+    def to_elements(self) -> List[Element]:
+        """Materialize every row as an Element"""
+        return [row.to_element() for row in self]
+
+    # ------------------------------------------------------------------
+    # Indexed lookups
+    # ------------------------------------------------------------------
+
+    def get(self, index: int) -> Optional['CandidateRow']:
+        """First row whose element index is index, or None"""
+        if self._rows_by_index is None:
+            rows: Dict[int, int] = {}
+            for row, value in enumerate(self._index):
+                rows.setdefault(value, row)
+            self._rows_by_index = rows
+        row = self._rows_by_index.get(index)
+        return None if row is None else CandidateRow(self, row)
+
+    def by_tag(self, tag: str) -> List['CandidateRow']:
+        """Rows with the given tag, in table order"""
+        return [CandidateRow(self, row) for row in self.tag_rows(tag)]
+
+    def tag_rows(self, tag: str) -> List[int]:
+        """Row numbers with the given tag, in table order (do not modify)"""
+        if self._rows_by_tag is None:
+            rows: Dict[int, List[int]] = {}
+            for row, code in enumerate(self._tag):
+                rows.setdefault(code, []).append(row)
+            self._rows_by_tag = rows
+        code = self._type_pool.codes.get(tag)
+        if code is None:
+            return []
+        return self._rows_by_tag.get(code, [])
+
+    def get_by_uuid(self, uuid: str) -> Optional['CandidateRow']:
+        """First row whose element has this uuid, or None"""
+        if self._rows_by_uuid is None:
+            rows: Dict[Union[bytes, str], int] = {}
+            for row in range(len(self)):
+                rows.setdefault(self._uuid_key(row), row)
+            self._rows_by_uuid = rows
+        key: Dict[str, Any] = {}
+        packed = self._pack_uuid(uuid, key)
+        row = self._rows_by_uuid.get(key.get('uuid', packed))
+        return None if row is None else CandidateRow(self, row)
+
+    def contains_uuid(self, uuid: str) -> bool:
+        """Check if a row with this uuid exists"""
+        return self.get_by_uuid(uuid) is not None
+
+    def get_by_selector(self, selector: str) -> Optional['CandidateRow']:
+        """First row with this selector, or None"""
+        if self._rows_by_selector is None:
+            rows: Dict[str, int] = {}
+            for row, value in enumerate(self._selector):
+                rows.setdefault(value, row)
+            self._rows_by_selector = rows
+        row = self._rows_by_selector.get(selector)
+        return None if row is None else CandidateRow(self, row)
+
+    # ------------------------------------------------------------------
+    # Column access
+    # ------------------------------------------------------------------
+
+    def value(self, row: int, field: str) -> Any:
+        """Value of one Element field for one row"""
+        extra = self._extra.get(row)
+        if extra is not None and field in extra:
+            return extra[field]
+
+        getter = _GETTERS.get(field)
+        if getter is None:
+            raise AttributeError(field)
+        return getter(self, row)
+
+    def column_getter(self, field: str) -> Callable[[int], Any]:
+        """
+        Function row -> value of one Element field, for tight loops
+
+        Equivalent to value(row, field) but resolves the field once. Valid
+        for the rows present when it is created.
+        """
+        getter = _GETTERS.get(field)
+        if getter is None:
+            raise AttributeError(field)
+        if field in _DERIVED_ATTRIBUTES:
+            column = self.attribute_getter(field, '')
+        elif field in _POOLED_COLUMNS:
+            pool = self._type_pool.values
+            codes = getattr(self, _POOLED_COLUMNS[field])
+            column = lambda row: pool[codes[row]]
+        elif field in FLAG_BITS:
+            flags = self._flags
+            bit = FLAG_BITS[field]
+            column = lambda row: bool(flags[row] & bit)
+        else:
+            column = partial(getter, self)
+        extra = self._extra
+        if not self.has_overrides(field):
+            return column
+
+        def get(row: int) -> Any:
+            values = extra.get(row)
+            if values is not None and field in values:
+                return values[field]
+            return column(row)
+
+        return get
+
+    def has_overrides(self, field: str) -> bool:
+        """True if some row stores field outside its column"""
+        return any(field in values for values in self._extra.values())
+
+    def raw_columns(self) -> Dict[str, Any]:
+        """
+        Typed column buffers, for bulk evaluation (e.g. as NumPy arrays)
+
+        index (array 'q'), selector_cost (array 'd', NaN for None), tag
+        (array 'I' of tag_code() values) and flags (bytearray of FLAG_BITS).
+        The buffers are live: copy them rather than keep exporting views,
+        since an exported buffer cannot grow.
+        """
+        return {'index': self._index, 'selector_cost': self._cost,
+                'tag': self._tag, 'flags': self._flags}
+
+    def tag_code(self, tag: str) -> Optional[int]:
+        """Code tag has in the tag column, or None if no row can have it"""
+        return self._type_pool.codes.get(tag)
+
+    def attribute_getter(self, name: str, default: Any = None) -> Callable[[int], Any]:
+        """Function row -> attribute(row, name, default), resolved per shape"""
+        shapes = self._shapes.values
+        shape_column = self._shape
+        values = self._values
+        positions: Dict[int, int] = {}
+
+        def get(row: int) -> Any:
+            shape = shape_column[row]
+            position = positions.get(shape)
+            if position is None:
+                keys = shapes[shape]
+                position = positions[shape] = keys.index(name) if name in keys else -1
+            return values[row][position] if position >= 0 else default
+
+        return get
+
+    def attributes(self, row: int) -> Dict[str, str]:
+        """Attribute dict of one row (a fresh copy)"""
+        return dict(zip(self._shapes.values[self._shape[row]], self._values[row]))
+
+    def attribute(self, row: int, name: str, default: Any = None) -> Any:
+        """One attribute value without building the dict"""
+        keys = self._shapes.values[self._shape[row]]
+        try:
+            return self._values[row][keys.index(name)]
+        except ValueError:
+            return default
+
+    def _locator(self, row: int):
+        position = self._position[row]
+        if position < 0 or self.page is None:
+            return None
+        return self.page.locator(self._type_pool.values[self._tag[row]]).nth(position)
+
+    def _uuid_of(self, row: int) -> str:
+        return str(uuid_module.UUID(bytes=bytes(self._uuid[row * 16:row * 16 + 16])))
+
+    def _scanned_at_of(self, row: int) -> datetime:
+        return _EPOCH + timedelta(microseconds=self._scanned_at[row])
+
+
+_POOLED_COLUMNS = {'tag': '_tag', 'strategy_used': '_strategy', 'page_url': '_page_url'}
+FLAG_BITS = {'visible': _VISIBLE, 'enabled': _ENABLED, 'in_shadow': _IN_SHADOW}
+
+
+def _pooled(column: str):
+    return lambda table, row: table._type_pool.values[getattr(table, column)[row]]
+
+
+def _flag(bit: int):
+    return lambda table, row: bool(table._flags[row] & bit)
+
+
+# Fields read from the attribute of the same name unless overridden
+_DERIVED_ATTRIBUTES = frozenset({'type', 'value', 'name', 'id', 'placeholder'})
+
+
+def _attr(name: str):
+    return lambda table, row: table.attribute(row, name, '')
+
+
+_GETTERS = {
+    'index': lambda t, r: t._index[r],
+    'uuid': CandidateTable._uuid_of,
+    'tag': _pooled('_tag'),
+    'type': _attr('type'),
+    'text': lambda t, r: t._text[r],
+    'value': _attr('value'),
+    'attributes': CandidateTable.attributes,
+    'name': _attr('name'),
+    'id': _attr('id'),
+    'classes': lambda t, r: (t.attribute(r, 'class') or '').split(),
+    'placeholder': _attr('placeholder'),
+    'selector': lambda t, r: t._selector[r],
+    'xpath': lambda t, r: t._xpath[r],
+    'path': lambda t, r: '',
+    'selector_cost': lambda t, r: None if math.isnan(t._cost[r]) else t._cost[r],
+    'strategy_used': _pooled('_strategy'),
+    'visible': _flag(_VISIBLE),
+    'enabled': _flag(_ENABLED),
+    'disabled': lambda t, r: t.attribute(r, 'disabled') is not None,
+    'in_shadow': _flag(_IN_SHADOW),
+    'shadow_host': lambda t, r: None,
+    'shadow_path': lambda t, r: None,
+    'locator': CandidateTable._locator,
+    'handle': lambda t, r: None,
+    'scanned_at': CandidateTable._scanned_at_of,
+    'page_url': _pooled('_page_url'),
+}
+assert set(_GETTERS) == set(FIELDS)
+
+
+_set_slot = object.__setattr__
+
+
+class CandidateRow:
+    """Read-only, Element-like view of one CandidateTable row"""
+
+    __slots__ = ('_table', '_row')
+
+    def __init__(self, table: CandidateTable, row: int):
+        _set_slot(self, '_table', table)
+        _set_slot(self, '_row', row)
+
+    def __getattr__(self, name: str) -> Any:
+        # Only reached for Element fields (slots are found normally)
+        if name in _GETTERS:
+            return self._table.value(self._row, name)
+        raise AttributeError(f"'CandidateRow' object has no attribute '{name}'")
+
+    def __setattr__(self, name: str, value: Any):
+        raise AttributeError("CandidateRow is read-only; use to_element() for a mutable copy")
+
+    def to_element(self) -> Element:
+        """Materialize the row as a regular Element"""
+        return Element(**{field: self._table.value(self._row, field) for field in FIELDS})
+
+    def to_dict(self) -> dict:
+        return Element.to_dict(self)
+
+    def __str__(self) -> str:
+        return Element.__str__(self)
+
+    def __repr__(self) -> str:
+        return f"CandidateRow(index={self.index}, tag={self.tag!r}, selector={self.selector!r})"
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, CandidateRow):
+            if other._table is self._table:
+                return other._row == self._row
+            return self.to_element() == other.to_element()
+        if isinstance(other, Element):
+            return self.to_element() == other
+        return NotImplemented
+
+    __hash__ = None
@@ -1,40 +1,69 @@
 """
 ElementCollection data model for Selector CLI
 """
-from typing import List, Dict, Optional, Callable
+from typing import List, Dict, Optional, Callable, ValuesView
 from datetime import datetime
 from .element import Element
 
 
 class ElementCollection:
-    """Collection of elements with filtering and set operations"""
+    """Collection of elements with filtering and set operations
+
+    Elements are kept in an insertion-ordered dict keyed by element index,
+    with secondary indexes by uuid, tag and selector maintained on every
+    add/remove, so membership, lookups and removal are O(1) and the set
+    operations are linear.
+    """
 
     def __init__(self, name: Optional[str] = None):
-        self.elements: List[Element] = []
         self._index: Dict[int, Element] = {}
+        # key -> {element index: element}, in insertion order
+        self._by_uuid: Dict[str, Dict[int, Element]] = {}
+        self._by_tag: Dict[str, Dict[int, Element]] = {}
+        self._by_selector: Dict[str, Dict[int, Element]] = {}
         self.name = name
         self.created_at = datetime.now()
         self.modified_at = datetime.now()
+        self.version = 0  # bumped on every add/remove/clear
+
+    @property
+    def elements(self) -> ValuesView[Element]:
+        """Elements in insertion order (live, read-only view)"""
+        return self._index.values()
 
     def add(self, element: Element) -> None:
         """Add element to collection"""
         if element.index not in self._index:
-            self.elements.append(element)
             self._index[element.index] = element
+            for index, key in self._secondary_keys(element):
+                index.setdefault(key, {})[element.index] = element
             self.modified_at = datetime.now()
+            self.version += 1
 
     def remove(self, element: Element) -> None:
         """Remove element from collection"""
-        if element.index in self._index:
-            self.elements.remove(element)
-            del self._index[element.index]
+        stored = self._index.pop(element.index, None)
+        if stored is not None:
+            for index, key in self._secondary_keys(stored):
+                bucket = index[key]
+                del bucket[stored.index]
+                if not bucket:
+                    del index[key]
             self.modified_at = datetime.now()
+            self.version += 1
+
+    def _secondary_keys(self, element: Element):
+        return ((self._by_uuid, element.uuid), (self._by_tag, element.tag),
+                (self._by_selector, element.selector))
 
     def clear(self) -> None:
         """Clear all elements"""
-        self.elements.clear()
         self._index.clear()
+        self._by_uuid.clear()
+        self._by_tag.clear()
+        self._by_selector.clear()
         self.modified_at = datetime.now()
+        self.version += 1
 
     def filter(self, condition: Callable[[Element], bool]) -> 'ElementCollection':
         """Filter elements by condition, returns new collection"""
@@ -48,21 +77,39 @@ class ElementCollection:
         """Check if element is in collection"""
         return element.index in self._index
 
+    def contains_uuid(self, uuid: str) -> bool:
+        """Check if an element with this UUID is in collection"""
+        return uuid in self._by_uuid
+
     def get(self, index: int) -> Optional[Element]:
         """Get element by index"""
         return self._index.get(index)
 
+    def get_by_uuid(self, uuid: str) -> Optional[Element]:
+        """Get element by UUID"""
+        bucket = self._by_uuid.get(uuid)
+        return next(iter(bucket.values())) if bucket else None
+
+    def get_by_selector(self, selector: str) -> Optional[Element]:
+        """Get the first element added with this selector"""
+        bucket = self._by_selector.get(selector)
+        return next(iter(bucket.values())) if bucket else None
+
+    def get_by_tag(self, tag: str) -> List[Element]:
+        """Get all elements with this tag, in insertion order"""
+        return list(self._by_tag.get(tag, {}).values())
+
     def count(self) -> int:
         """Get element count"""
-        return len(self.elements)
+        return len(self._index)
 
     def get_all(self) -> List[Element]:
         """Get all elements"""
-        return self.elements.copy()
+        return list(self._index.values())
 
     def is_empty(self) -> bool:
         """Check if collection is empty"""
-        return len(self.elements) == 0
+        return not self._index
 
     def union(self, other: 'ElementCollection') -> 'ElementCollection':
         """Union with another collection"""
@@ -106,20 +153,14 @@ class ElementCollection:
 
     def intersect_in_place(self, other: 'ElementCollection') -> None:
         """Intersect with another collection (modifies current collection)"""
-        to_remove = []
-        for elem in self.elements:
-            if not other.contains(elem):
-                to_remove.append(elem)
+        to_remove = [elem for elem in self._index.values() if not other.contains(elem)]
         for elem in to_remove:
             self.remove(elem)
         self.modified_at = datetime.now()
 
     def difference_in_place(self, other: 'ElementCollection') -> None:
         """Difference with another collection (modifies current collection)"""
-        to_remove = []
-        for elem in self.elements:
-            if other.contains(elem):
-                to_remove.append(elem)
+        to_remove = [elem for elem in self._index.values() if other.contains(elem)]
         for elem in to_remove:
             self.remove(elem)
         self.modified_at = datetime.now()
@@ -148,11 +189,11 @@ class ElementCollection:
 
     def __len__(self) -> int:
         """Length of collection"""
-        return len(self.elements)
+        return len(self._index)
 
     def __iter__(self):
         """Iterate over elements"""
-        return iter(self.elements)
+        return iter(self._index.values())
 
     def __str__(self) -> str:
         """String representation"""
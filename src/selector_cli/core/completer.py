@@ -10,7 +10,7 @@ class SelectorCompleter:
 
     # Command keywords
     COMMANDS = [
-        'open', 'scan', 'add', 'remove', 'clear', 'list', 'ls', 'show',
+        'open', 'scan', 'open-many', 'scan-many', 'add', 'remove', 'clear', 'list', 'ls', 'show',
         'count', 'help', 'quit', 'exit', 'q',
         # Phase 3
         'export',
@@ -20,6 +20,8 @@ class SelectorCompleter:
         # Phase 5
         'highlight', 'unhighlight', 'union', 'intersect', 'difference',
         'unique', 'history',
+        # Query planning
+        'explain',
     ]
 
     # Element types
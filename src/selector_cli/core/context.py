@@ -1,11 +1,12 @@
 """
 Execution context for Selector CLI
 """
-from typing import List, Dict, Optional, Any
+from typing import List, Dict, Optional, Any, Iterable, Sequence
 from datetime import datetime
 from pathlib import Path
 from .element import Element
 from .collection import ElementCollection
+from .candidate_table import CandidateTable
 from .browser import BrowserManager
 from .macro import MacroManager
 
@@ -37,8 +38,8 @@ class Context:
         # These will be redirected to v2 layers via properties
 
         # === v2 Three-Layer Architecture ===
-        # candidates: SCAN results (read-only source)
-        self._candidates: List[Element] = []
+        # candidates: SCAN results (read-only source, stored column-wise)
+        self._candidates: CandidateTable = CandidateTable()
 
         # temp: FIND results (current query results)
         self.temp: List[Element] = []
@@ -47,6 +48,9 @@ class Context:
         # Reuses v1 collection for backward compatibility
         self.collection: ElementCollection = ElementCollection()
 
+        # Per-URL SCAN results of open-many/scan-many, in URL order
+        self.page_candidates: Dict[str, CandidateTable] = {}
+
         # Focus tracking (which layer is currently being operated on)
         self._focus: str = 'candidates'  # candidates | temp | workspace
 
@@ -145,20 +149,40 @@ class Context:
         return None
 
     def update_elements(self, elements: List[Element]):
-        """Update all elements from scan"""
-        self.all_elements = elements
+        """Update elements from scan - v1 compatible."""
+        # In v2, scan updates candidates (not temp or workspace)
+        self.candidates = elements
         self.last_scan_time = datetime.now()
+        # Keep workspace intact (don't clear it like v1 did)
 
     def get_element_by_index(self, index: int) -> Optional[Element]:
-        """Get element by index from all elements"""
-        for elem in self.all_elements:
-            if elem.index == index:
-                return elem
-        return None
+        """Get element by index from candidates (indexed lookup)"""
+        return self._candidates.get(index)
 
     def get_elements_by_type(self, elem_type: str) -> List[Element]:
-        """Get all elements of a specific type"""
-        return [elem for elem in self.all_elements if elem.tag == elem_type]
+        """Get all elements of a specific type from candidates (indexed lookup)"""
+        return self._candidates.by_tag(elem_type)
+
+    def page_table(self, url: str) -> Optional[CandidateTable]:
+        """SCAN results of an open-many page (https:// assumed, like open-many)"""
+        table = self.page_candidates.get(url)
+        if table is None and not url.startswith(('http://', 'https://', 'file://')):
+            table = self.page_candidates.get('https://' + url)
+        return table
+
+    def add_candidates(self, elements: Iterable[Element]) -> int:
+        """
+        Append elements to candidates, skipping UUIDs already present
+
+        Returns:
+            Number of elements added
+        """
+        added = 0
+        for elem in elements:
+            if not self._candidates.contains_uuid(elem.uuid):
+                self._candidates.append(elem)
+                added += 1
+        return added
 
     def _load_variables(self):
         """Load variables from JSON file"""
@@ -240,13 +264,15 @@ class Context:
     # ---- v2 Layer Properties ----
 
     @property
-    def candidates(self) -> List[Element]:
-        """Get candidates (SCAN results) - read-only source layer"""
-        return self._candidates.copy()
+    def candidates(self) -> Sequence[Element]:
+        """Get candidates (SCAN results) - read-only view, not a copy"""
+        return self._candidates
 
     @candidates.setter
     def candidates(self, elements: List[Element]):
-        """Set candidates (SCAN results)"""
+        """Set candidates (SCAN results) - a CandidateTable or any elements"""
+        if not isinstance(elements, CandidateTable):
+            elements = CandidateTable.from_elements(elements)
         self._candidates = elements
         self.last_scan_time = datetime.now()
 
@@ -290,24 +316,3 @@ class Context:
             return self.temp
         else:  # workspace
             return list(self.workspace.elements)
-
-    # ---- Element Access Helpers ----
-
-    def update_elements(self, elements: List[Element]):
-        """Update elements from scan - v1 compatible."""
-        # In v2, scan updates candidates (not temp or workspace)
-        self.candidates = elements
-        self.last_scan_time = datetime.now()
-        # Keep workspace intact (don't clear it like v1 did)
-
-    def get_element_by_index(self, index: int) -> Optional[Element]:
-        """Get element by index from candidates."""
-        for elem in self.candidates:
-            if elem.index == index:
-                return elem
-        return None
-
-    def get_elements_by_type(self, elem_type: str) -> List[Element]:
-        """Get all elements of a specific type from candidates."""
-        return [elem for elem in self.candidates if elem.tag == elem_type]
-
@@ -2,9 +2,11 @@
 Element data model for Selector CLI
 """
 from dataclasses import dataclass, field
-from typing import Dict, Optional, List
+from typing import TYPE_CHECKING, Dict, Optional, List
 from datetime import datetime
-from playwright.async_api import Locator, ElementHandle
+
+if TYPE_CHECKING:
+    from playwright.async_api import Locator, ElementHandle
 
 
 @dataclass
@@ -50,8 +52,8 @@ class Element:
     shadow_path: Optional[str] = None
 
     # Playwright
-    locator: Optional[Locator] = None
-    handle: Optional[ElementHandle] = None
+    locator: Optional['Locator'] = None
+    handle: Optional['ElementHandle'] = None
 
     # Metadata
     scanned_at: datetime = field(default_factory=datetime.now)
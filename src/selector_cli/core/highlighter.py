@@ -1,10 +1,12 @@
 """
 Highlighter utility for visual feedback
 """
-from typing import List, Optional, Set
-from playwright.async_api import Page, Locator
+from typing import TYPE_CHECKING, List, Optional, Set
 from .element import Element
 
+if TYPE_CHECKING:
+    from playwright.async_api import Page, Locator
+
 
 class Highlighter:
     """Highlight elements in the browser for visual feedback"""
@@ -24,7 +26,7 @@ class Highlighter:
         'warning': '#ffd43b',  # Yellow
     }
 
-    def __init__(self, page: Page):
+    def __init__(self, page: 'Page'):
         self.page = page
         self.highlighted_selectors: Set[str] = set()
 
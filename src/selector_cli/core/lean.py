@@ -0,0 +1,140 @@
+"""
+Lean browser profile: block resources selector extraction never needs
+
+Images, fonts, media and tracker scripts cost load time and memory but do
+not change which elements a page has or their attributes. With a profile
+installed, every request of a page goes through page.route and blocked
+ones are aborted before they are sent. Service workers are blocked too,
+since requests they make would bypass the route filter, and JavaScript can
+optionally be turned off entirely.
+
+Blocked requests are counted per page. Sizes are known for local files
+(file:// fixtures), so bytes saved are exact there; a remote resource's
+size is unknown without downloading it and is only counted as a request.
+"""
+import os
+from dataclasses import dataclass, field
+from typing import Dict, FrozenSet, Optional, Tuple
+from urllib.parse import urlparse
+
+# Playwright resource types (Request.resource_type)
+RESOURCE_TYPES = frozenset({
+    'document', 'stylesheet', 'image', 'media', 'font', 'script', 'texttrack',
+    'xhr', 'fetch', 'eventsource', 'websocket', 'manifest', 'other',
+})
+
+DEFAULT_BLOCKED_TYPES = frozenset({'image', 'font', 'media'})
+
+# Analytics, ads and session-recording hosts (subdomains included)
+TRACKER_DOMAINS = (
+    'google-analytics.com', 'googletagmanager.com', 'googlesyndication.com',
+    'doubleclick.net', 'facebook.net', 'connect.facebook.com', 'hotjar.com',
+    'segment.io', 'segment.com', 'mixpanel.com', 'fullstory.com', 'amplitude.com',
+    'newrelic.com', 'nr-data.net', 'clarity.ms', 'scorecardresearch.com',
+)
+
+
+@dataclass
+class BlockStats:
+    """Requests a lean page did not load"""
+    by_reason: Dict[str, int] = field(default_factory=dict)  # resource type or 'tracker'
+    bytes_saved: int = 0
+    unknown_size: int = 0  # blocked requests whose size is not known
+
+    @property
+    def requests(self) -> int:
+        return sum(self.by_reason.values())
+
+    def record(self, reason: str, size: Optional[int]):
+        self.by_reason[reason] = self.by_reason.get(reason, 0) + 1
+        if size is None:
+            self.unknown_size += 1
+        else:
+            self.bytes_saved += size
+
+    def clear(self):
+        self.by_reason.clear()
+        self.bytes_saved = 0
+        self.unknown_size = 0
+
+    def merge(self, other: 'BlockStats'):
+        for reason, count in other.by_reason.items():
+            self.by_reason[reason] = self.by_reason.get(reason, 0) + count
+        self.bytes_saved += other.bytes_saved
+        self.unknown_size += other.unknown_size
+
+    def __str__(self) -> str:
+        if not self.requests:
+            return "blocked 0 requests"
+        reasons = ", ".join(f"{count} {reason}" for reason, count
+                            in sorted(self.by_reason.items(), key=lambda item: (-item[1], item[0])))
+        saved = f"{_format_bytes(self.bytes_saved)} saved"
+        if self.unknown_size:
+            saved += f", {self.unknown_size} of unknown size"
+        return f"blocked {self.requests} request(s): {reasons} ({saved})"
+
+
+@dataclass(frozen=True)
+class LeanProfile:
+    """Which requests a lean browser blocks"""
+    resource_types: FrozenSet[str] = DEFAULT_BLOCKED_TYPES
+    domains: Tuple[str, ...] = TRACKER_DOMAINS
+    javascript: bool = True
+
+    def __post_init__(self):
+        unknown = set(self.resource_types) - RESOURCE_TYPES
+        if unknown:
+            raise ValueError(
+                f"Unknown resource type(s): {', '.join(sorted(unknown))}. "
+                f"Use {', '.join(sorted(RESOURCE_TYPES))}"
+            )
+        if 'document' in self.resource_types:
+            raise ValueError("Blocking 'document' would block the page itself")
+
+    def context_options(self) -> Dict[str, object]:
+        """Keyword arguments for Browser.new_context()"""
+        return {'service_workers': 'block', 'java_script_enabled': self.javascript}
+
+    def block_reason(self, url: str, resource_type: str) -> Optional[str]:
+        """Why a request is blocked ('tracker' or its resource type), None if allowed"""
+        host = (urlparse(url).hostname or '').lower()
+        if host and any(host == domain or host.endswith('.' + domain) for domain in self.domains):
+            return 'tracker'
+        if resource_type in self.resource_types:
+            return resource_type
+        return None
+
+    async def install(self, page) -> BlockStats:
+        """Route all of page's requests through the filter; returns its live stats"""
+        stats = BlockStats()
+
+        async def handle(route):
+            request = route.request
+            reason = self.block_reason(request.url, request.resource_type)
+            if reason is None:
+                await route.continue_()
+                return
+            stats.record(reason, _local_size(request.url))
+            await route.abort('blockedbyclient')
+
+        await page.route('**/*', handle)
+        return stats
+
+
+def _local_size(url: str) -> Optional[int]:
+    """Size of a file:// resource, None for remote or missing ones"""
+    parsed = urlparse(url)
+    if parsed.scheme != 'file':
+        return None
+    from urllib.request import url2pathname  # slow to import; local pages only
+    try:
+        return os.path.getsize(url2pathname(parsed.path))
+    except OSError:
+        return None
+
+
+def _format_bytes(size: int) -> str:
+    for unit in ('B', 'KB', 'MB'):
+        if size < 1024 or unit == 'MB':
+            return f"{size} {unit}" if unit == 'B' else f"{size:.1f} {unit}"
+        size /= 1024
@@ -5,9 +5,19 @@ Provides intelligent element locator generation with uniqueness verification
 and cost-based strategy selection.
 """
 
-from .strategy import LocationStrategyEngine, LocationResult
-from .cost import calculate_total_cost, StrategyCost, STRATEGY_COSTS
-from .validator import UniquenessValidator
+from importlib import import_module
+
+# Re-exports are loaded on first access, so importing one submodule
+# (e.g. snapshot) does not load the whole engine
+_EXPORTS = {
+    'LocationStrategyEngine': '.strategy',
+    'LocationResult': '.strategy',
+    'calculate_total_cost': '.cost',
+    'StrategyCost': '.cost',
+    'STRATEGY_COSTS': '.cost',
+    'UniquenessValidator': '.validator',
+    'DOMSnapshot': '.snapshot',
+}
 
 __all__ = [
     'LocationStrategyEngine',
@@ -16,4 +26,13 @@ __all__ = [
     'StrategyCost',
     'STRATEGY_COSTS',
     'UniquenessValidator',
+    'DOMSnapshot',
 ]
+
+
+def __getattr__(name):
+    if name not in _EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(_EXPORTS[name], __name__), name)
+    globals()[name] = value
+    return value
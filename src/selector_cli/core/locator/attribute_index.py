@@ -0,0 +1,117 @@
+"""
+Page-wide attribute frequency index
+
+Counts how often each value of the commonly generated locator attributes
+occurs on a page, collected in one in-page pass. Simple exact-match selectors
+(#id, .class, [attr="value"], tag[attr="value"]) can then be checked for
+uniqueness without another browser round-trip. Anything more complex
+(compound attributes, combinators, pseudo-classes like :has-text) is left to
+the page.
+"""
+import re
+from typing import Dict, List, Optional, Tuple
+
+
+# Attributes counted by the index. All are matched case-sensitively by CSS
+# in HTML documents (unlike e.g. type), so plain string counts are exact.
+INDEXED_ATTRIBUTES = [
+    'id', 'data-testid', 'name', 'placeholder', 'aria-label', 'title', 'href', 'role'
+]
+
+# One pass over every element: counts per attr/value, and per tag/attr/value.
+# Keys are joined with NUL, which cannot occur in tag or attribute names.
+ATTRIBUTE_INDEX_SCRIPT = """
+(attributes) => {
+    const counts = {};
+    const add = (key) => { counts[key] = (counts[key] || 0) + 1; };
+
+    for (const el of document.querySelectorAll('*')) {
+        const tag = el.tagName.toLowerCase();
+        for (const attr of attributes) {
+            const value = el.getAttribute(attr);
+            if (value !== null) {
+                add(attr + '\\u0000' + value);
+                add(tag + '\\u0000' + attr + '\\u0000' + value);
+            }
+        }
+        for (const cls of new Set(el.classList)) {
+            add('class\\u0000' + cls);
+            add(tag + '\\u0000class\\u0000' + cls);
+        }
+    }
+    return counts;
+}
+"""
+
+_IDENT = r'-?[A-Za-z_][\w-]*'
+_TAG = r'[a-z][a-z0-9-]*'
+
+_SIMPLE_SELECTORS = [
+    (re.compile(rf'^(?P<tag>{_TAG})?#(?P<value>{_IDENT})$'), 'id'),
+    (re.compile(rf'^(?P<tag>{_TAG})?\.(?P<value>{_IDENT})$'), 'class'),
+    (re.compile(rf'^(?P<tag>{_TAG})?\[(?P<attr>[\w-]+)="(?P<value>[^"\\]*)"\]$'), None),
+]
+
+
+def parse_simple_selector(selector: str) -> Optional[Tuple[str, str, str]]:
+    """
+    Parse an index-answerable selector
+
+    Returns:
+        (tag or '', attribute, value), or None if the selector is not a single
+        exact match on an indexed attribute or class
+    """
+    for pattern, attr in _SIMPLE_SELECTORS:
+        match = pattern.match(selector)
+        if match:
+            attr = attr or match.group('attr')
+            if attr != 'class' and attr not in INDEXED_ATTRIBUTES:
+                return None
+            return match.group('tag') or '', attr, match.group('value')
+    return None
+
+
+class AttributeIndex:
+    """Frequency of attribute values (and class names) on one page"""
+
+    def __init__(self, counts: Dict[str, int]):
+        # Keys as produced by ATTRIBUTE_INDEX_SCRIPT: "attr\0value" or "tag\0attr\0value"
+        self.counts = counts
+
+    @classmethod
+    async def from_page(cls, page, attributes: List[str] = None) -> 'AttributeIndex':
+        """Build the index with a single page.evaluate call"""
+        counts = await page.evaluate(ATTRIBUTE_INDEX_SCRIPT, attributes or INDEXED_ATTRIBUTES)
+        return cls(counts or {})
+
+    def count(self, selector: str) -> Optional[int]:
+        """Number of elements matching selector, or None if it can't be answered"""
+        parsed = parse_simple_selector(selector)
+        if parsed is None:
+            return None
+        tag, attr, value = parsed
+        key = f"{tag}\0{attr}\0{value}" if tag else f"{attr}\0{value}"
+        return self.counts.get(key, 0)
+
+    def identifies(self, selector: str, target) -> Optional[bool]:
+        """
+        Decide strict uniqueness for target from the index alone
+
+        A selector that matches exactly one element identifies the target iff
+        the target itself carries the matched attribute value.
+
+        Returns:
+            True/False, or None if the selector can't be answered by the index
+        """
+        count = self.count(selector)
+        if count is None:
+            return None
+        if count != 1:
+            return False
+
+        tag, attr, value = parse_simple_selector(selector)
+        if tag and tag != target.tag:
+            return False
+        if attr == 'class':
+            return value in target.classes
+        return target.attributes.get(attr) == value
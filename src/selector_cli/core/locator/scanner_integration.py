@@ -3,11 +3,13 @@ Scanner/Collection Integration Interface
 Connects the LocationStrategyEngine with the element scanner system
 """
 
-from typing import List, Optional, Dict, Any
+from typing import TYPE_CHECKING, List, Optional, Dict, Any
 from ..element import Element
-from ...strategy import LocationStrategyEngine, LocationResult
+from .strategy import LocationStrategyEngine, LocationResult
 from .logging import logger
-from playwright.async_api import Page
+
+if TYPE_CHECKING:
+    from playwright.async_api import Page
 
 
 class LocatorIntegrationEngine:
@@ -30,13 +32,13 @@ class LocatorIntegrationEngine:
             }
         }
 
-    async def process_collection(self, elements: List[Element], page: Page) -> Dict[str, Any]:
+    async def process_collection(self, elements: List[Element], page: 'Page') -> Dict[str, Any]:
         """
         Process a collection of elements and generate locators for each
 
         Args:
             elements: List of elements from scanner
-            page: Playwright page object
+            page: Playwright page object or DOMSnapshot
 
         Returns:
             Dictionary with results and statistics
@@ -59,11 +61,11 @@ class LocatorIntegrationEngine:
 
         results = []
 
-        for idx, element in enumerate(elements):
-            logger.info(f"\n[Element {idx+1}/{len(elements)}] Processing: {element}")
+        # Validate all candidate selectors in one batch (page or DOMSnapshot)
+        locators = await self.strategy_engine.find_best_locators(elements, page)
 
-            # Find best locator
-            result = await self.strategy_engine.find_best_locator(element, page)
+        for idx, (element, result) in enumerate(zip(elements, locators)):
+            logger.info(f"\n[Element {idx+1}/{len(elements)}] Processing: {element}")
 
             if result and result.is_unique:
                 # Success
@@ -0,0 +1,762 @@
+"""
+Offline DOM snapshot for locator generation without a live page
+
+A DOMSnapshot parses serialized HTML (page.content() or a saved file) once and
+indexes elements by id, attribute, class and tag. It answers the CSS and XPath
+forms produced by LocationStrategyEngine and ElementScanner in pure Python, so
+UniquenessValidator and ElementScanner.scan_snapshot can use it in place of a
+Playwright page.
+
+Supported CSS: compound selectors (tag, #id, .class, [attr], [attr op "v"],
+:nth-of-type(n), :first-of-type, :first-child, :last-child, :nth-child(n),
+Playwright's :has-text("...")) joined by descendant, '>', '+', '~' or ','.
+Supported XPath: location paths of '/' and '//' steps with position, @attr,
+@attr='v', contains(text()|.|@attr, 'v') and text()='v' predicates joined by
+'and'. Anything else is reported as unsupported (query returns None).
+"""
+import os
+import re
+import uuid
+from html.parser import HTMLParser
+from typing import Dict, List, Optional, Tuple, Union
+
+
+# Elements that never have content
+VOID_ELEMENTS = frozenset([
+    'area', 'base', 'br', 'col', 'embed', 'hr', 'img', 'input', 'link',
+    'meta', 'param', 'source', 'track', 'wbr',
+])
+
+# Start tags that implicitly close an open element of the listed tags
+IMPLIED_END_TAGS = {
+    'li': {'li'},
+    'option': {'option'},
+    'dt': {'dt', 'dd'},
+    'dd': {'dt', 'dd'},
+    'tr': {'tr', 'td', 'th'},
+    'td': {'td', 'th'},
+    'th': {'td', 'th'},
+}
+
+# Block-level start tags that close an open <p>
+CLOSES_PARAGRAPH = frozenset([
+    'address', 'article', 'aside', 'blockquote', 'div', 'dl', 'fieldset',
+    'footer', 'form', 'h1', 'h2', 'h3', 'h4', 'h5', 'h6', 'header', 'hr',
+    'main', 'nav', 'ol', 'p', 'pre', 'section', 'table', 'ul',
+])
+
+# Elements whose text never renders
+NON_RENDERED = frozenset(['head', 'script', 'style', 'template', 'title', 'noscript'])
+
+# Elements that support the disabled state
+FORM_CONTROLS = frozenset(['button', 'input', 'select', 'textarea', 'optgroup', 'option', 'fieldset'])
+
+
+class UnsupportedSelector(ValueError):
+    """Selector uses syntax the snapshot engine does not implement"""
+
+
+class SnapshotNode:
+    """Element in a DOMSnapshot"""
+
+    __slots__ = ('tag', 'attributes', 'parent', 'children', 'content', 'order', '_text')
+
+    def __init__(self, tag: str, attributes: Dict[str, str], parent: Optional['SnapshotNode']):
+        self.tag = tag
+        self.attributes = attributes
+        self.parent = parent
+        self.children: List['SnapshotNode'] = []                # Element children
+        self.content: List[Union[str, 'SnapshotNode']] = []     # Text and elements in order
+        self.order = -1
+        self._text: Optional[str] = None  # Cached text_content (snapshots are immutable)
+
+    def __repr__(self) -> str:
+        return f"<SnapshotNode {self.tag} #{self.order}>"
+
+    @property
+    def is_element(self) -> bool:
+        return not self.tag.startswith('#')
+
+    @property
+    def classes(self) -> List[str]:
+        return self.attributes.get('class', '').split()
+
+    def append(self, node: 'SnapshotNode'):
+        self.children.append(node)
+        self.content.append(node)
+
+    def append_text(self, text: str):
+        # Keep adjacent text in one node, as the DOM does
+        if self.content and isinstance(self.content[-1], str):
+            self.content[-1] += text
+        else:
+            self.content.append(text)
+
+    def first_text(self) -> Optional[str]:
+        """First direct text node (XPath text() in string context)"""
+        for item in self.content:
+            if isinstance(item, str):
+                return item
+        return None
+
+    def text_content(self) -> str:
+        """Concatenated descendant text, skipping script/style content"""
+        if self._text is None:
+            parts = []
+            stack: List[Union[str, SnapshotNode]] = [self]
+            while stack:
+                item = stack.pop()
+                if isinstance(item, str):
+                    parts.append(item)
+                elif item is self or item.tag not in ('script', 'style'):
+                    stack.extend(reversed(item.content))
+            self._text = ''.join(parts)
+        return self._text
+
+    def inner_text(self) -> str:
+        """Whitespace-collapsed text, approximating innerText without layout"""
+        return ' '.join(self.text_content().split())
+
+    def previous_siblings(self) -> List['SnapshotNode']:
+        """Preceding element siblings, nearest first"""
+        if self.parent is None:
+            return []
+        siblings = self.parent.children
+        return siblings[:siblings.index(self)][::-1]
+
+
+class _SnapshotBuilder(HTMLParser):
+    """Tolerant HTML tree builder on top of html.parser"""
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.root = SnapshotNode('#document', {}, None)
+        self.stack = [self.root]
+
+    def handle_starttag(self, tag, attrs):
+        self._close_implied(tag)
+
+        attributes = {}
+        for name, value in attrs:
+            # First occurrence wins, as in browsers
+            attributes.setdefault(name, value if value is not None else '')
+
+        node = SnapshotNode(tag, attributes, self.stack[-1])
+        self.stack[-1].append(node)
+        if tag not in VOID_ELEMENTS:
+            self.stack.append(node)
+
+    def handle_startendtag(self, tag, attrs):
+        # '/>' is ignored on HTML elements: void elements close anyway and
+        # others stay open until their end tag
+        self.handle_starttag(tag, attrs)
+
+    def handle_endtag(self, tag):
+        for i in range(len(self.stack) - 1, 0, -1):
+            if self.stack[i].tag == tag:
+                del self.stack[i:]
+                return
+        # Stray end tag - ignored
+
+    def handle_data(self, data):
+        self.stack[-1].append_text(data)
+
+    def _close_implied(self, tag: str):
+        closes = IMPLIED_END_TAGS.get(tag, set())
+        if tag in CLOSES_PARAGRAPH:
+            closes = closes | {'p'}
+        while len(self.stack) > 1 and self.stack[-1].tag in closes:
+            self.stack.pop()
+
+
+class DOMSnapshot:
+    """
+    Immutable, indexed copy of a page's DOM
+
+    Attributes:
+        url: Page URL (used as the validation cache namespace)
+        token: Unique per snapshot; validators treat a new token as a new DOM
+        nodes: All elements in document order
+    """
+
+    def __init__(self, html: str, url: str = ''):
+        builder = _SnapshotBuilder()
+        builder.feed(html)
+        builder.close()
+
+        self.root = builder.root
+        self._ensure_body()
+
+        self.url = url or f"snapshot://{uuid.uuid4().hex}"
+        self.token = uuid.uuid4().hex
+
+        self.nodes: List[SnapshotNode] = []
+        self.by_id: Dict[str, List[SnapshotNode]] = {}
+        self.by_tag: Dict[str, List[SnapshotNode]] = {}
+        self.by_class: Dict[str, List[SnapshotNode]] = {}
+        self.by_attribute: Dict[Tuple[str, str], List[SnapshotNode]] = {}
+        self._build_index()
+
+        self._query_cache: Dict[Tuple[str, bool], Optional[List[SnapshotNode]]] = {}
+
+    @classmethod
+    def from_file(cls, path: str, url: Optional[str] = None) -> 'DOMSnapshot':
+        """Load a saved HTML file"""
+        with open(path, 'r', encoding='utf-8') as f:
+            html = f.read()
+        return cls(html, url or 'file://' + os.path.abspath(path))
+
+    @classmethod
+    async def from_page(cls, page) -> 'DOMSnapshot':
+        """Serialize a live Playwright page once"""
+        return cls(await page.content(), page.url)
+
+    def _ensure_body(self):
+        """Wrap fragments in html/body like the browser's parser does"""
+        if any(node.tag == 'html' for node in self.root.children):
+            return
+
+        html = SnapshotNode('html', {}, self.root)
+        body = SnapshotNode('body', {}, html)
+        html.append(body)
+        for item in self.root.content:
+            if isinstance(item, SnapshotNode):
+                item.parent = body
+                body.append(item)
+            else:
+                body.append_text(item)
+        self.root.children = []
+        self.root.content = []
+        self.root.append(html)
+
+    def _build_index(self):
+        stack = list(reversed(self.root.children))
+        while stack:
+            node = stack.pop()
+            node.order = len(self.nodes)
+            self.nodes.append(node)
+
+            self.by_tag.setdefault(node.tag, []).append(node)
+            for name, value in node.attributes.items():
+                self.by_attribute.setdefault((name, value), []).append(node)
+            if node.attributes.get('id'):
+                self.by_id.setdefault(node.attributes['id'], []).append(node)
+            for cls_name in node.classes:
+                self.by_class.setdefault(cls_name, []).append(node)
+
+            stack.extend(reversed(node.children))
+
+    # ------------------------------------------------------------------
+    # Querying
+    # ------------------------------------------------------------------
+
+    def query(self, selector: str, is_xpath: bool = False) -> Optional[List[SnapshotNode]]:
+        """
+        Return elements matching selector in document order
+
+        Returns:
+            List of matching nodes, or None if the selector is not supported
+        """
+        key = (selector, is_xpath)
+        if key not in self._query_cache:
+            try:
+                if is_xpath:
+                    result = self._query_xpath(selector)
+                else:
+                    result = self._query_css(selector)
+            except UnsupportedSelector:
+                result = None
+            self._query_cache[key] = result
+        return self._query_cache[key]
+
+    def count(self, selector: str, is_xpath: bool = False) -> Optional[int]:
+        """Number of matches, or None if the selector is not supported"""
+        nodes = self.query(selector, is_xpath)
+        return None if nodes is None else len(nodes)
+
+    def _query_css(self, selector: str) -> List[SnapshotNode]:
+        groups = _parse_css(selector)
+        matched = {}
+        for parts in groups:
+            for node in self._css_candidates(parts[-1][1]):
+                if _css_matches(node, parts, len(parts) - 1):
+                    matched[node.order] = node
+        return [matched[order] for order in sorted(matched)]
+
+    def _css_candidates(self, compound: dict) -> List[SnapshotNode]:
+        """Narrow the search to the smallest index list for the rightmost compound"""
+        lists = [self.by_id.get(element_id, []) for element_id in compound['ids']]
+        if compound['tag'] != '*':
+            lists.append(self.by_tag.get(compound['tag'], []))
+        lists.extend(self.by_class.get(cls_name, []) for cls_name in compound['classes'])
+        lists.extend(
+            self.by_attribute.get((name, value), [])
+            for name, op, value, ignore_case in compound['attributes']
+            if op == '=' and not ignore_case
+        )
+        return min(lists, key=len) if lists else self.nodes
+
+    def _query_xpath(self, expression: str) -> List[SnapshotNode]:
+        steps = _parse_xpath(expression)
+        context = [self.root]
+
+        for i, (axis, test, predicates) in enumerate(steps):
+            positional = any(p[0] in ('position', 'last') for p in predicates)
+
+            if i == 0 and axis == '//' and not positional:
+                # Fast path for //tag[...]: filter the smallest matching index directly
+                lists = [] if test == '*' else [self.by_tag.get(test, [])]
+                lists.extend(
+                    self.by_attribute.get((name, value), [])
+                    for _, conditions in predicates
+                    for kind, name, value in conditions
+                    if kind == 'attr_eq'
+                )
+                candidates = min(lists, key=len) if lists else self.nodes
+                context = [
+                    n for n in candidates
+                    if (test == '*' or n.tag == test) and all(_xpath_test(n, p) for p in predicates)
+                ]
+                continue
+
+            if axis == '//':
+                context = self._descendants_or_self(context)
+
+            result = {}
+            for node in context:
+                children = [c for c in node.children if test == '*' or c.tag == test]
+                for predicate in predicates:
+                    children = _apply_xpath_predicate(children, predicate)
+                for child in children:
+                    result[child.order] = child
+            context = [result[order] for order in sorted(result)]
+
+        return context
+
+    def _descendants_or_self(self, context: List[SnapshotNode]) -> List[SnapshotNode]:
+        seen = {}
+        for node in context:
+            stack = [node]
+            while stack:
+                current = stack.pop()
+                if id(current) in seen:
+                    continue
+                seen[id(current)] = current
+                stack.extend(current.children)
+        return sorted(seen.values(), key=lambda n: n.order)
+
+    # ------------------------------------------------------------------
+    # Element data (same payload shape as EXTRACT_ELEMENTS_SCRIPT)
+    # ------------------------------------------------------------------
+
+    def extract_elements(self, types: List[str], attributes: List[str]) -> Dict[str, List[dict]]:
+        """
+        Payloads for every element of the given types
+
+        Types whose selector is not supported are omitted.
+        """
+        groups = {}
+        for elem_type in types:
+            nodes = self.query(elem_type)
+            if nodes is None:
+                continue
+            groups[elem_type] = [
+                {
+                    'attributes': {a: node.attributes[a] for a in attributes if a in node.attributes},
+                    'text': node.inner_text()[:200],
+                    'visible': self.is_visible(node),
+                    'enabled': self.is_enabled(node),
+                    'xpath': self.xpath_of(node),
+                }
+                for node in nodes
+            ]
+        return groups
+
+    def is_visible(self, node: SnapshotNode) -> bool:
+        """Best-effort visibility without layout: hidden attributes and inline styles"""
+        if node.tag == 'input' and node.attributes.get('type', '').lower() == 'hidden':
+            return False
+
+        current = node
+        while current is not None and current.is_element:
+            if current.tag in NON_RENDERED or 'hidden' in current.attributes:
+                return False
+            style = current.attributes.get('style', '').replace(' ', '').lower()
+            if 'display:none' in style:
+                return False
+            if current is node and 'visibility:hidden' in style:
+                return False
+            current = current.parent
+        return True
+
+    def is_enabled(self, node: SnapshotNode) -> bool:
+        """Mirror of :not(:disabled) for form controls and disabled fieldsets"""
+        if node.tag not in FORM_CONTROLS:
+            return True
+        if 'disabled' in node.attributes:
+            return False
+
+        current = node.parent
+        while current is not None and current.is_element:
+            if current.tag == 'fieldset' and 'disabled' in current.attributes:
+                return False
+            current = current.parent
+        return True
+
+    def xpath_of(self, node: SnapshotNode) -> str:
+        """XPath in the same format as the scanner's in-page getXPath"""
+        steps = []
+        current = node
+        while current is not None and current.is_element:
+            if current.attributes.get('id'):
+                steps.append(f'//*[@id="{current.attributes["id"]}"]')
+                break
+            if current.tag == 'body':
+                steps.append('/html/body')
+                break
+            same_tag_before = sum(1 for s in current.previous_siblings() if s.tag == current.tag)
+            steps.append(f'/{current.tag}[{same_tag_before + 1}]')
+            current = current.parent
+        return ''.join(reversed(steps))
+
+
+# ----------------------------------------------------------------------
+# CSS
+# ----------------------------------------------------------------------
+
+_CSS_TOKEN = re.compile(r'''
+    (?P<ws>\s+)
+  | (?P<comb>[>+~,])
+  | (?P<tag>\*|[a-zA-Z][\w-]*)
+  | \#(?P<id>(?:[\w-]|\\.)+)
+  | \.(?P<cls>(?:[\w-]|\\.)+)
+  | \[\s*(?P<attr>[\w:-]+)\s*
+        (?:(?P<op>[~|^$*]?=)\s*
+           (?P<value>"(?:[^"\\]|\\.)*"|'(?:[^'\\]|\\.)*'|[^\]\s"']+)\s*
+           (?P<flag>[iIsS])?\s*)?
+    \]
+  | :(?P<pseudo>[\w-]+)(?:\(\s*(?P<arg>"(?:[^"\\]|\\.)*"|'(?:[^'\\]|\\.)*'|[^)]*?)\s*\))?
+''', re.VERBOSE)
+
+_SUPPORTED_PSEUDOS = frozenset([
+    'nth-of-type', 'first-of-type', 'last-of-type', 'nth-child', 'first-child',
+    'last-child', 'has-text',
+])
+
+
+def _unescape(text: str) -> str:
+    return re.sub(r'\\(.)', r'\1', text)
+
+
+def _unquote(text: str) -> str:
+    if len(text) >= 2 and text[0] == text[-1] and text[0] in ('"', "'"):
+        text = text[1:-1]
+    return _unescape(text)
+
+
+def _new_compound() -> dict:
+    return {'tag': '*', 'ids': [], 'classes': [], 'attributes': [], 'pseudos': []}
+
+
+def _parse_css(selector: str) -> List[List[Tuple[str, dict]]]:
+    """Parse into selector groups of (combinator, compound) parts"""
+    groups = []
+    parts: List[Tuple[str, dict]] = []
+    compound = None
+    combinator = ''
+    position = 0
+    text = selector.strip()
+
+    if not text:
+        raise UnsupportedSelector(selector)
+
+    while position < len(text):
+        match = _CSS_TOKEN.match(text, position)
+        if not match:
+            raise UnsupportedSelector(selector)
+        position = match.end()
+        kind = match.lastgroup if match.lastgroup in ('ws', 'comb') else None
+
+        if kind == 'ws':
+            if compound is not None:
+                parts.append((combinator, compound))
+                compound = None
+                combinator = ' '
+            continue
+
+        if kind == 'comb':
+            symbol = match.group('comb')
+            if compound is not None:
+                parts.append((combinator, compound))
+                compound = None
+            elif not parts or symbol == ',':
+                raise UnsupportedSelector(selector)
+            if symbol == ',':
+                groups.append(parts)
+                parts = []
+                combinator = ''
+            else:
+                combinator = symbol
+            continue
+
+        if compound is None:
+            if parts and not combinator:
+                raise UnsupportedSelector(selector)
+            compound = _new_compound()
+
+        if match.group('tag'):
+            if compound['tag'] != '*' or compound['ids'] or compound['classes'] \
+                    or compound['attributes'] or compound['pseudos']:
+                raise UnsupportedSelector(selector)
+            compound['tag'] = match.group('tag').lower()
+        elif match.group('id'):
+            compound['ids'].append(_unescape(match.group('id')))
+        elif match.group('cls'):
+            compound['classes'].append(_unescape(match.group('cls')))
+        elif match.group('attr'):
+            value = match.group('value')
+            compound['attributes'].append((
+                match.group('attr').lower(),
+                match.group('op'),
+                _unquote(value) if value is not None else None,
+                (match.group('flag') or '').lower() == 'i',
+            ))
+        else:
+            name = match.group('pseudo').lower()
+            if name not in _SUPPORTED_PSEUDOS:
+                raise UnsupportedSelector(selector)
+            arg = match.group('arg')
+            compound['pseudos'].append((name, _unquote(arg) if arg is not None else None))
+
+    if compound is None:
+        raise UnsupportedSelector(selector)
+    parts.append((combinator, compound))
+    groups.append(parts)
+    return groups
+
+
+def _attribute_matches(node: SnapshotNode, name: str, op: Optional[str],
+                       value: Optional[str], ignore_case: bool) -> bool:
+    actual = node.attributes.get(name)
+    if actual is None:
+        return False
+    if op is None:
+        return True
+    if ignore_case:
+        actual, value = actual.lower(), value.lower()
+
+    if op == '=':
+        return actual == value
+    if op == '~=':
+        return bool(value) and value in actual.split()
+    if op == '|=':
+        return actual == value or actual.startswith(value + '-')
+    if op == '^=':
+        return bool(value) and actual.startswith(value)
+    if op == '$=':
+        return bool(value) and actual.endswith(value)
+    if op == '*=':
+        return bool(value) and value in actual
+    return False
+
+
+def _position_matches(index: int, arg: Optional[str], selector_name: str) -> bool:
+    arg = (arg or '').strip().lower()
+    if arg == 'odd':
+        return index % 2 == 1
+    if arg == 'even':
+        return index % 2 == 0
+    if arg.isdigit():
+        return index == int(arg)
+    raise UnsupportedSelector(f":{selector_name}({arg})")
+
+
+def _pseudo_matches(node: SnapshotNode, name: str, arg: Optional[str]) -> bool:
+    if name == 'has-text':
+        # Playwright semantics: case-insensitive, whitespace-normalized substring
+        needle = ' '.join((arg or '').split()).lower()
+        return needle in node.inner_text().lower()
+
+    siblings = node.parent.children if node.parent is not None else [node]
+    if name in ('nth-of-type', 'first-of-type', 'last-of-type'):
+        same = [s for s in siblings if s.tag == node.tag]
+        if name == 'first-of-type':
+            return same[0] is node
+        if name == 'last-of-type':
+            return same[-1] is node
+        return _position_matches(same.index(node) + 1, arg, name)
+
+    if name == 'first-child':
+        return siblings[0] is node
+    if name == 'last-child':
+        return siblings[-1] is node
+    return _position_matches(siblings.index(node) + 1, arg, name)
+
+
+def _compound_matches(node: SnapshotNode, compound: dict) -> bool:
+    if not node.is_element:
+        return False
+    if compound['tag'] != '*' and node.tag != compound['tag']:
+        return False
+    for element_id in compound['ids']:
+        if node.attributes.get('id') != element_id:
+            return False
+    if compound['classes']:
+        classes = node.classes
+        if any(c not in classes for c in compound['classes']):
+            return False
+    for name, op, value, ignore_case in compound['attributes']:
+        if not _attribute_matches(node, name, op, value, ignore_case):
+            return False
+    for name, arg in compound['pseudos']:
+        if not _pseudo_matches(node, name, arg):
+            return False
+    return True
+
+
+def _css_matches(node: SnapshotNode, parts: List[Tuple[str, dict]], i: int) -> bool:
+    """Match parts[:i + 1] right-to-left with node as the subject of parts[i]"""
+    combinator, compound = parts[i]
+    if not _compound_matches(node, compound):
+        return False
+    if i == 0:
+        return True
+
+    if combinator == '>':
+        return node.parent is not None and _css_matches(node.parent, parts, i - 1)
+    if combinator == ' ':
+        ancestor = node.parent
+        while ancestor is not None and ancestor.is_element:
+            if _css_matches(ancestor, parts, i - 1):
+                return True
+            ancestor = ancestor.parent
+        return False
+
+    siblings = node.previous_siblings()
+    if combinator == '+':
+        return bool(siblings) and _css_matches(siblings[0], parts, i - 1)
+    if combinator == '~':
+        return any(_css_matches(s, parts, i - 1) for s in siblings)
+    raise UnsupportedSelector(combinator)
+
+
+# ----------------------------------------------------------------------
+# XPath
+# ----------------------------------------------------------------------
+
+_XPATH_STEP = re.compile(r'''
+    (?P<axis>//?)
+    (?P<test>\*|[a-zA-Z][\w-]*)
+    (?P<predicates>(?:\[(?:[^\]'"]|"[^"]*"|'[^']*')*\])*)
+''', re.VERBOSE)
+
+_XPATH_PREDICATE = re.compile(r'''\[((?:[^\]'"]|"[^"]*"|'[^']*')*)\]''')
+
+_XPATH_STRING = r'''(?P<string>"[^"]*"|'[^']*')'''
+
+_XPATH_CONDITIONS = [
+    ('attr_eq', re.compile(r'^@(?P<name>[\w:-]+)\s*=\s*' + _XPATH_STRING + '$')),
+    ('attr', re.compile(r'^@(?P<name>[\w:-]+)$')),
+    ('text_contains', re.compile(r'^contains\(\s*text\(\)\s*,\s*' + _XPATH_STRING + r'\s*\)$')),
+    ('string_contains', re.compile(r'^contains\(\s*\.\s*,\s*' + _XPATH_STRING + r'\s*\)$')),
+    ('attr_contains', re.compile(r'^contains\(\s*@(?P<name>[\w:-]+)\s*,\s*' + _XPATH_STRING + r'\s*\)$')),
+    ('text_eq', re.compile(r'^text\(\)\s*=\s*' + _XPATH_STRING + '$')),
+]
+
+
+def _split_and(expression: str) -> List[str]:
+    """Split on ' and ' outside string literals"""
+    parts = []
+    current = []
+    quote = None
+    i = 0
+    while i < len(expression):
+        c = expression[i]
+        if quote:
+            if c == quote:
+                quote = None
+        elif c in ('"', "'"):
+            quote = c
+        elif expression[i:i + 5] == ' and ':
+            parts.append(''.join(current))
+            current = []
+            i += 5
+            continue
+        current.append(c)
+        i += 1
+    parts.append(''.join(current))
+    return [p.strip() for p in parts]
+
+
+def _parse_xpath_predicate(expression: str) -> tuple:
+    expression = expression.strip()
+    if expression.isdigit():
+        return ('position', int(expression))
+    if expression == 'last()':
+        return ('last', None)
+
+    conditions = []
+    for part in _split_and(expression):
+        for kind, pattern in _XPATH_CONDITIONS:
+            match = pattern.match(part)
+            if match:
+                groups = match.groupdict()
+                string = groups.get('string')
+                conditions.append((kind, groups.get('name'), string[1:-1] if string else None))
+                break
+        else:
+            raise UnsupportedSelector(expression)
+    return ('conditions', conditions)
+
+
+def _parse_xpath(expression: str) -> List[Tuple[str, str, list]]:
+    text = expression.strip()
+    if text.startswith('xpath='):
+        text = text[len('xpath='):]
+    if not text.startswith('/'):
+        raise UnsupportedSelector(expression)
+
+    steps = []
+    position = 0
+    while position < len(text):
+        match = _XPATH_STEP.match(text, position)
+        if not match:
+            raise UnsupportedSelector(expression)
+        position = match.end()
+        predicates = [
+            _parse_xpath_predicate(p)
+            for p in _XPATH_PREDICATE.findall(match.group('predicates'))
+        ]
+        steps.append((match.group('axis'), match.group('test').lower(), predicates))
+    return steps
+
+
+def _xpath_condition(node: SnapshotNode, kind: str, name: Optional[str], value: Optional[str]) -> bool:
+    if kind == 'attr_eq':
+        return node.attributes.get(name) == value
+    if kind == 'attr':
+        return name in node.attributes
+    if kind == 'text_contains':
+        # contains() converts the node-set to the string value of its first node
+        return value in (node.first_text() or '')
+    if kind == 'string_contains':
+        return value in node.text_content()
+    if kind == 'attr_contains':
+        return value in node.attributes.get(name, '')
+    if kind == 'text_eq':
+        return any(isinstance(item, str) and item == value for item in node.content)
+    return False
+
+
+def _xpath_test(node: SnapshotNode, predicate: tuple) -> bool:
+    """Evaluate a non-positional predicate"""
+    return all(_xpath_condition(node, *condition) for condition in predicate[1])
+
+
+def _apply_xpath_predicate(nodes: List[SnapshotNode], predicate: tuple) -> List[SnapshotNode]:
+    kind, argument = predicate
+    if kind == 'position':
+        return nodes[argument - 1:argument] if argument >= 1 else []
+    if kind == 'last':
+        return nodes[-1:]
+    return [n for n in nodes if _xpath_test(n, predicate)]
@@ -5,20 +5,16 @@ Enhanced version with debug logging and performance tracking
 
 from enum import Enum
 from dataclasses import dataclass
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Callable, Tuple
 from ..element import Element
 from .cost import calculate_total_cost, STRATEGY_COSTS, CostCalculator
 from .validator import UniquenessValidator
+import asyncio
+import inspect
 import logging
 
-# Setup logger
+# Level and output are configured by the application (see locator.logging)
 logger = logging.getLogger('locator.strategy')
-logger.setLevel(logging.DEBUG)
-if not logger.handlers:
-    handler = logging.StreamHandler()
-    handler.setLevel(logging.DEBUG)
-    handler.setFormatter(logging.Formatter('[%(levelname)s] %(message)s'))
-    logger.addHandler(handler)
 
 
 class LocatorType(Enum):
@@ -111,6 +107,32 @@ class LocationStrategyEngine:
         self.xpath_strategies = self._load_xpath_strategies()
         self._cache = {}  # For caching validation results
 
+        # Per-tag dispatch tables, compiled once (see _compile_dispatch)
+        self._css_dispatch = self._compile_dispatch(self.css_strategies)
+        self._xpath_dispatch = self._compile_dispatch(self.xpath_strategies)
+
+    @staticmethod
+    def _compile_dispatch(strategies: List[Dict[str, Any]]) -> Dict[str, Tuple[Tuple[str, Callable, bool], ...]]:
+        """Build per-tag ordered (name, generator, is_async) tuples
+
+        Strategies are filtered by applies_to and sorted by priority here, so
+        the per-element loops need no filtering, sorting or reflection. The
+        '*' entry serves every tag that no strategy names explicitly.
+        """
+        ordered = sorted(strategies, key=lambda s: s['priority'].value)
+
+        def table(tag: str) -> Tuple[Tuple[str, Callable, bool], ...]:
+            return tuple(
+                (s['name'], s['generator'], inspect.iscoroutinefunction(s['generator']))
+                for s in ordered
+                if tag in s['applies_to'] or '*' in s['applies_to']
+            )
+
+        tags = {tag for s in ordered for tag in s['applies_to'] if tag != '*'}
+        dispatch = {tag: table(tag) for tag in tags}
+        dispatch['*'] = table('*')
+        return dispatch
+
     def _load_css_strategies(self) -> List[Dict[str, Any]]:
         """Load CSS strategy definitions"""
         return [
@@ -416,53 +438,121 @@ class LocationStrategyEngine:
 
         return None
 
+    async def find_best_locators(self, elements: List[Element], page,
+                                 concurrency: int = 1) -> List[Optional[LocationResult]]:
+        """
+        Find the best locator for many elements with batched validation
+
+        Candidate selectors for every element are generated up front and
+        validated together in one in-page call. The chosen locator per
+        element is the same one find_best_locator would pick: first unique
+        CSS candidate in priority order, then first unique XPath candidate.
+        Selectors the page could not evaluate are validated individually.
+
+        Args:
+            elements: Elements to locate
+            page: Playwright page object
+            concurrency: Max elements whose individual validations run at once
+
+        Returns:
+            List of LocationResult (or None) aligned with elements
+        """
+        plans = []
+        for element in elements:
+            css = await self._generate_candidates(element, page, self._css_dispatch)
+            xpath = await self._generate_candidates(element, page, self._xpath_dispatch)
+            plans.append(
+                [(name, selector, LocatorType.CSS) for name, selector in css] +
+                [(name, selector, LocatorType.XPATH) for name, selector in xpath]
+            )
+
+        logger.debug(f"[BATCH] Validating {sum(len(p) for p in plans)} candidates "
+                     f"for {len(elements)} elements")
+        matrix = await self.validator.validate_batch(page, [
+            (element, [(selector, locator_type == LocatorType.XPATH)
+                       for _, selector, locator_type in plan])
+            for element, plan in zip(elements, plans)
+        ])
+
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def select(element, plan, row):
+            async with semaphore:
+                return await self._select_candidate(element, plan, row, page)
+
+        return list(await asyncio.gather(*(
+            select(element, plan, row) for element, plan, row in zip(elements, plans, matrix)
+        )))
+
+    async def _select_candidate(self, element: Element, plan: List[tuple],
+                                row: List[Optional[bool]], page) -> Optional[LocationResult]:
+        """Pick the first unique candidate, validating unresolved ones individually"""
+        for (name, selector, locator_type), is_unique in zip(plan, row):
+            if is_unique is None:
+                # Not evaluable in page (e.g. :has-text) - validate through Playwright
+                is_unique = await self._validate_selector(
+                    selector, element, page, is_xpath=locator_type == LocatorType.XPATH
+                )
+            if is_unique:
+                logger.debug(f"  [OK]  <{element.tag}> {name:20s} → {selector}")
+                return LocationResult(
+                    type=locator_type,
+                    selector=selector,
+                    strategy=name,
+                    cost=calculate_total_cost(STRATEGY_COSTS[name], selector),
+                    is_unique=True,
+                )
+
+        logger.debug(f"  [FAIL] <{element.tag}> no unique locator")
+        return None
+
+    async def _generate_candidates(self, element: Element, page,
+                                   dispatch: Dict[str, tuple]) -> List[tuple]:
+        """Generate (strategy_name, selector) pairs in priority order"""
+        candidates = []
+        for name, generator, is_async in dispatch.get(element.tag, dispatch['*']):
+            selector = await generator(element, page) if is_async else generator(element)
+            if selector is not None:
+                candidates.append((name, selector))
+        return candidates
+
     async def _try_css_strategies(self, element: Element, page) -> Optional[LocationResult]:
         """Try all CSS strategies in priority order"""
-        # Get strategies that apply to this element type
-        applicable_strategies = [
-            s for s in self.css_strategies
-            if element.tag in s['applies_to'] or '*' in s['applies_to']
-        ]
-
-        # Sort by priority (lower value = higher priority)
-        applicable_strategies.sort(key=lambda s: s['priority'].value)
+        # Strategies that apply to this element type, already in priority order
+        applicable_strategies = self._css_dispatch.get(element.tag, self._css_dispatch['*'])
 
         logger.debug(f"Trying {len(applicable_strategies)} CSS strategies in order...")
         attempted = []
 
-        for strategy in applicable_strategies:
+        for name, generator, is_async in applicable_strategies:
             # Generate selector
-            generator = strategy['generator']
-            if 'page' in __import__('inspect').signature(generator).parameters:
-                selector = await generator(element, page)
-            else:
-                selector = generator(element)
+            selector = await generator(element, page) if is_async else generator(element)
 
             if selector is None:
-                logger.debug(f"  [SKIP] {strategy['name']}: not applicable")
+                logger.debug(f"  [SKIP] {name}: not applicable")
                 continue
 
             # Log attempt
-            logger.debug(f"  [TRY] {strategy['name']:20s} → {selector}")
+            logger.debug(f"  [TRY] {name:20s} → {selector}")
 
             # Try to validate uniqueness
             is_unique = await self._validate_selector(selector, element, page)
 
             if is_unique:
-                cost = calculate_total_cost(STRATEGY_COSTS[strategy['name']], selector)
-                logger.debug(f"  [OK]  {strategy['name']:20s} (cost: {cost:.3f})")
+                cost = calculate_total_cost(STRATEGY_COSTS[name], selector)
+                logger.debug(f"  [OK]  {name:20s} (cost: {cost:.3f})")
                 return LocationResult(
                     type=LocatorType.CSS,
                     selector=selector,
-                    strategy=strategy['name'],
+                    strategy=name,
                     cost=cost,
                     is_unique=True,
                 )
             else:
-                logger.debug(f"  [FAIL] {strategy['name']:20s} (not unique)")
+                logger.debug(f"  [FAIL] {name:20s} (not unique)")
                 attempted.append({
                     'selector': selector,
-                    'strategy': strategy['name'],
+                    'strategy': name,
                     'reason': 'not_unique'
                 })
 
@@ -471,36 +561,27 @@ class LocationStrategyEngine:
 
     async def _try_xpath_strategies(self, element: Element, page) -> Optional[LocationResult]:
         """Try all XPath strategies in priority order"""
-        applicable_strategies = [
-            s for s in self.xpath_strategies
-            if element.tag in s['applies_to'] or '*' in s['applies_to']
-        ]
-
-        applicable_strategies.sort(key=lambda s: s['priority'].value)
+        applicable_strategies = self._xpath_dispatch.get(element.tag, self._xpath_dispatch['*'])
         logger.debug(f"Trying {len(applicable_strategies)} XPath strategies...")
 
-        for strategy in applicable_strategies:
-            generator = strategy['generator']
-            if 'page' in __import__('inspect').signature(generator).parameters:
-                selector = await generator(element, page)
-            else:
-                selector = generator(element)
+        for name, generator, is_async in applicable_strategies:
+            selector = await generator(element, page) if is_async else generator(element)
 
             if selector is None:
                 continue
 
-            logger.debug(f"  [TRY] {strategy['name']:20s} → {selector}")
+            logger.debug(f"  [TRY] {name:20s} → {selector}")
 
             # Validate uniqueness
             is_unique = await self._validate_selector(selector, element, page, is_xpath=True)
 
             if is_unique:
-                cost = calculate_total_cost(STRATEGY_COSTS[strategy['name']], selector)
-                logger.debug(f"  [OK]  {strategy['name']:20s} (cost: {cost:.3f})")
+                cost = calculate_total_cost(STRATEGY_COSTS[name], selector)
+                logger.debug(f"  [OK]  {name:20s} (cost: {cost:.3f})")
                 return LocationResult(
                     type=LocatorType.XPATH,
                     selector=selector,
-                    strategy=strategy['name'],
+                    strategy=name,
                     cost=cost,
                     is_unique=True,
                 )
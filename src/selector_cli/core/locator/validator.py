@@ -5,17 +5,90 @@ Provides multiple levels of validation to ensure a locator uniquely
 identifies the target element without intersecting with other elements.
 """
 
-from typing import TYPE_CHECKING, Optional, Dict
+from typing import TYPE_CHECKING, Optional, Dict, List, Tuple
+from .snapshot import DOMSnapshot
+from .attribute_index import AttributeIndex
 
 if TYPE_CHECKING:
     from ...core.element import Element
 
 
+# In-page batch validation: every distinct selector is resolved once, then
+# each (target, selector) pair is checked for count == 1 and target identity
+# (same tag/type/name/id comparison as matches_target). Selectors the browser
+# cannot evaluate (e.g. Playwright-only :has-text) come back as null.
+VALIDATE_BATCH_SCRIPT = """
+({selectors, targets, pairs}) => {
+    const resolved = selectors.map(([selector, isXpath]) => {
+        try {
+            if (isXpath) {
+                const snapshot = document.evaluate(
+                    selector, document, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null
+                );
+                return {
+                    count: snapshot.snapshotLength,
+                    first: snapshot.snapshotLength ? snapshot.snapshotItem(0) : null
+                };
+            }
+            const nodes = document.querySelectorAll(selector);
+            return {count: nodes.length, first: nodes.length ? nodes[0] : null};
+        } catch (e) {
+            return null;
+        }
+    });
+
+    function isTarget(el, target) {
+        if (!el || el.nodeType !== 1) return false;
+        if (el.tagName.toLowerCase() !== target.tag) return false;
+        if (target.type && el.getAttribute('type') !== target.type) return false;
+        if (target.name && el.getAttribute('name') !== target.name) return false;
+        if (target.id && el.getAttribute('id') !== target.id) return false;
+        return true;
+    }
+
+    return {
+        counts: resolved.map((r) => r ? r.count : null),
+        results: pairs.map(([t, s]) => {
+            const r = resolved[s];
+            if (!r) return null;
+            return r.count === 1 && isTarget(r.first, targets[t]);
+        })
+    };
+}
+"""
+
+# Per-document DOM state: a random token (new for every document, so it
+# changes on navigation/reload) plus a version bumped by a MutationObserver.
+# Highlighting only touches style and data-selector-highlighted, which are
+# ignored so that highlighting does not invalidate cached results.
+PAGE_STATE_SCRIPT = """
+() => {
+    let state = window.__selectorCliState;
+    if (!state) {
+        state = {token: Math.random().toString(36).slice(2), version: 0};
+        const ignored = new Set(['style', 'data-selector-highlighted']);
+        new MutationObserver((records) => {
+            if (records.some((r) => r.type !== 'attributes' || !ignored.has(r.attributeName))) {
+                state.version++;
+            }
+        }).observe(document, {subtree: true, childList: true, attributes: true, characterData: true});
+        window.__selectorCliState = state;
+    }
+    return state.token + ':' + state.version;
+}
+"""
+
+
 class UniquenessValidator:
     """Validates that locators uniquely identify elements"""
 
     def __init__(self):
         self.validation_cache = {}
+        self.hits = 0
+        self.misses = 0
+        self.index_hits = 0
+        self._page_states: Dict[str, str] = {}
+        self._attribute_indexes: Dict[str, AttributeIndex] = {}
 
     async def is_unique(self, selector: str, page, is_xpath: bool = False) -> bool:
         """
@@ -34,8 +107,24 @@ class UniquenessValidator:
         cache_key = f"{page.url}:{selector}:{is_xpath}"
 
         if cache_key in self.validation_cache:
+            self.hits += 1
             return self.validation_cache[cache_key]
 
+        self.misses += 1
+        if isinstance(page, DOMSnapshot):
+            # Offline: unsupported selectors count as not unique
+            result = page.count(selector, is_xpath) == 1
+            self.validation_cache[cache_key] = result
+            return result
+
+        index = None if is_xpath else self._attribute_indexes.get(page.url)
+        count = index.count(selector) if index else None
+        if count is not None:
+            self.index_hits += 1
+            result = count == 1
+            self.validation_cache[cache_key] = result
+            return result
+
         try:
             if is_xpath:
                 locator = page.locator(f"xpath={selector}")
@@ -70,6 +159,10 @@ class UniquenessValidator:
         Returns:
             True if selector matches the target element
         """
+        if isinstance(page, DOMSnapshot):
+            nodes = page.query(selector, is_xpath)
+            return bool(nodes) and self._node_is_target(nodes[0], target_element)
+
         try:
             if is_xpath:
                 matched_locator = page.locator(f"xpath={selector}").first
@@ -134,6 +227,10 @@ class UniquenessValidator:
         if not await self.is_unique(selector, page, is_xpath):
             return False
 
+        # Simple attribute selectors: the index already knows the answer
+        if self._index_identifies(page, selector, is_xpath, target_element):
+            return True
+
         # Level 2: Check it matches target
         if not await self.matches_target(selector, target_element, page, is_xpath):
             return False
@@ -206,13 +303,211 @@ class UniquenessValidator:
 
         return result
 
+    async def validate_batch(self, page,
+                             candidates: List[Tuple['Element', List[Tuple[str, bool]]]]
+                             ) -> List[List[Optional[bool]]]:
+        """
+        Batch strict-uniqueness check for many elements in one round-trip
+
+        Equivalent to calling is_strictly_unique for every candidate selector,
+        but all counts and target checks run inside the page in a single
+        evaluate call. Distinct selectors are resolved only once.
+
+        Args:
+            page: Playwright page object or DOMSnapshot
+            candidates: List of (target_element, [(selector, is_xpath), ...])
+
+        Returns:
+            Match matrix aligned with candidates: True/False per selector, or
+            None where the page could not evaluate the selector (the caller
+            should fall back to is_strictly_unique for those).
+        """
+        matrix: List[List[Optional[bool]]] = [[None] * len(sels) for _, sels in candidates]
+
+        selectors: List[Tuple[str, bool]] = []
+        selector_ids: Dict[Tuple[str, bool], int] = {}
+        targets = []
+        pairs = []
+        slots = []
+
+        for t, (element, element_selectors) in enumerate(candidates):
+            targets.append({
+                'tag': element.tag,
+                'type': element.type or '',
+                'name': element.name or '',
+                'id': element.id or '',
+            })
+            for c, (selector, is_xpath) in enumerate(element_selectors):
+                key = (selector, is_xpath)
+                cached = self.validation_cache.get(f"{page.url}:{selector}:{is_xpath}")
+
+                # Known non-unique selectors need no page work
+                if cached is False:
+                    self.hits += 1
+                    matrix[t][c] = False
+                    continue
+
+                decided = self._index_identifies(page, selector, is_xpath, element)
+                if decided is not None:
+                    self.index_hits += 1
+                    matrix[t][c] = decided
+                    continue
+
+                if cached is not None or key in selector_ids:
+                    self.hits += 1
+                else:
+                    self.misses += 1
+
+                if key not in selector_ids:
+                    selector_ids[key] = len(selectors)
+                    selectors.append(key)
+                pairs.append((t, selector_ids[key]))
+                slots.append((t, c))
+
+        if not pairs:
+            return matrix
+
+        if isinstance(page, DOMSnapshot):
+            response = self._validate_snapshot(page, selectors, candidates, pairs)
+        else:
+            response = await self._evaluate_batch(page, selectors, targets, pairs)
+        if response is None:
+            # Leave everything unresolved so callers use the per-selector path
+            return matrix
+
+        # Remember page-level uniqueness for later single-selector checks
+        for (selector, is_xpath), count in zip(selectors, response['counts']):
+            if count is not None:
+                self.validation_cache[f"{page.url}:{selector}:{is_xpath}"] = count == 1
+
+        for (t, c), result in zip(slots, response['results']):
+            matrix[t][c] = result
+
+        return matrix
+
+    async def _evaluate_batch(self, page, selectors, targets, pairs) -> Optional[dict]:
+        """Run VALIDATE_BATCH_SCRIPT; None if the page could not run it"""
+        try:
+            return await page.evaluate(VALIDATE_BATCH_SCRIPT, {
+                'selectors': [[s, x] for s, x in selectors],
+                'targets': targets,
+                'pairs': [[t, s] for t, s in pairs],
+            })
+        except Exception:
+            return None
+
+    def _index_identifies(self, page, selector: str, is_xpath: bool,
+                          target_element: 'Element') -> Optional[bool]:
+        """Strict uniqueness from the page's attribute index, None if undecidable"""
+        if is_xpath:
+            return None
+        index = self._attribute_indexes.get(page.url)
+        if index is None:
+            return None
+        decided = index.identifies(selector, target_element)
+        if decided is not None:
+            self.validation_cache[f"{page.url}:{selector}:{is_xpath}"] = index.count(selector) == 1
+        return decided
+
+    def _validate_snapshot(self, snapshot: DOMSnapshot, selectors, candidates, pairs) -> dict:
+        """Offline equivalent of VALIDATE_BATCH_SCRIPT (unsupported -> not unique)"""
+        resolved = [snapshot.query(selector, is_xpath) or [] for selector, is_xpath in selectors]
+        return {
+            'counts': [len(nodes) for nodes in resolved],
+            'results': [
+                len(resolved[s]) == 1 and self._node_is_target(resolved[s][0], candidates[t][0])
+                for t, s in pairs
+            ],
+        }
+
+    @staticmethod
+    def _node_is_target(node, target_element: 'Element') -> bool:
+        """Same identity check as matches_target, on a snapshot node"""
+        if node.tag != target_element.tag:
+            return False
+        for attr in ('type', 'name', 'id'):
+            expected = getattr(target_element, attr)
+            if expected and node.attributes.get(attr) != expected:
+                return False
+        return True
+
+    async def sync_page(self, page) -> bool:
+        """
+        Drop cached results for page if its DOM changed since the last sync
+
+        Installs (once per document) a MutationObserver-backed state marker in
+        the page and compares it with the one seen last time. Navigation or
+        reload yields a new document token; DOM mutations bump its version.
+
+        Args:
+            page: Playwright page object
+
+        Returns:
+            True if cached results for the page were kept, False if invalidated
+        """
+        try:
+            if isinstance(page, DOMSnapshot):
+                state = page.token
+            else:
+                state = await page.evaluate(PAGE_STATE_SCRIPT)
+        except Exception:
+            # State unknown - don't trust anything cached for this page
+            state = None
+
+        url = page.url
+        if state is not None and self._page_states.get(url) == state:
+            return True
+
+        self.clear_page(url)
+        if state is not None:
+            self._page_states[url] = state
+        return False
+
+    async def index_page(self, page) -> bool:
+        """
+        Build the attribute frequency index for page (one evaluate call)
+
+        Once indexed, simple selectors such as #id or [name="q"] are answered
+        without touching the page. The index is dropped together with the
+        page's cached results, so call this after sync_page.
+
+        Args:
+            page: Playwright page object
+
+        Returns:
+            True if the page has an index afterwards
+        """
+        if isinstance(page, DOMSnapshot):
+            # Snapshots keep their own attribute indexes
+            return False
+        if page.url in self._attribute_indexes:
+            return True
+        try:
+            self._attribute_indexes[page.url] = await AttributeIndex.from_page(page)
+        except Exception:
+            return False
+        return True
+
+    def clear_page(self, url: str):
+        """Clear cached results for a single page URL"""
+        prefix = f"{url}:"
+        for key in [k for k in self.validation_cache if k.startswith(prefix)]:
+            del self.validation_cache[key]
+        self._page_states.pop(url, None)
+        self._attribute_indexes.pop(url, None)
+
     def clear_cache(self):
         """Clear validation cache"""
         self.validation_cache.clear()
+        self._page_states.clear()
+        self._attribute_indexes.clear()
 
     def cache_stats(self) -> Dict[str, int]:
         """Get cache statistics"""
         return {
             'cache_size': len(self.validation_cache),
+            'hits': self.hits,
+            'misses': self.misses,
+            'index_hits': self.index_hits,
             'cache_keys': list(self.validation_cache.keys())[:10]  # First 10 keys
         }
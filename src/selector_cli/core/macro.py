@@ -17,27 +17,29 @@ class Macro:
         Expand macro commands with provided arguments
         Replace {param1}, {param2}, etc. with actual values
         """
+        param_map = self.bind(arguments)
+        return [self.expand_command(cmd, param_map) for cmd in self.commands]
+
+    def bind(self, arguments: List[str]) -> Dict[str, str]:
+        """
+        Map each {param} placeholder to its argument
+
+        Raises:
+            ValueError: If fewer arguments than parameters are given
+        """
         if len(arguments) < len(self.parameters):
             raise ValueError(
                 f"Macro '{self.name}' expects {len(self.parameters)} parameters "
                 f"({', '.join(self.parameters)}), but got {len(arguments)}"
             )
-
-        # Create parameter mapping
-        param_map = {}
-        for i, param in enumerate(self.parameters):
-            if i < len(arguments):
-                param_map[f"{{{param}}}"] = arguments[i]
-
-        # Replace parameters in all commands
-        expanded_commands = []
-        for cmd in self.commands:
-            expanded_cmd = cmd
-            for param_placeholder, value in param_map.items():
-                expanded_cmd = expanded_cmd.replace(param_placeholder, value)
-            expanded_commands.append(expanded_cmd)
-
-        return expanded_commands
+        return {f"{{{param}}}": arguments[i] for i, param in enumerate(self.parameters)}
+
+    @staticmethod
+    def expand_command(cmd: str, param_map: Dict[str, str]) -> str:
+        """One command with placeholders replaced, in parameter order"""
+        for param_placeholder, value in param_map.items():
+            cmd = cmd.replace(param_placeholder, value)
+        return cmd
 
     def __str__(self):
         if self.parameters:
@@ -0,0 +1,40 @@
+"""
+Live progress output for long-running commands
+"""
+import sys
+import time
+from typing import Optional, TextIO
+
+
+class LiveCounter:
+    """Single-line counter redrawn in place on a terminal (silent otherwise)"""
+
+    def __init__(self, label: str, stream: Optional[TextIO] = None, interval: float = 0.1):
+        """
+        Args:
+            label: Text shown before the count, e.g. "Scanning"
+            stream: Output stream (default: stderr, so piped stdout stays clean)
+            interval: Minimum seconds between redraws
+        """
+        self.label = label
+        self.stream = stream if stream is not None else sys.stderr
+        self.interval = interval
+        self.count = 0
+        self._last_draw = 0.0
+        isatty = getattr(self.stream, 'isatty', None)
+        self.enabled = bool(isatty and isatty())
+
+    def update(self, count: int):
+        """Record the current count, redrawing at most every interval seconds"""
+        self.count = count
+        now = time.monotonic()
+        if self.enabled and now - self._last_draw >= self.interval:
+            self._last_draw = now
+            self.stream.write(f"\r\033[2K{self.label}... {count}")
+            self.stream.flush()
+
+    def close(self):
+        """Erase the counter line"""
+        if self.enabled and self._last_draw:
+            self.stream.write("\r\033[2K")
+            self.stream.flush()
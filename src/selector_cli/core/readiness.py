@@ -0,0 +1,148 @@
+"""
+Page readiness policies: when a navigated page counts as loaded
+
+networkidle waits until no requests have been in flight for 500 ms, which
+pages with analytics beacons, long polling or websockets reach late or
+never. The cheaper policies:
+
+- load               the load event (all subresources fetched)
+- domcontentloaded   the HTML is parsed; scripts may still render
+- selector:<css>     DOMContentLoaded, then an element matching css exists
+- quiet[:ms]         DOMContentLoaded, then no DOM mutation for ms
+                     (default 500) as seen by a MutationObserver
+- networkidle        the load event, then network idle (the default)
+
+Policies are written as strings, e.g. open url --wait "selector:#app".
+"""
+import time
+from dataclasses import dataclass
+from typing import Optional
+
+NETWORKIDLE = 'networkidle'
+LOAD = 'load'
+DOMCONTENTLOADED = 'domcontentloaded'
+SELECTOR = 'selector'
+QUIET = 'quiet'
+
+POLICIES = (NETWORKIDLE, LOAD, DOMCONTENTLOADED, SELECTOR, QUIET)
+
+DEFAULT_QUIET_MS = 500
+
+# Milliseconds allowed for the readiness wait after navigation
+DEFAULT_TIMEOUT = 30000
+
+# Resolves true once the document has gone quietMs without a mutation,
+# false if that never happens within timeoutMs
+DOM_QUIET_SCRIPT = """
+({quietMs, timeoutMs}) => new Promise(resolve => {
+    let timer = null;
+    let limit = null;
+    const observer = new MutationObserver(() => {
+        clearTimeout(timer);
+        timer = setTimeout(() => done(true), quietMs);
+    });
+    const done = (quiet) => {
+        observer.disconnect();
+        clearTimeout(timer);
+        clearTimeout(limit);
+        resolve(quiet);
+    };
+    observer.observe(document, {
+        subtree: true, childList: true, attributes: true, characterData: true
+    });
+    timer = setTimeout(() => done(true), quietMs);
+    limit = setTimeout(() => done(false), timeoutMs);
+})
+"""
+
+
+@dataclass(frozen=True)
+class ReadinessPolicy:
+    """How to wait for a page after goto()/reload()"""
+    kind: str = NETWORKIDLE
+    selector: Optional[str] = None
+    quiet_ms: int = DEFAULT_QUIET_MS
+    timeout: int = DEFAULT_TIMEOUT
+
+    @classmethod
+    def parse(cls, spec: str) -> 'ReadinessPolicy':
+        """
+        Policy from its string form
+
+        Raises:
+            ValueError: If spec is not a known policy
+        """
+        name, _, argument = spec.strip().partition(':')
+        name = name.strip().lower()
+
+        if name in (NETWORKIDLE, LOAD, DOMCONTENTLOADED) and not argument:
+            return cls(name)
+        if name == SELECTOR and argument.strip():
+            return cls(SELECTOR, selector=argument.strip())
+        if name == QUIET:
+            if not argument:
+                return cls(QUIET)
+            if argument.strip().isdigit() and int(argument) > 0:
+                return cls(QUIET, quiet_ms=int(argument))
+            raise ValueError(f"quiet needs a window in milliseconds, e.g. quiet:300 (got '{spec}')")
+        raise ValueError(
+            f"Unknown wait policy '{spec}'. Use networkidle, load, domcontentloaded, "
+            f"selector:<css> or quiet[:ms]"
+        )
+
+    def __str__(self) -> str:
+        if self.kind == SELECTOR:
+            return f"{SELECTOR}:{self.selector}"
+        if self.kind == QUIET and self.quiet_ms != DEFAULT_QUIET_MS:
+            return f"{QUIET}:{self.quiet_ms}"
+        return self.kind
+
+    @property
+    def navigation_event(self) -> str:
+        """Event goto()/reload() themselves wait for"""
+        if self.kind in (LOAD, NETWORKIDLE):
+            return LOAD
+        return DOMCONTENTLOADED
+
+    async def goto(self, page, url: str, timeout: int = 60000) -> float:
+        """
+        Navigate page to url and wait until it is ready
+
+        Returns:
+            Seconds from the start of navigation until the page was ready
+        """
+        started = time.perf_counter()
+        if self.kind == NETWORKIDLE:
+            await page.goto(url, timeout=timeout)
+        else:
+            await page.goto(url, timeout=timeout, wait_until=self.navigation_event)
+        await self.wait(page)
+        return time.perf_counter() - started
+
+    async def reload(self, page) -> float:
+        """Reload page and wait until it is ready; returns seconds taken"""
+        started = time.perf_counter()
+        await page.reload(wait_until=self.navigation_event)
+        await self.wait(page)
+        return time.perf_counter() - started
+
+    async def wait(self, page):
+        """
+        Wait for the policy's condition on an already navigated page
+
+        Raises:
+            TimeoutError (or Playwright's TimeoutError): If the page does not
+                get ready within timeout milliseconds
+        """
+        if self.kind == NETWORKIDLE:
+            await page.wait_for_load_state(NETWORKIDLE, timeout=self.timeout)
+        elif self.kind == SELECTOR:
+            await page.wait_for_selector(self.selector, state='attached', timeout=self.timeout)
+        elif self.kind == QUIET:
+            quiet = await page.evaluate(
+                DOM_QUIET_SCRIPT, {'quietMs': self.quiet_ms, 'timeoutMs': self.timeout}
+            )
+            if not quiet:
+                raise TimeoutError(
+                    f"DOM did not stay quiet for {self.quiet_ms} ms within {self.timeout} ms"
+                )
@@ -1,91 +1,778 @@
 """
 Element scanner for Selector CLI
 """
-from typing import List, Optional, Tuple
-from playwright.async_api import Page, Locator
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, List, Optional, Tuple, Dict, Awaitable, AsyncIterator, TypeVar
 from .element import Element
-from .locator.strategy import LocationStrategyEngine
+from .locator.snapshot import DOMSnapshot
+import asyncio
 import uuid
 
+if TYPE_CHECKING:
+    from playwright.async_api import Page, Locator
+
+T = TypeVar('T')
+
+
+# Attributes copied onto every scanned Element
+SCANNED_ATTRIBUTES = [
+    'type', 'name', 'id', 'class', 'placeholder', 'value', 'href', 'disabled',
+    'required', 'readonly', 'aria-label', 'title', 'data-testid', 'role'
+]
+
+# Shared in-page helpers: positional XPath and element description
+_ELEMENT_HELPERS_JS = """
+    function getXPath(node) {
+        if (node.id) {
+            return `//*[@id="${node.id}"]`;
+        }
+
+        if (node === document.body) {
+            return '/html/body';
+        }
+
+        let ix = 0;
+        const siblings = node.parentNode ? node.parentNode.childNodes : [];
+
+        for (let i = 0; i < siblings.length; i++) {
+            const sibling = siblings[i];
+            if (sibling === node) {
+                const tagName = node.tagName.toLowerCase();
+                return getXPath(node.parentNode) + '/' + tagName + '[' + (ix + 1) + ']';
+            }
+            if (sibling.nodeType === 1 && sibling.tagName === node.tagName) {
+                ix++;
+            }
+        }
+        return '';
+    }
+
+    function isVisible(el) {
+        const rect = el.getBoundingClientRect();
+        const style = window.getComputedStyle(el);
+        return rect.width > 0 && rect.height > 0 && style.visibility !== 'hidden';
+    }
+
+    function describeState(el) {
+        return {
+            visible: isVisible(el),
+            enabled: !el.matches(':disabled'),
+            xpath: getXPath(el) || ''
+        };
+    }
+
+    function textOf(el) {
+        const text = el.innerText !== undefined ? el.innerText : el.textContent;
+        return (text || '').trim().slice(0, 200);
+    }
+
+    function describe(el) {
+        const attrs = {};
+        for (const name of attributes) {
+            const value = el.getAttribute(name);
+            if (value !== null) {
+                attrs[name] = value;
+            }
+        }
+
+        return Object.assign({
+            attributes: attrs,
+            text: textOf(el)
+        }, describeState(el));
+    }
+"""
+
+# In-page extraction used by batch scans: describes the elements of every
+# requested type (attributes, text, state and XPath) in one payload. With
+# offset/limit only positions [offset, offset + limit) of each type are
+# described, so large pages are extracted a chunk at a time. Each group either
+# carries 'total' and 'elements' or 'error' (invalid selector etc.).
+EXTRACT_ELEMENTS_SCRIPT = """
+({types, attributes, offset, limit}) => {
+""" + _ELEMENT_HELPERS_JS + """
+    const start = offset || 0;
+    return types.map((type) => {
+        try {
+            const nodes = document.querySelectorAll(type);
+            const end = limit == null ? nodes.length : Math.min(nodes.length, start + limit);
+            const elements = [];
+            for (let i = start; i < end; i++) {
+                elements.push(describe(nodes[i]));
+            }
+            return {type: type, total: nodes.length, elements: elements};
+        } catch (e) {
+            return {type: type, error: String(e)};
+        }
+    });
+}
+"""
+
+# In-page FIND: walks every element of every requested type, keeps those
+# matching an optional CSS selector and an optional filter tree (see
+# selector_cli.query.pushdown), and describes only the matches. Positions are
+# per type; 'index' in the filter counts across types like find's indices.
+FIND_ELEMENTS_SCRIPT = """
+({types, attributes, css, filter}) => {
+""" + _ELEMENT_HELPERS_JS + """
+    function fieldValue(field, el, type, index) {
+        switch (field.kind) {
+            case 'attr': {
+                const value = el.getAttribute(field.name);
+                return value === null ? field.default : value;
+            }
+            case 'tag': return type;
+            case 'text': return textOf(el).trim().slice(0, 100);
+            case 'visible': return isVisible(el);
+            case 'enabled': return !el.matches(':disabled');
+            case 'disabled': return el.getAttribute('disabled') !== null;
+            case 'index': return index;
+        }
+        return '';
+    }
+
+    // str() of a Python bool/int/str
+    function pyStr(value) {
+        return typeof value === 'boolean' ? (value ? 'True' : 'False') : String(value);
+    }
+
+    function test(node, el, type, index) {
+        switch (node.op) {
+            case 'and': return node.args.every((arg) => test(arg, el, type, index));
+            case 'or': return node.args.some((arg) => test(arg, el, type, index));
+            case 'not': return !test(node.arg, el, type, index);
+        }
+        let value = fieldValue(node.field, el, type, index);
+        if (node.text) {
+            value = pyStr(value);
+        }
+        const expected = node.value;
+        switch (node.test) {
+            case 'eq': return value === expected;
+            case 'ne': return value !== expected;
+            case 'contains': return value.includes(expected);
+            case 'starts': return value.startsWith(expected);
+            case 'ends': return value.endsWith(expected);
+            case 'gt': return value > expected;
+            case 'gte': return value >= expected;
+            case 'lt': return value < expected;
+            case 'lte': return value <= expected;
+        }
+        return false;
+    }
+
+    let index = 0;
+    return types.map((type) => {
+        let nodes;
+        try {
+            nodes = document.querySelectorAll(type);
+        } catch (e) {
+            return {type: type, error: String(e)};
+        }
+        const matches = [];
+        nodes.forEach((el, position) => {
+            if ((!css || el.matches(css)) && (!filter || test(filter, el, type, index + position))) {
+                matches.push(Object.assign({position: position}, describe(el)));
+            }
+        });
+        index += nodes.length;
+        return {type: type, total: nodes.length, matches: matches};
+    });
+}
+"""
+
+# In-page extraction for incremental scans. A MutationObserver (installed once
+# per document) collects changed nodes; every element gets a stable key from a
+# WeakMap. Elements whose key the caller already knows (same token) and whose
+# subtree did not change come back as {key, visible, enabled, xpath} only -
+# everything else gets the full description plus its key. Highlight-only
+# attribute changes are ignored, like in PAGE_STATE_SCRIPT.
+INCREMENTAL_EXTRACT_SCRIPT = """
+({types, attributes, token, known}) => {
+""" + _ELEMENT_HELPERS_JS + """
+    let state = window.__selectorCliScan;
+    if (!state) {
+        state = {
+            token: Math.random().toString(36).slice(2),
+            keys: new WeakMap(),
+            next: 0,
+            changed: new Set()
+        };
+        const ignored = new Set(['style', 'data-selector-highlighted']);
+        new MutationObserver((records) => {
+            for (const r of records) {
+                if (r.type !== 'attributes' || !ignored.has(r.attributeName)) {
+                    state.changed.add(r.target);
+                }
+            }
+        }).observe(document, {subtree: true, childList: true, attributes: true, characterData: true});
+        window.__selectorCliScan = state;
+    }
+
+    // An element is dirty if a mutation happened on it or inside its subtree
+    const dirty = new Set();
+    for (const node of state.changed) {
+        for (let n = node; n && !dirty.has(n); n = n.parentNode) {
+            dirty.add(n);
+        }
+    }
+    state.changed.clear();
+    const reuse = new Set(state.token === token ? known : []);
+
+    function entry(el) {
+        let key = state.keys.get(el);
+        if (key === undefined) {
+            key = state.next++;
+            state.keys.set(el, key);
+        }
+        const data = reuse.has(key) && !dirty.has(el) ? describeState(el) : describe(el);
+        data.key = key;
+        return data;
+    }
+
+    return {
+        token: state.token,
+        groups: types.map((type) => {
+            try {
+                return {type: type, elements: Array.from(document.querySelectorAll(type), entry)};
+            } catch (e) {
+                return {type: type, error: String(e)};
+            }
+        })
+    };
+}
+"""
+
+
+@dataclass
+class _IncrementalState:
+    """What an incremental scan remembers about one page"""
+    token: str
+    element_types: List[str]
+    elements: Dict[Tuple[str, int], Element]  # (type, in-page key) -> element
+    next_index: int
+
 
 class ElementScanner:
     """Scan page for elements"""
 
     DEFAULT_ELEMENT_TYPES = ['input', 'button', 'a', 'select', 'textarea']
 
+    # Maximum number of elements processed at the same time
+    DEFAULT_CONCURRENCY = 8
+
+    # Elements per scan_iter chunk (one batch validation round-trip each)
+    STREAM_CHUNK_SIZE = 32
+
+    # Elements per type described by one extraction round-trip of scan_iter
+    EXTRACT_CHUNK_SIZE = 256
+
+    def __init__(self, batch: bool = True, concurrency: int = DEFAULT_CONCURRENCY):
+        """
+        Args:
+            batch: Extract all elements with a single in-page script. When False
+                   (or when the script fails) every element is read through
+                   individual locator round-trips.
+            concurrency: Maximum number of element builds / locator searches
+                         in flight at once (1 = sequential).
+        """
+        if concurrency < 1:
+            raise ValueError("concurrency must be at least 1")
+        self.batch = batch
+        self.concurrency = concurrency
+
+        # One engine for the scanner's lifetime so the validation cache is
+        # shared across elements and scans (invalidated per page by sync_page).
+        # Imported here so query modules can use SCANNED_ATTRIBUTES without it.
+        from .locator.strategy import LocationStrategyEngine
+        self.strategy_engine = LocationStrategyEngine()
+
+        # Incremental scan state per page URL, and how many elements the last
+        # incremental scan carried over unchanged
+        self._incremental: Dict[str, _IncrementalState] = {}
+        self.last_reused = 0
+
     async def scan(
         self,
-        page: Page,
+        page: 'Page',
         element_types: List[str] = None,
-        deep: bool = False
+        deep: bool = False,
+        concurrency: Optional[int] = None,
+        incremental: bool = False
     ) -> List[Element]:
-        """Scan page and return elements"""
+        """Scan page and return elements
+
+        Elements are processed concurrently (bounded by concurrency, which
+        defaults to the scanner's setting) but always returned in index order.
+
+        With incremental=True only elements added or changed since the last
+        incremental scan of the page are rebuilt; unchanged elements are
+        returned as the same Element objects (same index and uuid). The first
+        incremental scan of a page is a full scan.
+        """
 
         if element_types is None:
             element_types = self.DEFAULT_ELEMENT_TYPES
+        if concurrency is None:
+            concurrency = self.concurrency
+        if concurrency < 1:
+            raise ValueError("concurrency must be at least 1")
 
-        elements = []
+        if incremental and self.batch:
+            elements = await self._scan_incremental(page, list(element_types), concurrency)
+            if elements is not None:
+                return elements
+
+        return [element async for element in self.scan_iter(page, element_types, concurrency)]
+
+    async def scan_iter(
+        self,
+        page: 'Page',
+        element_types: List[str] = None,
+        concurrency: Optional[int] = None
+    ) -> AsyncIterator[Element]:
+        """Scan page, yielding elements in index order as they are finished
+
+        Same elements as scan(). The page is extracted EXTRACT_CHUNK_SIZE
+        elements per type at a time and built in chunks of STREAM_CHUNK_SIZE,
+        so the first results arrive after one chunk instead of the whole page
+        and memory holds one extraction chunk, not the page. Consumers writing
+        straight to a file never hold the full list.
+
+        Elements added or removed while a large page is being extracted can
+        shift the positions later chunks start at.
+        """
+        if element_types is None:
+            element_types = self.DEFAULT_ELEMENT_TYPES
+        if concurrency is None:
+            concurrency = self.concurrency
+        if concurrency < 1:
+            raise ValueError("concurrency must be at least 1")
+
+        # A full scan hands out new indices/uuids, so forget the old mapping
+        self._incremental.pop(page.url, None)
+
+        await self.sync_page(page)
+        # Lets simple attribute selectors skip the browser during validation
+        await self.strategy_engine.validator.index_page(page)
+
+        extract = self.EXTRACT_CHUNK_SIZE
+        groups = await self._extract_batch(page, element_types, limit=extract) \
+            if self.batch else None
+
+        chunk = self.STREAM_CHUNK_SIZE
         index = 0
 
         for elem_type in element_types:
-            # Query elements
-            locators = await page.locator(elem_type).all()
+            group = groups.get(elem_type) if groups else None
+            done = 0
+
+            # Batch path: one extraction chunk at a time, selectors validated per chunk
+            while group is not None:
+                total, payloads = group
+                for start in range(0, len(payloads), chunk):
+                    for element in await self._elements_from_payloads(
+                        page, elem_type, payloads[start:start + chunk], index + done + start,
+                        concurrency, first_position=done + start
+                    ):
+                        yield element
+                done += len(payloads)
+                if not payloads or done >= total:
+                    break
+                more = await self._extract_batch(page, [elem_type], offset=done, limit=extract)
+                group = more.get(elem_type) if more else None
+            else:
+                # Fallback: per-element round-trips (for the rest, if a later chunk failed)
+                locators = await page.locator(elem_type).all()
+
+                for start in range(done, len(locators), chunk):
+                    for element in await self._gather_bounded([
+                        self._build_element(locator, index + start + position, elem_type,
+                                            page.url, page)
+                        for position, locator in enumerate(locators[start:start + chunk])
+                    ], concurrency):
+                        yield element
+                done = max(done, len(locators))
+
+            index += done
+
+    async def scan_snapshot(
+        self,
+        snapshot: DOMSnapshot,
+        element_types: List[str] = None,
+        concurrency: Optional[int] = None
+    ) -> List[Element]:
+        """Scan an offline DOMSnapshot - same elements as scan(), no browser needed
+
+        Elements have no Playwright locator; visibility is estimated from
+        markup since there is no layout.
+        """
+        if element_types is None:
+            element_types = self.DEFAULT_ELEMENT_TYPES
+        if concurrency is None:
+            concurrency = self.concurrency
+        if concurrency < 1:
+            raise ValueError("concurrency must be at least 1")
+
+        await self.sync_page(snapshot)
+        groups = snapshot.extract_elements(element_types, SCANNED_ATTRIBUTES)
+
+        elements = []
+        for elem_type in element_types:
+            payloads = groups.get(elem_type, [])
+            elements.extend(await self._elements_from_payloads(
+                snapshot, elem_type, payloads, len(elements), concurrency
+            ))
+        return elements
+
+    async def find(
+        self,
+        page: 'Page',
+        element_types: List[str],
+        css: str = '',
+        filter: Optional[dict] = None,
+        concurrency: Optional[int] = None
+    ) -> List[Element]:
+        """Elements of the given types that pass an in-page filter
+
+        Only matching elements are described and sent back (one round-trip),
+        then located like scanned ones. css is a selector each element must
+        match; filter is a tree in FIND_ELEMENTS_SCRIPT's format. Element
+        indices count all elements of the requested types, matching or not.
+
+        Raises:
+            ValueError: If an element type is not a valid selector
+        """
+        if concurrency is None:
+            concurrency = self.concurrency
+        if concurrency < 1:
+            raise ValueError("concurrency must be at least 1")
+
+        await self.sync_page(page)
+        groups = await page.evaluate(FIND_ELEMENTS_SCRIPT, {
+            'types': list(element_types), 'attributes': SCANNED_ATTRIBUTES,
+            'css': css, 'filter': filter,
+        })
+
+        elements = []
+        offset = 0
+        for group in groups:
+            if 'error' in group:
+                raise ValueError(f"Invalid element type '{group['type']}': {group['error']}")
+            matches = group['matches']
+            positions = [match['position'] for match in matches]
+            found = await self._elements_from_payloads(
+                page, group['type'], matches, 0, concurrency, positions=positions
+            )
+            for element, position in zip(found, positions):
+                element.index = offset + position
+            elements.extend(found)
+            offset += group['total']
+        return elements
 
-            for locator in locators:
-                # Build Element object
-                element = await self._build_element(locator, index, elem_type, page.url, page)
-                elements.append(element)
-                index += 1
+    async def _scan_incremental(
+        self,
+        page: 'Page',
+        element_types: List[str],
+        concurrency: int
+    ) -> Optional[List[Element]]:
+        """Rebuild only new or changed elements; None if a full scan is needed"""
+        await self.sync_page(page)
+        await self.strategy_engine.validator.index_page(page)
+
+        state = self._incremental.get(page.url)
+        if state is not None and state.element_types != element_types:
+            state = None
 
+        try:
+            response = await page.evaluate(INCREMENTAL_EXTRACT_SCRIPT, {
+                'types': element_types,
+                'attributes': SCANNED_ATTRIBUTES,
+                'token': state.token if state else None,
+                'known': sorted({key for _, key in state.elements}) if state else [],
+            })
+        except Exception:
+            return None
+        groups = response.get('groups') or []
+        if any('elements' not in group for group in groups):
+            return None
+
+        # A new document token means new keys: nothing carries over
+        previous = state.elements if state and state.token == response['token'] else {}
+        next_index = state.next_index if previous else 0
+
+        # slots: (key, type, position); entries are either a kept Element or a payload
+        slots = []
+        kept = {}
+        rebuild = {}
+        for group in groups:
+            elem_type = group['type']
+            for position, entry in enumerate(group['elements']):
+                key = (elem_type, entry['key'])
+                slots.append((key, elem_type, position))
+                element = previous.get(key)
+                if element is not None and 'attributes' not in entry:
+                    # Unchanged content; layout-dependent state is always fresh
+                    element.visible = bool(entry.get('visible', True))
+                    element.enabled = bool(entry.get('enabled', True))
+                    element.xpath = entry.get('xpath') or ''
+                    element.locator = page.locator(elem_type).nth(position)
+                    kept[key] = element
+                else:
+                    rebuild[key] = entry
+
+        # Other changes may have made a kept selector ambiguous
+        for key in await self._stale_selectors(page, kept):
+            rebuild[key] = self._payload_of(kept.pop(key))
+
+        # Re-processed nodes keep their index; brand new ones get fresh indices
+        indices = {}
+        for key, _, _ in slots:
+            if key in previous:
+                indices[key] = previous[key].index
+            elif key in rebuild:
+                indices[key] = next_index
+                next_index += 1
+
+        positions = {key: (elem_type, position) for key, elem_type, position in slots}
+        keys = [key for key, _, _ in slots if key in rebuild]
+        candidates = [
+            self._candidate_element(rebuild[key], indices[key], positions[key][0]) for key in keys
+        ]
+        results = await self.strategy_engine.find_best_locators(
+            candidates, page, concurrency=concurrency
+        )
+        built = await self._gather_bounded([
+            self._finish_element(
+                rebuild[key], candidate, result,
+                page.locator(positions[key][0]).nth(positions[key][1]), page.url, page
+            )
+            for key, candidate, result in zip(keys, candidates, results)
+        ], concurrency)
+        built = dict(zip(keys, built))
+
+        elements = [kept.get(key) or built[key] for key, _, _ in slots]
+        self._incremental[page.url] = _IncrementalState(
+            token=response['token'],
+            element_types=element_types,
+            elements={key: element for (key, _, _), element in zip(slots, elements)},
+            next_index=next_index,
+        )
+        self.last_reused = len(kept)
         return elements
 
+    async def _stale_selectors(self, page: 'Page', kept: Dict[tuple, Element]) -> List[tuple]:
+        """Keys of kept elements whose selector no longer strictly identifies them"""
+        keys = list(kept)
+        validator = self.strategy_engine.validator
+        matrix = await validator.validate_batch(page, [
+            (kept[key], [(kept[key].selector, self._is_xpath(kept[key].selector))]) for key in keys
+        ])
+
+        stale = []
+        for key, (result,) in zip(keys, matrix):
+            element = kept[key]
+            if result is None:
+                result = await validator.is_strictly_unique(
+                    element.selector, element, page, self._is_xpath(element.selector)
+                )
+            if not result:
+                stale.append(key)
+        return stale
+
+    @staticmethod
+    def _is_xpath(selector: str) -> bool:
+        return selector.startswith(('/', '('))
+
+    @staticmethod
+    def _payload_of(element: Element) -> dict:
+        """Extraction payload equivalent of an already built element"""
+        return {
+            'attributes': dict(element.attributes),
+            'text': element.text,
+            'visible': element.visible,
+            'enabled': element.enabled,
+            'xpath': element.xpath,
+        }
+
+    async def _elements_from_payloads(
+        self,
+        page,
+        elem_type: str,
+        payloads: List[dict],
+        start_index: int,
+        concurrency: int,
+        first_position: int = 0,
+        positions: Optional[List[int]] = None
+    ) -> List[Element]:
+        """Locate and build elements for one type's extracted payloads
+
+        first_position is the position of payloads[0] among all elements of
+        elem_type on the page (used for the element's nth() locator);
+        positions gives each payload's position instead when they are not
+        consecutive (filtered results).
+        """
+        if positions is None:
+            positions = range(first_position, first_position + len(payloads))
+        candidates = [
+            self._candidate_element(payload, start_index + position, elem_type)
+            for position, payload in enumerate(payloads)
+        ]
+        results = await self.strategy_engine.find_best_locators(
+            candidates, page, concurrency=concurrency
+        )
+
+        live = not isinstance(page, DOMSnapshot)
+        return await self._gather_bounded([
+            self._finish_element(
+                payload, candidates[position], results[position],
+                page.locator(elem_type).nth(positions[position]) if live else None,
+                page.url, page
+            )
+            for position, payload in enumerate(payloads)
+        ], concurrency)
+
+    async def sync_page(self, page: 'Page') -> bool:
+        """Invalidate cached selector validations if the page's DOM changed
+
+        Returns:
+            True if cached results were kept
+        """
+        return await self.strategy_engine.validator.sync_page(page)
+
+    def cache_stats(self) -> Dict[str, int]:
+        """Validation cache statistics (size, hits, misses)"""
+        return self.strategy_engine.validator.cache_stats()
+
+    @staticmethod
+    async def _gather_bounded(coros: List[Awaitable[T]], concurrency: int) -> List[T]:
+        """Await coroutines with at most concurrency running; results keep input order"""
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def run(coro):
+            async with semaphore:
+                return await coro
+
+        return list(await asyncio.gather(*(run(coro) for coro in coros)))
+
+    async def _extract_batch(
+        self,
+        page: 'Page',
+        element_types: List[str],
+        offset: int = 0,
+        limit: Optional[int] = None
+    ) -> Optional[Dict[str, Tuple[int, List[dict]]]]:
+        """Extract elements of the given types in one page round-trip
+
+        offset/limit select positions [offset, offset + limit) of each type
+        (default: all elements).
+
+        Returns:
+            Mapping of element type to (number of elements of the type on the
+            page, payloads). Types whose query failed in the page are omitted
+            so the caller falls back for them. None if the script could not
+            run at all.
+        """
+        try:
+            groups = await page.evaluate(
+                EXTRACT_ELEMENTS_SCRIPT,
+                {'types': list(element_types), 'attributes': SCANNED_ATTRIBUTES,
+                 'offset': offset, 'limit': limit}
+            )
+        except Exception:
+            return None
+
+        result = {}
+        for group in groups or []:
+            if 'elements' in group:
+                elements = group['elements']
+                result[group['type']] = (group.get('total', offset + len(elements)), elements)
+        return result
+
     async def _build_element(
         self,
         locator,
         index: int,
         elem_type: str,
         page_url: str,
-        page: Page
+        page: 'Page'
     ) -> Element:
         """Build Element object from Playwright locator using LocationStrategyEngine"""
+        payload = await self._extract_element(locator)
+        return await self._element_from_payload(payload, locator, index, elem_type, page_url, page)
 
-        # Get basic properties
-        tag = elem_type
+    async def _extract_element(self, locator) -> dict:
+        """Read element data through individual locator calls (fallback path)
+
+        Produces the same payload shape as EXTRACT_ELEMENTS_SCRIPT.
+        """
         text = await locator.inner_text() if await locator.count() > 0 else ""
-        text = text.strip()[:100]  # Limit text length
 
         # Get attributes
         attributes = {}
         try:
             # Common attributes to extract
-            for attr in ['type', 'name', 'id', 'class', 'placeholder', 'value', 'href', 'disabled', 'required', 'readonly', 'aria-label', 'title', 'data-testid', 'role']:
+            for attr in SCANNED_ATTRIBUTES:
                 attr_value = await locator.get_attribute(attr)
                 if attr_value is not None:
                     attributes[attr] = attr_value
         except Exception:
             pass
 
-        # Computed properties
-        elem_type_attr = attributes.get('type', '')
-        name = attributes.get('name', '')
-        elem_id = attributes.get('id', '')
-        placeholder = attributes.get('placeholder', '')
-        value = attributes.get('value', '')
-        classes = attributes.get('class', '').split() if attributes.get('class') else []
-
-        # Create a temporary element for strategy engine
-        temp_element = Element(
+        # Build xpath
+        xpath = await self._build_xpath(locator)
+
+        # State
+        try:
+            visible = await locator.is_visible() if await locator.count() > 0 else False
+            enabled = await locator.is_enabled() if await locator.count() > 0 else True
+        except Exception:
+            visible = True
+            enabled = True
+
+        return {
+            'attributes': attributes,
+            'text': text,
+            'visible': visible,
+            'enabled': enabled,
+            'xpath': xpath,
+        }
+
+    async def _element_from_payload(
+        self,
+        payload: dict,
+        locator,
+        index: int,
+        elem_type: str,
+        page_url: str,
+        page: 'Page'
+    ) -> Element:
+        """Turn extracted element data into an Element with the best locator"""
+        temp_element = self._candidate_element(payload, index, elem_type)
+
+        # Use LocationStrategyEngine to find best selector
+        locator_result = await self.strategy_engine.find_best_locator(temp_element, page)
+
+        return await self._finish_element(payload, temp_element, locator_result, locator, page_url, page)
+
+    def _candidate_element(self, payload: dict, index: int, elem_type: str) -> Element:
+        """Create the temporary element the strategy engine works on"""
+
+        # Get basic properties
+        text = (payload.get('text') or '').strip()[:100]  # Limit text length
+        attributes = dict(payload.get('attributes') or {})
+
+        return Element(
             index=index,
             uuid=str(uuid.uuid4()),
-            tag=tag,
-            type=elem_type_attr,
+            tag=elem_type,
+            type=attributes.get('type', ''),
             text=text,
-            value=value,
+            value=attributes.get('value', ''),
             attributes=attributes,
-            name=name,
-            id=elem_id,
-            classes=classes,
-            placeholder=placeholder,
+            name=attributes.get('name', ''),
+            id=attributes.get('id', ''),
+            classes=attributes.get('class', '').split() if attributes.get('class') else [],
+            placeholder=attributes.get('placeholder', ''),
             selector='',  # Will be filled by strategy engine
             xpath='',     # Will be filled by strategy engine
             visible=True,  # Placeholder
@@ -93,9 +780,28 @@ class ElementScanner:
             disabled=False # Placeholder
         )
 
-        # Use LocationStrategyEngine to find best selector
-        strategy_engine = LocationStrategyEngine()
-        locator_result = await strategy_engine.find_best_locator(temp_element, page)
+    async def _finish_element(
+        self,
+        payload: dict,
+        temp_element: Element,
+        locator_result,
+        locator,
+        page_url: str,
+        page: 'Page'
+    ) -> Element:
+        """Build the final Element from extracted data and the chosen locator"""
+        index = temp_element.index
+        tag = temp_element.tag
+        text = temp_element.text
+        attributes = temp_element.attributes
+
+        # Computed properties
+        elem_type_attr = temp_element.type
+        name = temp_element.name
+        elem_id = temp_element.id
+        placeholder = temp_element.placeholder
+        value = temp_element.value
+        classes = temp_element.classes
 
         # Extract selector from result
         if locator_result and locator_result.is_unique:
@@ -106,18 +812,13 @@ class ElementScanner:
             selector = await self._build_unique_selector(tag, attributes, text, page)
             cost = None
 
-        # Build xpath (always build separately as LocationResult doesn't provide xpath)
-        xpath = await self._build_xpath(locator)
+        # XPath comes from extraction as LocationResult doesn't provide xpath
+        xpath = payload.get('xpath') or ''
 
         # State
-        try:
-            visible = await locator.is_visible() if await locator.count() > 0 else False
-            enabled = await locator.is_enabled() if await locator.count() > 0 else True
-            disabled = attributes.get('disabled') is not None
-        except Exception:
-            visible = True
-            enabled = True
-            disabled = False
+        visible = bool(payload.get('visible', True))
+        enabled = bool(payload.get('enabled', True))
+        disabled = attributes.get('disabled') is not None
 
         # Extract strategy metadata if available
         selector_cost = None
@@ -154,7 +855,7 @@ class ElementScanner:
         tag: str,
         attributes: dict,
         text: str,
-        page: Page
+        page: 'Page'
     ) -> str:
         """Build CSS selector that uniquely identifies the element
 
@@ -239,13 +940,9 @@ class ElementScanner:
         else:
             return tag
 
-    async def _is_unique_selector(self, page: Page, selector: str) -> bool:
+    async def _is_unique_selector(self, page: 'Page', selector: str) -> bool:
         """Check if selector matches exactly one element on the page"""
-        try:
-            count = await page.locator(selector).count()
-            return count == 1
-        except Exception:
-            return False
+        return await self.strategy_engine.validator.is_unique(selector, page)
 
     def _build_selector(self, tag: str, attributes: dict) -> str:
         """Build CSS selector from tag and attributes (legacy method)"""
@@ -0,0 +1,50 @@
+"""
+Read-only views of element layers
+
+Context layers used to be handed out as fresh list copies on every access,
+which made each touch O(n). ElementView wraps a tuple snapshot taken once
+when the layer is set, so reads share it instead of copying. It compares
+equal to lists and tuples with the same elements.
+"""
+from collections.abc import Sequence
+from typing import Iterable, Iterator, List, Union
+
+from .element import Element
+
+
+class ElementView(Sequence):
+    """Immutable, zero-copy sequence of elements"""
+
+    __slots__ = ('_items',)
+
+    def __init__(self, elements: Iterable[Element] = ()):
+        if isinstance(elements, ElementView):
+            elements = elements._items
+        self._items = elements if isinstance(elements, tuple) else tuple(elements)
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def __getitem__(self, item: Union[int, slice]):
+        if isinstance(item, slice):
+            return list(self._items[item])
+        return self._items[item]
+
+    def __iter__(self) -> Iterator[Element]:
+        return iter(self._items)
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, ElementView):
+            return self._items == other._items
+        if not isinstance(other, Sequence) or isinstance(other, (str, bytes)):
+            return NotImplemented
+        return len(self) == len(other) and all(a == b for a, b in zip(self, other))
+
+    __hash__ = None
+
+    def copy(self) -> List[Element]:
+        """Elements as a new list (for callers that want to reorder or extend)"""
+        return list(self._items)
+
+    def __repr__(self) -> str:
+        return f"ElementView({list(self._items)!r})"
@@ -0,0 +1,160 @@
+"""
+Client for the selector daemon (stdlib only)
+
+Usage:
+    selector attach [--socket PATH] [-c COMMAND] [-c COMMAND ...]
+    selector attach < script.sel
+
+With -c each COMMAND is run in turn; otherwise command lines are read from
+stdin (blank lines and # comments skipped), interactively with a prompt on
+a terminal. Relative paths (exec, export, --out) resolve against the
+client's working directory.
+
+Exit codes: 0 every command succeeded, 1 a command failed, 2 no daemon.
+
+Importing this module loads neither Playwright nor the command stack, so
+attaching costs milliseconds instead of a browser launch.
+"""
+import argparse
+import os
+import socket
+import sys
+from typing import Any, Dict, Iterable, List, Optional
+
+from .protocol import EXECUTE, SHUTDOWN, STATUS, decode, encode, socket_path
+
+
+class DaemonError(Exception):
+    """The daemon could not be reached or sent an unreadable reply"""
+
+
+class DaemonClient:
+    """Blocking connection to a selector daemon"""
+
+    def __init__(self, path: Optional[str] = None, timeout: Optional[float] = None):
+        """
+        Args:
+            path: Unix socket (default: $SELECTOR_SOCKET or ~/.selector-cli/daemon.sock)
+            timeout: Seconds to wait for a reply (None: as long as the command runs)
+        """
+        self.path = socket_path(path)
+        self.timeout = timeout
+        self._socket: Optional[socket.socket] = None
+        self._reader = None
+
+    def connect(self):
+        """
+        Connect to the daemon (done on first request otherwise)
+
+        Raises:
+            DaemonError: If no daemon listens on the socket
+        """
+        if self._socket is not None:
+            return
+        if not hasattr(socket, 'AF_UNIX'):
+            raise DaemonError("the daemon needs Unix domain sockets")
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        sock.settimeout(self.timeout)
+        try:
+            sock.connect(self.path)
+        except OSError as e:
+            sock.close()
+            raise DaemonError(
+                f"no selector daemon on {self.path} ({e.strerror or e}); "
+                f"start one with: selector daemon start"
+            )
+        self._socket = sock
+        self._reader = sock.makefile('rb')
+
+    def close(self):
+        if self._socket is not None:
+            self._reader.close()
+            self._socket.close()
+            self._socket = None
+            self._reader = None
+
+    def __enter__(self) -> 'DaemonClient':
+        self.connect()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def request(self, message: Dict[str, Any]) -> Dict[str, Any]:
+        """Send one request and wait for its response"""
+        self.connect()
+        try:
+            self._socket.sendall(encode(message))
+            line = self._reader.readline()
+        except OSError as e:
+            self.close()
+            raise DaemonError(f"lost connection to the daemon: {e}")
+        if not line:
+            self.close()
+            raise DaemonError("the daemon closed the connection")
+        try:
+            return decode(line)
+        except ValueError as e:
+            raise DaemonError(f"unreadable reply from the daemon: {e}")
+
+    def execute(self, line: str) -> Dict[str, Any]:
+        """Run a command line in the daemon; returns {'ok': bool, 'output': str}"""
+        return self.request({'op': EXECUTE, 'line': line, 'cwd': os.getcwd()})
+
+    def status(self) -> Dict[str, Any]:
+        return self.request({'op': STATUS})
+
+    def shutdown(self) -> Dict[str, Any]:
+        return self.request({'op': SHUTDOWN})
+
+
+def _command_lines(lines: Iterable[str]) -> Iterable[str]:
+    """Stripped lines, without blanks and comments"""
+    for line in lines:
+        line = line.strip()
+        if line and not line.startswith('#'):
+            yield line
+
+
+def _stdin_lines(interactive: bool) -> Iterable[str]:
+    while True:
+        try:
+            line = input("selector> ") if interactive else sys.stdin.readline()
+        except EOFError:
+            return
+        if not interactive and not line:
+            return
+        yield line
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Entry point for `selector attach`; returns the process exit code"""
+    parser = argparse.ArgumentParser(prog='selector attach',
+                                     description='Run commands in a running selector daemon')
+    parser.add_argument('--socket', default=None, help='Unix socket path')
+    parser.add_argument('-c', '--command', action='append', default=None,
+                        help='Command to run (repeatable); default: read from stdin')
+    args = parser.parse_args(argv)
+
+    interactive = args.command is None and sys.stdin.isatty()
+    lines = _command_lines(args.command if args.command is not None
+                           else _stdin_lines(interactive))
+
+    failed = False
+    try:
+        with DaemonClient(args.socket) as client:
+            for line in lines:
+                reply = client.execute(line)
+                if reply.get('output'):
+                    print(reply['output'], file=sys.stdout if reply.get('ok') else sys.stderr,
+                          flush=True)
+                if not reply.get('ok'):
+                    failed = True
+                if line.split(None, 1)[0].lower() in ('quit', 'exit', 'q'):
+                    break
+    except DaemonError as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 2
+    except KeyboardInterrupt:
+        print()
+    return 1 if failed else 0
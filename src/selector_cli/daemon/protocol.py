@@ -0,0 +1,55 @@
+"""
+Wire protocol between the selector daemon and its clients
+
+One JSON object per line over a Unix socket, in both directions.
+
+Requests:
+    {"op": "execute", "line": "<command line>", "cwd": "<client directory>"}
+    {"op": "status"}
+    {"op": "shutdown"}
+
+Responses:
+    {"ok": true, "output": "..."}
+    {"ok": false, "output": "<error message>"}
+
+Stdlib only: clients import this module without loading the browser stack.
+"""
+import json
+import os
+from typing import Any, Dict, Optional
+
+DEFAULT_SOCKET = os.path.join(os.path.expanduser('~'), '.selector-cli', 'daemon.sock')
+
+# Environment variable overriding DEFAULT_SOCKET
+SOCKET_ENV = 'SELECTOR_SOCKET'
+
+EXECUTE = 'execute'
+STATUS = 'status'
+SHUTDOWN = 'shutdown'
+
+
+def socket_path(path: Optional[str] = None) -> str:
+    """Socket to use: path if given, else $SELECTOR_SOCKET, else DEFAULT_SOCKET"""
+    return path or os.environ.get(SOCKET_ENV) or DEFAULT_SOCKET
+
+
+def encode(message: Dict[str, Any]) -> bytes:
+    """One protocol line"""
+    return json.dumps(message, ensure_ascii=False).encode('utf-8') + b'\n'
+
+
+def decode(line: bytes) -> Dict[str, Any]:
+    """
+    Message from one protocol line
+
+    Raises:
+        ValueError: If the line is not a JSON object
+    """
+    message = json.loads(line.decode('utf-8'))
+    if not isinstance(message, dict):
+        raise ValueError("message must be a JSON object")
+    return message
+
+
+def response(ok: bool, output: str) -> Dict[str, Any]:
+    return {'ok': ok, 'output': output}
@@ -0,0 +1,245 @@
+"""
+Selector daemon: one long-lived browser shared by many CLI runs
+
+Usage:
+    selector daemon start [--socket PATH] [--headed] [--pool N] [--wait P] [--lean ...]
+    selector daemon status|stop [--socket PATH]
+
+The daemon starts Playwright and Chromium once and keeps them, the page
+pool, the selector validation caches and the three element layers warm
+between clients. Clients (selector attach) send command lines over a
+Unix socket; they run one at a time against a single shared context, so
+scan results from one run are there for the next.
+"""
+import argparse
+import asyncio
+import os
+import socket
+import sys
+import time
+from typing import Any, Dict, List, Optional
+
+from ..commands.executor import CommandExecutor
+from ..core.browser import BrowserManager
+from ..core.context import Context
+from ..core.variable_expander import VariableExpander
+from ..parser.parser import Parser
+from .protocol import (
+    EXECUTE, SHUTDOWN, SOCKET_ENV, STATUS, decode, encode, response, socket_path
+)
+
+
+class DaemonServer:
+    """Serve command lines from Unix-socket clients against one browser"""
+
+    def __init__(self, path: str, browser: BrowserManager, headless: bool = True,
+                 context: Optional[Context] = None):
+        """
+        Args:
+            path: Unix socket to listen on
+            browser: Browser to share; initialized on start() unless it already is
+            headless: Launch Chromium without a window
+            context: Shared execution context (default: a new Context with
+                     persisted variables and history, as the REPL uses)
+        """
+        self.path = path
+        self.browser = browser
+        self.headless = headless
+        self.context = context if context is not None else Context()
+        self.context.browser = browser
+        self.executor = CommandExecutor()
+        self.parser = Parser()
+        self.variable_expander = VariableExpander()
+
+        self.started_at: Optional[float] = None
+        self.requests = 0
+        self._server: Optional[asyncio.AbstractServer] = None
+        self._stopping: Optional[asyncio.Event] = None
+        # Commands share one context, so they run one at a time
+        self._lock: Optional[asyncio.Lock] = None
+
+    async def start(self):
+        """
+        Start the browser (if needed) and listen on the socket
+
+        Raises:
+            RuntimeError: If another daemon is listening on the socket
+        """
+        if os.path.exists(self.path):
+            if _listening(self.path):
+                raise RuntimeError(f"A selector daemon is already listening on {self.path}")
+            os.unlink(self.path)  # left behind by a daemon that died
+        os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+
+        if self.browser.browser is None:
+            await self.browser.initialize(headless=self.headless)
+
+        self._stopping = asyncio.Event()
+        self._lock = asyncio.Lock()
+        self._server = await asyncio.start_unix_server(self._handle, path=self.path)
+        # Whoever can connect can drive the browser
+        os.chmod(self.path, 0o600)
+        self.started_at = time.monotonic()
+
+    async def serve(self):
+        """Start, then serve until a client sends shutdown"""
+        await self.start()
+        print(f"Selector daemon listening on {self.path}", flush=True)
+        try:
+            await self._stopping.wait()
+        finally:
+            await self.stop()
+
+    async def stop(self):
+        """Stop listening, remove the socket and close the browser"""
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+            self._server = None
+        if os.path.exists(self.path):
+            os.unlink(self.path)
+        await self.browser.close()
+
+    async def respond(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        """Response to one request"""
+        op = request.get('op')
+        if op == EXECUTE:
+            line = request.get('line')
+            if not isinstance(line, str):
+                return response(False, "Bad request: 'line' must be a string")
+            return await self.execute(line, request.get('cwd'))
+        if op == STATUS:
+            return response(True, self.status())
+        if op == SHUTDOWN:
+            self._stopping.set()
+            return response(True, "Daemon stopping")
+        return response(False, f"Bad request: unknown op {op!r}")
+
+    async def execute(self, line: str, cwd: Optional[str] = None) -> Dict[str, Any]:
+        """Run one command line, resolving relative paths against cwd"""
+        async with self._lock:
+            self.requests += 1
+            previous = os.getcwd()
+            try:
+                if cwd:
+                    os.chdir(cwd)
+                return await self._execute(line)
+            except OSError as e:
+                return response(False, f"Error: {e}")
+            finally:
+                os.chdir(previous)
+
+    async def _execute(self, line: str) -> Dict[str, Any]:
+        # Same steps as a REPL line
+        try:
+            if self.variable_expander.has_variables(line):
+                line = self.variable_expander.expand(line, self.context.variables)
+        except ValueError as e:
+            return response(False, f"Variable error: {e}")
+
+        try:
+            command = self.parser.parse(line)
+        except Exception as e:
+            return response(False, f"Parse error: {e}")
+
+        if command.verb == 'quit':
+            # Ends the client's session, not the daemon
+            return response(True, "")
+
+        try:
+            output = await self.executor.execute(command, self.context)
+        except Exception as e:
+            return response(False, f"Execution error: {e}")
+        return response(not output.startswith("Error"), output)
+
+    def status(self) -> str:
+        """One line per fact about the running daemon"""
+        uptime = time.monotonic() - self.started_at if self.started_at is not None else 0.0
+        return "\n".join([
+            f"Selector daemon (pid {os.getpid()}) on {self.path}",
+            f"Up {uptime:.1f}s, {self.requests} command(s) served",
+            f"Page: {self.context.current_url or '(none)'}",
+            f"Candidates: {len(self.context.candidates)}, workspace: "
+            f"{len(self.context.workspace)}, pages scanned: {len(self.context.page_candidates)}",
+        ])
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        try:
+            while not self._stopping.is_set():
+                line = await reader.readline()
+                if not line:
+                    break
+                try:
+                    request = decode(line)
+                except ValueError as e:
+                    reply = response(False, f"Bad request: {e}")
+                else:
+                    reply = await self.respond(request)
+                writer.write(encode(reply))
+                await writer.drain()
+        except ConnectionError:
+            pass
+        finally:
+            writer.close()
+
+
+def _listening(path: str) -> bool:
+    """True if something accepts connections on the Unix socket path"""
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as probe:
+        try:
+            probe.connect(path)
+        except OSError:
+            return False
+    return True
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Entry point for `selector daemon`; returns the process exit code"""
+    from ..main import add_browser_arguments, lean_profile
+
+    parser = argparse.ArgumentParser(prog='selector daemon',
+                                     description='Long-lived browser for selector attach')
+    parser.add_argument('action', nargs='?', default='start', choices=['start', 'stop', 'status'])
+    parser.add_argument('--socket', default=None,
+                        help=f'Unix socket path (default: ${SOCKET_ENV} or '
+                             f'~/.selector-cli/daemon.sock)')
+    parser.add_argument('--headed', action='store_true', help='Show the browser window')
+    parser.add_argument('--pool', type=int, default=BrowserManager.DEFAULT_POOL_SIZE,
+                        help='Pooled pages for open-many/scan-many')
+    add_browser_arguments(parser)
+    args = parser.parse_args(argv)
+    path = socket_path(args.socket)
+
+    if not hasattr(asyncio, 'start_unix_server'):
+        print("Error: the daemon needs Unix domain sockets", file=sys.stderr)
+        return 2
+
+    if args.action != 'start':
+        from .client import DaemonClient, DaemonError
+        try:
+            with DaemonClient(path) as client:
+                reply = client.shutdown() if args.action == 'stop' else client.status()
+        except DaemonError as e:
+            print(f"Error: {e}", file=sys.stderr)
+            return 2
+        print(reply['output'])
+        return 0
+
+    if args.pool < 1:
+        print("Error: --pool must be at least 1", file=sys.stderr)
+        return 2
+    try:
+        lean = lean_profile(args)
+    except ValueError as e:
+        parser.error(str(e))
+
+    browser = BrowserManager(pool_size=args.pool, readiness=args.wait, lean=lean)
+    server = DaemonServer(path, browser, headless=not args.headed)
+    try:
+        asyncio.run(server.serve())
+    except RuntimeError as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 1
+    except KeyboardInterrupt:
+        pass
+    return 0
@@ -3,7 +3,7 @@ Data exporters for Selector CLI (JSON, CSV, YAML)
 """
 import json
 import csv
-from typing import List, Optional
+from typing import AsyncIterable, List, Optional, TextIO
 from io import StringIO
 from ..core.element import Element
 from .base import CodeGenerator
@@ -23,29 +23,55 @@ class JSONExporter(CodeGenerator):
         if not elements:
             return "[]"
 
-        data = []
-        for elem in elements:
-            data.append({
-                "index": elem.index,
-                "tag": elem.tag,
-                "type": elem.type,
-                "id": elem.id,
-                "name": elem.name,
-                "selector": elem.selector,
-                "xpath": elem.xpath,
-                "text": elem.text[:100] if elem.text else "",  # Truncate long text
-                "placeholder": elem.placeholder,
-                "visible": elem.visible,
-                "enabled": elem.enabled,
-                "attributes": elem.attributes,
-            })
+        data = [self.element_record(elem) for elem in elements]
 
         return json.dumps(data, indent=2, ensure_ascii=False)
 
+    async def stream(self, elements: AsyncIterable[Element], out: TextIO) -> int:
+        """
+        Write elements to out as they arrive (e.g. from ElementScanner.scan_iter)
+
+        Produces the same document as generate() without holding the list.
+
+        Returns:
+            Number of elements written
+        """
+        count = 0
+        async for elem in elements:
+            record = json.dumps(self.element_record(elem), indent=2, ensure_ascii=False)
+            out.write(("[\n" if count == 0 else ",\n") + "  " + record.replace("\n", "\n  "))
+            count += 1
+        out.write("\n]" if count else "[]")
+        return count
+
+    @staticmethod
+    def element_record(elem: Element) -> dict:
+        """JSON-serializable record for one element (shared with JSONL output)"""
+        return {
+            "index": elem.index,
+            "tag": elem.tag,
+            "type": elem.type,
+            "id": elem.id,
+            "name": elem.name,
+            "selector": elem.selector,
+            "xpath": elem.xpath,
+            "text": elem.text[:100] if elem.text else "",  # Truncate long text
+            "placeholder": elem.placeholder,
+            "visible": elem.visible,
+            "enabled": elem.enabled,
+            "attributes": elem.attributes,
+        }
+
 
 class CSVExporter(CodeGenerator):
     """Export elements as CSV"""
 
+    HEADER = [
+        "index", "tag", "type", "id", "name",
+        "selector", "xpath", "text", "placeholder",
+        "visible", "enabled"
+    ]
+
     def get_format_name(self) -> str:
         return "csv"
 
@@ -61,30 +87,47 @@ class CSVExporter(CodeGenerator):
         writer = csv.writer(output)
 
         # Header
-        writer.writerow([
-            "index", "tag", "type", "id", "name",
-            "selector", "xpath", "text", "placeholder",
-            "visible", "enabled"
-        ])
+        writer.writerow(self.HEADER)
 
         # Data rows
         for elem in elements:
-            writer.writerow([
-                elem.index,
-                elem.tag,
-                elem.type,
-                elem.id,
-                elem.name,
-                elem.selector,
-                elem.xpath,
-                elem.text[:100] if elem.text else "",  # Truncate long text
-                elem.placeholder,
-                elem.visible,
-                elem.enabled,
-            ])
+            writer.writerow(self.element_row(elem))
 
         return output.getvalue()
 
+    async def stream(self, elements: AsyncIterable[Element], out: TextIO) -> int:
+        """
+        Write elements to out as they arrive (e.g. from ElementScanner.scan_iter)
+
+        Returns:
+            Number of elements written
+        """
+        writer = csv.writer(out)
+        writer.writerow(self.HEADER)
+
+        count = 0
+        async for elem in elements:
+            writer.writerow(self.element_row(elem))
+            count += 1
+        return count
+
+    @staticmethod
+    def element_row(elem: Element) -> list:
+        """CSV row for one element, in HEADER order"""
+        return [
+            elem.index,
+            elem.tag,
+            elem.type,
+            elem.id,
+            elem.name,
+            elem.selector,
+            elem.xpath,
+            elem.text[:100] if elem.text else "",  # Truncate long text
+            elem.placeholder,
+            elem.visible,
+            elem.enabled,
+        ]
+
 
 class YAMLExporter(CodeGenerator):
     """Export elements as YAML"""
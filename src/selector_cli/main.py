@@ -1,11 +1,12 @@
 """
 Selector CLI - Main entry point
 """
-import asyncio
 import sys
 import argparse
 import logging
-from .repl.main import SelectorREPL
+from typing import List, Optional
+from .core.readiness import ReadinessPolicy
+from .core.lean import DEFAULT_BLOCKED_TYPES, TRACKER_DOMAINS, LeanProfile
 
 
 def setup_logging(debug: bool = False):
@@ -18,19 +19,91 @@ def setup_logging(debug: bool = False):
     )
 
 
+def wait_policy(spec: str) -> ReadinessPolicy:
+    """argparse type for --wait"""
+    try:
+        return ReadinessPolicy.parse(spec)
+    except ValueError as e:
+        raise argparse.ArgumentTypeError(str(e))
+
+
+def comma_list(value: str) -> List[str]:
+    """argparse type for comma-separated lists"""
+    return [item.strip().lower() for item in value.split(',') if item.strip()]
+
+
+def lean_profile(args) -> Optional[LeanProfile]:
+    """LeanProfile from the --lean options, None if none was given"""
+    if not (args.lean or args.block_types is not None or args.block_domains or args.no_js):
+        return None
+    return LeanProfile(
+        resource_types=frozenset(args.block_types) if args.block_types is not None
+        else DEFAULT_BLOCKED_TYPES,
+        domains=TRACKER_DOMAINS + tuple(args.block_domains or ()),
+        javascript=not args.no_js,
+    )
+
+
+def add_browser_arguments(parser: argparse.ArgumentParser):
+    """Options for how the browser loads pages (--wait and the lean profile)"""
+    parser.add_argument('--wait', metavar='POLICY', type=wait_policy, default=None,
+                        help='When an opened page is ready: networkidle (default), load, '
+                             'domcontentloaded, selector:<css> or quiet[:ms]')
+    lean = parser.add_argument_group('lean profile', 'Block resources selector extraction never needs')
+    lean.add_argument('--lean', action='store_true',
+                      help='Block images, fonts, media and tracker domains')
+    lean.add_argument('--block-types', metavar='TYPES', type=comma_list, default=None,
+                      help='Comma-separated resource types to block instead of '
+                           f'{",".join(sorted(DEFAULT_BLOCKED_TYPES))} (implies --lean)')
+    lean.add_argument('--block-domains', metavar='DOMAINS', type=comma_list, default=None,
+                      help='Comma-separated domains to block in addition to trackers (implies --lean)')
+    lean.add_argument('--no-js', action='store_true',
+                      help='Disable JavaScript (implies --lean)')
+
+
 def main():
     """Main entry point"""
+    # Non-interactive subcommands
+    if len(sys.argv) > 1 and sys.argv[1] == 'batch':
+        from .commands.batch import main as batch_main
+        sys.exit(batch_main(sys.argv[2:]))
+    if len(sys.argv) > 1 and sys.argv[1] == 'run':
+        from .commands.runner import main as run_main
+        sys.exit(run_main(sys.argv[2:]))
+    if len(sys.argv) > 1 and sys.argv[1] == 'daemon':
+        from .daemon.server import main as daemon_main
+        sys.exit(daemon_main(sys.argv[2:]))
+    if len(sys.argv) > 1 and sys.argv[1] == 'attach':
+        from .daemon.client import main as attach_main
+        sys.exit(attach_main(sys.argv[2:]))
+
     # Parse command line arguments
-    parser = argparse.ArgumentParser(description='Selector CLI - Interactive web element selection and code generation tool')
+    parser = argparse.ArgumentParser(
+        description='Selector CLI - Interactive web element selection and code generation tool',
+        epilog='Scripts:    selector run <script.sel> [--url URL] [--out results.jsonl]\n'
+               'Batch mode: selector batch <dir-of-html> [--workers N] [--out results.jsonl]\n'
+               'Daemon:     selector daemon start|stop|status, selector attach [-c COMMAND]',
+        formatter_class=argparse.RawDescriptionHelpFormatter
+    )
     parser.add_argument('--debug', '-d', action='store_true', help='Enable debug mode with detailed logging')
+    add_browser_arguments(parser)
     args = parser.parse_args()
 
+    try:
+        profile = lean_profile(args)
+    except ValueError as e:
+        parser.error(str(e))
+
     # Setup logging
     setup_logging(debug=args.debug)
 
+    # Imported here so --help and daemon/attach runs skip the REPL's imports
+    import asyncio
+    from .repl.main import SelectorREPL
+
     try:
         # Run REPL
-        asyncio.run(SelectorREPL(debug=args.debug).run())
+        asyncio.run(SelectorREPL(debug=args.debug, readiness=args.wait, lean=profile).run())
     except KeyboardInterrupt:
         print("\nGoodbye!")
         sys.exit(0)
@@ -1,11 +1,20 @@
 """
 Command data structures for Selector CLI (Phase 2)
 """
-from dataclasses import dataclass
-from typing import Optional, List, Any, Union
+from dataclasses import dataclass, field
+from typing import Optional, List, Any, Union, Dict
 from enum import Enum, auto
 
 
+# Source layer of one open-many page: PAGE_SOURCE + URL (add from page "<url>")
+PAGE_SOURCE = 'page:'
+
+
+def page_source(url: str) -> str:
+    """Source layer name for the open-many page at url"""
+    return PAGE_SOURCE + url
+
+
 class TargetType(Enum):
     """Type of command target"""
     ELEMENT_TYPE = auto()  # input, button, etc.
@@ -114,7 +123,7 @@ class Command:
 
     # Phase 3: v2 enhancements
     # Source layer for commands (add from temp, list candidates, etc.)
-    source: Optional[str] = None  # "temp", "candidates", or "workspace"
+    source: Optional[str] = None  # "temp", "candidates", "workspace" or page_source(url)
 
     # Destination layer for commands (add to workspace, etc.)
     destination: Optional[str] = None  # "candidates" or "workspace"
@@ -124,3 +133,6 @@ class Command:
 
     # Find mode: regular find vs refine (.find)
     is_refine: bool = False
+
+    # Command options (--name, --name=value, --name value)
+    options: Dict[str, Any] = field(default_factory=dict)
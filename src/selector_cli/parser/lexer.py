@@ -1,6 +1,7 @@
 """
 Lexer for Selector CLI
 """
+import re
 from enum import Enum, auto
 from dataclasses import dataclass
 from typing import List
@@ -11,6 +12,8 @@ class TokenType(Enum):
     # Keywords
     OPEN = auto()
     SCAN = auto()
+    OPEN_MANY = auto()
+    SCAN_MANY = auto()
     ADD = auto()
     REMOVE = auto()
     CLEAR = auto()
@@ -39,6 +42,7 @@ class TokenType(Enum):
     RUN = auto()
     MACROS = auto()
     EXEC = auto()
+    EXPLAIN = auto()
 
     # Phase 5 - Advanced Features
     HIGHLIGHT = auto()
@@ -103,6 +107,7 @@ class TokenType(Enum):
     RBRACE = auto()     # }
     COMMA = auto()      # ,
     DASH = auto()       # -
+    SEMICOLON = auto()  # ; (command chains)
 
     # V2 - Additional tokens
     DOT = auto()        # . (for .find)
@@ -130,6 +135,8 @@ class Lexer:
         # Commands
         'open': TokenType.OPEN,
         'scan': TokenType.SCAN,
+        'open-many': TokenType.OPEN_MANY,
+        'scan-many': TokenType.SCAN_MANY,
         'add': TokenType.ADD,
         'remove': TokenType.REMOVE,
         'clear': TokenType.CLEAR,
@@ -160,6 +167,7 @@ class Lexer:
         'run': TokenType.RUN,
         'macros': TokenType.MACROS,
         'exec': TokenType.EXEC,
+        'explain': TokenType.EXPLAIN,
 
         # Phase 5 - Advanced Features
         'highlight': TokenType.HIGHLIGHT,
@@ -212,203 +220,101 @@ class Lexer:
         'false': TokenType.FALSE,
     }
 
+    # Fixed-text tokens (operators and delimiters)
+    SYMBOLS = {
+        '>=': TokenType.GTE,
+        '>': TokenType.GT,
+        '<=': TokenType.LTE,
+        '<': TokenType.LT,
+        '=': TokenType.EQUALS,
+        '!=': TokenType.NOT_EQUALS,
+        '!': TokenType.BANG,  # history commands: !n or !!
+        '(': TokenType.LPAREN,
+        ')': TokenType.RPAREN,
+        '[': TokenType.LBRACKET,
+        ']': TokenType.RBRACKET,
+        '{': TokenType.LBRACE,
+        '}': TokenType.RBRACE,
+        ',': TokenType.COMMA,
+        '*': TokenType.ALL,  # wildcard like find *
+        '--': TokenType.DOUBLE_DASH,  # options like --deep
+        '-': TokenType.DASH,  # ranges like [1-10]
+        ';': TokenType.SEMICOLON,  # chained commands
+        '.': TokenType.DOT,  # .find
+    }
+
+    # Every token shape in one pattern, so each token costs a single match.
+    # Whitespace before a token is part of its match and anything else is an
+    # error match, so consecutive matches cover the whole text. In str
+    # patterns \s is exactly str.isspace(), \w is str.isalnum() or '_' and
+    # \d is str.isdecimal(); tokenize() handles the str.isdigit() characters
+    # \d leaves out. Unterminated strings run to the end.
+    _TOKEN = re.compile(r"""\s*(?:
+        (?P<number>\d+)
+      | (?P<word>\w[\w\-.:/]*)
+      | (?P<symbol>>=|<=|!=|--|[><=!()\[\]{},*\-;.])
+      | "(?P<dstring>[^"]*)"?
+      | '(?P<sstring>[^']*)'?
+      | (?P<error>.)
+    )""", re.VERBOSE | re.DOTALL)
+
     def __init__(self):
         self.text = ""
         self.position = 0
 
     def tokenize(self, text: str) -> List[Token]:
         """Convert string to tokens"""
-        self.text = text.strip()
-        self.position = 0
+        self.text = text = text.strip()
+        keywords, symbols = self.KEYWORDS, self.SYMBOLS
         tokens = []
-
-        while self.position < len(self.text):
-            # Skip whitespace
-            if self._current_char().isspace():
-                self.position += 1
-                continue
-
-            # String
-            if self._current_char() in '"\'':
-                tokens.append(self._read_string())
-                continue
-
-            # Number
-            if self._current_char().isdigit():
-                tokens.append(self._read_number())
-                continue
-
-            # Identifier or keyword
-            if self._current_char().isalpha() or self._current_char() == '_':
-                tokens.append(self._read_identifier())
-                continue
-
-            # Operators and delimiters
-            # Greater than or equal
-            if self._current_char() == '>' and self._peek() == '=':
-                tokens.append(Token(TokenType.GTE, '>=', self.position))
-                self.position += 2
-                continue
-
-            # Greater than
-            if self._current_char() == '>':
-                tokens.append(Token(TokenType.GT, '>', self.position))
-                self.position += 1
-                continue
-
-            # Less than or equal
-            if self._current_char() == '<' and self._peek() == '=':
-                tokens.append(Token(TokenType.LTE, '<=', self.position))
-                self.position += 2
-                continue
-
-            # Less than
-            if self._current_char() == '<':
-                tokens.append(Token(TokenType.LT, '<', self.position))
-                self.position += 1
-                continue
-
-            # Equals
-            if self._current_char() == '=':
-                tokens.append(Token(TokenType.EQUALS, '=', self.position))
-                self.position += 1
-                continue
-
-            # Not equals
-            if self._current_char() == '!' and self._peek() == '=':
-                tokens.append(Token(TokenType.NOT_EQUALS, '!=', self.position))
-                self.position += 2
-                continue
-
-            # Bang (history commands: !n or !!)
-            if self._current_char() == '!':
-                tokens.append(Token(TokenType.BANG, '!', self.position))
-                self.position += 1
-                continue
-
-            # Left parenthesis
-            if self._current_char() == '(':
-                tokens.append(Token(TokenType.LPAREN, '(', self.position))
-                self.position += 1
-                continue
-
-            # Right parenthesis
-            if self._current_char() == ')':
-                tokens.append(Token(TokenType.RPAREN, ')', self.position))
-                self.position += 1
-                continue
-
-            # Left bracket
-            if self._current_char() == '[':
-                tokens.append(Token(TokenType.LBRACKET, '[', self.position))
-                self.position += 1
-                continue
-
-            # Right bracket
-            if self._current_char() == ']':
-                tokens.append(Token(TokenType.RBRACKET, ']', self.position))
-                self.position += 1
-                continue
-
-            # Left brace
-            if self._current_char() == '{':
-                tokens.append(Token(TokenType.LBRACE, '{', self.position))
-                self.position += 1
-                continue
-
-            # Right brace
-            if self._current_char() == '}':
-                tokens.append(Token(TokenType.RBRACE, '}', self.position))
-                self.position += 1
-                continue
-
-            # Comma
-            if self._current_char() == ',':
-                tokens.append(Token(TokenType.COMMA, ',', self.position))
-                self.position += 1
-                continue
-
-            # Asterisk (for wildcard like find *)
-            if self._current_char() == '*':
-                tokens.append(Token(TokenType.ALL, '*', self.position))
-                self.position += 1
-                continue
-
-            # Dash (for ranges like [1-10])
-            if self._current_char() == '-':
-                # Check for double dash (--)
-                if self._peek() == '-':
-                    tokens.append(Token(TokenType.DOUBLE_DASH, '--', self.position))
-                    self.position += 2
+        append = tokens.append
+        position = 0
+
+        while True:
+            for m in self._TOKEN.finditer(text, position):
+                kind = m.lastgroup
+                start = m.start(kind)
+                value = m.group(kind)
+
+                if kind == 'word':
+                    first = value[0]
+                    if first.isalpha() or first == '_':
+                        append(Token(keywords.get(value.lower(), TokenType.IDENTIFIER),
+                                     value, start))
+                        continue
+                    if first.isdigit():
+                        # A number ends with its digits: rescan from there
+                        position = self._digits_end(text, start)
+                        append(Token(TokenType.NUMBER, text[start:position], start))
+                        break
+                    kind = 'error'
+                    value = first
+
+                if kind == 'symbol':
+                    append(Token(symbols[value], value, start))
+                elif kind == 'number':
+                    end = m.end()
+                    if end < len(text) and text[end].isdigit():
+                        position = self._digits_end(text, end)
+                        append(Token(TokenType.NUMBER, text[start:position], start))
+                        break
+                    append(Token(TokenType.NUMBER, value, start))
+                elif kind == 'error':
+                    self.position = start
+                    raise ValueError(f"Unexpected character: {value} at position {start}")
                 else:
-                    tokens.append(Token(TokenType.DASH, '-', self.position))
-                    self.position += 1
-                continue
-
-            # Dot (for .find)
-            if self._current_char() == '.':
-                tokens.append(Token(TokenType.DOT, '.', self.position))
-                self.position += 1
-                continue
-
-            # Unknown character
-            raise ValueError(f"Unexpected character: {self._current_char()} at position {self.position}")
+                    append(Token(TokenType.STRING, value, start - 1))
+            else:
+                break
 
+        self.position = len(text)
         tokens.append(Token(TokenType.EOF, '', self.position))
         return tokens
 
-    def _current_char(self) -> str:
-        """Get current character"""
-        if self.position >= len(self.text):
-            return ''
-        return self.text[self.position]
-
-    def _peek(self, offset: int = 1) -> str:
-        """Peek ahead"""
-        pos = self.position + offset
-        if pos >= len(self.text):
-            return ''
-        return self.text[pos]
-
-    def _read_string(self) -> Token:
-        """Read string literal"""
-        start_pos = self.position
-        quote = self._current_char()
-        self.position += 1  # Skip opening quote
-
-        value = ''
-        while self.position < len(self.text) and self._current_char() != quote:
-            value += self._current_char()
-            self.position += 1
-
-        if self._current_char() == quote:
-            self.position += 1  # Skip closing quote
-
-        return Token(TokenType.STRING, value, start_pos)
-
-    def _read_number(self) -> Token:
-        """Read number"""
-        start_pos = self.position
-        value = ''
-
-        while self.position < len(self.text) and self._current_char().isdigit():
-            value += self._current_char()
-            self.position += 1
-
-        return Token(TokenType.NUMBER, value, start_pos)
-
-    def _read_identifier(self) -> Token:
-        """Read identifier or keyword"""
-        start_pos = self.position
-        value = ''
-
-        while self.position < len(self.text) and (
-            self._current_char().isalnum() or self._current_char() in '_-.:/'
-        ):
-            value += self._current_char()
-            self.position += 1
-
-        # Check if it's a keyword
-        token_type = self.KEYWORDS.get(value.lower(), TokenType.IDENTIFIER)
-
-        return Token(token_type, value, start_pos)
+    @staticmethod
+    def _digits_end(text: str, position: int) -> int:
+        """End of the run of str.isdigit() characters starting at position"""
+        length = len(text)
+        while position < length and text[position].isdigit():
+            position += 1
+        return position
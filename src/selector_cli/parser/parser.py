@@ -1,10 +1,11 @@
 """
 Parser for Selector CLI (Phase 2)
 """
-from typing import List, Optional, Any
+from functools import lru_cache
+from typing import List, Optional, Any, Dict
 from .lexer import Lexer, Token, TokenType
 from .command import (
-    Command, Target, TargetType,
+    Command, Target, TargetType, page_source,
     Condition, Operator,  # Phase 1
     ConditionNode, ConditionType, LogicOp  # Phase 2
 )
@@ -13,13 +14,35 @@ from .command import (
 class Parser:
     """Parse command strings into Command objects"""
 
-    def __init__(self):
+    # Distinct command texts whose parse is kept (REPL history, macros, scripts)
+    DEFAULT_CACHE_SIZE = 512
+
+    def __init__(self, cache_size: int = DEFAULT_CACHE_SIZE):
+        """
+        Args:
+            cache_size: Parsed commands kept, least recently used dropped first
+                        (0 disables the cache)
+        """
         self.lexer = Lexer()
         self.tokens: List[Token] = []
         self.position = 0
+        self._parse_cached = lru_cache(maxsize=cache_size)(self._parse)
 
     def parse(self, command_str: str) -> Command:
-        """Parse command string"""
+        """
+        Parse command string
+
+        Commands are cached by their text without surrounding whitespace, so
+        a repeated command skips lexing and parsing. Cached commands are
+        shared: treat them as read-only. Failed parses are not cached.
+        """
+        return self._parse_cached(command_str.strip())
+
+    def cache_info(self):
+        """Parse cache statistics (hits, misses, maxsize, currsize)"""
+        return self._parse_cached.cache_info()
+
+    def _parse(self, command_str: str) -> Command:
         # Tokenize
         self.tokens = self.lexer.tokenize(command_str)
         self.position = 0
@@ -35,6 +58,8 @@ class Parser:
             return self._parse_open(command_str)
         elif verb_token.type == TokenType.SCAN:
             return self._parse_scan(command_str)
+        elif verb_token.type in (TokenType.OPEN_MANY, TokenType.SCAN_MANY):
+            return self._parse_many(command_str)
         elif verb_token.type == TokenType.FIND:
             return self._parse_find(command_str)
         elif verb_token.type == TokenType.DOT:
@@ -73,6 +98,8 @@ class Parser:
             return self._parse_macros(command_str)
         elif verb_token.type == TokenType.EXEC:
             return self._parse_exec(command_str)
+        elif verb_token.type == TokenType.EXPLAIN:
+            return self._parse_explain(command_str)
         elif verb_token.type == TokenType.HIGHLIGHT:
             return self._parse_highlight(command_str)
         elif verb_token.type == TokenType.UNHIGHLIGHT:
@@ -101,7 +128,7 @@ class Parser:
             raise ValueError(f"Unknown command: {verb_token.value}")
 
     def _parse_open(self, raw: str) -> Command:
-        """Parse: open <url>"""
+        """Parse: open <url> [--wait <policy>]"""
         self._consume(TokenType.OPEN)
 
         # Get URL (could be string or identifier)
@@ -112,20 +139,109 @@ class Parser:
         elif url_token.type == TokenType.IDENTIFIER:
             # URL without quotes
             url = url_token.value
+            end = url_token.position + len(url_token.value)
             self._advance()
-            # Continue reading until EOF to get full URL
-            while self._current_token().type not in (TokenType.EOF,):
-                url += self._current_token().value
+            # Continue reading to get full URL, up to a separate --option
+            while self._current_token().type != TokenType.EOF:
+                token = self._current_token()
+                if token.type == TokenType.DOUBLE_DASH and token.position != end:
+                    break
+                url += token.value
+                end = token.position + len(token.value)
                 self._advance()
         else:
             raise ValueError("Expected URL after 'open'")
 
-        return Command(verb='open', argument=url, raw=raw)
+        options = self._parse_options()
+        if self._current_token().type != TokenType.EOF:
+            raise ValueError(f"Unexpected token after options: {self._current_token().value}")
+
+        return Command(verb='open', argument=url, options=options, raw=raw)
 
     def _parse_scan(self, raw: str) -> Command:
-        """Parse: scan"""
+        """Parse: scan [--concurrency N] [--incremental] [--out "file"]"""
         self._consume(TokenType.SCAN)
-        return Command(verb='scan', raw=raw)
+        options = self._parse_options()
+        return Command(verb='scan', options=options, raw=raw)
+
+    def _parse_many(self, raw: str) -> Command:
+        """Parse: open-many|scan-many [<url> ...] [--file "urls.txt"] [--pool N] [--wait <policy>]"""
+        verb = self._current_token().value.lower()
+        self._advance()
+
+        # URLs are separated by whitespace: adjacent tokens belong to one URL
+        urls = []
+        end = None
+        while self._current_token().type not in (TokenType.EOF, TokenType.DOUBLE_DASH):
+            token = self._current_token()
+            if token.type == TokenType.STRING or token.position != end or not urls:
+                urls.append(token.value)
+            else:
+                urls[-1] += token.value
+            end = None if token.type == TokenType.STRING else token.position + len(token.value)
+            self._advance()
+
+        options = self._parse_options()
+        if self._current_token().type != TokenType.EOF:
+            raise ValueError(f"Unexpected token after options: {self._current_token().value}")
+
+        # Store as "url1\x00url2\x00..."
+        return Command(verb=verb, argument="\x00".join(urls) if urls else None,
+                       options=options, raw=raw)
+
+    # Options whose value may be a bare word (--wait load, --wait=quiet:300)
+    WORD_OPTIONS = frozenset({'wait'})
+
+    def _parse_options(self) -> Dict[str, Any]:
+        """Parse trailing options: --flag, --name=value or --name value
+
+        A value separated by whitespace must be a number or quoted string
+        (or, for WORD_OPTIONS, a bare word); anything else leaves the option
+        as a boolean flag.
+        """
+        options = {}
+        while self._current_token().type == TokenType.DOUBLE_DASH:
+            self._consume(TokenType.DOUBLE_DASH)
+            option_token = self._current_token()
+            if option_token.type != TokenType.IDENTIFIER:
+                raise ValueError(f"Expected option name after '--', got {option_token.type}")
+            option_name = option_token.value
+            self._advance()
+
+            if option_name in self.WORD_OPTIONS:
+                if self._current_token().type == TokenType.EQUALS:
+                    self._consume(TokenType.EQUALS)
+                word = self._parse_word()
+                options[option_name] = True if word is None else word
+            elif self._current_token().type == TokenType.EQUALS:
+                self._consume(TokenType.EQUALS)
+                options[option_name] = self._parse_value()
+            elif self._current_token().type in (TokenType.NUMBER, TokenType.STRING):
+                options[option_name] = self._parse_value()
+            else:
+                # Boolean flag
+                options[option_name] = True
+
+        return options
+
+    def _parse_word(self) -> Optional[str]:
+        """Parse a quoted string or run of adjacent tokens (e.g. quiet:300) as text"""
+        token = self._current_token()
+        if token.type == TokenType.STRING:
+            self._advance()
+            return token.value
+        if token.type in (TokenType.EOF, TokenType.DOUBLE_DASH):
+            return None
+
+        word = token.value
+        end = token.position + len(token.value)
+        self._advance()
+        while (self._current_token().type not in (TokenType.EOF, TokenType.STRING)
+               and self._current_token().position == end):
+            word += self._current_token().value
+            end += len(self._current_token().value)
+            self._advance()
+        return word
 
     # ========== Phase 3: FIND Command ==========
 
@@ -171,6 +287,7 @@ class Parser:
             add to workspace             # candidates → workspace (needs from)
             add to workspace from candidates  # explicit: candidates → workspace
             add from temp                # v2: from temp
+            add from page "<url>"        # from one open-many page
             add append                   # append to candidates
             add to workspace append      # append to workspace
         """
@@ -195,7 +312,9 @@ class Parser:
             if self._current_token().type == TokenType.FROM:
                 self._consume(TokenType.FROM)
                 source_token = self._current_token()
-                if source_token.type == TokenType.IDENTIFIER:
+                if self._at_page_source():
+                    cmd.source = self._parse_page_source()
+                elif source_token.type == TokenType.IDENTIFIER:
                     cmd.source = source_token.value.lower()
                     self._advance()
                 else:
@@ -249,13 +368,15 @@ class Parser:
         return Command(verb='clear', raw=raw)
 
     def _parse_list(self, raw: str) -> Command:
-        """Parse: list [candidates|temp|workspace] [<target>] [where <condition>]"""
+        """Parse: list [candidates|temp|workspace|page "<url>"] [<target>] [where <condition>]"""
         self._consume(TokenType.LIST)
 
         cmd = Command(verb='list', raw=raw)
 
         # Check for source layer (v2 feature): list candidates, list temp, list workspace
-        if self._current_token().type == TokenType.IDENTIFIER:
+        if self._at_page_source():
+            cmd.source = self._parse_page_source()
+        elif self._current_token().type == TokenType.IDENTIFIER:
             source_value = self._current_token().value.lower()
             if source_value in ['candidates', 'temp', 'workspace']:
                 cmd.source = source_value
@@ -275,6 +396,19 @@ class Parser:
 
         return cmd
 
+    def _at_page_source(self) -> bool:
+        """At `page <url>` (an open-many page as source layer)"""
+        token = self._current_token()
+        return (token.type == TokenType.IDENTIFIER and token.value.lower() == 'page'
+                and self._peek_token().type in (TokenType.STRING, TokenType.IDENTIFIER))
+
+    def _parse_page_source(self) -> str:
+        """Parse: page "<url>" - returns the source layer name"""
+        self._advance()
+        url = self._current_token().value
+        self._advance()
+        return page_source(url)
+
     def _parse_show(self, raw: str) -> Command:
         """Parse: show [<target>]"""
         self._consume(TokenType.SHOW)
@@ -564,6 +698,18 @@ class Parser:
 
         return Command(verb='exec', argument=filepath, raw=raw)
 
+    def _parse_explain(self, raw: str) -> Command:
+        """Parse: explain <command>[; <command>...]"""
+        verb_token = self._current_token()
+        self._consume(TokenType.EXPLAIN)
+
+        # Rest of line (preserve original), planned rather than parsed here
+        explained = raw[verb_token.position + len(verb_token.value):].strip()
+        if not explained:
+            raise ValueError("Expected command after 'explain'")
+
+        return Command(verb='explain', argument=explained, raw=raw)
+
     def _parse_highlight(self, raw: str) -> Command:
         """Parse: highlight [<target>] [where <condition>]"""
         self._consume(TokenType.HIGHLIGHT)
@@ -941,15 +1087,24 @@ class Parser:
             return self.tokens[-1]  # EOF
         return self.tokens[self.position]
 
+    def _peek_token(self, offset: int = 1) -> Token:
+        """Get the token offset positions ahead (EOF past the end)"""
+        position = self.position + offset
+        if position >= len(self.tokens):
+            return self.tokens[-1]  # EOF
+        return self.tokens[position]
+
     def _advance(self):
         """Move to next token"""
         if self.position < len(self.tokens) - 1:
             self.position += 1
 
-    def _consume(self, expected_type: TokenType):
-        """Consume token of expected type"""
-        if self._current_token().type != expected_type:
+    def _consume(self, expected_type: TokenType) -> Token:
+        """Consume token of expected type and return it"""
+        token = self._current_token()
+        if token.type != expected_type:
             raise ValueError(
-                f"Expected {expected_type}, got {self._current_token().type}"
+                f"Expected {expected_type}, got {token.type}"
             )
         self._advance()
+        return token
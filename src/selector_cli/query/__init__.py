@@ -0,0 +1,12 @@
+"""
+Query evaluation for Selector CLI (WHERE clauses)
+"""
+from .compiler import compile_condition, filter_elements, field_getter, TEXT, NATIVE
+
+__all__ = [
+    'compile_condition',
+    'filter_elements',
+    'field_getter',
+    'TEXT',
+    'NATIVE',
+]
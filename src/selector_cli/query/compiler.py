@@ -0,0 +1,206 @@
+"""
+WHERE-clause compiler
+
+Turns a parser ConditionNode tree into a plain Python predicate once, instead
+of re-walking the tree for every element:
+
+- field names are resolved to getter functions up front
+- operator dispatch happens at compile time; constants (str(value), numbers,
+  regexes) are converted once
+- AND/OR short-circuit
+
+Two dialects reproduce the two executors' semantics exactly:
+
+- TEXT (CommandExecutor): values compare as strings, ordering operators
+  compare numerically via float() (non-numbers count as 0), and
+  contains/starts/ends/matches work on str(value)
+- NATIVE (ExecutorV2): values compare as-is; only contains is a string test
+"""
+import re
+from operator import attrgetter
+from typing import Any, Callable, Iterable, List, Optional
+
+from ..core.candidate_table import CandidateRow, CandidateTable
+from ..core.element import Element
+from ..parser.command import ConditionNode, ConditionType, LogicOp, Operator
+
+
+TEXT = 'text'
+NATIVE = 'native'
+
+Predicate = Callable[[Any], bool]
+
+# Element dataclass fields; anything else is looked up in attributes
+ELEMENT_FIELDS = frozenset(Element.__dataclass_fields__)
+
+# Fields ExecutorV2 reads directly from the element
+NATIVE_FIELDS = frozenset({
+    'tag', 'type', 'text', 'value', 'id', 'name', 'visible', 'enabled', 'disabled'
+})
+
+_ORDERING = frozenset({Operator.GT, Operator.GTE, Operator.LT, Operator.LTE})
+
+# Boolean keywords that default to False when not an attribute (TEXT dialect)
+_FALSE_KEYWORDS = frozenset({'required', 'readonly'})
+
+
+def _never(elem) -> bool:
+    return False
+
+
+def to_number(value: Any) -> float:
+    """Convert value to number for comparison (0.0 if not numeric)"""
+    try:
+        return float(value)
+    except (ValueError, TypeError):
+        return 0.0
+
+
+def field_getter(field: str, dialect: str = TEXT) -> Callable[[Any], Any]:
+    """Getter returning the value a WHERE clause sees for field"""
+    if dialect == NATIVE:
+        if field in NATIVE_FIELDS:
+            return attrgetter(field)
+        return lambda elem: elem.attributes.get(field, "")
+
+    if field in ELEMENT_FIELDS:
+        return attrgetter(field)
+
+    def get(elem):
+        # Same lookup order as CommandExecutor._get_field_value
+        if hasattr(elem, field):
+            return getattr(elem, field)
+        attributes = elem.attributes
+        if field in attributes:
+            return attributes[field]
+        if field in _FALSE_KEYWORDS:
+            return False
+        return ""
+
+    return get
+
+
+def table_field_getter(table: CandidateTable, field: str,
+                       dialect: str = TEXT) -> Callable[[int], Any]:
+    """Like field_getter, but over CandidateTable row numbers"""
+    if field in (NATIVE_FIELDS if dialect == NATIVE else ELEMENT_FIELDS):
+        return table.column_getter(field)
+    default = False if dialect == TEXT and field in _FALSE_KEYWORDS else ""
+    return table.attribute_getter(field, default)
+
+
+def compile_condition(node: ConditionNode, dialect: str = TEXT,
+                      getter: Optional[Callable[[str], Callable]] = None) -> Predicate:
+    """
+    Compile a condition tree into a predicate over elements
+
+    Args:
+        node: Parsed WHERE clause
+        dialect: TEXT or NATIVE comparison semantics
+        getter: Maps a field name to a value getter; defaults to
+                field_getter (predicates then take elements)
+    """
+    if getter is None:
+        getter = lambda field: field_getter(field, dialect)
+
+    if node.type == ConditionType.SIMPLE:
+        return _compile_simple(node, dialect, getter(node.field))
+
+    if node.type == ConditionType.COMPOUND:
+        left = compile_condition(node.left, dialect, getter)
+        right = compile_condition(node.right, dialect, getter)
+        if node.logic_op == LogicOp.AND:
+            return lambda elem: left(elem) and right(elem)
+        if node.logic_op == LogicOp.OR:
+            return lambda elem: left(elem) or right(elem)
+        return _never
+
+    if node.type == ConditionType.UNARY:
+        operand = compile_condition(node.operand, dialect, getter)
+        return lambda elem: not operand(elem)
+
+    return _never
+
+
+def may_raise(node: ConditionNode, dialect: str = TEXT) -> bool:
+    """True if the compiled predicate can raise (invalid regex, NATIVE ordering)"""
+    if node.type == ConditionType.COMPOUND:
+        return may_raise(node.left, dialect) or may_raise(node.right, dialect)
+    if node.type == ConditionType.UNARY:
+        return may_raise(node.operand, dialect)
+    if node.operator == Operator.MATCHES:
+        try:
+            re.compile(str(node.value))
+        except re.error:
+            return True
+        return False
+    return dialect == NATIVE and node.operator in _ORDERING
+
+
+def filter_elements(elements: Iterable[Any], node: ConditionNode,
+                    dialect: str = TEXT) -> List[Any]:
+    """Elements matching the condition tree, in order"""
+    if isinstance(elements, CandidateTable):
+        return filter_rows(elements, range(len(elements)), node, dialect)
+    return list(filter(compile_condition(node, dialect), elements))
+
+
+def filter_rows(table: CandidateTable, rows: Iterable[int], node: ConditionNode,
+                dialect: str = TEXT) -> List[CandidateRow]:
+    """Table rows (by row number) matching the condition tree, in order"""
+    # Evaluate on columns; only matching rows get a row view
+    matches = compile_condition(
+        node, dialect, lambda field: table_field_getter(table, field, dialect)
+    )
+    return [CandidateRow(table, row) for row in rows if matches(row)]
+
+
+def _compile_simple(node: ConditionNode, dialect: str, get: Callable) -> Predicate:
+    op = node.operator
+    value = node.value
+
+    if dialect == NATIVE:
+        if op == Operator.EQUALS:
+            return lambda elem: get(elem) == value
+        if op == Operator.NOT_EQUALS:
+            return lambda elem: get(elem) != value
+        if op == Operator.CONTAINS:
+            return lambda elem: value in str(get(elem))
+        if op == Operator.GT:
+            return lambda elem: get(elem) > value
+        if op == Operator.GTE:
+            return lambda elem: get(elem) >= value
+        if op == Operator.LT:
+            return lambda elem: get(elem) < value
+        if op == Operator.LTE:
+            return lambda elem: get(elem) <= value
+        return _never
+
+    text = str(value)
+    if op == Operator.EQUALS:
+        return lambda elem: str(get(elem)) == text
+    if op == Operator.NOT_EQUALS:
+        return lambda elem: str(get(elem)) != text
+    if op in (Operator.GT, Operator.GTE, Operator.LT, Operator.LTE):
+        number = to_number(value)
+        if op == Operator.GT:
+            return lambda elem: to_number(get(elem)) > number
+        if op == Operator.GTE:
+            return lambda elem: to_number(get(elem)) >= number
+        if op == Operator.LT:
+            return lambda elem: to_number(get(elem)) < number
+        return lambda elem: to_number(get(elem)) <= number
+    if op == Operator.CONTAINS:
+        return lambda elem: text in str(get(elem))
+    if op == Operator.STARTS:
+        return lambda elem: str(get(elem)).startswith(text)
+    if op == Operator.ENDS:
+        return lambda elem: str(get(elem)).endswith(text)
+    if op == Operator.MATCHES:
+        try:
+            search = re.compile(text).search
+        except re.error:
+            # Invalid patterns fail when evaluated, as before
+            return lambda elem: bool(re.search(text, str(get(elem))))
+        return lambda elem: search(str(get(elem))) is not None
+    return _never
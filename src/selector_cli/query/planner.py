@@ -0,0 +1,592 @@
+"""
+Cost-based planning for find/add/filter pipelines
+
+Every verb used to filter its source layer eagerly and in isolation. The
+planner decides, per command, where a WHERE clause runs:
+
+- browser: FIND pushes what it can into the page (see pushdown)
+- index: a `tag = "x"` conjunct, or a type target, reads the layer's tag
+  index instead of scanning it
+- vectorized: numeric/boolean predicates as NumPy masks over the
+  candidates table's columns (query.vectorized; optional)
+- python: compiled predicates over the whole layer
+
+Top-level AND conjuncts are reordered so cheap, selective tests run first
+(rank = cost / (1 - selectivity)). Conjuncts that can raise (invalid
+regexes, NATIVE ordering comparisons) are never moved across, so a
+pipeline fails exactly where it failed before.
+
+A `;`-chained line, macro or exec script is planned as a whole. Within one
+pipeline, filter results are cached per layer and reused by later commands
+until a command writes that layer. The DOM is never cached: the page can
+change under us.
+"""
+from dataclasses import dataclass
+from typing import Any, Dict, Hashable, Iterable, List, Optional, Sequence, Tuple, Union
+
+from ..core.candidate_table import CandidateTable
+from ..core.collection import ElementCollection
+from ..parser.command import (
+    PAGE_SOURCE, Command, ConditionNode, ConditionType, LogicOp, Operator, TargetType
+)
+from .compiler import TEXT, ELEMENT_FIELDS, filter_elements, filter_rows, may_raise
+from .pushdown import PushdownPlan, conjoin, conjuncts, plan_pushdown
+from .vectorized import filter_collection, filter_table, vectorizable
+
+
+# Access paths
+BROWSER = 'browser'
+INDEX = 'index'
+VECTOR = 'vectorized'
+PYTHON = 'python'
+
+LAYERS = ('candidates', 'temp', 'workspace')
+
+# What open-many/scan-many write: every page_source() layer
+PAGES = 'pages'
+
+# Guessed fraction of elements a predicate keeps, by operator
+_SELECTIVITY = {
+    Operator.EQUALS: 0.1,
+    Operator.NOT_EQUALS: 0.9,
+    Operator.GT: 1 / 3,
+    Operator.GTE: 1 / 3,
+    Operator.LT: 1 / 3,
+    Operator.LTE: 1 / 3,
+    Operator.CONTAINS: 0.2,
+    Operator.STARTS: 0.15,
+    Operator.ENDS: 0.15,
+    Operator.MATCHES: 0.2,
+}
+
+# Relative cost of evaluating one predicate on one element
+_COST = {
+    Operator.GT: 2.0,
+    Operator.GTE: 2.0,
+    Operator.LT: 2.0,
+    Operator.LTE: 2.0,
+    Operator.CONTAINS: 1.5,
+    Operator.STARTS: 1.5,
+    Operator.ENDS: 1.5,
+    Operator.MATCHES: 4.0,
+}
+
+# Fields whose values (nearly) identify one element
+_UNIQUE_FIELDS = frozenset({'uuid', 'selector', 'xpath', 'id', 'index'})
+
+# Boolean fields: a test keeps about half the elements
+_FLAG_FIELDS = frozenset({'visible', 'enabled', 'disabled', 'required', 'readonly'})
+
+# Layers each verb writes; verbs not listed may write anything
+_WRITES = {
+    'open': LAYERS,
+    'scan': ('candidates',),
+    'open-many': (PAGES,),
+    'scan-many': (PAGES,),
+    'find': ('temp',),
+    'remove': ('workspace',),
+    'clear': ('workspace',),
+    'keep': ('workspace',),
+    'filter': ('workspace',),
+    'union': ('workspace',),
+    'intersect': ('workspace',),
+    'difference': ('workspace',),
+    'unique': ('workspace',),
+    'load': ('workspace',),
+    'list': (),
+    'show': (),
+    'count': (),
+    'export': (),
+    'save': (),
+    'saved': (),
+    'set': (),
+    'vars': (),
+    'macro': (),
+    'macros': (),
+    'highlight': (),
+    'unhighlight': (),
+    'history': (),
+    'help': (),
+    'explain': (),
+}
+
+
+# ----------------------------------------------------------------------
+# Predicates
+# ----------------------------------------------------------------------
+
+def selectivity(node: ConditionNode, source: Optional[Sequence] = None) -> float:
+    """Estimated fraction of source that node keeps"""
+    if node.type == ConditionType.COMPOUND:
+        left = selectivity(node.left, source)
+        right = selectivity(node.right, source)
+        if node.logic_op == LogicOp.AND:
+            return left * right
+        return left + right - left * right
+    if node.type == ConditionType.UNARY:
+        return 1.0 - selectivity(node.operand, source)
+
+    op = node.operator
+    if node.field in _FLAG_FIELDS and op in (Operator.EQUALS, Operator.NOT_EQUALS):
+        return 0.5
+    if op == Operator.EQUALS:
+        if node.field == 'tag' and source:
+            tagged = lookup_tag(source, str(node.value))
+            if tagged is not None:
+                return len(tagged) / len(source)
+        if node.field in _UNIQUE_FIELDS:
+            return 1 / len(source) if source else 0.01
+    return _SELECTIVITY.get(op, 0.5)
+
+
+def predicate_cost(node: ConditionNode) -> float:
+    """Relative cost of evaluating node on one element"""
+    if node.type == ConditionType.COMPOUND:
+        return predicate_cost(node.left) + predicate_cost(node.right)
+    if node.type == ConditionType.UNARY:
+        return predicate_cost(node.operand)
+    cost = _COST.get(node.operator, 1.0)
+    if node.field not in ELEMENT_FIELDS:
+        cost += 0.5  # attribute dict lookup
+    return cost
+
+
+def order_conjuncts(condition: ConditionNode, dialect: str = TEXT,
+                    source: Optional[Sequence] = None) -> ConditionNode:
+    """Condition with top-level AND conjuncts in cheapest-first order"""
+    parts = conjuncts(condition)
+    if len(parts) < 2:
+        return condition
+
+    def rank(node):
+        kept = selectivity(node, source)
+        return float('inf') if kept >= 1 else predicate_cost(node) / (1 - kept)
+
+    ordered: List[ConditionNode] = []
+    segment: List[ConditionNode] = []
+    for part in parts:
+        if may_raise(part, dialect):
+            ordered.extend(sorted(segment, key=rank))
+            ordered.append(part)
+            segment = []
+        else:
+            segment.append(part)
+    ordered.extend(sorted(segment, key=rank))
+
+    if all(a is b for a, b in zip(ordered, parts)):
+        return condition
+    return conjoin(ordered)
+
+
+def condition_key(node: Optional[ConditionNode]) -> Hashable:
+    """Hashable identity of a condition tree (values keep their type)"""
+    if node is None:
+        return None
+    if node.type == ConditionType.COMPOUND:
+        return (node.logic_op.name, condition_key(node.left), condition_key(node.right))
+    if node.type == ConditionType.UNARY:
+        return ('NOT', condition_key(node.operand))
+    return (node.field, node.operator.name, type(node.value).__name__, node.value)
+
+
+# ----------------------------------------------------------------------
+# Layer filtering
+# ----------------------------------------------------------------------
+
+def lookup_tag(source: Sequence, tag: str) -> Optional[Sequence]:
+    """Elements of source with this tag via its index, or None if unindexed"""
+    if isinstance(source, CandidateTable):
+        return source.tag_rows(tag)
+    if isinstance(source, ElementCollection):
+        return source.get_by_tag(tag)
+    return None
+
+
+@dataclass
+class FilterPlan:
+    """How one layer is filtered"""
+    access: str = PYTHON
+    tag: Optional[str] = None                      # index key (INDEX access)
+    condition: Optional[ConditionNode] = None      # evaluated per element, ordered
+
+
+def plan_filter(source: Sequence, condition: Optional[ConditionNode],
+                dialect: str = TEXT, tag: Optional[str] = None) -> FilterPlan:
+    """
+    Choose the access path for filtering source
+
+    Args:
+        source: Layer to filter (CandidateTable, ElementCollection or a list)
+        condition: WHERE clause, if any
+        dialect: TEXT or NATIVE comparison semantics
+        tag: Keep only elements with this tag (a type target)
+    """
+    if condition is not None:
+        condition = order_conjuncts(condition, dialect, source)
+
+    if (isinstance(source, (CandidateTable, ElementCollection))
+            and vectorizable(source, condition, dialect, tag)):
+        # The tag column is masked with the rest
+        return FilterPlan(VECTOR, tag, condition)
+
+    indexed = isinstance(source, (CandidateTable, ElementCollection))
+    if indexed and tag is None and condition is not None:
+        tag, condition = _tag_probe(condition, dialect)
+
+    return FilterPlan(INDEX if indexed and tag is not None else PYTHON, tag, condition)
+
+
+def filter_layer(source: Sequence, condition: Optional[ConditionNode],
+                 dialect: str = TEXT, tag: Optional[str] = None) -> List[Any]:
+    """Elements of source with the tag (if given) matching condition, in order"""
+    plan = plan_filter(source, condition, dialect, tag)
+    if plan.access == VECTOR:
+        if isinstance(source, ElementCollection):
+            return filter_collection(source, plan.condition, dialect, plan.tag)
+        return filter_table(source, plan.condition, dialect, plan.tag)
+    if plan.tag is None:
+        if plan.condition is None:
+            return list(source)
+        return filter_elements(source, plan.condition, dialect)
+
+    if isinstance(source, CandidateTable):
+        if plan.condition is None:
+            return source.by_tag(plan.tag)
+        return filter_rows(source, source.tag_rows(plan.tag), plan.condition, dialect)
+
+    if plan.access == INDEX:
+        elements = source.get_by_tag(plan.tag)
+    else:
+        elements = [e for e in source if e.tag == plan.tag]
+    if plan.condition is None:
+        return elements
+    return filter_elements(elements, plan.condition, dialect)
+
+
+def _tag_probe(condition: ConditionNode,
+               dialect: str) -> Tuple[Optional[str], Optional[ConditionNode]]:
+    """Split a `tag = "x"` conjunct off condition for an index lookup"""
+    parts = conjuncts(condition)
+    for position, part in enumerate(parts):
+        if (part.type == ConditionType.SIMPLE and part.field == 'tag'
+                and part.operator == Operator.EQUALS
+                and (dialect == TEXT or isinstance(part.value, str))):
+            rest = parts[:position] + parts[position + 1:]
+            return str(part.value), conjoin(rest)
+        if may_raise(part, dialect):
+            # Skipping rows would skip this conjunct's error
+            break
+    return None, condition
+
+
+class LayerCache:
+    """Filter results within one pipeline, dropped when their layer is written"""
+
+    def __init__(self):
+        self._entries: Dict[Hashable, List[Any]] = {}
+        self.hits = 0
+
+    @staticmethod
+    def key(layer: str, condition: Optional[ConditionNode], dialect: str = TEXT,
+            tag: Optional[str] = None) -> Hashable:
+        return (layer, tag, dialect, condition_key(condition))
+
+    def get(self, key: Hashable) -> Optional[List[Any]]:
+        result = self._entries.get(key)
+        if result is None:
+            return None
+        self.hits += 1
+        return list(result)
+
+    def put(self, key: Hashable, result: List[Any]) -> None:
+        self._entries[key] = list(result)
+
+    def invalidate(self, layers: Sequence[str]) -> None:
+        """Forget results read from any of layers"""
+        self._entries = {k: v for k, v in self._entries.items()
+                         if not written_by(k[0], layers)}
+
+
+# ----------------------------------------------------------------------
+# Pipelines
+# ----------------------------------------------------------------------
+
+# Verbs whose argument is the rest of the line, chains included
+_LINE_VERBS = ('macro', 'explain')
+
+
+def split_statements(line: str) -> List[str]:
+    """
+    Split a `;`-chained line into commands
+
+    `;` inside quotes does not split, and a macro or explain statement keeps
+    the rest of the line (its body may itself be a chain).
+    """
+    statements = []
+    current: List[str] = []
+    quote = None
+    for position, char in enumerate(line):
+        if quote:
+            if char == quote:
+                quote = None
+        elif char in '"\'':
+            quote = char
+        elif char == ';':
+            statement = ''.join(current).strip()
+            words = statement.split(None, 1)
+            if words and words[0].lower() in _LINE_VERBS:
+                current = [statement, line[position:]]
+                break
+            statements.append(statement)
+            current = []
+            continue
+        current.append(char)
+    statements.append(''.join(current).strip())
+    return [s for s in statements if s]
+
+
+def script_statements(lines: Iterable[str]) -> List[Tuple[int, str]]:
+    """Statements of a script, numbered by line (blank lines and # comments skipped)"""
+    statements = []
+    for line_num, line in enumerate(lines, 1):
+        line = line.strip()
+        if not line or line.startswith('#'):
+            continue
+        statements.extend((line_num, statement) for statement in split_statements(line))
+    return statements
+
+
+def writes(command: Command) -> Tuple[str, ...]:
+    """Layers a command may change"""
+    if command.verb == 'add':
+        return (command.destination or 'candidates',)
+    if command.verb == 'find' and not command.is_refine:
+        return ('temp',)
+    return _WRITES.get(command.verb, LAYERS + (PAGES,))
+
+
+def written_by(layer: str, layers: Sequence[str]) -> bool:
+    """True if writing layers may change layer"""
+    return (PAGES if layer.startswith(PAGE_SOURCE) else layer) in layers
+
+
+@dataclass
+class PlanStep:
+    """One command of a pipeline and how it will run"""
+    statement: str
+    line: int = 0
+    command: Optional[Command] = None
+    error: Optional[Exception] = None              # parse error; the pipeline stops here
+    access: Optional[str] = None                   # None: no filtering
+    layer: Optional[str] = None                    # source layer ('dom' for FIND)
+    filter: Optional[FilterPlan] = None
+    pushdown: Optional[PushdownPlan] = None
+    rows_in: Optional[int] = None
+    rows_out: Optional[float] = None
+    cost: float = 0.0
+    reuses: Optional[int] = None                   # step whose cached result is read
+    cache_key: Optional[Hashable] = None
+    writes: Tuple[str, ...] = ()
+
+
+class PipelineError(Exception):
+    """A pipeline command failed to parse or run"""
+
+    def __init__(self, step: PlanStep, error: Exception):
+        super().__init__(str(error))
+        self.step = step
+        self.error = error
+
+
+class QueryPlanner:
+    """Plan find/add/filter pipelines"""
+
+    # Per-element cost of a DOM round trip relative to one Python predicate
+    BROWSER_ROW_COST = 0.2
+    BROWSER_TRIP_COST = 50.0
+
+    def __init__(self, parser=None):
+        if parser is None:
+            from ..parser.parser import Parser
+            parser = Parser()
+        self.parser = parser
+
+    def plan(self, statements: Sequence[Tuple[int, Union[str, Command]]], context=None,
+             stop_on_error: bool = True) -> List[PlanStep]:
+        """
+        Plan statements, parsing each once
+
+        Args:
+            statements: (line number, command text) pairs, in order; a
+                        precompiled Command may stand in for its text
+            context: Context whose layers size the estimates (optional)
+            stop_on_error: End the plan at the first parse error; when False
+                           every statement is planned, so all errors are found
+        """
+        steps: List[PlanStep] = []
+        seen: Dict[Hashable, int] = {}
+
+        for line, statement in statements:
+            if isinstance(statement, Command):
+                step = PlanStep(statement=statement.raw, line=line, command=statement)
+                steps.append(step)
+            else:
+                step = PlanStep(statement=statement, line=line)
+                steps.append(step)
+                try:
+                    step.command = self.parser.parse(statement)
+                except Exception as e:
+                    step.error = e
+                    if stop_on_error:
+                        break
+                    continue
+
+            self._plan_command(step, context)
+            if step.cache_key is not None:
+                if step.cache_key in seen:
+                    step.reuses = seen[step.cache_key]
+                    step.cost = 0.0
+                else:
+                    seen[step.cache_key] = len(steps)
+            step.writes = writes(step.command)
+            for key in [k for k in seen if written_by(k[0], step.writes)]:
+                del seen[key]
+
+        return steps
+
+    def _plan_command(self, step: PlanStep, context) -> None:
+        command = step.command
+
+        if command.verb == 'find' and not command.is_refine:
+            step.access = BROWSER
+            step.layer = 'dom'
+            step.pushdown = plan_pushdown(command.condition_tree)
+            step.cost = self.BROWSER_TRIP_COST
+            return
+
+        read = layer_read(command)
+        if read is None:
+            return
+        layer, tag = read
+        if command.condition_tree is None and tag is None:
+            return
+
+        source = _layer_elements(context, layer)
+        plan = plan_filter(source, command.condition_tree, TEXT, tag)
+        step.layer = layer
+        step.filter = plan
+        step.access = plan.access
+        step.cache_key = LayerCache.key(layer, command.condition_tree, TEXT, tag)
+
+        if context is None:
+            return
+        rows = len(source)
+        if plan.tag is not None:
+            tagged = lookup_tag(source, plan.tag)
+            rows = len(tagged) if tagged is not None else rows
+        step.rows_in = rows
+        if plan.condition is None:
+            step.rows_out = rows
+            step.cost = rows * (0.1 if plan.access == INDEX else 1.0)
+        else:
+            step.rows_out = rows * selectivity(plan.condition, source)
+            step.cost = rows * predicate_cost(plan.condition)
+
+    def explain(self, statements: Sequence[Tuple[int, Union[str, Command]]],
+                context=None) -> str:
+        """Human-readable plan"""
+        steps = self.plan(statements, context)
+        lines = [f"Plan ({len(steps)} step(s)):"]
+        for number, step in enumerate(steps, 1):
+            lines.append(f"  {number}. {step.statement}")
+            lines.extend(f"     {detail}" for detail in self._describe(step))
+        total = sum(step.cost for step in steps)
+        lines.append(f"Estimated cost: {total:.0f}")
+        return "\n".join(lines)
+
+    def _describe(self, step: PlanStep) -> List[str]:
+        if step.error is not None:
+            return [f"parse error: {step.error} (pipeline stops here)"]
+        if step.reuses is not None:
+            return [f"cached: same {step.layer} filter as step {step.reuses}"]
+
+        if step.access == BROWSER:
+            plan = step.pushdown
+            details = []
+            if plan.css:
+                details.append(f"css {plan.css}")
+            if plan.filter is not None:
+                details.append("in-page filter")
+            lines = [f"browser push-down: {', '.join(details) if details else 'type only'}"]
+            if plan.pushed:
+                lines.append(f"pushed: {conjoin(plan.pushed)}")
+            if plan.residual is not None:
+                lines.append(f"python residual: {plan.residual}")
+            return lines
+
+        if step.access is None:
+            return []
+
+        rows = '' if step.rows_in is None else f" ({step.rows_in} rows)"
+        if step.access == INDEX:
+            lines = [f"index lookup: tag = {step.filter.tag} on {step.layer}{rows}"]
+        elif step.access == VECTOR:
+            tag = '' if step.filter.tag is None else f" (tag = {step.filter.tag})"
+            lines = [f"vectorized filter on {step.layer}{rows}{tag}"]
+        else:
+            lines = [f"python filter on {step.layer}{rows}"]
+        if step.filter.condition is not None:
+            lines.append(f"predicates: {step.filter.condition}")
+        if step.rows_out is not None:
+            lines.append(f"estimate: ~{step.rows_out:.0f} row(s), cost {step.cost:.0f}")
+        return lines
+
+
+def layer_read(command: Command) -> Optional[Tuple[str, Optional[str]]]:
+    """(layer, tag) a command filters, or None if it filters no layer"""
+    verb = command.verb
+    if verb == 'find':
+        return ('temp', None) if command.is_refine else None
+    if verb in ('keep', 'filter'):
+        return ('workspace', None)
+    if verb == 'add':
+        source = command.source or 'candidates'
+        target = command.target
+        if target is None:
+            return (source, None)
+        if target.type == TargetType.ELEMENT_TYPE and source == 'candidates':
+            return (source, target.element_type)
+        return None
+    if verb == 'list' and command.source:
+        return (command.source, None)
+    if verb == 'list' and command.target is None:
+        return ('workspace', None)
+    if verb in ('list', 'remove', 'highlight'):
+        return _target_read(command.target)
+    return None
+
+
+def _target_read(target) -> Optional[Tuple[str, Optional[str]]]:
+    if target is None:
+        return None
+    if target.type == TargetType.ELEMENT_TYPE:
+        return ('candidates', target.element_type)
+    if target.type == TargetType.ALL:
+        return ('candidates', None)
+    return None
+
+
+def _layer_elements(context, layer: str) -> Sequence:
+    """The layer's storage (indexed where possible); empty without a context"""
+    if context is None:
+        if layer == 'workspace':
+            return ElementCollection()
+        return [] if layer == 'temp' else CandidateTable()
+    if layer == 'workspace':
+        return context.workspace
+    if layer == 'temp':
+        return context.temp
+    if layer.startswith(PAGE_SOURCE):
+        table = context.page_table(layer[len(PAGE_SOURCE):])
+        return table if table is not None else CandidateTable()
+    return context.candidates
@@ -0,0 +1,233 @@
+"""
+WHERE push-down for FIND
+
+Translates the parts of a condition tree that the page can decide into the
+format of FIND_ELEMENTS_SCRIPT, so FIND describes and transfers only matching
+elements instead of every node of the requested type:
+
+- top-level AND conjuncts that test an attribute for equality become one CSS
+  selector (checked with el.matches, natively)
+- other conjuncts on fields the page knows (attributes, tag, text, visible,
+  enabled, disabled, index) become a JSON filter tree interpreted in the
+  page - no generated code, so page CSPs do not matter
+- whatever is left (regexes, selector/xpath/cost, unsupported comparisons) is
+  the residual, evaluated in Python on the returned elements
+
+A conjunct is only pushed when the page computes exactly the value the
+compiled evaluator would see on the resulting Element, in the same dialect.
+"""
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional
+
+from ..core.element import Element
+from ..core.scanner import SCANNED_ATTRIBUTES
+from ..parser.command import ConditionNode, ConditionType, LogicOp, Operator
+from .compiler import (
+    TEXT, NATIVE, ELEMENT_FIELDS, filter_elements, to_number
+)
+
+
+# Attributes whose values CSS attribute selectors match case-sensitively in
+# HTML documents (type, for one, is matched case-insensitively)
+CSS_ATTRIBUTES = frozenset({
+    'id', 'name', 'class', 'placeholder', 'value', 'href', 'title', 'aria-label',
+    'data-testid', 'role'
+})
+
+# Element fields derived from the attribute of the same name ('' if missing)
+_ATTRIBUTE_FIELDS = frozenset({'type', 'value', 'name', 'id', 'placeholder'})
+
+# Fields computed in the page from the element itself
+_PAGE_FIELDS = frozenset({'tag', 'text', 'visible', 'enabled', 'disabled'})
+
+_STRING_TESTS = {
+    Operator.EQUALS: 'eq',
+    Operator.NOT_EQUALS: 'ne',
+    Operator.CONTAINS: 'contains',
+    Operator.STARTS: 'starts',
+    Operator.ENDS: 'ends',
+}
+
+_ORDER_TESTS = {
+    Operator.GT: 'gt',
+    Operator.GTE: 'gte',
+    Operator.LT: 'lt',
+    Operator.LTE: 'lte',
+}
+
+# Attributes that read as False rather than '' when missing (TEXT dialect)
+_FALSE_DEFAULTS = frozenset({'required', 'readonly'})
+
+
+@dataclass
+class PushdownPlan:
+    """Where each part of a FIND condition runs"""
+    css: str = ''                                   # attribute selectors, '' if none
+    filter: Optional[Dict[str, Any]] = None         # in-page filter tree
+    residual: Optional[ConditionNode] = None        # evaluated in Python afterwards
+    pushed: List[ConditionNode] = field(default_factory=list)
+
+    @property
+    def exact(self) -> bool:
+        """True if the page decides the whole condition"""
+        return self.residual is None
+
+
+def plan_pushdown(condition: Optional[ConditionNode], dialect: str = TEXT) -> PushdownPlan:
+    """Split a condition tree into CSS, in-page filter and Python residual"""
+    plan = PushdownPlan()
+    if condition is None:
+        return plan
+
+    css_parts: List[str] = []
+    filters: List[Dict[str, Any]] = []
+    residual: List[ConditionNode] = []
+
+    for conjunct in conjuncts(condition):
+        css = _css_of(conjunct, dialect)
+        if css is not None:
+            css_parts.append(css)
+            plan.pushed.append(conjunct)
+            continue
+        tree = _filter_of(conjunct, dialect)
+        if tree is not None:
+            filters.append(tree)
+            plan.pushed.append(conjunct)
+        else:
+            residual.append(conjunct)
+
+    plan.css = ''.join(css_parts)
+    if filters:
+        plan.filter = filters[0] if len(filters) == 1 else {'op': 'and', 'args': filters}
+    plan.residual = conjoin(residual)
+    return plan
+
+
+async def find_elements(scanner, page, element_types: List[str],
+                        condition: Optional[ConditionNode] = None,
+                        dialect: str = TEXT) -> List[Element]:
+    """FIND with the condition pushed into the page as far as possible"""
+    plan = plan_pushdown(condition, dialect)
+    elements = await scanner.find(page, element_types, css=plan.css, filter=plan.filter)
+    if plan.residual is not None:
+        elements = filter_elements(elements, plan.residual, dialect)
+    return elements
+
+
+def conjuncts(condition: ConditionNode) -> List[ConditionNode]:
+    """Top-level AND operands, left to right"""
+    if condition.type == ConditionType.COMPOUND and condition.logic_op == LogicOp.AND:
+        return conjuncts(condition.left) + conjuncts(condition.right)
+    return [condition]
+
+
+def conjoin(nodes: List[ConditionNode]) -> Optional[ConditionNode]:
+    """AND of nodes (None if empty)"""
+    if not nodes:
+        return None
+    tree = nodes[0]
+    for node in nodes[1:]:
+        tree = ConditionNode(type=ConditionType.COMPOUND, left=tree, right=node,
+                             logic_op=LogicOp.AND)
+    return tree
+
+
+def _field_spec(name: str, dialect: str) -> Optional[Dict[str, Any]]:
+    """How the page computes a field, or None if it cannot"""
+    if name in _PAGE_FIELDS:
+        return {'kind': name}
+    if name in _ATTRIBUTE_FIELDS:
+        return {'kind': 'attr', 'name': name, 'default': ''}
+
+    if dialect == NATIVE:
+        # Everything else is attributes.get(name, '')
+        if name not in SCANNED_ATTRIBUTES:
+            return None
+        return {'kind': 'attr', 'name': name, 'default': ''}
+
+    if name == 'index':
+        return {'kind': 'index'}
+    if name in ELEMENT_FIELDS or hasattr(Element, name) or name not in SCANNED_ATTRIBUTES:
+        return None
+    return {'kind': 'attr', 'name': name,
+            'default': 'False' if name in _FALSE_DEFAULTS else ''}
+
+
+def _leaf_of(node: ConditionNode, dialect: str) -> Optional[Dict[str, Any]]:
+    spec = _field_spec(node.field, dialect)
+    if spec is None:
+        return None
+    op = node.operator
+    value = node.value
+    boolean = spec['kind'] in ('visible', 'enabled', 'disabled')
+
+    if dialect == TEXT:
+        if op in _STRING_TESTS:
+            return {'op': 'cmp', 'field': spec, 'test': _STRING_TESTS[op],
+                    'value': str(value), 'text': True}
+        if op in _ORDER_TESTS and spec['kind'] == 'index':
+            return {'op': 'cmp', 'field': spec, 'test': _ORDER_TESTS[op],
+                    'value': to_number(value), 'text': False}
+        return None
+
+    # NATIVE: raw comparisons, only where JS and Python agree on types
+    if op in (Operator.EQUALS, Operator.NOT_EQUALS):
+        if (isinstance(value, bool) if boolean else isinstance(value, str)):
+            return {'op': 'cmp', 'field': spec, 'test': _STRING_TESTS[op],
+                    'value': value, 'text': False}
+        return None
+    if op == Operator.CONTAINS and isinstance(value, str):
+        return {'op': 'cmp', 'field': spec, 'test': 'contains', 'value': value, 'text': True}
+    return None
+
+
+def _filter_of(node: ConditionNode, dialect: str) -> Optional[Dict[str, Any]]:
+    """In-page filter tree for node, or None if any part cannot be pushed"""
+    if node.type == ConditionType.SIMPLE:
+        return _leaf_of(node, dialect)
+
+    if node.type == ConditionType.COMPOUND:
+        if node.logic_op not in (LogicOp.AND, LogicOp.OR):
+            return None
+        left = _filter_of(node.left, dialect)
+        right = _filter_of(node.right, dialect)
+        if left is None or right is None:
+            return None
+        return {'op': 'and' if node.logic_op == LogicOp.AND else 'or', 'args': [left, right]}
+
+    if node.type == ConditionType.UNARY:
+        operand = _filter_of(node.operand, dialect)
+        return None if operand is None else {'op': 'not', 'arg': operand}
+
+    return None
+
+
+def _css_of(node: ConditionNode, dialect: str) -> Optional[str]:
+    """Attribute selector equivalent to node, or None"""
+    if node.type != ConditionType.SIMPLE or node.operator != Operator.EQUALS:
+        return None
+    if node.field not in CSS_ATTRIBUTES:
+        return None
+    spec = _field_spec(node.field, dialect)
+    if spec is None or spec['kind'] != 'attr':
+        return None
+    if dialect == NATIVE and not isinstance(node.value, str):
+        return None
+    value = str(node.value)
+    if not value:
+        # '' also matches a missing attribute; CSS cannot say that
+        return None
+    return f'[{node.field}={css_string(value)}]'
+
+
+def css_string(value: str) -> str:
+    """Quoted CSS string literal"""
+    out = []
+    for char in value:
+        if char in '"\\':
+            out.append('\\' + char)
+        elif char < ' ' or char == '\x7f':
+            out.append(f'\\{ord(char):x} ')
+        else:
+            out.append(char)
+    return '"' + ''.join(out) + '"'
@@ -0,0 +1,427 @@
+"""
+Vectorized WHERE evaluation over CandidateTable columns (optional NumPy)
+
+Numeric and boolean predicates - index, selector_cost, visible, enabled,
+in_shadow and tag - are evaluated for all rows at once as NumPy boolean
+masks over copies of the table's typed columns, instead of calling
+to_number()/str() per row per node. Other conjuncts (text, attributes,
+regexes) run in Python afterwards, on the surviving rows only.
+
+Workspace collections (e.g. loaded from storage) have no columns of their
+own: each array is built from the collection's elements the first time a
+filter reads it and kept until the collection changes.
+
+Results are identical to the compiled evaluator:
+
+- only top-level AND conjuncts before the first one that can raise are
+  vectorized, so errors surface exactly as before
+- a predicate is vectorized only where its column holds every row's value
+  (no per-row overrides) and the comparison is exact on that column
+
+NumPy is optional (pip install selector-cli[fast]); without it, or for
+small tables where the array setup costs more than it saves, callers get
+None and use the pure-Python path.
+"""
+import weakref
+from operator import attrgetter
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Union
+
+from ..core.candidate_table import FLAG_BITS, CandidateRow, CandidateTable
+from ..core.collection import ElementCollection
+from ..core.element import Element
+from ..parser.command import ConditionNode, ConditionType, LogicOp, Operator
+from .compiler import TEXT, NATIVE, filter_elements, filter_rows, may_raise, to_number
+from .pushdown import conjoin, conjuncts
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+NUMPY_AVAILABLE = np is not None
+
+# Below this many rows the Python path is as fast
+MIN_ROWS = 2048
+
+_ORDERING = {
+    Operator.GT: '__gt__',
+    Operator.GTE: '__ge__',
+    Operator.LT: '__lt__',
+    Operator.LTE: '__le__',
+}
+
+# Column arrays per table, rebuilt when the table grows
+_columns: Dict[int, Tuple[int, '_Columns']] = {}
+
+# Element columns per collection, rebuilt when its version changes
+_collections: Dict[int, Tuple[int, 'ElementColumns']] = {}
+
+
+class ElementColumns:
+    """
+    NumPy columns of a list of elements, each built the first time a
+    support check or mask reads it
+
+    Stands in for both a CandidateTable (has_overrides, tag_code) and its
+    _Columns. A field with a value the typed column cannot hold exactly (a
+    non-int index, a non-float cost, a non-bool flag, a non-str tag) counts
+    as overridden, so its predicates stay in Python.
+    """
+
+    def __init__(self, elements: Iterable[Element]):
+        self.elements = list(elements)
+        self.rows = len(self.elements)
+        self._built: Dict[str, Any] = {}
+        self._tag_codes: Dict[str, int] = {}
+        self._overrides = set()
+
+    def __len__(self) -> int:
+        return self.rows
+
+    def has_overrides(self, field: str) -> bool:
+        if field in _ELEMENT_KINDS:
+            self.column(field)
+        return field in self._overrides
+
+    def tag_code(self, tag: str) -> Optional[int]:
+        self.column('tag')
+        return self._tag_codes.get(tag)
+
+    def column(self, field: str):
+        """The NumPy column of field (None if overridden)"""
+        if field not in self._built:
+            values = list(map(attrgetter(field), self.elements))
+            if not set(map(type, values)) <= _ELEMENT_KINDS[field]:
+                self._overrides.add(field)
+                self._built[field] = None
+            elif field == 'tag':
+                self._tag_codes = {tag: code for code, tag in enumerate(dict.fromkeys(values))}
+                self._built[field] = np.fromiter(map(self._tag_codes.__getitem__, values),
+                                                 dtype=np.uint32, count=self.rows)
+            else:
+                self._built[field] = self._typed(field, values)
+        return self._built[field]
+
+    def _typed(self, field: str, values: List[Any]):
+        if field == 'index':
+            try:
+                return np.array(values, dtype=np.int64)
+            except OverflowError:
+                self._overrides.add(field)
+                return None
+        if field == 'selector_cost':
+            return np.array(values, dtype=np.float64)  # None -> NaN
+        return np.array(values, dtype=bool)
+
+    @property
+    def index(self):
+        return self.column('index')
+
+    @property
+    def cost(self):
+        return self.column('selector_cost')
+
+    @property
+    def cost_number(self):
+        if 'cost_number' not in self._built:
+            self._built['cost_number'] = np.where(np.isnan(self.cost), 0.0, self.cost)
+        return self._built['cost_number']
+
+    @property
+    def tag(self):
+        return self.column('tag')
+
+    def flag(self, field: str):
+        return self.column(field)
+
+
+# Value types each element column can hold exactly
+_ELEMENT_KINDS = {
+    'index': {int},
+    'selector_cost': {float, type(None)},
+    'tag': {str},
+    'visible': {bool},
+    'enabled': {bool},
+    'in_shadow': {bool},
+}
+
+
+def element_columns(collection: ElementCollection) -> ElementColumns:
+    """Columns of a collection's elements (cached until it changes)"""
+    key = id(collection)
+    cached = _collections.get(key)
+    if cached is not None and cached[0] == collection.version:
+        return cached[1]
+    if cached is None:
+        weakref.finalize(collection, _collections.pop, key, None)
+    columns = ElementColumns(collection.elements)
+    _collections[key] = (collection.version, columns)
+    return columns
+
+
+# Anything the masks can read columns from
+Columnar = Union[CandidateTable, ElementColumns]
+
+
+class _Columns:
+    """NumPy copies of one table's numeric columns"""
+
+    def __init__(self, table: Columnar):
+        raw = table.raw_columns()
+        self.rows = len(table)
+        self.index = np.array(raw['index'], dtype=np.int64)
+        self.cost = np.array(raw['selector_cost'], dtype=np.float64)
+        self.tag = np.array(raw['tag'], dtype=np.uint32)
+        flags = np.frombuffer(bytes(raw['flags']), dtype=np.uint8)
+        self.flags = {field: (flags & bit) != 0 for field, bit in FLAG_BITS.items()}
+
+        # Ordering operators read None as 0 (to_number)
+        self.cost_number = np.where(np.isnan(self.cost), 0.0, self.cost)
+
+    def flag(self, field: str):
+        return self.flags[field]
+
+
+def columns_of(table: Columnar) -> Union['_Columns', ElementColumns]:
+    """Column arrays of table (cached until it grows)"""
+    if isinstance(table, ElementColumns):
+        return table
+    key = id(table)
+    cached = _columns.get(key)
+    if cached is not None and cached[0] == len(table):
+        return cached[1]
+    if cached is None:
+        weakref.finalize(table, _columns.pop, key, None)
+    columns = _Columns(table)
+    _columns[key] = (len(table), columns)
+    return columns
+
+
+def split_condition(table: Columnar, condition: Optional[ConditionNode],
+                    dialect: str = TEXT) -> Tuple[List[ConditionNode], Optional[ConditionNode]]:
+    """
+    Split condition into vectorizable conjuncts and the Python residual
+
+    Returns:
+        (conjuncts evaluated as masks, residual condition or None)
+    """
+    if condition is None:
+        return [], None
+    vector: List[ConditionNode] = []
+    residual: List[ConditionNode] = []
+    blocked = False
+    for part in conjuncts(condition):
+        blocked = blocked or may_raise(part, dialect)
+        if not blocked and _supported(table, part, dialect):
+            vector.append(part)
+        else:
+            residual.append(part)
+    return vector, conjoin(residual)
+
+
+def vectorizable(source: Union[CandidateTable, ElementCollection],
+                 condition: Optional[ConditionNode], dialect: str = TEXT,
+                 tag: Optional[str] = None) -> bool:
+    """True if filter_table/filter_collection would evaluate part of the filter as masks"""
+    if np is None or len(source) < MIN_ROWS:
+        return False
+    table = element_columns(source) if isinstance(source, ElementCollection) else source
+    if tag is not None:
+        return not table.has_overrides('tag')
+    return bool(split_condition(table, condition, dialect)[0])
+
+
+def filter_table(table: CandidateTable, condition: Optional[ConditionNode],
+                 dialect: str = TEXT, tag: Optional[str] = None) -> Optional[List[CandidateRow]]:
+    """
+    Rows with the tag (if given) matching condition, in table order
+
+    Returns:
+        The matching rows, or None if NumPy is unavailable, the table is
+        small or nothing in the filter is vectorizable
+    """
+    if not vectorizable(table, condition, dialect, tag):
+        return None
+
+    rows, residual = _matching_rows(table, condition, dialect, tag)
+    if residual is not None:
+        return filter_rows(table, rows, residual, dialect)
+    return [CandidateRow(table, row) for row in rows]
+
+
+def filter_collection(collection: ElementCollection, condition: Optional[ConditionNode],
+                      dialect: str = TEXT, tag: Optional[str] = None) -> Optional[List[Element]]:
+    """
+    Elements of collection with the tag (if given) matching condition, in order
+
+    Returns:
+        The matching elements, or None if the filter is not vectorizable
+        (see filter_table)
+    """
+    if not vectorizable(collection, condition, dialect, tag):
+        return None
+
+    table = element_columns(collection)
+    rows, residual = _matching_rows(table, condition, dialect, tag)
+    elements = [table.elements[row] for row in rows]
+    if residual is not None:
+        return filter_elements(elements, residual, dialect)
+    return elements
+
+
+def _matching_rows(table: Columnar, condition: Optional[ConditionNode], dialect: str,
+                   tag: Optional[str]) -> Tuple[List[int], Optional[ConditionNode]]:
+    """Rows passing the vectorizable conjuncts (and tag), and the Python residual"""
+    columns = columns_of(table)
+    vector, residual = split_condition(table, condition, dialect)
+
+    mask = np.ones(columns.rows, dtype=bool)
+    if tag is not None:
+        mask &= _tag_mask(table, columns, tag)
+    for part in vector:
+        mask &= _mask(table, columns, part, dialect)
+    return np.flatnonzero(mask).tolist(), residual
+
+
+# ----------------------------------------------------------------------
+# Masks
+# ----------------------------------------------------------------------
+
+def _supported(table: Columnar, node: ConditionNode, dialect: str) -> bool:
+    if node.type == ConditionType.COMPOUND:
+        return (node.logic_op in (LogicOp.AND, LogicOp.OR)
+                and _supported(table, node.left, dialect)
+                and _supported(table, node.right, dialect))
+    if node.type == ConditionType.UNARY:
+        return _supported(table, node.operand, dialect)
+    return _leaf(table, None, node, dialect) is not None
+
+
+def _mask(table: Columnar, columns: _Columns, node: ConditionNode, dialect: str):
+    if node.type == ConditionType.COMPOUND:
+        left = _mask(table, columns, node.left, dialect)
+        right = _mask(table, columns, node.right, dialect)
+        return left & right if node.logic_op == LogicOp.AND else left | right
+    if node.type == ConditionType.UNARY:
+        return ~_mask(table, columns, node.operand, dialect)
+    return _leaf(table, columns, node, dialect)()
+
+
+def _leaf(table: Columnar, columns: Optional[_Columns], node: ConditionNode,
+          dialect: str):
+    """
+    Mask factory for a SIMPLE node, or None if it cannot be vectorized
+
+    With columns=None only support is checked; the factory must not be called.
+    """
+    field = node.field
+    op = node.operator
+    value = node.value
+    if table.has_overrides(field):
+        return None
+
+    if field in FLAG_BITS:
+        if dialect == NATIVE and field == 'in_shadow':
+            return None
+        column = None if columns is None else columns.flag(field)
+        if dialect == NATIVE:
+            if op not in (Operator.EQUALS, Operator.NOT_EQUALS):
+                return None
+            if isinstance(value, str):
+                return _constant(columns, op == Operator.NOT_EQUALS)
+            if not isinstance(value, (bool, int, float)):
+                return None
+            return _compare(column, op, value)
+        if op in _ORDERING:
+            return _compare(column, op, to_number(value))
+        if op in (Operator.EQUALS, Operator.NOT_EQUALS):
+            text = str(value)
+            if text not in ('True', 'False'):
+                return _constant(columns, op == Operator.NOT_EQUALS)
+            return _compare(column, op, text == 'True')
+        return None
+
+    if field == 'tag':
+        if op not in (Operator.EQUALS, Operator.NOT_EQUALS):
+            return None
+        if dialect == NATIVE and not isinstance(value, str):
+            return _constant(columns, op == Operator.NOT_EQUALS)
+        code = table.tag_code(str(value))
+        if code is None:
+            return _constant(columns, op == Operator.NOT_EQUALS)
+        return _compare(None if columns is None else columns.tag, op, code)
+
+    if dialect == NATIVE:
+        # index and selector_cost are attribute lookups in NATIVE
+        return None
+
+    if field == 'index':
+        column = None if columns is None else columns.index
+        if op in _ORDERING:
+            return _compare(column, op, to_number(value))
+        if op in (Operator.EQUALS, Operator.NOT_EQUALS):
+            text = str(value)
+            number = _canonical_int(text)
+            if number is None:
+                return _constant(columns, op == Operator.NOT_EQUALS)
+            return _compare(column, op, number)
+        return None
+
+    if field == 'selector_cost':
+        if op in _ORDERING:
+            return _compare(None if columns is None else columns.cost_number, op,
+                            to_number(value))
+        if op in (Operator.EQUALS, Operator.NOT_EQUALS):
+            text = str(value)
+            if text == 'None':
+                isnan = None if columns is None else np.isnan(columns.cost)
+                return lambda: isnan if op == Operator.EQUALS else ~isnan
+            number = _canonical_float(text)
+            if number is None:
+                return _constant(columns, op == Operator.NOT_EQUALS)
+            if number == 0:
+                return None  # str() tells 0.0 from -0.0; == does not
+            return _compare(None if columns is None else columns.cost, op, number)
+        return None
+
+    return None
+
+
+def _compare(column, op: Operator, value: Any):
+    if op == Operator.EQUALS:
+        return lambda: column == value
+    if op == Operator.NOT_EQUALS:
+        return lambda: column != value
+    method = _ORDERING[op]
+    return lambda: getattr(column, method)(value)
+
+
+def _constant(columns: Optional[_Columns], result: bool):
+    if columns is None:
+        return lambda: None
+    return lambda: np.full(columns.rows, result, dtype=bool)
+
+
+def _tag_mask(table: Columnar, columns: _Columns, tag: str):
+    code = table.tag_code(tag)
+    if code is None:
+        return np.zeros(columns.rows, dtype=bool)
+    return columns.tag == code
+
+
+def _canonical_int(text: str) -> Optional[int]:
+    """int n with str(n) == text, or None"""
+    try:
+        number = int(text)
+    except ValueError:
+        return None
+    return number if str(number) == text else None
+
+
+def _canonical_float(text: str) -> Optional[float]:
+    """float x with str(x) == text, or None"""
+    try:
+        number = float(text)
+    except ValueError:
+        return None
+    return number if str(number) == text else None
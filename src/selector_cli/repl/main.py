@@ -4,10 +4,13 @@ REPL (Read-Eval-Print Loop) for Selector CLI
 import asyncio
 import sys
 import logging
+from typing import Optional
 from ..parser.parser import Parser
 from ..commands.executor import CommandExecutor
 from ..core.context import Context
 from ..core.browser import BrowserManager
+from ..core.readiness import ReadinessPolicy
+from ..core.lean import LeanProfile
 from ..core.variable_expander import VariableExpander
 from ..core.completer import SelectorCompleter
 from ..core.storage import StorageManager
@@ -25,8 +28,11 @@ except ImportError:
 class SelectorREPL:
     """Interactive REPL for Selector CLI"""
 
-    def __init__(self, debug: bool = False):
+    def __init__(self, debug: bool = False, readiness: Optional[ReadinessPolicy] = None,
+                 lean: Optional[LeanProfile] = None):
         self.debug = debug
+        self.readiness = readiness  # default page-ready policy (networkidle if None)
+        self.lean = lean            # resource blocking profile (None: load everything)
         self.parser = Parser()
         self.executor = CommandExecutor()
         self.context = Context()
@@ -161,7 +167,7 @@ class SelectorREPL:
                 pass
 
         # Initialize browser
-        self.context.browser = BrowserManager()
+        self.context.browser = BrowserManager(readiness=self.readiness, lean=self.lean)
         await self.context.browser.initialize(headless=False)
 
     async def _cleanup(self):
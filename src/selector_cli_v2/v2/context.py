@@ -1,7 +1,7 @@
 """
 V2 Execution Context - Three-layer model (candidates → temp → workspace)
 """
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Sequence
 from datetime import datetime, timedelta
 from pathlib import Path
 import sys
@@ -12,6 +12,8 @@ sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
 
 from selector_cli.core.element import Element
 from selector_cli.core.collection import ElementCollection
+from selector_cli.core.candidate_table import CandidateTable
+from selector_cli.core.views import ElementView
 from selector_cli.core.browser import BrowserManager
 
 
@@ -40,8 +42,8 @@ class ContextV2:
         self.current_url: Optional[str] = None
 
         # Three-layer element management
-        self._candidates: List[Element] = []
-        self._temp: List[Element] = []
+        self._candidates: CandidateTable = CandidateTable()
+        self._temp: ElementView = ElementView()
         self._workspace: ElementCollection = ElementCollection(name="workspace")
 
         # Focus tracking (which layer is currently being viewed/operated on)
@@ -70,32 +72,34 @@ class ContextV2:
     # =========================================================================
 
     @property
-    def candidates(self) -> List[Element]:
-        """Get candidates (SCAN results)"""
-        return self._candidates.copy()
+    def candidates(self) -> Sequence[Element]:
+        """Get candidates (SCAN results) - read-only view, not a copy"""
+        return self._candidates
 
     @candidates.setter
     def candidates(self, elements: List[Element]):
-        """Set candidates (SCAN results)"""
+        """Set candidates (SCAN results) - a CandidateTable or any elements"""
+        if not isinstance(elements, CandidateTable):
+            elements = CandidateTable.from_elements(elements)
         self._candidates = elements
         self.last_scan_time = datetime.now()
 
     @property
-    def temp(self) -> List[Element]:
-        """Get temp (FIND results) - may be expired"""
+    def temp(self) -> Sequence[Element]:
+        """Get temp (FIND results) - may be expired; read-only snapshot"""
         if self._is_temp_expired():
-            return []
-        return self._temp.copy()
+            return ElementView()
+        return self._temp
 
     @temp.setter
     def temp(self, elements: List[Element]):
-        """Set temp (FIND results)"""
-        self._temp = elements
+        """Set temp (FIND results) - snapshotted once here"""
+        self._temp = ElementView(elements)
         self._last_find_time = datetime.now()
 
     def clear_temp(self) -> None:
         """Clear temp state"""
-        self._temp.clear()
+        self._temp = ElementView()
         self._last_find_time = None
         self._focus = 'candidates'  # Reset focus when temp is cleared
 
@@ -151,9 +155,7 @@ class ContextV2:
             Element or None
         """
         if layer == 'candidates':
-            for elem in self._candidates:
-                if elem.index == index:
-                    return elem
+            return self._candidates.get(index)
         elif layer == 'temp':
             for elem in self.temp:  # Use property to check expiration
                 if elem.index == index:
@@ -175,7 +177,7 @@ class ContextV2:
             List of elements
         """
         if layer == 'candidates':
-            return [elem for elem in self._candidates if elem.tag == elem_type]
+            return self._candidates.by_tag(elem_type)
         elif layer == 'temp':
             return [elem for elem in self.temp if elem.tag == elem_type]
         elif layer == 'workspace':
@@ -10,9 +10,13 @@ sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
 
 from selector_cli.core.element import Element
 from selector_cli.core.scanner import ElementScanner
+from selector_cli.core.progress import LiveCounter
+from selector_cli.core.candidate_table import CandidateTable
 from selector_cli_v2.v2.context import ContextV2
 from selector_cli_v2.v2.command import CommandV2
-from selector_cli.parser.command import ConditionNode, ConditionType, Operator
+from selector_cli.query.compiler import compile_condition, filter_elements, NATIVE
+from selector_cli.query.pushdown import find_elements
+from selector_cli.query.planner import filter_layer
 
 
 class ExecutorV2:
@@ -20,6 +24,7 @@ class ExecutorV2:
 
     def __init__(self, ctx: ContextV2):
         self.ctx = ctx
+        self.scanner = ElementScanner()
 
     async def execute(self, cmd: CommandV2) -> Tuple[bool, Any]:
         """
@@ -91,23 +96,15 @@ class ExecutorV2:
         # If this is a refine command (.find), source is temp
         if cmd.is_refine_command():
             # Start from current temp results
-            elements = self.ctx.temp.copy()
-        elif source_layer == "temp":
-            # Find from temp (shouldn't happen for top-level find, but support it)
-            elements = self.ctx.temp.copy()
-        elif source_layer == "candidates":
-            # Find from candidates
-            elements = self.ctx.candidates.copy()
-        elif source_layer == "workspace":
-            # Find from workspace
-            elements = self.ctx.workspace.get_all()
-        else:
-            # Default: query from DOM
+            source_layer = "temp"
+        elif source_layer not in ("temp", "candidates", "workspace"):
+            # Default: query from DOM; WHERE runs in the page where possible
             elements = await self._query_dom(page, cmd)
+            self.ctx.temp = elements
+            return elements
 
-        # Apply WHERE conditions if present
-        if cmd.condition_tree:
-            elements = self._filter_elements(elements, cmd.condition_tree)
+        # Apply WHERE conditions if present (tag index or compiled filter)
+        elements = self._select(source_layer, cmd.condition_tree)
 
         # Store in temp
         self.ctx.temp = elements
@@ -127,31 +124,15 @@ class ExecutorV2:
         # Determine source (candidates is default)
         source = cmd.source or "candidates"
 
-        # Get source elements
-        if source == "candidates":
-            source_elements = self.ctx.candidates
-        elif source == "temp":
-            source_elements = self.ctx.temp
-        elif source == "workspace":
-            source_elements = self.ctx.workspace.get_all()
-        else:
-            raise ValueError(f"Invalid source: {source}")
-
-        # Filter by element types if specified
+        # Filter by element types (tag index lookups) and WHERE conditions
         if cmd.element_types:
             elements_to_add = []
             for elem_type in cmd.element_types:
-                if elem_type == "*":
-                    elements_to_add.extend(source_elements)
-                else:
-                    elements_to_add.extend([e for e in source_elements if e.tag == elem_type])
+                tag = None if elem_type == "*" else elem_type
+                elements_to_add.extend(self._select(source, cmd.condition_tree, tag))
         else:
             # Add all from source
-            elements_to_add = source_elements
-
-        # Apply WHERE conditions if present
-        if cmd.condition_tree:
-            elements_to_add = self._filter_elements(elements_to_add, cmd.condition_tree)
+            elements_to_add = self._select(source, cmd.condition_tree)
 
         # Add to workspace
         added_count = 0
@@ -218,18 +199,38 @@ class ExecutorV2:
             raise ValueError("No browser/page loaded")
 
         page = self.ctx.browser.get_page()
-        scanner = ElementScanner()
 
         # Get element types to scan
-        element_types = cmd.element_types or scanner.DEFAULT_ELEMENT_TYPES
+        element_types = cmd.element_types or self.scanner.DEFAULT_ELEMENT_TYPES
+
+        concurrency = cmd.options.get('concurrency', self.scanner.DEFAULT_CONCURRENCY)
+        if isinstance(concurrency, bool) or not isinstance(concurrency, int) or concurrency < 1:
+            raise ValueError("--concurrency requires a positive integer")
+
+        incremental = cmd.options.get('incremental', False)
+        if incremental is not True and incremental is not False:
+            raise ValueError("--incremental takes no value")
 
         # Scan for elements
-        elements = await scanner.scan(page, element_types=element_types)
+        if incremental:
+            elements = await self.scanner.scan(
+                page, element_types=element_types, concurrency=concurrency, incremental=True
+            )
+            table = CandidateTable.from_scan(elements, page)
+        else:
+            table = CandidateTable(page)
+            counter = LiveCounter("Scanning")
+            try:
+                async for element in self.scanner.scan_iter(page, element_types, concurrency):
+                    table.append_scanned(element)
+                    counter.update(len(table))
+            finally:
+                counter.close()
 
         # Store in candidates
-        self.ctx.candidates = elements
+        self.ctx.candidates = table
 
-        return elements
+        return self.ctx.candidates
 
     async def execute_preview(self, cmd: CommandV2) -> str:
         """
@@ -361,115 +362,37 @@ class ExecutorV2:
     # =========================================================================
 
     async def _query_dom(self, page, cmd: CommandV2) -> List[Element]:
-        """Query DOM for elements matching command criteria"""
-        elements = []
-
-        if not cmd.element_types:
-            return elements
-
-        # Query each element type
-        element_index = 0
-        for elem_type in cmd.element_types:
-            if elem_type == "*":
-                # Query all elements - NOT IMPLEMENTED YET
-                continue
-
-            # Query elements by tag name
-            locators = await page.locator(elem_type).all()
-
-            for locator in locators:
-                try:
-                    # Build element (reuse scanner logic)
-                    scanner = ElementScanner()
-                    element = await scanner._build_element(
-                        locator, element_index, elem_type, page.url, page
-                    )
-                    elements.append(element)
-                    element_index += 1
-                except Exception:
-                    # Skip if we can't build element
-                    continue
+        """Query DOM for elements matching command criteria (types and WHERE)"""
+        # Query all elements ("*") - NOT IMPLEMENTED YET
+        element_types = [t for t in cmd.element_types or [] if t != "*"]
+        if not element_types:
+            return []
+
+        return await find_elements(
+            self.scanner, page, element_types, cmd.condition_tree, NATIVE
+        )
+
+    def _layer(self, source: str):
+        """Storage of a layer (indexed where possible)"""
+        if source == "candidates":
+            return self.ctx.candidates
+        elif source == "temp":
+            return self.ctx.temp
+        elif source == "workspace":
+            return self.ctx.workspace
+        raise ValueError(f"Invalid source: {source}")
 
-        return elements
+    def _select(self, source: str, condition_tree, tag: Optional[str] = None) -> List[Element]:
+        """Elements of a layer (with tag, if given) matching the condition tree"""
+        return filter_layer(self._layer(source), condition_tree, NATIVE, tag)
 
     def _filter_elements(self, elements: List[Element], condition_tree) -> List[Element]:
-        """Filter elements based on condition tree"""
-        return [e for e in elements if self._evaluate_condition(e, condition_tree)]
+        """Filter elements based on condition tree (compiled once per call)"""
+        return filter_elements(elements, condition_tree, NATIVE)
 
     def _evaluate_condition(self, element: Element, condition_node) -> bool:
         """Evaluate condition tree against element"""
-        from selector_cli.parser.command import ConditionType, LogicOp, Operator
-
-        if condition_node.type == ConditionType.SIMPLE:
-            return self._evaluate_simple_condition(element, condition_node)
-
-        elif condition_node.type == ConditionType.COMPOUND:
-            left_result = self._evaluate_condition(element, condition_node.left)
-            right_result = self._evaluate_condition(element, condition_node.right)
-
-            if condition_node.logic_op == LogicOp.AND:
-                return left_result and right_result
-            elif condition_node.logic_op == LogicOp.OR:
-                return left_result or right_result
-
-        elif condition_node.type == ConditionType.UNARY:
-            operand_result = self._evaluate_condition(element, condition_node.operand)
-            return not operand_result
-
-        return False
-
-    def _evaluate_simple_condition(self, element: Element, condition_node) -> bool:
-        """Evaluate simple condition against element"""
-        field = condition_node.field
-        operator = condition_node.operator
-        value = condition_node.value
-
-        # Get field value from element
-        field_value = self._get_field_value(element, field)
-
-        # Evaluate based on operator
-        if operator == Operator.EQUALS:
-            return field_value == value
-        elif operator == Operator.NOT_EQUALS:
-            return field_value != value
-        elif operator == Operator.CONTAINS:
-            return value in str(field_value)
-        elif operator == Operator.GT:
-            return field_value > value
-        elif operator == Operator.GTE:
-            return field_value >= value
-        elif operator == Operator.LT:
-            return field_value < value
-        elif operator == Operator.LTE:
-            return field_value <= value
-
-        return False
-
-    def _get_field_value(self, element: Element, field: str):
-        """Get field value from element"""
-        if field == "tag":
-            return element.tag
-        elif field == "type":
-            return element.type
-        elif field == "text":
-            return element.text
-        elif field == "value":
-            return element.value
-        elif field == "id":
-            return element.id
-        elif field == "name":
-            return element.name
-        elif field == "visible":
-            return element.visible
-        elif field == "enabled":
-            return element.enabled
-        elif field == "disabled":
-            return element.disabled
-        elif field in element.attributes:
-            return element.attributes[field]
-        else:
-            # Default to attribute or empty string
-            return element.attributes.get(field, "")
+        return compile_condition(condition_node, NATIVE)(element)
 
     def _format_elements(self, elements: List[Element], source: str) -> str:
         """Format elements for display"""
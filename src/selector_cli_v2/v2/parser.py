@@ -306,7 +306,7 @@ class ParserV2(V1Parser):
         )
 
     def _parse_scan_v2(self, raw: str) -> CommandV2:
-        """Parse: scan [element_types] [--deep] [--types type1,type2]"""
+        """Parse: scan [element_types] [--deep] [--types type1,type2] [--concurrency N] [--incremental]"""
         self._consume(TokenType.SCAN)
 
         # Parse element types (comma-separated list)
@@ -318,23 +318,8 @@ class ParserV2(V1Parser):
         ):
             element_types = self._parse_element_types()
 
-        # Parse options (Phase 2: --deep, --types, etc.)
-        options = {}
-        while self._current_token().type == TokenType.DOUBLE_DASH:
-            self._consume(TokenType.DOUBLE_DASH)
-            option_token = self._current_token()
-            if option_token.type == TokenType.IDENTIFIER:
-                option_name = option_token.value
-                self._advance()
-
-                # Check for = value
-                if self._current_token().type == TokenType.EQUALS:
-                    self._consume(TokenType.EQUALS)
-                    option_value = self._parse_value()
-                    options[option_name] = option_value
-                else:
-                    # Boolean flag
-                    options[option_name] = True
+        # Parse options (Phase 2: --deep, --types, --concurrency N, etc.)
+        options = self._parse_options()
 
         return CommandV2(
             verb="scan",
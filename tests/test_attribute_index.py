@@ -0,0 +1,191 @@
+"""
+Tests for the page-wide attribute frequency index
+"""
+import pytest
+from selector_cli.core.element import Element
+from selector_cli.core.locator.attribute_index import (
+    AttributeIndex, ATTRIBUTE_INDEX_SCRIPT, INDEXED_ATTRIBUTES, parse_simple_selector
+)
+from selector_cli.core.locator.validator import (
+    UniquenessValidator, VALIDATE_BATCH_SCRIPT, PAGE_STATE_SCRIPT
+)
+
+
+def build_counts(nodes, attributes):
+    """Python equivalent of ATTRIBUTE_INDEX_SCRIPT"""
+    counts = {}
+
+    def add(key):
+        counts[key] = counts.get(key, 0) + 1
+
+    for node in nodes:
+        tag, attrs = node['tag'], node['attributes']
+        for attr in attributes:
+            if attr in attrs:
+                add(f"{attr}\0{attrs[attr]}")
+                add(f"{tag}\0{attr}\0{attrs[attr]}")
+        for cls in set(attrs.get('class', '').split()):
+            add(f"class\0{cls}")
+            add(f"{tag}\0class\0{cls}")
+    return counts
+
+
+class IndexedPage:
+    """Page answering the index and state scripts; any other access is recorded"""
+
+    def __init__(self, nodes):
+        self.url = "https://example.com/"
+        self.nodes = nodes
+        self.calls = []
+
+    async def evaluate(self, script, arg=None):
+        if script == ATTRIBUTE_INDEX_SCRIPT:
+            self.calls.append('index')
+            return build_counts(self.nodes, arg)
+        if script == PAGE_STATE_SCRIPT:
+            return "doc:0"
+        assert script == VALIDATE_BATCH_SCRIPT
+        self.calls.append(('batch', [s for s, _ in arg['selectors']]))
+        return {'counts': [None] * len(arg['selectors']), 'results': [None] * len(arg['pairs'])}
+
+    def locator(self, selector):
+        self.calls.append(('locator', selector))
+        raise RuntimeError("unexpected page access")
+
+
+def make_nodes():
+    return [
+        {'tag': 'input', 'attributes': {'id': 'email', 'name': 'email', 'class': 'field wide'}},
+        {'tag': 'input', 'attributes': {'name': 'q', 'class': 'field'}},
+        {'tag': 'button', 'attributes': {'name': 'q', 'class': 'btn'}},
+        {'tag': 'a', 'attributes': {'href': '/home', 'class': 'btn'}},
+    ]
+
+
+def make_element(tag, **attributes):
+    return Element(
+        index=0, uuid="uuid-0", tag=tag, type=attributes.get('type', ''), text='',
+        value='', attributes=attributes, name=attributes.get('name', ''),
+        id=attributes.get('id', ''), classes=attributes.get('class', '').split(),
+        placeholder='', selector='', xpath='', visible=True, enabled=True, disabled=False,
+    )
+
+
+class TestParseSimpleSelector:
+    """Only single exact-match selectors are index-answerable"""
+
+    @pytest.mark.parametrize('selector,expected', [
+        ('#email', ('', 'id', 'email')),
+        ('input#email', ('input', 'id', 'email')),
+        ('.btn', ('', 'class', 'btn')),
+        ('a.btn', ('a', 'class', 'btn')),
+        ('[data-testid="login"]', ('', 'data-testid', 'login')),
+        ('input[name="q"]', ('input', 'name', 'q')),
+        ('a[href="/home"]', ('a', 'href', '/home')),
+    ])
+    def test_simple(self, selector, expected):
+        assert parse_simple_selector(selector) == expected
+
+    @pytest.mark.parametrize('selector', [
+        'input',
+        'input[type="text"]',             # type matches case-insensitively in HTML
+        'input[type="text"][name="q"]',
+        'button:has-text("Save")',
+        'form > input[name="q"]',
+        '#1abc',
+        '[name="a\\"b"]',
+    ])
+    def test_not_simple(self, selector):
+        assert parse_simple_selector(selector) is None
+
+
+class TestAttributeIndex:
+    """Counts and target identification"""
+
+    def setup_method(self):
+        self.index = AttributeIndex(build_counts(make_nodes(), INDEXED_ATTRIBUTES))
+
+    def test_counts(self):
+        assert self.index.count('#email') == 1
+        assert self.index.count('[name="q"]') == 2
+        assert self.index.count('input[name="q"]') == 1
+        assert self.index.count('.btn') == 2
+        assert self.index.count('a.btn') == 1
+        assert self.index.count('#missing') == 0
+        assert self.index.count('button:has-text("Go")') is None
+
+    def test_identifies(self):
+        email = make_element('input', id='email', name='email')
+        search = make_element('input', name='q', **{'class': 'field'})
+
+        assert self.index.identifies('#email', email) is True
+        assert self.index.identifies('#email', search) is False
+        assert self.index.identifies('input[name="q"]', search) is True
+        assert self.index.identifies('button[name="q"]', search) is False
+        assert self.index.identifies('[name="q"]', search) is False
+        assert self.index.identifies('.wide', search) is False
+        assert self.index.identifies('input:nth-of-type(2)', search) is None
+
+
+class TestValidatorWithIndex:
+    """UniquenessValidator answers simple selectors without page access"""
+
+    @pytest.mark.asyncio
+    async def test_is_unique_uses_index(self):
+        page = IndexedPage(make_nodes())
+        validator = UniquenessValidator()
+        assert await validator.index_page(page)
+
+        assert await validator.is_unique('#email', page) is True
+        assert await validator.is_unique('[name="q"]', page) is False
+        assert page.calls == ['index']
+        assert validator.cache_stats()['index_hits'] == 2
+
+    @pytest.mark.asyncio
+    async def test_strict_uniqueness_without_page(self):
+        page = IndexedPage(make_nodes())
+        validator = UniquenessValidator()
+        await validator.index_page(page)
+
+        email = make_element('input', id='email', name='email')
+        assert await validator.is_strictly_unique('input#email', email, page) is True
+        assert page.calls == ['index']
+
+    @pytest.mark.asyncio
+    async def test_batch_sends_only_undecided_selectors(self):
+        page = IndexedPage(make_nodes())
+        validator = UniquenessValidator()
+        await validator.index_page(page)
+
+        search = make_element('input', name='q', **{'class': 'field'})
+        matrix = await validator.validate_batch(page, [
+            (search, [('[name="q"]', False), ('input[name="q"]', False),
+                      ('input:nth-of-type(2)', False)]),
+        ])
+
+        assert matrix == [[False, True, None]]
+        assert page.calls == ['index', ('batch', ['input:nth-of-type(2)'])]
+
+    @pytest.mark.asyncio
+    async def test_index_dropped_with_page_cache(self):
+        page = IndexedPage(make_nodes())
+        validator = UniquenessValidator()
+        await validator.index_page(page)
+        await validator.index_page(page)
+        assert page.calls == ['index']
+
+        validator.clear_page(page.url)
+        await validator.index_page(page)
+        assert page.calls == ['index', 'index']
+
+    @pytest.mark.asyncio
+    async def test_index_failure_falls_back_to_page(self):
+        class BrokenPage:
+            url = "https://example.com/"
+
+            async def evaluate(self, script, arg=None):
+                raise RuntimeError("Execution context was destroyed")
+
+        validator = UniquenessValidator()
+        assert await validator.index_page(BrokenPage()) is False
+        assert validator._index_identifies(BrokenPage(), '#email', False, make_element('input')) is None
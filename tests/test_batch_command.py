@@ -0,0 +1,87 @@
+"""
+Tests for `selector batch` over saved HTML pages
+"""
+import io
+import json
+import os
+import shutil
+from selector_cli.commands.batch import find_html_files, run_batch, main
+
+
+FIXTURE = os.path.join(os.path.dirname(__file__), 'test_role_button.html')
+
+LOGIN_HTML = """
+<form>
+  <input id="user" type="text" name="user">
+  <input type="password" name="pwd">
+  <button type="submit">Log in</button>
+</form>
+"""
+
+
+def make_corpus(tmp_path):
+    shutil.copy(FIXTURE, tmp_path / 'role.html')
+    (tmp_path / 'nested').mkdir()
+    (tmp_path / 'nested' / 'login.htm').write_text(LOGIN_HTML, encoding='utf-8')
+    (tmp_path / 'notes.txt').write_text('not html', encoding='utf-8')
+    return tmp_path
+
+
+def read_lines(text):
+    return [json.loads(line) for line in text.splitlines()]
+
+
+class TestBatch:
+    """run_batch / main"""
+
+    def test_finds_html_recursively(self, tmp_path):
+        corpus = make_corpus(tmp_path)
+        paths = find_html_files(str(corpus))
+
+        assert [os.path.relpath(p, corpus) for p in paths] == [
+            os.path.join('nested', 'login.htm'), 'role.html'
+        ]
+
+    def test_jsonl_records_in_page_order(self, tmp_path):
+        corpus = make_corpus(tmp_path)
+        out = io.StringIO()
+
+        summary = run_batch(str(corpus), out, workers=2)
+        lines = read_lines(out.getvalue())
+
+        assert summary == {'pages': 2, 'elements': len(lines), 'failed': 0}
+        assert [l['page'] for l in lines] == [os.path.join('nested', 'login.htm')] * 3 + ['role.html'] * 3
+
+        user = lines[0]
+        assert user['selector'] == '#user'
+        assert user['strategy'] == 'ID_SELECTOR'
+        assert user['cost'] > 0
+        assert user['url'].startswith('file://')
+        assert lines[1]['selector'] == 'input[type="password"][name="pwd"]'
+        assert lines[4]['selector'] == '#traditional'
+
+    def test_single_worker_matches_pool(self, tmp_path):
+        corpus = make_corpus(tmp_path)
+        pooled, inline = io.StringIO(), io.StringIO()
+
+        run_batch(str(corpus), pooled, workers=2)
+        run_batch(str(corpus), inline, workers=1)
+
+        assert read_lines(pooled.getvalue()) == read_lines(inline.getvalue())
+
+    def test_unreadable_page_is_reported(self, tmp_path):
+        corpus = make_corpus(tmp_path)
+        (corpus / 'broken.html').write_bytes(b'\xff\xfe\x00<html')
+        out_file = tmp_path / 'out.jsonl'
+
+        code = main([str(corpus), '--workers', '1', '--out', str(out_file), '--types', 'button'])
+        lines = read_lines(out_file.read_text(encoding='utf-8'))
+
+        assert code == 1
+        assert lines[0]['page'] == 'broken.html'
+        assert 'UnicodeDecodeError' in lines[0]['error']
+        assert [l['tag'] for l in lines[1:]] == ['button', 'button']
+
+    def test_invalid_arguments(self, tmp_path):
+        assert main([str(tmp_path / 'missing')]) == 2
+        assert main([str(tmp_path), '--workers', '0']) == 2
@@ -0,0 +1,218 @@
+"""
+Tests for batched in-page uniqueness validation
+"""
+import re
+import pytest
+from selector_cli.core.element import Element
+from selector_cli.core.locator.validator import UniquenessValidator, VALIDATE_BATCH_SCRIPT
+from selector_cli.core.locator.strategy import LocationStrategyEngine
+
+
+SIMPLE_SELECTOR = re.compile(r'^(?P<tag>[a-z]+)?(?:#(?P<id>[\w-]+))?(?:\[(?P<attr>[\w-]+)="(?P<value>[^"]*)"\])*$')
+
+
+class FakeLocator:
+    """Locator used only by the per-selector fallback"""
+
+    def __init__(self, page, selector, nodes):
+        self.page = page
+        self.selector = selector
+        self.nodes = nodes
+
+    @property
+    def first(self):
+        return FakeLocator(self.page, self.selector, self.nodes[:1])
+
+    async def count(self):
+        self.page.calls.append(('count', self.selector))
+        return len(self.nodes)
+
+    async def evaluate(self, script):
+        return self.nodes[0]['tag']
+
+    async def get_attribute(self, name):
+        return self.nodes[0]['attributes'].get(name)
+
+
+class FakePage:
+    """Page with a tiny selector engine covering the forms used in tests"""
+
+    def __init__(self, nodes):
+        self.url = "https://example.com/"
+        self.nodes = nodes
+        self.calls = []
+
+    def _resolve(self, selector, is_xpath):
+        """Return matching nodes, or None if the 'browser' can't evaluate it"""
+        if is_xpath or ':has-text' in selector:
+            return None
+        match = SIMPLE_SELECTOR.match(selector)
+        if not match:
+            return None
+        nodes = self.nodes
+        if match.group('tag'):
+            nodes = [n for n in nodes if n['tag'] == match.group('tag')]
+        if match.group('id'):
+            nodes = [n for n in nodes if n['attributes'].get('id') == match.group('id')]
+        for attr, value in re.findall(r'\[([\w-]+)="([^"]*)"\]', selector):
+            nodes = [n for n in nodes if n['attributes'].get(attr) == value]
+        return nodes
+
+    def locator(self, selector):
+        if selector.startswith('xpath='):
+            return FakeLocator(self, selector, [])
+        if ':has-text' in selector:
+            text = selector.split('"')[1]
+            nodes = [n for n in self.nodes if text in n.get('text', '')]
+            return FakeLocator(self, selector, nodes)
+        return FakeLocator(self, selector, self._resolve(selector, False) or [])
+
+    async def evaluate(self, script, arg=None):
+        assert script == VALIDATE_BATCH_SCRIPT
+        self.calls.append(('page.evaluate', [tuple(s) for s in arg['selectors']]))
+        resolved = [self._resolve(s, x) for s, x in arg['selectors']]
+
+        def is_target(node, target):
+            attrs = node['attributes']
+            return (node['tag'] == target['tag']
+                    and all(not target[k] or attrs.get(k) == target[k] for k in ('type', 'name', 'id')))
+
+        return {
+            'counts': [None if r is None else len(r) for r in resolved],
+            'results': [
+                None if resolved[s] is None
+                else len(resolved[s]) == 1 and is_target(resolved[s][0], arg['targets'][t])
+                for t, s in arg['pairs']
+            ],
+        }
+
+
+def make_element(index, tag, **attributes):
+    return Element(
+        index=index, uuid=f"uuid-{index}", tag=tag,
+        type=attributes.get('type', ''), text=attributes.pop('text', ''),
+        value='', attributes=attributes,
+        name=attributes.get('name', ''), id=attributes.get('id', ''),
+        classes=[], placeholder='', selector='', xpath='',
+        visible=True, enabled=True, disabled=False,
+    )
+
+
+def make_nodes():
+    return [
+        {'tag': 'input', 'attributes': {'id': 'email', 'type': 'email'}},
+        {'tag': 'input', 'attributes': {'type': 'text', 'name': 'q'}},
+        {'tag': 'input', 'attributes': {'type': 'text', 'name': 'q'}},
+        {'tag': 'button', 'attributes': {}, 'text': 'Save'},
+    ]
+
+
+class TestValidateBatch:
+    """UniquenessValidator.validate_batch"""
+
+    @pytest.mark.asyncio
+    async def test_single_round_trip_with_deduplication(self):
+        page = FakePage(make_nodes())
+        validator = UniquenessValidator()
+        a = make_element(0, 'input', id='email', type='email')
+        b = make_element(1, 'input', type='text', name='q')
+
+        matrix = await validator.validate_batch(page, [
+            (a, [('#email', False), ('input', False)]),
+            (b, [('input', False), ('input[name="q"]', False)]),
+        ])
+
+        assert matrix == [[True, False], [False, False]]
+        evaluates = [c for c in page.calls if c[0] == 'page.evaluate']
+        assert len(evaluates) == 1
+        assert evaluates[0][1] == [('#email', False), ('input', False), ('input[name="q"]', False)]
+        assert not [c for c in page.calls if c[0] == 'count']
+
+    @pytest.mark.asyncio
+    async def test_target_mismatch_is_not_unique(self):
+        page = FakePage(make_nodes())
+        wrong = make_element(0, 'input', id='other', type='email')
+
+        matrix = await UniquenessValidator().validate_batch(page, [(wrong, [('#email', False)])])
+        assert matrix == [[False]]
+
+    @pytest.mark.asyncio
+    async def test_unevaluable_selectors_are_unresolved(self):
+        page = FakePage(make_nodes())
+        button = make_element(3, 'button', text='Save')
+
+        matrix = await UniquenessValidator().validate_batch(page, [
+            (button, [('button:has-text("Save")', False), ("//button[1]", True)]),
+        ])
+        assert matrix == [[None, None]]
+
+    @pytest.mark.asyncio
+    async def test_results_fill_cache(self):
+        page = FakePage(make_nodes())
+        validator = UniquenessValidator()
+        a = make_element(0, 'input', id='email', type='email')
+
+        await validator.validate_batch(page, [(a, [('#email', False), ('input', False)])])
+        assert validator.validation_cache[f"{page.url}:#email:False"] is True
+        assert validator.validation_cache[f"{page.url}:input:False"] is False
+
+        # Known non-unique selectors are not sent again
+        page.calls.clear()
+        matrix = await validator.validate_batch(page, [(a, [('input', False)])])
+        assert matrix == [[False]]
+        assert not page.calls
+
+    @pytest.mark.asyncio
+    async def test_script_failure_leaves_matrix_unresolved(self):
+        page = FakePage(make_nodes())
+
+        async def broken(script, arg=None):
+            raise RuntimeError("Execution context was destroyed")
+        page.evaluate = broken
+
+        a = make_element(0, 'input', id='email', type='email')
+        matrix = await UniquenessValidator().validate_batch(page, [(a, [('#email', False)])])
+        assert matrix == [[None]]
+
+
+class TestFindBestLocators:
+    """LocationStrategyEngine.find_best_locators"""
+
+    @pytest.mark.asyncio
+    async def test_matches_single_element_search(self):
+        elements = [
+            make_element(0, 'input', id='email', type='email'),
+            make_element(1, 'button', text='Save'),
+        ]
+
+        batch_page = FakePage(make_nodes())
+        batch = await LocationStrategyEngine().find_best_locators(elements, batch_page)
+
+        single_page = FakePage(make_nodes())
+        engine = LocationStrategyEngine()
+        single = [await engine.find_best_locator(e, single_page) for e in elements]
+
+        assert [(r.selector, r.strategy) for r in batch] == [(r.selector, r.strategy) for r in single]
+        assert batch[0].selector == '#email'
+        assert batch[1].selector == 'button:has-text("Save")'
+
+    @pytest.mark.asyncio
+    async def test_falls_back_only_for_unresolved_selectors(self):
+        elements = [
+            make_element(0, 'input', id='email', type='email'),
+            make_element(1, 'button', text='Save'),
+        ]
+        page = FakePage(make_nodes())
+        await LocationStrategyEngine().find_best_locators(elements, page)
+
+        assert len([c for c in page.calls if c[0] == 'page.evaluate']) == 1
+        # Only pseudo-class selectors the fake page can't evaluate hit locators
+        counted = {c[1] for c in page.calls if c[0] == 'count'}
+        assert 'button:has-text("Save")' in counted
+        assert all(':' in selector for selector in counted)
+
+    @pytest.mark.asyncio
+    async def test_no_unique_locator(self):
+        elements = [make_element(1, 'input', type='text', name='q')]
+        results = await LocationStrategyEngine().find_best_locators(elements, FakePage(make_nodes()))
+        assert results == [None]
@@ -0,0 +1,180 @@
+"""
+Tests for the columnar CandidateTable and its CandidateRow views
+"""
+from datetime import datetime, timezone
+
+import pytest
+from selector_cli.core.candidate_table import CandidateTable, CandidateRow
+from selector_cli.core.collection import ElementCollection
+from selector_cli.core.context import Context
+from selector_cli.core.element import Element
+from selector_cli.commands.executor import CommandExecutor
+from selector_cli.generators.data_exporters import JSONExporter, CSVExporter
+from selector_cli.parser.command import ConditionNode, ConditionType, Operator
+
+
+class FakeLocator:
+    def __init__(self, selector, position=None):
+        self.selector = selector
+        self.position = position
+
+    def nth(self, position):
+        return FakeLocator(self.selector, position)
+
+
+class FakePage:
+    def locator(self, selector):
+        return FakeLocator(selector)
+
+
+def scanned(index, tag, text='', **attributes):
+    """Element shaped like ElementScanner output"""
+    return Element(
+        index=index, uuid=f"6f1c0b8e-4a8b-4f55-9c1e-{index:012d}", tag=tag,
+        type=attributes.get('type', ''), text=text, value=attributes.get('value', ''),
+        attributes=attributes, name=attributes.get('name', ''), id=attributes.get('id', ''),
+        classes=attributes['class'].split() if attributes.get('class') else [],
+        placeholder=attributes.get('placeholder', ''),
+        selector=f"#{attributes['id']}" if 'id' in attributes else tag,
+        xpath=f"/html/body/{tag}[1]", selector_cost=0.5, strategy_used='ID_SELECTOR',
+        visible=True, enabled=True, disabled='disabled' in attributes,
+        page_url="https://example.com/",
+    )
+
+
+def make_elements():
+    return [
+        scanned(0, 'input', id='email', type='email', name='email', **{'class': 'field wide'}),
+        scanned(1, 'input', type='text', name='q', placeholder='Search'),
+        scanned(2, 'button', 'Go', id='go', disabled=''),
+    ]
+
+
+class TestRoundTrip:
+    """Rows reproduce the elements they were built from"""
+
+    def test_scanner_elements(self):
+        elements = make_elements()
+        table = CandidateTable.from_elements(elements)
+
+        assert len(table) == 3
+        assert [row.to_element() for row in table] == elements
+        assert table.to_elements() == elements
+
+    def test_fields_that_differ_from_attributes(self):
+        element = Element(
+            index=7, uuid='not-a-uuid', tag='div', type='custom', name='n',
+            attributes={'class': 'a b'}, classes=['x'], disabled=True, path='/p',
+            in_shadow=True, shadow_host='my-host', visible=False, selector_cost=None,
+            scanned_at=datetime(2024, 5, 1, 12, 0, 0, 123456, tzinfo=timezone.utc),
+        )
+        row = CandidateTable.from_elements([element])[0]
+
+        assert row.to_element() == element
+        assert row.uuid == 'not-a-uuid'
+        assert row.type == 'custom'
+        assert row.classes == ['x']
+        assert row.disabled is True
+        assert row.selector_cost is None
+
+    def test_naive_timestamp_is_exact(self):
+        element = make_elements()[0]
+        element.scanned_at = datetime(2025, 1, 2, 3, 4, 5, 678901)
+        assert CandidateTable.from_elements([element])[0].scanned_at == element.scanned_at
+
+
+class TestRowView:
+    """CandidateRow reads like an Element"""
+
+    def setup_method(self):
+        self.elements = make_elements()
+        self.table = CandidateTable.from_elements(self.elements)
+
+    def test_attribute_access(self):
+        email, search, go = self.table
+        assert email.id == 'email'
+        assert email.classes == ['field', 'wide']
+        assert email.attributes == self.elements[0].attributes
+        assert search.placeholder == 'Search'
+        assert go.disabled is True
+        assert go.text == 'Go'
+
+    def test_str_and_to_dict_match_element(self):
+        for row, element in zip(self.table, self.elements):
+            assert str(row) == str(element)
+            assert row.to_dict() == element.to_dict()
+
+    def test_read_only(self):
+        row = self.table[0]
+        with pytest.raises(AttributeError):
+            row.text = 'changed'
+        with pytest.raises(AttributeError):
+            row.no_such_field
+
+        # attribute dicts are copies
+        row.attributes['id'] = 'other'
+        assert row.id == 'email'
+
+    def test_sequence_protocol(self):
+        assert self.table[-1].index == 2
+        assert [r.index for r in self.table[1:]] == [1, 2]
+        assert self.table[0] == self.elements[0]
+        assert self.elements[0] == self.table[0]
+        with pytest.raises(IndexError):
+            self.table[3]
+
+
+class TestScannedLocators:
+    """Locators of scanned rows are rebuilt from tag and position"""
+
+    def test_positions_per_tag(self):
+        page = FakePage()
+        elements = make_elements()
+        for element, position in zip(elements, (0, 1, 0)):
+            element.locator = page.locator(element.tag).nth(position)
+
+        table = CandidateTable.from_scan(elements, page)
+
+        assert [(r.locator.selector, r.locator.position) for r in table] == [
+            ('input', 0), ('input', 1), ('button', 0)
+        ]
+
+    def test_unscanned_locators_are_kept(self):
+        element = make_elements()[0]
+        element.locator = FakeLocator('custom')
+        assert CandidateTable.from_elements([element])[0].locator is element.locator
+
+
+class TestConsumers:
+    """Collections, exporters, WHERE evaluation and contexts read rows directly"""
+
+    def setup_method(self):
+        self.elements = make_elements()
+        self.table = CandidateTable.from_elements(self.elements)
+
+    def test_collection(self):
+        collection = ElementCollection()
+        for row in self.table:
+            collection.add(row)
+        assert collection.get(1).name == 'q'
+        assert collection.filter(lambda e: e.tag == 'input').count() == 2
+
+    @pytest.mark.parametrize('exporter', [JSONExporter(), CSVExporter()])
+    def test_exporters(self, exporter):
+        assert exporter.generate(list(self.table)) == exporter.generate(self.elements)
+
+    def test_where_evaluation(self):
+        condition = ConditionNode(
+            type=ConditionType.SIMPLE, field='type', operator=Operator.EQUALS, value='text'
+        )
+        matched = CommandExecutor()._filter_by_condition_tree(list(self.table), condition)
+        assert [row.index for row in matched] == [1]
+
+    def test_context_stores_table(self):
+        context = Context(enable_history_file=False)
+        context.update_elements(self.elements)
+
+        assert isinstance(context._candidates, CandidateTable)
+        assert all(isinstance(row, CandidateRow) for row in context.candidates)
+        assert context.get_element_by_index(2).id == 'go'
+        assert context.candidates == self.elements
@@ -0,0 +1,129 @@
+"""
+Tests for the hash indexes on ElementCollection and CandidateTable
+"""
+import time
+
+import pytest
+from selector_cli.core.candidate_table import CandidateTable
+from selector_cli.core.collection import ElementCollection
+from selector_cli.core.context import Context
+from selector_cli.core.element import Element
+from selector_cli.commands.executor import CommandExecutor
+from selector_cli.parser.parser import Parser
+
+
+def make_elements(count, start=0):
+    return [
+        Element(index=i, uuid=f"00000000-0000-4000-8000-{i:012d}",
+                tag=('button', 'input')[i % 2], selector=f"#el-{i}")
+        for i in range(start, start + count)
+    ]
+
+
+def collection_of(elements):
+    collection = ElementCollection()
+    for elem in elements:
+        collection.add(elem)
+    return collection
+
+
+class TestCollectionIndexes:
+    """Secondary indexes stay in step with add/remove/clear"""
+
+    def test_lookups(self):
+        collection = collection_of(make_elements(4))
+
+        assert collection.get_by_uuid("00000000-0000-4000-8000-000000000002").index == 2
+        assert collection.get_by_selector("#el-3").index == 3
+        assert [e.index for e in collection.get_by_tag('input')] == [1, 3]
+        assert collection.contains_uuid("00000000-0000-4000-8000-000000000000")
+        assert collection.get_by_uuid("missing") is None
+
+    def test_remove_updates_indexes_and_keeps_order(self):
+        elements = make_elements(4)
+        collection = collection_of(elements)
+
+        collection.remove(elements[1])
+
+        assert [e.index for e in collection] == [0, 2, 3]
+        assert [e.index for e in collection.get_by_tag('input')] == [3]
+        assert collection.get_by_selector("#el-1") is None
+        assert not collection.contains_uuid(elements[1].uuid)
+
+        collection.clear()
+        assert collection.is_empty()
+        assert collection.get_by_tag('button') == []
+
+    def test_shared_selector_falls_back_to_next(self):
+        first, second = make_elements(2)
+        second.selector = first.selector
+        collection = collection_of([first, second])
+
+        collection.remove(first)
+        assert collection.get_by_selector(first.selector) is second
+
+    def test_set_operations_scale_linearly(self):
+        big = collection_of(make_elements(20000))
+        other = collection_of(make_elements(20000, start=10000))
+
+        started = time.perf_counter()
+        big.difference_in_place(other)
+        elapsed = time.perf_counter() - started
+
+        assert len(big) == 10000
+        assert big.get(9999) is not None and big.get(10000) is None
+        assert elapsed < 1.0
+
+
+class TestCandidateUuidIndex:
+    """uuid and selector lookups on CandidateTable"""
+
+    def test_lookups_follow_appends(self):
+        table = CandidateTable.from_elements(make_elements(3))
+        assert table.get_by_uuid("00000000-0000-4000-8000-000000000001").index == 1
+        assert table.get_by_selector("#el-2").index == 2
+
+        table.append(Element(index=9, uuid='not-a-uuid', tag='a', selector='a'))
+
+        assert table.contains_uuid('not-a-uuid')
+        assert table.get_by_selector('a').index == 9
+        assert not table.contains_uuid("00000000-0000-4000-8000-000000000099")
+
+
+class TestContextLookups:
+    """Context lookups go through the candidate indexes"""
+
+    def test_lookups_use_indexes(self, monkeypatch):
+        ctx = Context(enable_history_file=False)
+        ctx.update_elements(make_elements(1000))
+        table = ctx._candidates
+
+        def scan(self):
+            raise AssertionError("candidates scanned")
+        monkeypatch.setattr(CandidateTable, '__iter__', scan)
+
+        assert ctx.get_element_by_index(500).selector == "#el-500"
+        assert len(ctx.get_elements_by_type('input')) == 500
+        assert ctx.add_candidates(make_elements(2, start=999)) == 1
+        assert table._rows_by_index is not None
+        assert table._rows_by_tag is not None
+        assert table._rows_by_uuid is not None
+
+        # Indexes follow the appended row
+        assert ctx.get_element_by_index(1000).selector == "#el-1000"
+        assert len(ctx.get_elements_by_type('button')) == 501
+
+
+class TestAddCommand:
+    """add ... where ... to workspace on a large page"""
+
+    @pytest.mark.asyncio
+    async def test_add_to_workspace_from_candidates(self):
+        ctx = Context(enable_history_file=False)
+        ctx.update_elements(make_elements(10000))
+
+        command = Parser().parse('add to workspace from candidates where tag = "input"')
+        result = await CommandExecutor().execute(command, ctx)
+
+        assert result == "Added 5000 element(s) → workspace (5000 total)"
+        assert ctx.workspace.get_by_tag('button') == []
@@ -0,0 +1,136 @@
+"""
+Tests for the parse cache and compiled macros/scripts
+"""
+import os
+import pytest
+from selector_cli.commands.compiled import CompiledMacro, CompiledScripts
+from selector_cli.commands.executor import CommandExecutor
+from selector_cli.core.context import Context
+from selector_cli.core.element import Element
+from selector_cli.core.macro import Macro
+from selector_cli.parser.command import Command
+from selector_cli.parser.parser import Parser
+from selector_cli.query.planner import split_statements
+
+
+def make_context():
+    context = Context(enable_history_file=False)
+    context.candidates = [Element(index=i, uuid=f"00000000-0000-4000-8000-{i:012d}",
+                                  tag=('input', 'button')[i % 2], text=f"Item {i}")
+                          for i in range(6)]
+    return context
+
+
+def no_lexing(parser, monkeypatch):
+    def tokenize(text):
+        raise AssertionError(f"lexed {text!r}")
+    monkeypatch.setattr(parser.lexer, 'tokenize', tokenize)
+
+
+class TestParseCache:
+    """Parser.parse is an LRU cache over normalized text"""
+
+    def test_repeated_text_parsed_once(self):
+        parser = Parser()
+        first = parser.parse('add from candidates where tag = "input"')
+        assert parser.parse('  add from candidates where tag = "input"\n') is first
+        assert parser.cache_info().hits == 1 and parser.cache_info().misses == 1
+
+    def test_errors_not_cached(self):
+        parser = Parser()
+        for _ in range(2):
+            with pytest.raises(ValueError):
+                parser.parse("list where")
+        assert parser.cache_info().currsize == 0
+
+    def test_lru_bound_and_disabled(self):
+        parser = Parser(cache_size=2)
+        for text in ("count", "list", "clear", "count"):
+            parser.parse(text)
+        assert parser.cache_info().currsize == 2
+
+        uncached = Parser(cache_size=0)
+        assert uncached.parse("count") is not uncached.parse("count")
+
+
+class TestCompiledMacro:
+    """Macro bodies parse once; quoted parameters are bound without parsing"""
+
+    @pytest.mark.parametrize('args', [['input'], ['Item 1'], ['a;b'], ['{x}'], ['say "hi"']])
+    def test_binding_matches_text_expansion(self, args):
+        macro = Macro('m', ['count; list where tag = "{t}" and text contains \'{t}\'',
+                            'find input where name = "{t}-x"', 'list candidates',
+                            'open {t}'], ['t'])
+        parser = Parser()
+
+        def parsed(statements):
+            result = []
+            for number, statement in statements:
+                if isinstance(statement, str):
+                    try:
+                        statement = Parser(cache_size=0).parse(statement)
+                    except ValueError:
+                        pass
+                result.append((number, statement))
+            return result
+
+        expected = [(number, statement) for number, cmd in enumerate(macro.expand(args), 1)
+                    for statement in split_statements(cmd)]
+        assert parsed(CompiledMacro(macro, parser).statements(args)) == parsed(expected)
+
+    def test_runs_skip_lexing(self, monkeypatch):
+        macro = Macro('m', ['count', 'list where tag = "{t}"; list temp'], ['t'])
+        parser = Parser()
+        compiled = CompiledMacro(macro, parser)
+        no_lexing(parser, monkeypatch)
+
+        runs = [compiled.statements([tag]) for tag in ('input', 'button', 'a')]
+
+        assert [command.condition_tree.value for run in runs for _, command in run[1:2]] == \
+            ['input', 'button', 'a']
+        assert runs[0][0][1] is runs[1][0][1]  # constant statement shared
+        assert runs[1][1][1].raw == 'list where tag = "button"'
+
+    def test_unquoted_parameter_expands_as_text(self):
+        compiled = CompiledMacro(Macro('m', ['open {url}'], ['url']), Parser())
+        assert compiled.statements(['example.com']) == [(1, 'open example.com')]
+
+    def test_too_few_arguments(self):
+        compiled = CompiledMacro(Macro('m', ['list where tag = "{t}"'], ['t']), Parser())
+        with pytest.raises(ValueError, match="expects 1 parameters"):
+            compiled.statements([])
+
+
+class TestExecutor:
+    """run and exec use the compiled forms"""
+
+    @pytest.mark.asyncio
+    async def test_macro_recompiled_when_redefined(self):
+        executor, context = CommandExecutor(), make_context()
+        parse = executor.parser.parse
+
+        await executor.execute(parse('macro pick {t} add to workspace from candidates '
+                                     'where tag = "{t}"'), context)
+        assert await executor.execute(parse('run pick "input"'), context) == \
+            "Added 3 element(s) → workspace (3 total)"
+        await executor.execute(parse('macro pick {t} clear'), context)
+        assert await executor.execute(parse('run pick "input"'), context) == \
+            "Cleared 3 element(s) from collection"
+
+    @pytest.mark.asyncio
+    async def test_script_compiled_per_version(self, tmp_path):
+        executor = CommandExecutor()
+        script = tmp_path / "s.sel"
+        script.write_text("count\n# note\nlist; bogus\n")
+
+        first = executor.scripts.statements(str(script))
+        assert executor.scripts.statements(str(script)) is first
+        assert [(line, isinstance(s, Command)) for line, s in first] == \
+            [(1, True), (3, True), (3, False)]
+
+        script.write_text("count\ncount\ncount\n")
+        os.utime(script, ns=(0, os.stat(script).st_mtime_ns + 1_000_000))
+        assert len(executor.scripts.statements(str(script))) == 3
+
+        result = await executor.execute(executor.parser.parse(f'exec "{script}"'), make_context())
+        assert result.count("Collection contains 0 element(s)") == 3
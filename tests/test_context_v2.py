@@ -19,8 +19,8 @@ class TestContextThreeLayerModel:
         assert ctx.temp == []
         assert ctx.workspace.is_empty()
         assert ctx.focus == 'candidates'
-        # Check property returns copy, not direct reference
-        assert ctx.candidates is not ctx._candidates
+        # Property returns the read-only table itself, not a copy
+        assert ctx.candidates is ctx._candidates
 
     def test_candidates_setter(self):
         """Test setting candidates"""
@@ -183,9 +183,8 @@ class TestContextV1BackwardCompatibility:
         assert ctx.all_elements[0].tag == 'button'
         assert ctx.candidates[0].tag == 'button'
 
-        # They should point to the same underlying data
-        # (but note that the property returns a copy, so we test that)
-        assert ctx.all_elements is not ctx.all_elements  # Different copies
+        # They should point to the same underlying data (no per-access copy)
+        assert ctx.all_elements is ctx.candidates
 
     def test_collection_backward_compatible(self):
         """Test that collection (workspace) works for v1 compatibility"""
@@ -0,0 +1,114 @@
+"""
+Tests for zero-copy context layers (candidates table, temp snapshot)
+"""
+import pytest
+from selector_cli.core.candidate_table import CandidateTable
+from selector_cli.core.context import Context
+from selector_cli.core.element import Element
+from selector_cli.core.views import ElementView
+from selector_cli.commands.executor import CommandExecutor
+from selector_cli.parser.parser import Parser
+from selector_cli_v2.v2.context import ContextV2
+
+
+def make_elements():
+    return [
+        Element(index=0, uuid='a', tag='button', text='Go'),
+        Element(index=1, uuid='b', tag='input', name='q'),
+        Element(index=2, uuid='c', tag='button', text='Stop'),
+    ]
+
+
+class TestElementView:
+    """Read-only tuple snapshot"""
+
+    def test_sequence_and_equality(self):
+        elements = make_elements()
+        view = ElementView(elements)
+
+        assert len(view) == 3
+        assert view == elements
+        assert elements == view
+        assert view[1:] == elements[1:]
+        assert ElementView() == []
+        assert view != elements[:2]
+
+    def test_snapshot_is_immutable(self):
+        elements = make_elements()
+        view = ElementView(elements)
+        elements.pop()
+
+        assert len(view) == 3
+        assert not hasattr(view, 'append')
+        assert view.copy() is not view.copy()
+
+    def test_rewrapping_shares_storage(self):
+        view = ElementView(make_elements())
+        assert ElementView(view)._items is view._items
+
+
+class TestCandidateLookups:
+    """Hash lookups on CandidateTable"""
+
+    def test_get_and_by_tag(self):
+        table = CandidateTable.from_elements(make_elements())
+
+        assert table.get(1).name == 'q'
+        assert table.get(9) is None
+        assert [row.text for row in table.by_tag('button')] == ['Go', 'Stop']
+        assert table.by_tag('select') == []
+
+    def test_indexes_follow_appends(self):
+        table = CandidateTable.from_elements(make_elements())
+        table.get(0)
+        table.by_tag('input')
+
+        table.append(Element(index=3, uuid='d', tag='input', name='r'))
+
+        assert table.get(3).name == 'r'
+        assert [row.name for row in table.by_tag('input')] == ['q', 'r']
+
+
+class TestContextLayers:
+    """Layer access returns the stored view instead of a copy"""
+
+    def test_v2_layers_are_shared(self):
+        elements = make_elements()
+        ctx = ContextV2(enable_history_file=False)
+        ctx.candidates = elements
+        ctx.temp = elements[:2]
+
+        assert ctx.candidates is ctx.candidates
+        assert ctx.temp is ctx.temp
+        assert ctx.temp == elements[:2]
+        assert ctx.get_element_by_index(2).text == 'Stop'
+        assert len(ctx.get_elements_by_type('button')) == 2
+
+        ctx.clear_temp()
+        assert ctx.temp == []
+
+    @pytest.mark.asyncio
+    async def test_v1_add_appends_to_candidates(self):
+        ctx = Context(enable_history_file=False)
+        ctx.update_elements(make_elements()[:2])
+        ctx.temp = make_elements()
+
+        result = await CommandExecutor().execute(Parser().parse('add from temp'), ctx)
+
+        assert result == "Added 1 element(s) → candidates (3 total)"
+        assert [e.uuid for e in ctx.candidates] == ['a', 'b', 'c']
+        assert ctx.get_element_by_index(2).text == 'Stop'
+
+    def test_v1_lookups_do_not_scan_candidates(self, monkeypatch):
+        ctx = Context(enable_history_file=False)
+        ctx.collection.add(make_elements()[0])
+        ctx.update_elements(make_elements())
+
+        def scan(self):
+            raise AssertionError("candidates scanned")
+        monkeypatch.setattr(CandidateTable, '__iter__', scan)
+
+        assert ctx.get_element_by_index(2).text == 'Stop'
+        assert ctx.get_element_by_index(9) is None
+        assert [e.uuid for e in ctx.get_elements_by_type('button')] == ['a', 'c']
+        assert len(ctx.workspace) == 1  # update_elements keeps the workspace
@@ -0,0 +1,158 @@
+"""
+Tests for the selector daemon and its attach client
+"""
+import asyncio
+import os
+import subprocess
+import sys
+from contextlib import asynccontextmanager
+import pytest
+from selector_cli.core.browser import BrowserManager
+from selector_cli.core.context import Context
+from selector_cli.core.element import Element
+from selector_cli.daemon import client as attach
+from selector_cli.daemon.client import DaemonClient, DaemonError
+from selector_cli.daemon.server import DaemonServer
+
+pytestmark = pytest.mark.skipif(not hasattr(asyncio, 'start_unix_server'),
+                                reason="needs Unix domain sockets")
+
+
+class IdleBrowser(BrowserManager):
+    """Started browser that never navigates"""
+
+    def __init__(self):
+        super().__init__()
+        self.browser = object()
+        self.closed = False
+
+    async def close(self):
+        self.closed = True
+
+
+ADD_INPUTS = 'add to workspace from candidates where tag = "input"'
+
+
+def make_elements():
+    return [Element(index=i, uuid=f"00000000-0000-4000-8000-{i:012d}",
+                    tag=('input', 'button')[i % 2], text=f"Item {i}")
+            for i in range(6)]
+
+
+def quiet_context():
+    return Context(enable_history_file=False)
+
+
+@asynccontextmanager
+async def running_daemon(tmp_path):
+    context = quiet_context()
+    context.candidates = make_elements()
+    daemon = DaemonServer(str(tmp_path / "daemon.sock"), IdleBrowser(), context=context)
+    await daemon.start()
+    try:
+        yield daemon
+    finally:
+        await daemon.stop()
+
+
+def in_thread(function, *args):
+    """Run blocking client code off the event loop the daemon serves on"""
+    return asyncio.get_event_loop().run_in_executor(None, function, *args)
+
+
+class TestDaemon:
+    """Clients share one warm context"""
+
+    @pytest.mark.asyncio
+    async def test_state_survives_between_clients(self, tmp_path):
+        async with running_daemon(tmp_path) as server:
+            def first():
+                with DaemonClient(server.path) as client:
+                    return client.execute(ADD_INPUTS), client.execute('bogus')
+
+            def second():
+                with DaemonClient(server.path) as client:
+                    return client.execute('count'), client.status()
+
+            added, bogus = await in_thread(first)
+            count, status = await in_thread(second)
+
+            assert added == {'ok': True, 'output': "Added 3 element(s) → workspace (3 total)"}
+            assert bogus == {'ok': False, 'output': "Parse error: Unknown command: bogus"}
+            assert count['output'] == "Collection contains 3 element(s)"
+            assert "Up " in status['output'] and "3 command(s) served" in status['output']
+            assert "Candidates: 6, workspace: 3" in status['output']
+
+    @pytest.mark.asyncio
+    async def test_relative_paths_use_client_directory(self, tmp_path):
+        async with running_daemon(tmp_path) as server:
+            (tmp_path / "pick.sel").write_text(ADD_INPUTS.replace('input', 'button') + "\n")
+
+            reply = await server.execute('exec "pick.sel"', cwd=str(tmp_path))
+
+            assert reply['ok'], reply
+            assert len(server.context.workspace) == 3
+            assert os.getcwd() != str(tmp_path)
+
+    @pytest.mark.asyncio
+    async def test_second_daemon_refused_and_stale_socket_replaced(self, tmp_path):
+        async with running_daemon(tmp_path) as server:
+            other = DaemonServer(server.path, IdleBrowser(), context=quiet_context())
+            with pytest.raises(RuntimeError, match="already listening"):
+                await other.start()
+
+            stale = tmp_path / "stale.sock"
+            stale.write_text("")
+            daemon = DaemonServer(str(stale), IdleBrowser(), context=quiet_context())
+            await daemon.start()
+            await daemon.stop()
+            assert not stale.exists() and daemon.browser.closed
+
+    @pytest.mark.asyncio
+    async def test_shutdown_ends_serve(self, tmp_path):
+        daemon = DaemonServer(str(tmp_path / "d.sock"), IdleBrowser(), context=quiet_context())
+        serving = asyncio.ensure_future(daemon.serve())
+        while not os.path.exists(daemon.path):
+            await asyncio.sleep(0.01)
+
+        def stop():
+            with DaemonClient(daemon.path) as client:
+                return client.shutdown()
+
+        assert (await in_thread(stop))['output'] == "Daemon stopping"
+        await asyncio.wait_for(serving, 5)
+        assert daemon.browser.closed and not os.path.exists(daemon.path)
+
+
+class TestAttach:
+    """selector attach exit codes and output"""
+
+    @pytest.mark.asyncio
+    async def test_exit_codes(self, tmp_path, capsys):
+        async with running_daemon(tmp_path) as server:
+            socket_args = ['--socket', server.path]
+            ok = await in_thread(attach.main, socket_args + ['-c', ADD_INPUTS, '-c', 'count'])
+            failed = await in_thread(attach.main, socket_args + ['-c', 'list input where'])
+            blank = await in_thread(attach.main, socket_args + ['-c', '   ', '-c', ''])
+
+            out, err = capsys.readouterr()
+            assert (ok, failed, blank) == (0, 1, 0)
+            assert out.splitlines() == ["Added 3 element(s) → workspace (3 total)",
+                                        "Collection contains 3 element(s)"]
+            assert err.startswith("Parse error")
+
+    def test_no_daemon(self, tmp_path, capsys):
+        path = str(tmp_path / "missing.sock")
+        with pytest.raises(DaemonError, match="no selector daemon"):
+            DaemonClient(path).connect()
+        assert attach.main(['--socket', path, '-c', 'count']) == 2
+        assert "selector daemon start" in capsys.readouterr().err
+
+    def test_client_does_not_load_browser_stack(self):
+        code = ("import sys, selector_cli.daemon.client; "
+                "print(sorted(m for m in ('playwright', 'selector_cli.commands.executor') "
+                "if m in sys.modules))")
+        env = dict(os.environ, PYTHONPATH=os.pathsep.join(sys.path))
+        result = subprocess.run([sys.executable, '-c', code], capture_output=True, text=True,
+                                env=env, check=True)
+        assert result.stdout.strip() == "[]"
@@ -0,0 +1,198 @@
+"""
+Tests for pushing FIND's WHERE clause into the page
+"""
+import re
+
+import pytest
+from selector_cli.core.context import Context
+from selector_cli.core.locator.validator import VALIDATE_BATCH_SCRIPT, PAGE_STATE_SCRIPT
+from selector_cli.core.scanner import FIND_ELEMENTS_SCRIPT
+from selector_cli.commands.executor import CommandExecutor
+from selector_cli.parser.parser import Parser
+from selector_cli.query.compiler import NATIVE
+from selector_cli.query.pushdown import plan_pushdown, css_string
+
+
+def where(clause):
+    return Parser().parse(f"add where {clause}").condition_tree
+
+
+class TestPlan:
+    """Splitting conditions into CSS, in-page filter and residual"""
+
+    def test_attribute_equality_becomes_css(self):
+        plan = plan_pushdown(where('role = "button" and name = "go"'))
+        assert plan.css == '[role="button"][name="go"]'
+        assert plan.filter is None
+        assert plan.exact
+
+    def test_page_fields_become_filter(self):
+        plan = plan_pushdown(where('visible and text contains "Save"'))
+        assert plan.css == ''
+        assert plan.filter == {'op': 'and', 'args': [
+            {'op': 'cmp', 'field': {'kind': 'visible'}, 'test': 'eq', 'value': 'True', 'text': True},
+            {'op': 'cmp', 'field': {'kind': 'text'}, 'test': 'contains', 'value': 'Save',
+             'text': True},
+        ]}
+        assert plan.exact
+
+    def test_unsupported_conjuncts_stay_in_python(self):
+        plan = plan_pushdown(where('role = "button" and text matches "^S" and index > 3'))
+        assert plan.css == '[role="button"]'
+        assert plan.filter['field'] == {'kind': 'index'}
+        assert repr(plan.residual) == '(text MATCHES ^S)'
+
+    def test_or_is_pushed_only_as_a_whole(self):
+        assert plan_pushdown(where('id = "a" or title = "b"')).filter['op'] == 'or'
+        plan = plan_pushdown(where('id = "a" or selector = "#a"'))
+        assert plan.filter is None and not plan.exact
+
+    def test_case_insensitive_and_empty_values_avoid_css(self):
+        plan = plan_pushdown(where('type = "email" and name = ""'))
+        assert plan.css == ''
+        assert [arg['field']['name'] for arg in plan.filter['args']] == ['type', 'name']
+
+    def test_native_dialect_keeps_python_types(self):
+        plan = plan_pushdown(where('visible = true and name = "q"'), NATIVE)
+        assert plan.css == '[name="q"]'
+        assert plan.filter['value'] is True and plan.filter['text'] is False
+        # str vs bool never equal in Python; leave it to Python
+        assert not plan_pushdown(where('visible = "yes"'), NATIVE).exact
+
+    def test_css_string_escaping(self):
+        assert css_string('a"b\\c\nd') == '"a\\"b\\\\c\\a d"'
+
+
+class FakeLocator:
+    def __init__(self, selector, position=None):
+        self.selector = selector
+        self.position = position
+
+    def nth(self, position):
+        return FakeLocator(self.selector, position)
+
+
+class FindPage:
+    """Page answering FIND_ELEMENTS_SCRIPT by interpreting its arguments"""
+
+    def __init__(self, nodes):
+        self.url = "https://example.com/"
+        self.nodes = nodes
+        self.find_calls = []
+        self.described = 0
+
+    def _match(self, selector):
+        if selector.startswith('#'):
+            return [n for n in self.nodes if n['attributes'].get('id') == selector[1:]]
+        return [n for n in self.nodes if n['tag'] == selector]
+
+    def locator(self, selector):
+        return FakeLocator(selector)
+
+    def _value(self, field, node, type_, index):
+        kind = field['kind']
+        if kind == 'attr':
+            return node['attributes'].get(field['name'], field['default'])
+        if kind == 'tag':
+            return type_
+        if kind == 'index':
+            return index
+        return node[kind]
+
+    def _test(self, tree, node, type_, index):
+        if tree['op'] in ('and', 'or'):
+            results = [self._test(arg, node, type_, index) for arg in tree['args']]
+            return all(results) if tree['op'] == 'and' else any(results)
+        if tree['op'] == 'not':
+            return not self._test(tree['arg'], node, type_, index)
+        value = self._value(tree['field'], node, type_, index)
+        if tree['text']:
+            value = str(value)
+        expected = tree['value']
+        return {
+            'eq': lambda: value == expected, 'ne': lambda: value != expected,
+            'contains': lambda: expected in value, 'gt': lambda: value > expected,
+        }[tree['test']]()
+
+    def _css(self, css, node):
+        return all(node['attributes'].get(name) == value
+                   for name, value in re.findall(r'\[([\w-]+)="([^"]*)"\]', css))
+
+    async def evaluate(self, script, arg=None):
+        if script == PAGE_STATE_SCRIPT:
+            return "doc:0"
+        if script == FIND_ELEMENTS_SCRIPT:
+            self.find_calls.append(arg)
+            groups, index = [], 0
+            for type_ in arg['types']:
+                nodes = self._match(type_)
+                matches = []
+                for position, node in enumerate(nodes):
+                    if (not arg['css'] or self._css(arg['css'], node)) and \
+                            (not arg['filter'] or self._test(arg['filter'], node, type_,
+                                                             index + position)):
+                        self.described += 1
+                        matches.append({'position': position, 'attributes': node['attributes'],
+                                        'text': node['text'], 'visible': node['visible'],
+                                        'enabled': True, 'xpath': ''})
+                index += len(nodes)
+                groups.append({'type': type_, 'total': len(nodes), 'matches': matches})
+            return groups
+        if script == VALIDATE_BATCH_SCRIPT:
+            resolved = [None if x or not s.startswith('#') else self._match(s)
+                        for s, x in arg['selectors']]
+            return {
+                'counts': [None if r is None else len(r) for r in resolved],
+                'results': [None if resolved[s] is None else len(resolved[s]) == 1
+                            for _, s in arg['pairs']],
+            }
+        raise RuntimeError("unsupported script")
+
+
+class FakeBrowser:
+    def __init__(self, page):
+        self.page = page
+
+    def get_page(self):
+        return self.page
+
+
+def role_page(count):
+    return FindPage([
+        {'tag': 'div', 'text': f'Item {i}', 'visible': i % 2 == 0,
+         'attributes': {'id': f'd{i}', **({'role': 'button'} if i % 10 == 0 else {})}}
+        for i in range(count)
+    ])
+
+
+class TestFindCommand:
+    """find runs one in-page pass and only describes matches"""
+
+    def setup_method(self):
+        self.page = role_page(100)
+        self.context = Context(enable_history_file=False)
+        self.context.browser = FakeBrowser(self.page)
+
+    async def find(self, line):
+        return await CommandExecutor().execute(Parser().parse(line), self.context)
+
+    @pytest.mark.asyncio
+    async def test_find_where_role(self):
+        result = await self.find('find div where role="button"')
+
+        assert result == "Found 10 div(s) → temp"
+        assert len(self.page.find_calls) == 1
+        assert self.page.find_calls[0]['css'] == '[role="button"]'
+        assert self.page.described == 10
+        assert [e.index for e in self.context.temp] == list(range(0, 100, 10))
+        assert self.context.temp[1].selector == '#d10'
+        assert (self.context.temp[1].locator.selector, self.context.temp[1].locator.position) \
+            == ('div', 10)
+
+    @pytest.mark.asyncio
+    async def test_residual_applied_after_pushdown(self):
+        result = await self.find('find div where visible and id matches "^d[2-4]0$"')
+
+        assert result == "Found 3 div(s) → temp"
+        assert self.page.described == 50
+        assert [e.id for e in self.context.temp] == ['d20', 'd30', 'd40']
@@ -0,0 +1,74 @@
+"""
+Import-time checks for the startup path (python -X importtime)
+
+Each module is imported in a fresh interpreter; importtime reports every
+module loaded along the way with its cumulative cost in microseconds.
+"""
+import importlib.util
+import os
+import subprocess
+import sys
+from typing import Dict
+import pytest
+
+# Modules only browser work, scans and exports need
+HEAVY = (
+    'playwright',
+    'selector_cli.generators',
+    'selector_cli.core.locator.strategy',
+    'selector_cli.core.highlighter',
+)
+
+
+def import_times(statement: str) -> Dict[str, int]:
+    """Module name -> cumulative import time (us) for running statement"""
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join(sys.path))
+    result = subprocess.run([sys.executable, '-X', 'importtime', '-c', statement],
+                            capture_output=True, text=True, env=env, check=True)
+    times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+        _, cumulative, name = line[len('import time:'):].split('|')
+        times[name.strip()] = int(cumulative)
+    return times
+
+
+class TestColdStart:
+    """The entry point and non-browser commands skip the browser stack"""
+
+    @pytest.mark.parametrize('module', [
+        'selector_cli.main',
+        'selector_cli.parser.parser',
+        'selector_cli.commands.executor',
+        'selector_cli.repl.main',
+        'selector_cli.daemon.server',
+    ])
+    def test_no_heavy_imports(self, module):
+        loaded = import_times(f'import {module}')
+        assert module in loaded
+        assert [name for name in HEAVY if name in loaded] == []
+
+    def test_scanner_defers_strategy_engine(self):
+        loaded = import_times('import selector_cli.core.scanner, selector_cli.core.locator.snapshot')
+        assert 'selector_cli.core.locator.strategy' not in loaded
+
+        loaded = import_times('from selector_cli.core.scanner import ElementScanner; ElementScanner()')
+        assert 'selector_cli.core.locator.strategy' in loaded
+
+    @pytest.mark.skipif(importlib.util.find_spec('playwright') is None,
+                        reason="needs playwright")
+    def test_entry_point_cheaper_than_playwright(self):
+        # Relative budget: holds on slow and fast machines alike
+        entry = import_times('import selector_cli.main')['selector_cli.main']
+        browser = import_times('import playwright.async_api')['playwright.async_api']
+        assert entry < browser
+
+    def test_strategy_installs_no_handler(self):
+        env = dict(os.environ, PYTHONPATH=os.pathsep.join(sys.path))
+        code = ("import logging, selector_cli.core.locator.strategy; "
+                "logger = logging.getLogger('locator.strategy'); "
+                "print(len(logger.handlers), logger.level)")
+        result = subprocess.run([sys.executable, '-c', code], capture_output=True, text=True,
+                                env=env, check=True)
+        assert result.stdout.split() == ['0', '0']
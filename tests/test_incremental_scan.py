@@ -0,0 +1,251 @@
+"""
+Tests for incremental re-scans (MutationObserver-driven)
+"""
+import pytest
+from selector_cli.core.scanner import (
+    ElementScanner, EXTRACT_ELEMENTS_SCRIPT, INCREMENTAL_EXTRACT_SCRIPT, SCANNED_ATTRIBUTES
+)
+from selector_cli.core.locator.validator import VALIDATE_BATCH_SCRIPT, PAGE_STATE_SCRIPT
+
+
+class Node:
+    def __init__(self, tag, text='', **attributes):
+        self.tag = tag
+        self.text = text
+        self.attributes = attributes
+        self.key = None
+
+
+class MockLocator:
+    def __init__(self, nodes):
+        self.nodes = nodes
+
+    @property
+    def first(self):
+        return MockLocator(self.nodes[:1])
+
+    def nth(self, position):
+        return MockLocator(self.nodes[position:position + 1])
+
+    async def count(self):
+        return len(self.nodes)
+
+
+class MutablePage:
+    """
+    Page emulating INCREMENTAL_EXTRACT_SCRIPT in Python: nodes get stable keys,
+    mutations are recorded and only dirty or unknown nodes are fully described.
+    """
+
+    def __init__(self, nodes):
+        self.url = "https://example.com/app"
+        self.nodes = nodes
+        self.token = "doc1"
+        self.version = 0
+        self.next_key = 0
+        self.changed = set()
+        self.described = []
+        self.scripts = []
+        self.incremental_broken = False
+
+    # --- mutations -------------------------------------------------------
+    def set_attribute(self, node, name, value):
+        node.attributes[name] = value
+        self.changed.add(node)
+        self.version += 1
+
+    def insert(self, position, node):
+        self.nodes.insert(position, node)
+        self.version += 1
+
+    def navigate(self, nodes):
+        self.nodes = nodes
+        self.token += "'"
+        self.version = 0
+        self.next_key = 0
+        self.changed = set()
+
+    # --- page API --------------------------------------------------------
+    def _match(self, selector):
+        if selector.startswith('#'):
+            return [n for n in self.nodes if n.attributes.get('id') == selector[1:]]
+        return [n for n in self.nodes if n.tag == selector]
+
+    def locator(self, selector):
+        return MockLocator(self._match(selector))
+
+    async def evaluate(self, script, arg=None):
+        self.scripts.append(script)
+        if script == PAGE_STATE_SCRIPT:
+            return f"{self.token}:{self.version}"
+        if script == VALIDATE_BATCH_SCRIPT:
+            return self._validate_batch(arg)
+        if script == INCREMENTAL_EXTRACT_SCRIPT and not self.incremental_broken:
+            return self._incremental(arg)
+        if script == EXTRACT_ELEMENTS_SCRIPT:
+            return [
+                {'type': t, 'elements': [
+                    {'attributes': dict(n.attributes), 'text': n.text,
+                     'visible': True, 'enabled': True, 'xpath': f'//{n.tag}'}
+                    for n in self.nodes if n.tag == t
+                ]}
+                for t in arg['types']
+            ]
+        raise RuntimeError("unsupported script")
+
+    def _incremental(self, arg):
+        assert arg['attributes'] == SCANNED_ATTRIBUTES
+        reuse = set(arg['known']) if arg['token'] == self.token else set()
+        dirty, self.changed = self.changed, set()
+
+        def entry(node):
+            if node.key is None:
+                node.key = self.next_key
+                self.next_key += 1
+            data = {'visible': True, 'enabled': True, 'xpath': f'//{node.tag}', 'key': node.key}
+            if node.key not in reuse or node in dirty:
+                self.described.append(node)
+                data.update(attributes=dict(node.attributes), text=node.text)
+            return data
+
+        return {'token': self.token, 'groups': [
+            {'type': t, 'elements': [entry(n) for n in self.nodes if n.tag == t]}
+            for t in arg['types']
+        ]}
+
+    def _validate_batch(self, arg):
+        resolved = [
+            None if is_xpath or not (s.startswith('#') or s.isalpha()) else self._match(s)
+            for s, is_xpath in arg['selectors']
+        ]
+        results = []
+        for t, s in arg['pairs']:
+            nodes, target = resolved[s], arg['targets'][t]
+            if nodes is None:
+                results.append(None)
+                continue
+            results.append(len(nodes) == 1 and nodes[0].tag == target['tag']
+                           and nodes[0].attributes.get('id', '') == target['id'])
+        return {'counts': [None if r is None else len(r) for r in resolved], 'results': results}
+
+
+def make_page():
+    return MutablePage([
+        Node('input', id='email', name='email'),
+        Node('input', id='pwd', type='password'),
+        Node('button', 'Sign in', id='go'),
+    ])
+
+
+TYPES = ['input', 'button']
+
+
+class TestIncrementalScan:
+    """ElementScanner.scan(incremental=True)"""
+
+    @pytest.mark.asyncio
+    async def test_first_scan_is_full(self):
+        page = make_page()
+        scanner = ElementScanner()
+        elements = await scanner.scan(page, element_types=TYPES, incremental=True)
+
+        assert [e.index for e in elements] == [0, 1, 2]
+        assert [e.selector for e in elements] == ['#email', '#pwd', '#go']
+        assert len(page.described) == 3
+        assert scanner.last_reused == 0
+
+    @pytest.mark.asyncio
+    async def test_unchanged_page_reuses_elements(self):
+        page = make_page()
+        scanner = ElementScanner()
+        first = await scanner.scan(page, element_types=TYPES, incremental=True)
+        page.described.clear()
+
+        second = await scanner.scan(page, element_types=TYPES, incremental=True)
+
+        assert all(a is b for a, b in zip(first, second))
+        assert page.described == []
+        assert scanner.last_reused == 3
+
+    @pytest.mark.asyncio
+    async def test_changed_element_rebuilt_with_same_index(self):
+        page = make_page()
+        scanner = ElementScanner()
+        email, pwd, go = await scanner.scan(page, element_types=TYPES, incremental=True)
+        page.described.clear()
+
+        page.set_attribute(page.nodes[1], 'name', 'password')
+        second = await scanner.scan(page, element_types=TYPES, incremental=True)
+
+        assert page.described == [page.nodes[1]]
+        assert second[0] is email and second[2] is go
+        assert second[1] is not pwd
+        assert second[1].index == pwd.index
+        assert second[1].name == 'password'
+        assert scanner.last_reused == 2
+
+    @pytest.mark.asyncio
+    async def test_inserted_element_gets_new_index(self):
+        page = make_page()
+        scanner = ElementScanner()
+        first = await scanner.scan(page, element_types=TYPES, incremental=True)
+
+        page.insert(0, Node('input', id='search'))
+        second = await scanner.scan(page, element_types=TYPES, incremental=True)
+
+        assert [e.selector for e in second] == ['#search', '#email', '#pwd', '#go']
+        assert [e.index for e in second] == [3, 0, 1, 2]
+        assert second[1:] == first
+        assert all(a is b for a, b in zip(first, second[1:]))
+
+    @pytest.mark.asyncio
+    async def test_kept_selector_that_became_ambiguous_is_rebuilt(self):
+        page = make_page()
+        scanner = ElementScanner()
+        first = await scanner.scan(page, element_types=TYPES, incremental=True)
+
+        # A new element reusing id "go" makes the button's #go ambiguous
+        page.insert(2, Node('input', id='go'))
+        second = await scanner.scan(page, element_types=TYPES, incremental=True)
+
+        button = second[-1]
+        assert button is not first[2]
+        assert button.index == first[2].index
+        assert button.selector != '#go'
+
+    @pytest.mark.asyncio
+    async def test_navigation_starts_over(self):
+        page = make_page()
+        scanner = ElementScanner()
+        await scanner.scan(page, element_types=TYPES, incremental=True)
+
+        page.navigate([Node('button', 'Next', id='next')])
+        page.described.clear()
+        elements = await scanner.scan(page, element_types=TYPES, incremental=True)
+
+        assert [e.index for e in elements] == [0]
+        assert page.described == page.nodes
+        assert scanner.last_reused == 0
+
+    @pytest.mark.asyncio
+    async def test_full_scan_resets_incremental_state(self):
+        page = make_page()
+        scanner = ElementScanner()
+        await scanner.scan(page, element_types=TYPES, incremental=True)
+        assert page.url in scanner._incremental
+
+        elements = await scanner.scan(page, element_types=TYPES)
+        assert [e.index for e in elements] == [0, 1, 2]
+        assert page.url not in scanner._incremental
+
+    @pytest.mark.asyncio
+    async def test_script_failure_falls_back_to_full_scan(self):
+        page = make_page()
+        page.incremental_broken = True
+        scanner = ElementScanner()
+
+        elements = await scanner.scan(page, element_types=TYPES, incremental=True)
+
+        assert [e.selector for e in elements] == ['#email', '#pwd', '#go']
+        assert EXTRACT_ELEMENTS_SCRIPT in page.scripts
+        assert page.url not in scanner._incremental
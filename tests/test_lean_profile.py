@@ -0,0 +1,146 @@
+"""
+Tests for the lean browser profile (request blocking)
+"""
+import pytest
+from selector_cli.core.browser import BrowserManager
+from selector_cli.core.lean import BlockStats, LeanProfile
+
+
+class FakeRequest:
+    def __init__(self, url, resource_type):
+        self.url = url
+        self.resource_type = resource_type
+
+
+class FakeRoute:
+    def __init__(self, url, resource_type):
+        self.request = FakeRequest(url, resource_type)
+        self.outcome = None
+
+    async def continue_(self):
+        self.outcome = 'continued'
+
+    async def abort(self, reason):
+        self.outcome = reason
+
+
+class FakePage:
+    def __init__(self, context=None):
+        self.context = context
+        self.handler = None
+        self.url = 'about:blank'
+
+    async def route(self, pattern, handler):
+        assert pattern == '**/*'
+        self.handler = handler
+
+    async def request(self, url, resource_type):
+        route = FakeRoute(url, resource_type)
+        await self.handler(route)
+        return route.outcome
+
+    async def goto(self, url, timeout=None):
+        self.url = url
+        await self.request(url, 'document')
+        await self.request(url.rsplit('/', 1)[0] + '/logo.png', 'image')
+
+    async def wait_for_load_state(self, state, timeout=None):
+        pass
+
+
+class FakeContext:
+    def __init__(self, options):
+        self.options = options
+        self.closed = False
+
+    async def new_page(self):
+        return FakePage(self)
+
+    async def close(self):
+        self.closed = True
+
+
+class FakeBrowser:
+    def __init__(self):
+        self.contexts = []
+
+    async def new_context(self, **options):
+        self.contexts.append(FakeContext(options))
+        return self.contexts[-1]
+
+    async def close(self):
+        pass
+
+
+class TestProfile:
+    """Which requests are blocked"""
+
+    @pytest.mark.parametrize('url, resource_type, reason', [
+        ('https://example.com/', 'document', None),
+        ('https://example.com/app.js', 'script', None),
+        ('https://example.com/a.png', 'image', 'image'),
+        ('https://example.com/font.woff2', 'font', 'font'),
+        ('https://www.google-analytics.com/g/collect', 'fetch', 'tracker'),
+        ('https://notgoogle-analytics.com/x.js', 'script', None),
+        ('file:///tmp/fixture/video.mp4', 'media', 'media'),
+    ])
+    def test_block_reason(self, url, resource_type, reason):
+        assert LeanProfile().block_reason(url, resource_type) == reason
+
+    def test_configurable(self):
+        profile = LeanProfile(resource_types=frozenset({'stylesheet'}), domains=('cdn.test',))
+        assert profile.block_reason('https://a.test/x.png', 'image') is None
+        assert profile.block_reason('https://a.test/x.css', 'stylesheet') == 'stylesheet'
+        assert profile.block_reason('https://img.cdn.test/x.png', 'image') == 'tracker'
+
+    @pytest.mark.parametrize('types', [{'pictures'}, {'document'}])
+    def test_rejects_bad_types(self, types):
+        with pytest.raises(ValueError):
+            LeanProfile(resource_types=frozenset(types))
+
+    def test_context_options(self):
+        assert LeanProfile(javascript=False).context_options() == \
+            {'service_workers': 'block', 'java_script_enabled': False}
+
+    @pytest.mark.asyncio
+    async def test_local_bytes_saved(self, tmp_path):
+        (tmp_path / "hero.jpg").write_bytes(b'x' * 3072)
+        page = FakePage()
+        stats = await LeanProfile().install(page)
+
+        assert await page.request((tmp_path / "index.html").as_uri(), 'document') == 'continued'
+        assert await page.request((tmp_path / "hero.jpg").as_uri(), 'image') == 'blockedbyclient'
+        assert await page.request('https://cdn.test/a.woff', 'font') == 'blockedbyclient'
+
+        assert (stats.by_reason, stats.bytes_saved, stats.unknown_size) == \
+            ({'image': 1, 'font': 1}, 3072, 1)
+        assert str(stats) == "blocked 2 request(s): 1 font, 1 image (3.0 KB saved, 1 of unknown size)"
+
+    def test_empty_stats(self):
+        assert str(BlockStats()) == "blocked 0 requests"
+
+
+class TestLeanBrowser:
+    """BrowserManager installs the profile on every page"""
+
+    @pytest.mark.asyncio
+    async def test_pages_get_own_filtered_context(self):
+        manager = BrowserManager(lean=LeanProfile(javascript=False))
+        manager.browser = FakeBrowser()
+
+        async with manager.pooled_page() as page:
+            await manager.load(page, 'https://example.com/index.html')
+            assert str(manager.blocked(page)) == \
+                "blocked 1 request(s): 1 image (0 B saved, 1 of unknown size)"
+
+            # Counts restart with every load
+            await manager.load(page, 'https://example.com/other.html')
+            assert manager.blocked(page).requests == 1
+
+        assert manager.browser.contexts[0].options['java_script_enabled'] is False
+        await manager.close()
+        assert manager.browser.contexts[0].closed
+
+    def test_not_lean_by_default(self):
+        manager = BrowserManager()
+        assert manager.lean is None and manager.blocked() is None
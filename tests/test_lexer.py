@@ -0,0 +1,119 @@
+"""
+Tests for the single-pass lexer: same tokens and errors as the
+character-by-character lexer it replaced
+"""
+import random
+import re
+import sys
+import pytest
+from selector_cli.parser.lexer import Lexer, Token, TokenType
+
+
+def reference_tokenize(text):
+    """The character-by-character lexer, condensed"""
+    text = text.strip()
+    tokens, pos = [], 0
+    while pos < len(text):
+        ch = text[pos]
+        if ch.isspace():
+            pos += 1
+        elif ch in '"\'':
+            end = text.find(ch, pos + 1)
+            end = len(text) if end < 0 else end
+            tokens.append(Token(TokenType.STRING, text[pos + 1:end], pos))
+            pos = end + 1
+        elif ch.isdigit():
+            end = pos
+            while end < len(text) and text[end].isdigit():
+                end += 1
+            tokens.append(Token(TokenType.NUMBER, text[pos:end], pos))
+            pos = end
+        elif ch.isalpha() or ch == '_':
+            end = pos
+            while end < len(text) and (text[end].isalnum() or text[end] in '_-.:/'):
+                end += 1
+            value = text[pos:end]
+            tokens.append(Token(Lexer.KEYWORDS.get(value.lower(), TokenType.IDENTIFIER),
+                                value, pos))
+            pos = end
+        elif text[pos:pos + 2] in ('>=', '<=', '!=', '--'):
+            tokens.append(Token(Lexer.SYMBOLS[text[pos:pos + 2]], text[pos:pos + 2], pos))
+            pos += 2
+        elif ch in Lexer.SYMBOLS:
+            tokens.append(Token(Lexer.SYMBOLS[ch], ch, pos))
+            pos += 1
+        else:
+            raise ValueError(f"Unexpected character: {ch} at position {pos}")
+    tokens.append(Token(TokenType.EOF, '', len(text)))
+    return tokens
+
+
+def outcome(tokenize, text):
+    try:
+        return tokenize(text)
+    except ValueError as e:
+        return str(e)
+
+
+# Characters the two lexers could disagree on: Unicode digits that are not
+# decimal ('²'), numerics that are not digits ('½', 'Ⅷ'), letters whose
+# lowercase differs in length ('İ'), non-ASCII whitespace, rejected characters
+ALPHABET = (list('aZ_09 \t\n"\'><=!()[]{},*-;.:/@#?') +
+            ['²', '½', 'Ⅷ', '٣', 'é', 'İ', 'ß', ' ', ' ', '', 'where', 'input'])
+
+
+class TestEquivalence:
+    """Token streams and errors match the reference lexer"""
+
+    @pytest.mark.parametrize('text', [
+        'add from candidates where tag = "input" and (index >= 5 or name != \'q\')',
+        'list [1-10] > out.json; find input, button --deep',
+        '.find where text contains "unterminated',
+        '!! ; !3 ; find * ; macro m {p} list',
+        'open https://example.com/a-b_c:8080/x.y',
+        '12abc 3.5 x9 ²³ 1²',
+        '    count   ',
+        '',
+        "where 'it''s'",
+        'find input @',
+        'list ½',
+        'list where x = 1 ',
+    ])
+    def test_examples(self, text):
+        assert outcome(Lexer().tokenize, text) == outcome(reference_tokenize, text)
+
+    def test_random_text(self):
+        rnd = random.Random(0)
+        lexer = Lexer()
+        for _ in range(20000):
+            text = ''.join(rnd.choice(ALPHABET) for _ in range(rnd.randint(0, 16)))
+            assert outcome(lexer.tokenize, text) == outcome(reference_tokenize, text), text
+
+    def test_character_classes(self):
+        # The pattern relies on \s, \w and \d meaning exactly these str methods
+        space, word, decimal = re.compile(r'\s'), re.compile(r'\w'), re.compile(r'\d')
+        for code in range(sys.maxunicode + 1):
+            ch = chr(code)
+            assert bool(space.match(ch)) == ch.isspace(), hex(code)
+            assert bool(word.match(ch)) == (ch.isalnum() or ch == '_'), hex(code)
+            assert bool(decimal.match(ch)) == ch.isdecimal(), hex(code)
+
+
+class TestTokens:
+    """Positions, errors and lexer state"""
+
+    def test_positions_relative_to_stripped_text(self):
+        tokens = Lexer().tokenize('   list "a b"  ')
+        assert [(t.type, t.value, t.position) for t in tokens] == [
+            (TokenType.LIST, 'list', 0), (TokenType.STRING, 'a b', 5), (TokenType.EOF, '', 10)]
+
+    def test_error_position(self):
+        lexer = Lexer()
+        with pytest.raises(ValueError, match=r"^Unexpected character: \$ at position 5$"):
+            lexer.tokenize('  list $x')
+        assert lexer.position == 5
+
+    def test_non_decimal_digits_stay_numbers(self):
+        tokens = Lexer().tokenize('1²2 ²x')
+        assert [(t.type, t.value) for t in tokens[:-1]] == [
+            (TokenType.NUMBER, '1²2'), (TokenType.NUMBER, '²'), (TokenType.IDENTIFIER, 'x')]
@@ -0,0 +1,191 @@
+"""
+Tests for the browser page pool and open-many/scan-many
+"""
+import asyncio
+import json
+import re
+import pytest
+from selector_cli.commands.executor import CommandExecutor
+from selector_cli.core.browser import BrowserManager
+from selector_cli.core.context import Context
+from selector_cli.core.element import Element
+from selector_cli.core.scanner import ElementScanner
+from selector_cli.parser.command import page_source
+from selector_cli.parser.parser import Parser
+from selector_cli.query.planner import LayerCache, writes
+
+
+class FakePage:
+    def __init__(self, browser):
+        self.browser = browser
+        self.url = 'about:blank'
+        self.closed = False
+
+    async def goto(self, url, timeout=None, wait_until=None):
+        self.browser.in_flight += 1
+        self.browser.max_in_flight = max(self.browser.max_in_flight, self.browser.in_flight)
+        await asyncio.sleep(0.01)
+        self.browser.in_flight -= 1
+        if 'broken' in url:
+            raise RuntimeError(f"net::ERR_NAME_NOT_RESOLVED at {url}\nCall log: ...")
+        self.url = url
+
+    async def wait_for_load_state(self, state, timeout=None):
+        pass
+
+    async def close(self):
+        self.closed = True
+
+
+class FakeBrowser:
+    def __init__(self):
+        self.pages = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def new_page(self):
+        page = FakePage(self)
+        self.pages.append(page)
+        return page
+
+
+def make_manager(pool_size=2):
+    manager = BrowserManager(pool_size=pool_size)
+    manager.browser = FakeBrowser()
+    return manager
+
+
+class TestPagePool:
+    """Pages are created up to pool_size and reused"""
+
+    @pytest.mark.asyncio
+    async def test_urls_run_pool_size_at_a_time(self):
+        manager = make_manager(pool_size=3)
+        urls = [f"https://example.com/{i}" for i in range(10)]
+
+        async def visit(page, url):
+            await manager.load(page, url)
+            return page.url
+
+        assert await manager.map_urls(urls, visit) == urls
+        assert len(manager.browser.pages) == 3
+        assert manager.browser.max_in_flight == 3
+
+    @pytest.mark.asyncio
+    async def test_failing_page_is_replaced(self):
+        manager = make_manager(pool_size=1)
+
+        async def visit(page, url):
+            await manager.load(page, url)
+            return page
+
+        first, failed, last = await manager.map_urls(
+            ['https://a.test', 'https://broken.test', 'https://c.test'], visit)
+
+        assert isinstance(failed, RuntimeError)
+        assert first is not last and first.closed
+        assert manager._pool_pages == [last]
+
+    @pytest.mark.asyncio
+    async def test_resize_closes_idle_pages(self):
+        manager = make_manager(pool_size=3)
+        await manager.map_urls(['a', 'b', 'c'], lambda page, url: manager.load(page, url))
+
+        await manager.resize_pool(1)
+
+        assert [page.closed for page in manager.browser.pages] == [False, True, True]
+        with pytest.raises(ValueError):
+            await manager.resize_pool(0)
+
+
+class TestOpenMany:
+    """open-many/scan-many keep one candidate set per URL"""
+
+    def setup_method(self):
+        self.context = Context(enable_history_file=False)
+        self.context.browser = make_manager()
+        self.executor = CommandExecutor()
+
+    @pytest.fixture(autouse=True)
+    def fake_scan(self, monkeypatch):
+        async def scan_iter(scanner, page, element_types=None, concurrency=None):
+            for i in range(len(page.url) % 4 + 1):
+                yield Element(index=i, uuid=f"{page.url}#{i}", tag='input',
+                              page_url=page.url, locator=object())
+        monkeypatch.setattr(ElementScanner, 'scan_iter', scan_iter)
+
+    async def run(self, line):
+        return await self.executor.execute(Parser().parse(line), self.context)
+
+    @pytest.mark.asyncio
+    async def test_open_many(self, tmp_path):
+        url_file = tmp_path / "urls.txt"
+        url_file.write_text("# more pages\nexample.com/ab\nhttps://broken.test\n\n")
+
+        result = await self.run(
+            f'open-many https://example.com/a "https://example.com/abc" --file "{url_file}"')
+
+        assert re.sub(r'\d+\.\d\ds', 'N.NNs', result).splitlines() == [
+            "Opened 3/4 page(s) on 2 pooled page(s)",
+            "  https://example.com/a: 2 elements (ready after N.NNs)",
+            "  https://example.com/abc: 4 elements (ready after N.NNs)",
+            "  https://example.com/ab: 3 elements (ready after N.NNs)",
+            "  https://broken.test: failed (net::ERR_NAME_NOT_RESOLVED at https://broken.test)",
+            "Ready (networkidle): N.NNs total page load time",
+        ]
+        table = self.context.page_candidates['https://example.com/abc']
+        assert [row.page_url for row in table] == ['https://example.com/abc'] * 4
+        assert table[0].locator is None
+        assert len(self.context.candidates) == 0
+
+    @pytest.mark.asyncio
+    async def test_scan_many_rescans_opened_urls(self):
+        await self.run('open-many https://example.com/a https://example.com/b')
+        self.context.page_candidates['https://example.com/a'] = None
+
+        result = await self.run('scan-many --pool 1')
+
+        assert result.splitlines()[0] == "Scanned 2/2 page(s) on 1 pooled page(s)"
+        assert len(self.context.page_candidates['https://example.com/a']) == 2
+        assert self.context.browser.pool_size == 1
+
+    @pytest.mark.asyncio
+    async def test_errors(self):
+        assert await self.run('scan-many') == \
+            "Error: No pages opened. Use 'open-many <url> ...' first."
+        assert await self.run('open-many --pool 2') == "Error: No URLs provided"
+        assert await self.run('open-many a.com --pool 0') == \
+            "Error: --pool requires a positive integer"
+        assert (await self.run('open-many a.com --file "/nonexistent/urls.txt"')).startswith(
+            "Error reading URL file '/nonexistent/urls.txt'")
+
+    @pytest.mark.asyncio
+    async def test_page_results_are_a_source(self, tmp_path):
+        await self.run('open-many https://example.com/a https://example.com/abc')
+
+        listed = await self.run('list page "https://example.com/abc"')
+        assert listed.splitlines()[0] == "Elements (4):"
+        assert await self.run('list page "example.com/a" where index > 0') == \
+            "Elements (1):\n[0] [1] input"
+
+        assert await self.run('add to workspace from page "https://example.com/abc" '
+                              'where index >= 2') == "Added 2 element(s) → workspace (2 total)"
+        out = tmp_path / "abc.json"
+        await self.run(f'export json > "{out}"')
+        records = json.loads(out.read_text(encoding='utf-8'))
+        assert [r['index'] for r in records] == [2, 3]  # page /a has only 0 and 1
+        assert [e.page_url for e in self.context.workspace] == ['https://example.com/abc'] * 2
+
+        assert await self.run('list page "https://example.com/zzz"') == \
+            "Error: Page not opened: https://example.com/zzz. Use 'open-many <url> ...' first."
+
+    def test_rescan_invalidates_cached_page_filters(self):
+        cache = LayerCache()
+        page = page_source('https://example.com/a')
+        cache.put(LayerCache.key(page, None), [1])
+        cache.put(LayerCache.key('workspace', None), [2])
+
+        cache.invalidate(writes(Parser().parse('scan-many')))
+
+        assert cache.get(LayerCache.key(page, None)) is None
+        assert cache.get(LayerCache.key('workspace', None)) == [2]
@@ -0,0 +1,198 @@
+"""
+Tests for the cost-based planner, explain and planned pipelines
+"""
+import pytest
+from selector_cli.core.candidate_table import CandidateTable
+from selector_cli.core.collection import ElementCollection
+from selector_cli.core.context import Context
+from selector_cli.core.element import Element
+from selector_cli.commands.executor import CommandExecutor
+from selector_cli.parser.parser import Parser
+from selector_cli.query.compiler import filter_elements
+from selector_cli.query.planner import (
+    INDEX, PYTHON, filter_layer, order_conjuncts, plan_filter, split_statements
+)
+
+
+def make_elements(count=12):
+    tags = ('input', 'button', 'a')
+    return [
+        Element(index=i, uuid=f"00000000-0000-4000-8000-{i:012d}", tag=tags[i % 3],
+                text=f"Item {i}", visible=i % 2 == 0, selector=f"#el-{i}",
+                attributes={'id': f"el-{i}"})
+        for i in range(count)
+    ]
+
+
+def where(clause):
+    return Parser().parse(f"add where {clause}").condition_tree
+
+
+class TestStatements:
+    """Splitting ;-chains"""
+
+    def test_split_respects_quotes(self):
+        assert split_statements('add input; list where text = "a;b" ;; count') == \
+            ['add input', 'list where text = "a;b"', 'count']
+
+    def test_macro_and_explain_keep_rest_of_line(self):
+        assert split_statements('clear; macro m add input; add button') == \
+            ['clear', 'macro m add input; add button']
+        assert split_statements('explain find a; list') == ['explain find a; list']
+
+
+class TestOrdering:
+    """Cheap, selective predicates run first"""
+
+    def test_selective_conjuncts_first(self):
+        ordered = order_conjuncts(where('text matches "^I" and visible and id = "el-4"'))
+        assert repr(ordered) == \
+            '(((id EQUALS el-4) AND (visible EQUALS True)) AND (text MATCHES ^I))'
+
+    def test_conjuncts_that_can_raise_are_not_crossed(self):
+        condition = where('text contains "x" and name matches "(" and id = "a"')
+        assert order_conjuncts(condition) is condition
+
+    def test_unchanged_order_returns_same_tree(self):
+        condition = where('id = "a" and visible')
+        assert order_conjuncts(condition) is condition
+
+
+class TestAccessPaths:
+    """Index lookups versus Python filters give the same rows"""
+
+    @pytest.mark.parametrize('clause', [
+        'tag = "button"',
+        'visible and tag = "input"',
+        'tag = "a" and text contains "1"',
+        'text contains "1" or tag = "a"',
+        'not visible',
+    ])
+    def test_same_result_on_every_layer(self, clause):
+        elements = make_elements()
+        expected = [e.index for e in filter_elements(elements, where(clause))]
+
+        collection = ElementCollection()
+        for elem in elements:
+            collection.add(elem)
+        for source in (elements, CandidateTable.from_elements(elements), collection):
+            assert [e.index for e in filter_layer(source, where(clause))] == expected
+
+    def test_tag_conjunct_uses_index(self):
+        table = CandidateTable.from_elements(make_elements())
+
+        plan = plan_filter(table, where('visible and tag = "input"'))
+        assert (plan.access, plan.tag, repr(plan.condition)) == \
+            (INDEX, 'input', '(visible EQUALS True)')
+        assert plan_filter(make_elements(), where('tag = "input"')).access == PYTHON
+        assert plan_filter(table, where('tag = "input" or visible')).access == PYTHON
+
+    def test_type_target_without_condition(self):
+        table = CandidateTable.from_elements(make_elements())
+        assert [r.index for r in filter_layer(table, None, tag='a')] == [2, 5, 8, 11]
+
+
+class TestExplain:
+    """explain shows where each predicate runs"""
+
+    def setup_method(self):
+        self.context = Context(enable_history_file=False)
+        self.context.candidates = make_elements()
+        self.executor = CommandExecutor()
+
+    async def explain(self, line):
+        return await self.executor.execute(Parser().parse(f"explain {line}"), self.context)
+
+    @pytest.mark.asyncio
+    async def test_chain(self):
+        output = await self.explain(
+            'find button where role = "tab" and text matches "^S"; '
+            'add where text contains "1" and tag = "input"; '
+            'add to workspace from temp where visible; '
+            'list temp where visible'
+        )
+        lines = output.splitlines()
+
+        assert lines[0] == "Plan (4 step(s)):"
+        assert '     browser push-down: css [role="tab"]' in lines
+        assert '     python residual: (text MATCHES ^S)' in lines
+        assert '     index lookup: tag = input on candidates (4 rows)' in lines
+        assert '     predicates: (text CONTAINS 1)' in lines
+        assert '     python filter on temp (0 rows)' in lines
+        assert '     cached: same temp filter as step 3' in lines
+
+    @pytest.mark.asyncio
+    async def test_write_invalidates_cached_layer(self):
+        output = await self.explain(
+            'keep where visible; filter where visible; keep where visible')
+        assert 'cached' not in output
+
+    @pytest.mark.asyncio
+    async def test_parse_error_stops_plan(self):
+        output = await self.explain('add input; bogus; list')
+        assert "Plan (2 step(s)):" in output
+        assert "parse error: Unknown command: bogus (pipeline stops here)" in output
+
+    @pytest.mark.asyncio
+    async def test_explain_run_expands_macro(self):
+        self.context.macro_manager.define('pick', ['add {kind} where visible; count'], ['kind'])
+        output = await self.explain('run pick "button"')
+        assert "  1. add button where visible" in output
+        assert "     index lookup: tag = button on candidates (4 rows)" in output
+        assert "  2. count" in output
+
+
+class TestPipelines:
+    """run and exec execute planned pipelines"""
+
+    def setup_method(self):
+        self.context = Context(enable_history_file=False)
+        self.context.candidates = make_elements()
+        self.executor = CommandExecutor()
+
+    async def run(self, line):
+        return await self.executor.execute(Parser().parse(line), self.context)
+
+    @pytest.mark.asyncio
+    async def test_macro_chain(self):
+        await self.run('macro pick add input where visible; add to workspace from candidates '
+                       'where tag = "input" and visible')
+        result = await self.run('run pick')
+
+        assert result.splitlines()[0] == "No new elements added (all already in candidates)"
+        assert [e.index for e in self.context.workspace] == [0, 6]
+
+    @pytest.mark.asyncio
+    async def test_cache_reused_until_layer_written(self, tmp_path, monkeypatch):
+        calls = []
+        import selector_cli.commands.executor as executor_module
+        original = executor_module.filter_layer
+        monkeypatch.setattr(executor_module, 'filter_layer',
+                            lambda *a, **k: calls.append(a[1]) or original(*a, **k))
+
+        script = tmp_path / "pipeline.sel"
+        script.write_text(
+            "# workspace from visible candidates\n"
+            "list candidates where visible; add to workspace from candidates where visible\n"
+            "keep where tag = \"a\"\n"
+            "list candidates where visible\n"
+            "list where tag = \"a\"\n"
+        )
+        result = await self.run(f'exec "{script}"')
+
+        assert result.splitlines()[0] == "[2] Elements (6):"
+        assert "[2] Added 6 element(s) → workspace (6 total)" in result
+        assert "[3] Kept 2 element(s), removed 4. Collection now: 2" in result
+        # candidates filtered once; workspace filtered again after keep wrote it
+        assert len(calls) == 3
+
+    @pytest.mark.asyncio
+    async def test_error_reports_line_after_running_earlier_steps(self, tmp_path):
+        script = tmp_path / "broken.sel"
+        script.write_text("add input\n\nadd button; bogus\n")
+
+        result = await self.run(f'exec "{script}"')
+
+        assert result == "Error at line 3: Unknown command: bogus\nCommand: bogus"
+        assert len(self.context.candidates) == 12
+        assert self.executor._layer_cache is None
@@ -0,0 +1,128 @@
+"""
+Tests for page readiness policies (open --wait)
+"""
+import pytest
+from selector_cli.commands.executor import CommandExecutor
+from selector_cli.core.browser import BrowserManager
+from selector_cli.core.context import Context
+from selector_cli.core.readiness import DOM_QUIET_SCRIPT, ReadinessPolicy
+from selector_cli.core.scanner import ElementScanner
+from selector_cli.parser.parser import Parser
+
+
+class RecordingPage:
+    """Page recording the navigation and wait calls made on it"""
+
+    def __init__(self, quiet=True):
+        self.url = 'about:blank'
+        self.calls = []
+        self.quiet = quiet
+
+    async def goto(self, url, **kwargs):
+        self.url = url
+        self.calls.append(('goto', kwargs.get('wait_until')))
+
+    async def reload(self, **kwargs):
+        self.calls.append(('reload', kwargs.get('wait_until')))
+
+    async def wait_for_load_state(self, state, timeout=None):
+        self.calls.append(('load_state', state))
+
+    async def wait_for_selector(self, selector, state=None, timeout=None):
+        self.calls.append(('selector', selector))
+
+    async def evaluate(self, script, arg=None):
+        if script == DOM_QUIET_SCRIPT:
+            self.calls.append(('quiet', arg['quietMs']))
+            return self.quiet
+        raise AssertionError("unexpected script")
+
+
+class TestPolicies:
+    """Policy strings and the waits they perform"""
+
+    @pytest.mark.parametrize('spec, text', [
+        ('networkidle', 'networkidle'),
+        ('LOAD', 'load'),
+        ('domcontentloaded', 'domcontentloaded'),
+        ('selector:#app .ready', 'selector:#app .ready'),
+        ('quiet', 'quiet'),
+        ('quiet:300', 'quiet:300'),
+    ])
+    def test_parse(self, spec, text):
+        assert str(ReadinessPolicy.parse(spec)) == text
+
+    @pytest.mark.parametrize('spec', ['idle', 'selector:', 'quiet:0', 'quiet:soon', 'load:5'])
+    def test_parse_rejects(self, spec):
+        with pytest.raises(ValueError):
+            ReadinessPolicy.parse(spec)
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize('spec, calls', [
+        ('networkidle', [('goto', None), ('load_state', 'networkidle')]),
+        ('load', [('goto', 'load')]),
+        ('domcontentloaded', [('goto', 'domcontentloaded')]),
+        ('selector:#app', [('goto', 'domcontentloaded'), ('selector', '#app')]),
+        ('quiet:250', [('goto', 'domcontentloaded'), ('quiet', 250)]),
+    ])
+    async def test_goto(self, spec, calls):
+        page = RecordingPage()
+        seconds = await ReadinessPolicy.parse(spec).goto(page, 'https://example.com')
+
+        assert page.calls == calls
+        assert seconds >= 0
+
+    @pytest.mark.asyncio
+    async def test_reload_uses_policy(self):
+        page = RecordingPage()
+        await ReadinessPolicy.parse('selector:main').reload(page)
+        assert page.calls == [('reload', 'domcontentloaded'), ('selector', 'main')]
+
+    @pytest.mark.asyncio
+    async def test_busy_dom_times_out(self):
+        with pytest.raises(TimeoutError, match="did not stay quiet for 500 ms"):
+            await ReadinessPolicy.parse('quiet').wait(RecordingPage(quiet=False))
+
+
+class TestOpenWait:
+    """open --wait picks the policy per command"""
+
+    def setup_method(self):
+        self.page = RecordingPage()
+        self.context = Context(enable_history_file=False)
+        self.context.browser = BrowserManager(readiness=ReadinessPolicy.parse('load'))
+        self.context.browser.page = self.page
+        self.executor = CommandExecutor()
+
+    @pytest.fixture(autouse=True)
+    def no_scan(self, monkeypatch):
+        async def scan(scanner, page, **kwargs):
+            return []
+        monkeypatch.setattr(ElementScanner, 'scan', scan)
+
+    async def run(self, line):
+        return await self.executor.execute(Parser().parse(line), self.context)
+
+    @pytest.mark.asyncio
+    async def test_per_command_policy(self):
+        result = await self.run('open example.com --wait "selector:#app"')
+
+        lines = result.splitlines()
+        assert lines[0] == "Opened: https://example.com"
+        assert lines[1].startswith("Ready (selector:#app) after ")
+        assert self.page.calls == [('goto', 'domcontentloaded'), ('selector', '#app')]
+
+    @pytest.mark.asyncio
+    async def test_browser_default(self):
+        result = await self.run('open example.com')
+        assert result.splitlines()[1].startswith("Ready (load) after ")
+        assert self.page.calls == [('goto', 'load')]
+
+    @pytest.mark.asyncio
+    async def test_invalid_policy(self):
+        assert await self.run('open example.com --wait') == (
+            "Error: --wait requires a policy: networkidle, load, domcontentloaded, "
+            "selector:<css> or quiet[:ms]")
+        assert (await self.run('open example.com --wait=soon')).startswith(
+            "Error: Unknown wait policy 'soon'")
+        assert self.page.calls == []
@@ -0,0 +1,137 @@
+"""
+Tests for the non-interactive script runner (selector run)
+"""
+import io
+import json
+import pytest
+from selector_cli.commands import runner as run_cli
+from selector_cli.commands.runner import ScriptRunner, needs_browser
+from selector_cli.core.browser import BrowserManager
+from selector_cli.core.context import Context
+from selector_cli.core.element import Element
+from selector_cli.query.planner import script_statements
+
+SCRIPT = """\
+# pick the inputs
+add to workspace from candidates where tag = "input"
+count; run nosuch
+count
+"""
+
+
+def make_runner():
+    context = Context(enable_history_file=False)
+    context.candidates = [Element(index=i, uuid=f"00000000-0000-4000-8000-{i:012d}",
+                                  tag=('input', 'button')[i % 2], text=f"Item {i}")
+                          for i in range(6)]
+    return ScriptRunner(context=context)
+
+
+def records(text):
+    return [json.loads(line) for line in text.splitlines()]
+
+
+class FakeBrowser(BrowserManager):
+    """Launches nothing; every page fails to load"""
+    instances = []
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.started = self.closed = False
+        FakeBrowser.instances.append(self)
+
+    async def initialize(self, headless=False):
+        self.started = True
+
+    async def open(self, url, timeout=60000, readiness=None):
+        return False
+
+    async def close(self):
+        self.closed = True
+
+
+@pytest.fixture
+def fake_browser(monkeypatch):
+    FakeBrowser.instances = []
+    monkeypatch.setattr(run_cli, 'BrowserManager', FakeBrowser)
+    monkeypatch.setattr(run_cli, 'Context', lambda: Context(enable_history_file=False))
+    return FakeBrowser.instances
+
+
+class TestScriptRunner:
+    """Planning and streaming"""
+
+    def test_all_parse_errors_found_up_front(self):
+        steps, invalid = make_runner().plan(script_statements(["count", "bogus", "list where"]))
+        assert len(steps) == 3
+        assert [step.line for step in invalid] == [2, 3]
+
+    @pytest.mark.asyncio
+    async def test_streams_records_and_stops_at_failure(self):
+        runner = make_runner()
+        steps, invalid = runner.plan(script_statements(SCRIPT.splitlines()))
+        assert not invalid
+        out = io.StringIO()
+
+        assert await runner.run(steps, out) == (3, 1)
+
+        lines = records(out.getvalue())
+        assert [(r['line'], r['command'], r['ok']) for r in lines] == [
+            (2, 'add to workspace from candidates where tag = "input"', True),
+            (3, 'count', True),
+            (3, 'run nosuch', False),
+        ]
+        assert lines[1]['output'] == "Collection contains 3 element(s)"
+        assert lines[2]['output'] == "Error: Macro 'nosuch' not found"
+        assert all(r['seconds'] >= 0 for r in lines)
+
+    def test_needs_browser(self):
+        runner = make_runner()
+        plan = lambda *lines: runner.plan(script_statements(lines))[0]
+        assert not needs_browser(plan("count", ".find where visible", "list"))
+        assert needs_browser(plan("count", "find input"))
+        assert needs_browser(plan('exec "other.sel"'))
+
+
+class TestRunCommand:
+    """selector run exit codes"""
+
+    def test_success_without_browser(self, tmp_path, capsys, fake_browser):
+        script = tmp_path / "ok.sel"
+        script.write_text("count\nlist\n")
+        out = tmp_path / "results.jsonl"
+
+        assert run_cli.main([str(script), '--out', str(out)]) == 0
+
+        assert [r['ok'] for r in records(out.read_text())] == [True, True]
+        assert fake_browser == []
+        assert "Ran 2/2 command(s)" in capsys.readouterr().err
+
+    def test_invalid_script_never_starts_browser(self, tmp_path, capsys, fake_browser):
+        script = tmp_path / "bad.sel"
+        script.write_text("open example.com\nbogus\n\nlist where\n")
+
+        assert run_cli.main([str(script)]) == 2
+
+        out, err = capsys.readouterr()
+        assert out == ""
+        assert f"{script}:2: Parse error" in err and f"{script}:4: Parse error" in err
+        assert fake_browser == []
+
+    def test_failed_command_exits_1_and_closes_browser(self, tmp_path, capsys, fake_browser):
+        script = tmp_path / "page.sel"
+        script.write_text("count\n")
+
+        assert run_cli.main([str(script), '--url', 'https://example.com']) == 1
+
+        out, err = capsys.readouterr()
+        assert records(out) == [{'line': 0, 'command': 'open https://example.com', 'ok': False,
+                                 'output': "Error: Failed to open: https://example.com",
+                                 'seconds': records(out)[0]['seconds']}]
+        assert "stopped at a failed command" in err
+        browser, = fake_browser
+        assert browser.started and browser.closed
+
+    def test_missing_script(self, tmp_path, capsys):
+        assert run_cli.main([str(tmp_path / "missing.sel")]) == 2
+        assert "cannot read script" in capsys.readouterr().err
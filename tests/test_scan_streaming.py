@@ -0,0 +1,226 @@
+"""
+Tests for streaming scans (scan_iter), streaming exporters and scan --out
+"""
+import io
+import json
+import pytest
+from selector_cli.core.scanner import ElementScanner, EXTRACT_ELEMENTS_SCRIPT
+from selector_cli.core.locator.validator import VALIDATE_BATCH_SCRIPT, PAGE_STATE_SCRIPT
+from selector_cli.core.progress import LiveCounter
+from selector_cli.core.context import Context
+from selector_cli.commands.executor import CommandExecutor
+from selector_cli.generators.data_exporters import JSONExporter, CSVExporter
+from selector_cli.parser.parser import Parser
+
+
+class MockLocator:
+    def __init__(self, nodes):
+        self.nodes = nodes
+
+    @property
+    def first(self):
+        return MockLocator(self.nodes[:1])
+
+    def nth(self, position):
+        return MockLocator(self.nodes[position:position + 1])
+
+    async def count(self):
+        return len(self.nodes)
+
+
+class MockPage:
+    """Page serving batch extraction and validation for '#id' selectors"""
+
+    def __init__(self, count):
+        self.url = "https://example.com/list"
+        self.nodes = [
+            {'tag': 'input', 'attributes': {'id': f'field-{i}', 'name': f'f{i}'}, 'text': ''}
+            for i in range(count)
+        ]
+        self.validations = 0
+        self.extracted = []  # payloads per extraction round-trip
+
+    def _match(self, selector):
+        if selector.startswith('#'):
+            return [n for n in self.nodes if n['attributes']['id'] == selector[1:]]
+        return [n for n in self.nodes if n['tag'] == selector]
+
+    def locator(self, selector):
+        return MockLocator(self._match(selector))
+
+    async def evaluate(self, script, arg=None):
+        if script == PAGE_STATE_SCRIPT:
+            return "doc:0"
+        if script == EXTRACT_ELEMENTS_SCRIPT:
+            offset, limit = arg['offset'], arg['limit']
+            groups = []
+            for t in arg['types']:
+                nodes = self._match(t)
+                chosen = nodes[offset:] if limit is None else nodes[offset:offset + limit]
+                self.extracted.append(len(chosen))
+                groups.append({'type': t, 'total': len(nodes), 'elements': [
+                    {'attributes': n['attributes'], 'text': n['text'], 'visible': True,
+                     'enabled': True, 'xpath': f"//*[@id=\"{n['attributes']['id']}\"]"}
+                    for n in chosen
+                ]})
+            return groups
+        if script == VALIDATE_BATCH_SCRIPT:
+            self.validations += 1
+            resolved = [None if x or not s.startswith('#') else self._match(s)
+                        for s, x in arg['selectors']]
+            return {
+                'counts': [None if r is None else len(r) for r in resolved],
+                'results': [None if resolved[s] is None else len(resolved[s]) == 1
+                            for _, s in arg['pairs']],
+            }
+        raise RuntimeError("unsupported script")
+
+
+class SmallChunkScanner(ElementScanner):
+    STREAM_CHUNK_SIZE = 2
+
+
+class SmallExtractScanner(SmallChunkScanner):
+    EXTRACT_CHUNK_SIZE = 3
+
+
+class TestScanIter:
+    """ElementScanner.scan_iter"""
+
+    @pytest.mark.asyncio
+    async def test_same_elements_as_scan(self):
+        page = MockPage(5)
+        streamed = [e async for e in SmallChunkScanner().scan_iter(page, ['input'])]
+        listed = await ElementScanner().scan(page, ['input'])
+
+        assert [e.index for e in streamed] == [0, 1, 2, 3, 4]
+        assert [e.selector for e in streamed] == [e.selector for e in listed]
+        # nth() locators point at the right node across chunk boundaries
+        assert [e.locator.nodes[0] for e in streamed] == page.nodes
+
+    @pytest.mark.asyncio
+    async def test_first_element_before_later_chunks(self):
+        page = MockPage(5)
+        stream = SmallChunkScanner().scan_iter(page, ['input'])
+
+        first = await stream.__anext__()
+        assert first.selector == '#field-0'
+        assert page.validations == 1
+
+        rest = [e async for e in stream]
+        assert len(rest) == 4
+        assert page.validations == 3
+
+    @pytest.mark.asyncio
+    async def test_page_extracted_a_chunk_at_a_time(self):
+        page = MockPage(7)
+        stream = SmallExtractScanner().scan_iter(page, ['input'])
+
+        first = await stream.__anext__()
+        assert first.selector == '#field-0'
+        assert page.extracted == [3]
+
+        rest = [e async for e in stream]
+        assert page.extracted == [3, 3, 1]
+        assert [e.index for e in rest] == [1, 2, 3, 4, 5, 6]
+        assert [e.locator.nodes[0] for e in [first] + rest] == page.nodes
+
+    @pytest.mark.asyncio
+    async def test_rejects_bad_concurrency(self):
+        with pytest.raises(ValueError):
+            [e async for e in ElementScanner().scan_iter(MockPage(1), concurrency=0)]
+
+
+async def scanned(count):
+    page = MockPage(count)
+    return await ElementScanner().scan(page, ['input'])
+
+
+async def aiter_list(items):
+    for item in items:
+        yield item
+
+
+class TestStreamingExporters:
+    """stream() output matches generate()"""
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize('exporter', [JSONExporter(), CSVExporter()])
+    async def test_stream_matches_generate(self, exporter):
+        elements = await scanned(3)
+        out = io.StringIO()
+
+        assert await exporter.stream(aiter_list(elements), out) == 3
+        assert out.getvalue() == exporter.generate(elements)
+
+    @pytest.mark.asyncio
+    async def test_empty_json_stream(self):
+        out = io.StringIO()
+        assert await JSONExporter().stream(aiter_list([]), out) == 0
+        assert out.getvalue() == "[]"
+
+
+class TtyStream(io.StringIO):
+    def isatty(self):
+        return True
+
+
+class TestLiveCounter:
+    """Progress line on terminals only"""
+
+    def test_silent_when_not_a_terminal(self):
+        stream = io.StringIO()
+        counter = LiveCounter("Scanning", stream, interval=0)
+        counter.update(5)
+        counter.close()
+        assert stream.getvalue() == ""
+
+    def test_draws_and_erases_on_terminal(self):
+        stream = TtyStream()
+        counter = LiveCounter("Scanning", stream, interval=0)
+        counter.update(5)
+        assert stream.getvalue().endswith("Scanning... 5")
+        counter.close()
+        assert stream.getvalue().endswith("\r\033[2K")
+
+
+class FakeBrowser:
+    def __init__(self, page):
+        self.page = page
+
+    def get_page(self):
+        return self.page
+
+
+class TestScanOut:
+    """scan --out streams into a file instead of the context"""
+
+    def setup_method(self):
+        self.context = Context(enable_history_file=False)
+        self.context.browser = FakeBrowser(MockPage(3))
+        self.context.is_page_loaded = True
+        self.executor = CommandExecutor()
+
+    @pytest.mark.asyncio
+    async def test_scan_out_json(self, tmp_path):
+        path = tmp_path / "scan.json"
+        command = Parser().parse(f'scan --out "{path}"')
+
+        result = await self.executor.execute(command, self.context)
+
+        assert result == f"Scanned 3 elements to '{path}' (json format)"
+        records = json.loads(path.read_text(encoding='utf-8'))
+        assert [r['selector'] for r in records] == ['#field-0', '#field-1', '#field-2']
+        assert self.context.all_elements == []
+
+    @pytest.mark.asyncio
+    async def test_scan_out_rejects_unknown_extension(self, tmp_path):
+        command = Parser().parse(f'scan --out "{tmp_path / "scan.txt"}"')
+        result = await self.executor.execute(command, self.context)
+        assert result.startswith("Error:")
+
+    @pytest.mark.asyncio
+    async def test_scan_in_memory(self):
+        result = await self.executor.execute(Parser().parse('scan'), self.context)
+        assert result == "Scanned 3 elements"
+        assert len(self.context.all_elements) == 3
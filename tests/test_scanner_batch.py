@@ -0,0 +1,194 @@
+"""
+Tests for ElementScanner batch extraction (single in-page round-trip)
+"""
+import pytest
+from selector_cli.core.scanner import ElementScanner, EXTRACT_ELEMENTS_SCRIPT, SCANNED_ATTRIBUTES
+from selector_cli.core.locator.validator import VALIDATE_BATCH_SCRIPT, PAGE_STATE_SCRIPT
+
+
+class MockLocator:
+    """Mock Playwright Locator backed by a list of fake DOM nodes"""
+
+    def __init__(self, page, selector, nodes):
+        self.page = page
+        self.selector = selector
+        self.nodes = nodes
+
+    @property
+    def first(self):
+        return MockLocator(self.page, self.selector, self.nodes[:1])
+
+    def nth(self, position):
+        return MockLocator(self.page, self.selector, self.nodes[position:position + 1])
+
+    async def all(self):
+        self.page.calls.append(('all', self.selector))
+        return [self.nth(i) for i in range(len(self.nodes))]
+
+    async def count(self):
+        self.page.calls.append(('count', self.selector))
+        return len(self.nodes)
+
+    async def get_attribute(self, name):
+        self.page.calls.append(('get_attribute', name))
+        return self.nodes[0]['attributes'].get(name) if self.nodes else None
+
+    async def inner_text(self):
+        self.page.calls.append(('inner_text', self.selector))
+        return self.nodes[0]['text']
+
+    async def is_visible(self):
+        self.page.calls.append(('is_visible', self.selector))
+        return self.nodes[0]['visible']
+
+    async def is_enabled(self):
+        self.page.calls.append(('is_enabled', self.selector))
+        return self.nodes[0]['enabled']
+
+    async def evaluate(self, script):
+        self.page.calls.append(('locator.evaluate', script))
+        if 'tagName' in script and 'getXPath' not in script:
+            return self.nodes[0]['tag']
+        return self.nodes[0]['xpath']
+
+
+class MockPage:
+    """Mock page holding fake nodes; supports id and tag selectors"""
+
+    def __init__(self, nodes, fail_evaluate=False, broken_types=()):
+        self.url = "https://example.com/form"
+        self.nodes = nodes
+        self.calls = []
+        self.fail_evaluate = fail_evaluate
+        self.broken_types = broken_types
+
+    def _match(self, selector):
+        if selector.startswith('#'):
+            return [n for n in self.nodes if n['attributes'].get('id') == selector[1:]]
+        if selector.startswith('xpath='):
+            return []
+        return [n for n in self.nodes if n['tag'] == selector]
+
+    def locator(self, selector):
+        return MockLocator(self, selector, self._match(selector))
+
+    async def evaluate(self, script, arg=None):
+        self.calls.append(('page.evaluate', script))
+        if self.fail_evaluate:
+            raise RuntimeError("Execution context was destroyed")
+        if script == PAGE_STATE_SCRIPT:
+            return "doc:0"
+        if script == VALIDATE_BATCH_SCRIPT:
+            return self._validate_batch(arg)
+        assert script == EXTRACT_ELEMENTS_SCRIPT
+        assert arg['attributes'] == SCANNED_ATTRIBUTES
+        groups = []
+        for elem_type in arg['types']:
+            if elem_type in self.broken_types:
+                groups.append({'type': elem_type, 'error': 'SyntaxError'})
+                continue
+            groups.append({'type': elem_type, 'elements': [
+                {
+                    'attributes': n['attributes'],
+                    'text': n['text'],
+                    'visible': n['visible'],
+                    'enabled': n['enabled'],
+                    'xpath': n['xpath'],
+                }
+                for n in self._match(elem_type)
+            ]})
+        return groups
+
+    def _validate_batch(self, arg):
+        # Only '#id' and bare tag selectors are resolved; the rest stay unresolved
+        resolved = [
+            None if is_xpath or not (s.startswith('#') or s.isalpha()) else self._match(s)
+            for s, is_xpath in arg['selectors']
+        ]
+        results = []
+        for t, s in arg['pairs']:
+            nodes, target = resolved[s], arg['targets'][t]
+            if nodes is None:
+                results.append(None)
+                continue
+            results.append(len(nodes) == 1 and nodes[0]['tag'] == target['tag']
+                           and nodes[0]['attributes'].get('id', '') == target['id'])
+        return {'counts': [None if r is None else len(r) for r in resolved], 'results': results}
+
+
+def make_nodes():
+    return [
+        {'tag': 'input', 'attributes': {'id': 'email', 'type': 'email', 'name': 'email'},
+         'text': '', 'visible': True, 'enabled': True, 'xpath': '//*[@id="email"]'},
+        {'tag': 'input', 'attributes': {'id': 'pwd', 'type': 'password', 'disabled': ''},
+         'text': '', 'visible': False, 'enabled': False, 'xpath': '//*[@id="pwd"]'},
+        {'tag': 'button', 'attributes': {'id': 'go', 'class': 'btn primary'},
+         'text': '  Sign in  ' + 'x' * 150, 'visible': True, 'enabled': True,
+         'xpath': '/html/body/form[1]/button[1]'},
+    ]
+
+
+class TestBatchExtraction:
+    """Batch scan should read element data with one page.evaluate"""
+
+    @pytest.mark.asyncio
+    async def test_batch_scan_uses_single_extraction_call(self):
+        page = MockPage(make_nodes())
+        elements = await ElementScanner().scan(page, element_types=['input', 'button'])
+
+        assert [e.index for e in elements] == [0, 1, 2]
+        assert [e.tag for e in elements] == ['input', 'input', 'button']
+        assert sum(1 for c in page.calls if c == ('page.evaluate', EXTRACT_ELEMENTS_SCRIPT)) == 1
+        assert sum(1 for c in page.calls if c == ('page.evaluate', VALIDATE_BATCH_SCRIPT)) == 2
+
+        # No per-element text/state/xpath reads on the batch path
+        per_element = {'inner_text', 'is_visible', 'is_enabled', 'all'}
+        assert not [c for c in page.calls if c[0] in per_element]
+        assert not [c for c in page.calls if c[0] == 'locator.evaluate' and 'getXPath' in c[1]]
+
+    @pytest.mark.asyncio
+    async def test_batch_payload_becomes_elements(self):
+        page = MockPage(make_nodes())
+        email, pwd, button = await ElementScanner().scan(page, element_types=['input', 'button'])
+
+        assert email.id == 'email'
+        assert email.type == 'email'
+        assert email.selector == '#email'
+        assert email.xpath == '//*[@id="email"]'
+        assert email.page_url == page.url
+
+        assert pwd.visible is False
+        assert pwd.enabled is False
+        assert pwd.disabled is True
+
+        assert button.classes == ['btn', 'primary']
+        assert button.text.startswith('Sign in')
+        assert len(button.text) == 100
+        assert button.xpath == '/html/body/form[1]/button[1]'
+
+    @pytest.mark.asyncio
+    async def test_fallback_when_script_fails(self):
+        page = MockPage(make_nodes(), fail_evaluate=True)
+        elements = await ElementScanner().scan(page, element_types=['input', 'button'])
+
+        assert [e.id for e in elements] == ['email', 'pwd', 'go']
+        assert ('all', 'input') in page.calls
+        assert ('inner_text', 'button') in page.calls
+        assert elements[1].visible is False
+
+    @pytest.mark.asyncio
+    async def test_fallback_only_for_failed_type(self):
+        page = MockPage(make_nodes(), broken_types=('button',))
+        elements = await ElementScanner().scan(page, element_types=['input', 'button'])
+
+        assert [e.index for e in elements] == [0, 1, 2]
+        assert ('all', 'input') not in page.calls
+        assert ('all', 'button') in page.calls
+
+    @pytest.mark.asyncio
+    async def test_batch_disabled_uses_locator_calls(self):
+        page = MockPage(make_nodes())
+        elements = await ElementScanner(batch=False).scan(page, element_types=['input'])
+
+        assert len(elements) == 2
+        assert not [c for c in page.calls if c == ('page.evaluate', EXTRACT_ELEMENTS_SCRIPT)]
@@ -0,0 +1,120 @@
+"""
+Tests for bounded concurrent element processing in ElementScanner
+"""
+import asyncio
+import pytest
+from selector_cli.core.scanner import ElementScanner
+from selector_cli.parser.parser import Parser
+
+
+class SlowLocator:
+    """Locator whose every call takes a fixed latency"""
+
+    def __init__(self, page, selector, nodes):
+        self.page = page
+        self.selector = selector
+        self.nodes = nodes
+
+    async def _call(self, value):
+        self.page.in_flight += 1
+        self.page.max_in_flight = max(self.page.max_in_flight, self.page.in_flight)
+        await asyncio.sleep(self.page.latency)
+        self.page.in_flight -= 1
+        return value
+
+    @property
+    def first(self):
+        return SlowLocator(self.page, self.selector, self.nodes[:1])
+
+    def nth(self, position):
+        return SlowLocator(self.page, self.selector, self.nodes[position:position + 1])
+
+    async def all(self):
+        return [self.nth(i) for i in range(len(self.nodes))]
+
+    async def count(self):
+        return await self._call(len(self.nodes))
+
+    async def get_attribute(self, name):
+        return await self._call(self.nodes[0].get(name) if self.nodes else None)
+
+    async def inner_text(self):
+        return await self._call('')
+
+    async def is_visible(self):
+        return await self._call(True)
+
+    async def is_enabled(self):
+        return await self._call(True)
+
+    async def evaluate(self, script):
+        if 'tagName' in script and 'getXPath' not in script:
+            return await self._call('input')
+        return await self._call(f'//*[@id="{self.nodes[0]["id"]}"]')
+
+
+class SlowPage:
+    """Page with one input per id; every locator call sleeps"""
+
+    def __init__(self, count, latency=0.005):
+        self.url = "https://example.com/slow"
+        self.nodes = [{'id': f'field-{i}', 'type': 'text'} for i in range(count)]
+        self.latency = latency
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    def locator(self, selector):
+        if selector.startswith('#'):
+            nodes = [n for n in self.nodes if n['id'] == selector[1:]]
+        elif selector == 'input':
+            nodes = self.nodes
+        else:
+            nodes = []
+        return SlowLocator(self, selector, nodes)
+
+
+class TestConcurrentScan:
+    """Element builds overlap but results stay in index order"""
+
+    @pytest.mark.asyncio
+    async def test_results_keep_index_order(self):
+        page = SlowPage(12)
+        elements = await ElementScanner(batch=False, concurrency=4).scan(page, element_types=['input'])
+
+        assert [e.index for e in elements] == list(range(12))
+        assert [e.id for e in elements] == [f'field-{i}' for i in range(12)]
+        assert [e.selector for e in elements] == [f'#field-{i}' for i in range(12)]
+
+    @pytest.mark.asyncio
+    async def test_concurrency_is_bounded(self):
+        page = SlowPage(12)
+        await ElementScanner(batch=False).scan(page, element_types=['input'], concurrency=3)
+
+        assert 1 < page.max_in_flight <= 3
+
+    @pytest.mark.asyncio
+    async def test_concurrency_one_is_sequential(self):
+        page = SlowPage(4)
+        await ElementScanner(batch=False, concurrency=1).scan(page, element_types=['input'])
+
+        assert page.max_in_flight == 1
+
+    @pytest.mark.asyncio
+    async def test_invalid_concurrency(self):
+        with pytest.raises(ValueError):
+            ElementScanner(concurrency=0)
+        with pytest.raises(ValueError):
+            await ElementScanner().scan(SlowPage(1), element_types=['input'], concurrency=0)
+
+
+class TestScanConcurrencyOption:
+    """v1 parser accepts scan --concurrency"""
+
+    def test_scan_without_options(self):
+        cmd = Parser().parse("scan")
+        assert cmd.verb == 'scan'
+        assert cmd.options == {}
+
+    def test_scan_concurrency(self):
+        assert Parser().parse("scan --concurrency 16").options == {'concurrency': 16}
+        assert Parser().parse("scan --concurrency=2").options == {'concurrency': 2}
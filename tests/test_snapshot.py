@@ -0,0 +1,154 @@
+"""
+Tests for offline DOM snapshot locator generation
+"""
+import os
+import pytest
+from selector_cli.core.element import Element
+from selector_cli.core.locator import DOMSnapshot, LocationStrategyEngine, UniquenessValidator
+from selector_cli.core.scanner import ElementScanner
+
+
+FIXTURE = os.path.join(os.path.dirname(__file__), 'test_role_button.html')
+
+FORM_HTML = """
+<form id="login">
+  <label for="email">Email</label><input id="email" type="email" name="email">
+  <input type="password" name="pwd" placeholder="Password">
+  <input type="hidden" name="csrf" value="x">
+  <input type="text" class="note">
+  <input type="text" class="note">
+  <fieldset disabled><select name="country"><option>NL</option></select></fieldset>
+  <button type="submit" data-testid="login-btn">Sign in</button>
+  <button type="button">Cancel</button>
+  <button type="button" style="display: none">Cancel</button>
+</form>
+<a href="/help" title="Help">Help</a>
+"""
+
+
+def make_element(tag, text='', **attributes):
+    return Element(
+        index=0, uuid='u', tag=tag, type=attributes.get('type', ''), text=text,
+        attributes=attributes, name=attributes.get('name', ''), id=attributes.get('id', ''),
+        classes=attributes.get('class', '').split(), placeholder=attributes.get('placeholder', ''),
+    )
+
+
+class TestSnapshotQueries:
+    """CSS and XPath evaluation against the index"""
+
+    def setup_method(self):
+        self.snapshot = DOMSnapshot(FORM_HTML, url="https://example.com/login")
+
+    def count(self, selector, is_xpath=False):
+        return self.snapshot.count(selector, is_xpath)
+
+    def test_css_forms_used_by_strategies(self):
+        assert self.count('#email') == 1
+        assert self.count('[data-testid="login-btn"]') == 1
+        assert self.count('label[for="email"] + input') == 1
+        assert self.count('input[type="password"][name="pwd"][placeholder="Password"]') == 1
+        assert self.count('a[href="/help"]') == 1
+        assert self.count('[title="Help"]') == 1
+        assert self.count('.note') == 2
+        assert self.count('input:nth-of-type(1)') == 1
+        assert self.count('button:has-text("sign IN")') == 1
+        assert self.count('button:has-text("Cancel")') == 2
+        assert self.count('form > button, a') == 4
+        assert self.count('fieldset select') == 1
+
+    def test_xpath_forms_used_by_strategies(self):
+        assert self.count("//input[@id='email']", True) == 1
+        assert self.count("//input[@type='text']", True) == 2
+        assert self.count("//button[contains(text(), 'Sign')]", True) == 1
+        assert self.count("//input[1]", True) == 1
+        assert self.count('//*[@id="login"]/button[2]', True) == 1
+        assert self.count("/html/body/a[1]", True) == 1
+
+    def test_unsupported_selectors(self):
+        assert self.snapshot.query('input:focus') is None
+        assert self.snapshot.query("concat('a', \"b\")", True) is None
+        assert self.snapshot.query('div >') is None
+
+    def test_element_payloads(self):
+        groups = self.snapshot.extract_elements(['input', 'select', 'button'], ['name', 'type'])
+
+        hidden = groups['input'][2]
+        assert hidden['attributes'] == {'name': 'csrf', 'type': 'hidden'}
+        assert hidden['visible'] is False
+        assert groups['input'][0]['xpath'] == '//*[@id="email"]'
+        assert groups['input'][1]['xpath'] == '//*[@id="login"]/input[2]'
+        assert groups['select'][0]['enabled'] is False
+        assert groups['button'][0]['text'] == 'Sign in'
+        assert groups['button'][2]['visible'] is False
+
+    def test_fragment_gets_html_body(self):
+        snapshot = DOMSnapshot('<p>one<p>two<div><input></div>')
+        assert snapshot.count('/html/body/p[2]', True) == 1
+        assert snapshot.count('p') == 2
+        assert snapshot.count('body > div > input') == 1
+
+
+class TestSnapshotValidation:
+    """Validator and engine run unchanged against a snapshot"""
+
+    @pytest.mark.asyncio
+    async def test_strict_uniqueness(self):
+        snapshot = DOMSnapshot(FORM_HTML)
+        validator = UniquenessValidator()
+        email = make_element('input', id='email', type='email', name='email')
+
+        assert await validator.is_strictly_unique('#email', email, snapshot)
+        assert not await validator.is_strictly_unique('input', email, snapshot)
+        assert not await validator.is_strictly_unique('[data-testid="login-btn"]', email, snapshot)
+
+    @pytest.mark.asyncio
+    async def test_single_and_batch_locators_agree(self):
+        snapshot = DOMSnapshot(FORM_HTML)
+        elements = [
+            make_element('input', id='email', type='email', name='email'),
+            make_element('input', type='password', name='pwd', placeholder='Password'),
+            make_element('button', 'Sign in', type='submit', **{'data-testid': 'login-btn'}),
+            make_element('a', 'Help', href='/help', title='Help'),
+        ]
+
+        engine = LocationStrategyEngine()
+        single = [await engine.find_best_locator(e, snapshot) for e in elements]
+        batch = await LocationStrategyEngine().find_best_locators(elements, snapshot)
+
+        assert [r.selector for r in single] == [r.selector for r in batch] == [
+            '#email',
+            'input[type="password"][name="pwd"][placeholder="Password"]',
+            '[data-testid="login-btn"]',
+            'a[href="/help"]',
+        ]
+
+
+class TestScanSnapshot:
+    """ElementScanner.scan_snapshot on a saved HTML fixture"""
+
+    @pytest.mark.asyncio
+    async def test_scan_fixture(self):
+        snapshot = DOMSnapshot.from_file(FIXTURE)
+        elements = await ElementScanner().scan_snapshot(snapshot, element_types=['button', 'input', 'a'])
+
+        assert [e.index for e in elements] == [0, 1, 2]
+        assert [e.selector for e in elements] == [
+            '#traditional',
+            'input[type="text"][name="username"][placeholder="Enter username"]',
+            'a[href="/login"]',
+        ]
+        assert elements[0].text == 'Traditional Button'
+        assert elements[0].xpath == '//*[@id="traditional"]'
+        assert all(e.locator is None for e in elements)
+        assert elements[0].page_url.startswith('file://')
+
+    @pytest.mark.asyncio
+    async def test_role_button_divs(self):
+        snapshot = DOMSnapshot.from_file(FIXTURE)
+        elements = await ElementScanner().scan_snapshot(snapshot, element_types=['div'])
+
+        assert [e.selector for e in elements] == [
+            '.sign-button', '.btn-text', '[aria-label="Submit Form"]'
+        ]
+        assert [e.text for e in elements] == ['Sign Up', 'Sign Up', 'Submit']
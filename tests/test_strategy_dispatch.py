@@ -0,0 +1,39 @@
+"""
+Tests for the precompiled per-tag strategy dispatch tables
+"""
+import inspect
+from selector_cli.core.locator.strategy import LocationStrategyEngine
+
+
+def legacy_order(strategies, tag):
+    applicable = [s for s in strategies if tag in s['applies_to'] or '*' in s['applies_to']]
+    applicable.sort(key=lambda s: s['priority'].value)
+    return [s['name'] for s in applicable]
+
+
+class TestDispatchTables:
+    """Tables reproduce the filter/sort the engine used to do per call"""
+
+    def setup_method(self):
+        self.engine = LocationStrategyEngine()
+
+    def test_tables_match_filtered_priority_order(self):
+        for tag in ['input', 'button', 'a', 'select', 'textarea', 'label', 'div', 'custom-el']:
+            css = self.engine._css_dispatch.get(tag, self.engine._css_dispatch['*'])
+            xpath = self.engine._xpath_dispatch.get(tag, self.engine._xpath_dispatch['*'])
+
+            assert [name for name, _, _ in css] == legacy_order(self.engine.css_strategies, tag)
+            assert [name for name, _, _ in xpath] == legacy_order(self.engine.xpath_strategies, tag)
+
+    def test_async_generators_flagged(self):
+        for table in self.engine._css_dispatch.values():
+            for name, generator, is_async in table:
+                assert is_async == inspect.iscoroutinefunction(generator)
+                assert is_async == (name == 'NTH_OF_TYPE')
+
+    def test_unknown_tags_use_wildcard_table(self):
+        names = [name for name, _, _ in self.engine._css_dispatch['*']]
+
+        assert 'ID_SELECTOR' in names
+        assert 'TYPE_NAME' not in names
+        assert 'LABEL_FOR' not in names
@@ -19,7 +19,7 @@ class TestContextV2ThreeLayerModel:
         assert ctx.temp == []
         assert ctx.workspace.is_empty()
         assert ctx.focus == 'candidates'
-        assert ctx.candidates is not ctx._candidates  # Should return copy
+        assert ctx.candidates is ctx._candidates  # Read-only view, not a copy
 
     def test_candidates_setter(self):
         """Test setting candidates"""
@@ -248,6 +248,25 @@ class TestParserV2ScanSyntax:
 
         assert cmd.element_types == ["*"]
 
+    def test_scan_concurrency_space_value(self):
+        """Test: scan --concurrency 16"""
+        cmd = self.parser.parse("scan --concurrency 16")
+
+        assert cmd.options == {"concurrency": 16}
+
+    def test_scan_concurrency_equals_value(self):
+        """Test: scan input --concurrency=4 --deep"""
+        cmd = self.parser.parse("scan input --concurrency=4 --deep")
+
+        assert cmd.element_types == ["input"]
+        assert cmd.options == {"concurrency": 4, "deep": True}
+
+    def test_scan_incremental(self):
+        """Test: scan --incremental"""
+        cmd = self.parser.parse("scan --incremental")
+
+        assert cmd.options == {"incremental": True}
+
 
 class TestParserV2RemoveSyntax:
     """Test remove command with source"""
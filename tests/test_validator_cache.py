@@ -0,0 +1,179 @@
+"""
+Tests for the shared, per-page invalidated validation cache
+"""
+import pytest
+from selector_cli.core.locator.validator import UniquenessValidator, PAGE_STATE_SCRIPT
+from selector_cli.core.scanner import ElementScanner
+
+
+class CountingLocator:
+    """Locator over fake nodes; records count() calls on the page"""
+
+    def __init__(self, page, selector, nodes):
+        self.page = page
+        self.selector = selector
+        self.nodes = nodes
+
+    @property
+    def first(self):
+        return CountingLocator(self.page, self.selector, self.nodes[:1])
+
+    def nth(self, position):
+        return CountingLocator(self.page, self.selector, self.nodes[position:position + 1])
+
+    async def all(self):
+        return [self.nth(i) for i in range(len(self.nodes))]
+
+    async def count(self):
+        self.page.counted.append(self.selector)
+        return len(self.nodes)
+
+    async def get_attribute(self, name):
+        return self.nodes[0].get(name) if self.nodes else None
+
+    async def inner_text(self):
+        return ''
+
+    async def is_visible(self):
+        return True
+
+    async def is_enabled(self):
+        return True
+
+    async def evaluate(self, script):
+        if 'tagName' in script and 'getXPath' not in script:
+            return 'input'
+        return '/html/body/input[1]'
+
+
+class StatefulPage:
+    """Page exposing a document token/version like PAGE_STATE_SCRIPT"""
+
+    def __init__(self, nodes):
+        self.url = "https://example.com/search"
+        self.nodes = nodes
+        self.token = "doc1"
+        self.version = 0
+        self.counted = []
+
+    async def evaluate(self, script, arg=None):
+        assert script == PAGE_STATE_SCRIPT
+        return f"{self.token}:{self.version}"
+
+    def locator(self, selector):
+        if selector.startswith('#'):
+            nodes = [n for n in self.nodes if n.get('id') == selector[1:]]
+        elif selector == 'input':
+            nodes = self.nodes
+        elif selector == 'input[type="text"]':
+            nodes = [n for n in self.nodes if n.get('type') == 'text']
+        else:
+            nodes = []
+        return CountingLocator(self, selector, nodes)
+
+
+def text_inputs(count):
+    return [{'type': 'text'} for _ in range(count)]
+
+
+class TestValidatorCounters:
+    """Cache hit/miss accounting"""
+
+    @pytest.mark.asyncio
+    async def test_repeated_selector_counted_once_per_page(self):
+        page = StatefulPage(text_inputs(3))
+        validator = UniquenessValidator()
+
+        for _ in range(5):
+            assert await validator.is_unique('input[type="text"]', page) is False
+
+        assert page.counted == ['input[type="text"]']
+        assert (validator.misses, validator.hits) == (1, 4)
+        assert validator.cache_stats()['hits'] == 4
+        assert validator.cache_stats()['misses'] == 1
+
+
+class TestSyncPage:
+    """Invalidation on navigation and DOM mutation"""
+
+    async def _primed(self):
+        page = StatefulPage(text_inputs(2))
+        validator = UniquenessValidator()
+        await validator.sync_page(page)
+        await validator.is_unique('input[type="text"]', page)
+        return page, validator
+
+    @pytest.mark.asyncio
+    async def test_unchanged_dom_keeps_cache(self):
+        page, validator = await self._primed()
+
+        assert await validator.sync_page(page) is True
+        await validator.is_unique('input[type="text"]', page)
+        assert len(page.counted) == 1
+
+    @pytest.mark.asyncio
+    async def test_mutation_invalidates(self):
+        page, validator = await self._primed()
+
+        page.version += 1
+        assert await validator.sync_page(page) is False
+        await validator.is_unique('input[type="text"]', page)
+        assert len(page.counted) == 2
+
+    @pytest.mark.asyncio
+    async def test_navigation_invalidates(self):
+        page, validator = await self._primed()
+
+        page.token = "doc2"
+        assert await validator.sync_page(page) is False
+        assert validator.cache_stats()['cache_size'] == 0
+
+    @pytest.mark.asyncio
+    async def test_unknown_state_invalidates(self):
+        page, validator = await self._primed()
+
+        async def broken(script, arg=None):
+            raise RuntimeError("Target closed")
+        page.evaluate = broken
+
+        assert await validator.sync_page(page) is False
+        assert validator.cache_stats()['cache_size'] == 0
+
+    @pytest.mark.asyncio
+    async def test_other_pages_untouched(self):
+        page, validator = await self._primed()
+        validator.validation_cache["https://example.com/other:#x:False"] = True
+
+        page.version += 1
+        await validator.sync_page(page)
+        assert list(validator.validation_cache) == ["https://example.com/other:#x:False"]
+
+
+class TestScannerSharedEngine:
+    """ElementScanner keeps one engine across elements and scans"""
+
+    @pytest.mark.asyncio
+    async def test_selector_validated_once_across_elements_and_scans(self):
+        page = StatefulPage(text_inputs(3))
+        scanner = ElementScanner(batch=False, concurrency=1)
+        engine = scanner.strategy_engine
+
+        await scanner.scan(page, element_types=['input'])
+        assert scanner.strategy_engine is engine
+        assert page.counted.count('input[type="text"]') == 1
+        first_misses = scanner.cache_stats()['misses']
+        assert scanner.cache_stats()['hits'] > 0
+
+        await scanner.scan(page, element_types=['input'])
+        assert page.counted.count('input[type="text"]') == 1
+        assert scanner.cache_stats()['misses'] == first_misses
+
+    @pytest.mark.asyncio
+    async def test_rescan_after_mutation_revalidates(self):
+        page = StatefulPage(text_inputs(3))
+        scanner = ElementScanner(batch=False, concurrency=1)
+
+        await scanner.scan(page, element_types=['input'])
+        page.version += 1
+        await scanner.scan(page, element_types=['input'])
+        assert page.counted.count('input[type="text"]') == 2
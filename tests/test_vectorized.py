@@ -0,0 +1,198 @@
+"""
+Tests for the vectorized (NumPy) WHERE path over CandidateTable columns
+and workspace collections
+"""
+import pytest
+from selector_cli.core.candidate_table import CandidateTable
+from selector_cli.core.collection import ElementCollection
+from selector_cli.core.context import Context
+from selector_cli.core.element import Element
+from selector_cli.core.storage import StorageManager
+from selector_cli.commands.executor import CommandExecutor
+from selector_cli.parser.parser import Parser
+from selector_cli.query import vectorized
+from selector_cli.query.compiler import filter_elements, TEXT, NATIVE
+from selector_cli.query.planner import PYTHON, VECTOR, filter_layer, plan_filter
+
+
+def make_elements(count=300):
+    tags = ('input', 'button', 'a', 'div')
+    return [
+        Element(index=i, uuid=f"00000000-0000-4000-8000-{i:012d}", tag=tags[i % 4],
+                text=f"Item {i}", visible=i % 3 != 0, enabled=i % 5 != 0,
+                selector_cost=(None, 0.5, 1, 2)[i % 4], attributes={'name': f"n{i % 6}"})
+        for i in range(count)
+    ]
+
+
+def where(clause):
+    return Parser().parse(f"add where {clause}").condition_tree
+
+
+CLAUSES = [
+    'index > 100 and visible and selector_cost < 2',
+    'not enabled or index <= 10',
+    'tag = "a" and (visible or index >= 250)',
+    'tag != "div"',
+    'index = 42',
+    'index = "042"',
+    'selector_cost = None',
+    'selector_cost = 2',
+    'visible = "yes"',
+    'visible = false',
+    'tag = "missing"',
+    'index < 120 and text contains "1"',
+    'name = "n2" and visible',
+]
+
+
+@pytest.fixture
+def small_tables(monkeypatch):
+    monkeypatch.setattr(vectorized, 'MIN_ROWS', 1)
+
+
+class TestWithoutNumpy:
+    """The pure-Python path is the fallback"""
+
+    def test_falls_back(self, monkeypatch, small_tables):
+        monkeypatch.setattr(vectorized, 'np', None)
+        table = CandidateTable.from_elements(make_elements())
+
+        assert vectorized.filter_table(table, where('visible')) is None
+        assert plan_filter(table, where('visible')).access == PYTHON
+        assert len(filter_layer(table, where('visible'))) == 200
+
+    def test_small_tables_stay_in_python(self):
+        table = CandidateTable.from_elements(make_elements(10))
+        assert vectorized.filter_table(table, where('visible')) is None
+
+
+class TestMasks:
+    """Masks select exactly the rows the compiled predicates select"""
+
+    @pytest.fixture(autouse=True)
+    def numpy(self, small_tables):
+        pytest.importorskip('numpy')
+
+    @pytest.mark.parametrize('dialect', [TEXT, NATIVE])
+    @pytest.mark.parametrize('clause', CLAUSES)
+    def test_same_rows_as_compiled(self, clause, dialect):
+        table = CandidateTable.from_elements(make_elements())
+        try:
+            expected = [r.index for r in filter_elements(table, where(clause), dialect)]
+        except TypeError as e:
+            # NATIVE ordering on str values raises; the masks must not hide it
+            with pytest.raises(TypeError, match=str(e)):
+                filter_layer(table, where(clause), dialect)
+            return
+
+        assert [r.index for r in filter_layer(table, where(clause), dialect)] == expected
+
+    def test_plan_and_residual(self):
+        table = CandidateTable.from_elements(make_elements())
+        plan = plan_filter(table, where('text contains "9" and visible'))
+        assert plan.access == VECTOR
+
+        vector, residual = vectorized.split_condition(table, plan.condition)
+        assert [repr(part) for part in vector] == ['(visible EQUALS True)']
+        assert repr(residual) == '(text CONTAINS 9)'
+
+    def test_type_target(self):
+        elements = make_elements()
+        table = CandidateTable.from_elements(elements)
+        rows = vectorized.filter_table(table, where('visible'), tag='button')
+        assert [r.index for r in rows] == [e.index for e in elements
+                                           if e.tag == 'button' and e.visible]
+
+    def test_nothing_moves_past_an_invalid_regex(self):
+        table = CandidateTable.from_elements(make_elements())
+        vector, residual = vectorized.split_condition(
+            table, where('visible and name matches "(" and enabled'))
+        assert [repr(part) for part in vector] == ['(visible EQUALS True)']
+        assert repr(residual) == '((name MATCHES () AND (enabled EQUALS True))'
+
+    def test_overridden_columns_are_not_vectorized(self):
+        elements = make_elements()
+        elements[4].visible = 'yes'  # stored per row, outside the flag column
+        table = CandidateTable.from_elements(elements)
+
+        assert vectorized.split_condition(table, where('visible'))[0] == []
+        assert [r.index for r in filter_layer(table, where('visible'))] == \
+            [e.index for e in filter_elements(elements, where('visible'))]
+
+    def test_columns_follow_appends(self):
+        table = CandidateTable.from_elements(make_elements())
+        assert len(vectorized.filter_table(table, where('index >= 299'))) == 1
+
+        table.append(Element(index=300, uuid='00000000-0000-4000-8000-000000000300', tag='a'))
+        assert [r.index for r in vectorized.filter_table(table, where('index >= 299'))] == \
+            [299, 300]
+
+
+def collection_of(elements):
+    collection = ElementCollection()
+    for elem in elements:
+        collection.add(elem)
+    return collection
+
+
+class TestCollections:
+    """Workspace collections get column arrays built from their elements"""
+
+    @pytest.fixture(autouse=True)
+    def numpy(self, small_tables):
+        pytest.importorskip('numpy')
+
+    @pytest.mark.parametrize('dialect', [TEXT, NATIVE])
+    @pytest.mark.parametrize('clause', CLAUSES)
+    def test_same_elements_as_compiled(self, clause, dialect):
+        elements = make_elements()
+        for elem in elements:
+            elem.selector_cost = None if elem.selector_cost is None else float(elem.selector_cost)
+        collection = collection_of(elements)
+        try:
+            expected = filter_elements(elements, where(clause), dialect)
+        except TypeError as e:
+            with pytest.raises(TypeError, match=str(e)):
+                filter_layer(collection, where(clause), dialect)
+            return
+
+        result = filter_layer(collection, where(clause), dialect)
+        assert [id(e) for e in result] == [id(e) for e in expected]
+
+    def test_plan_and_overrides(self):
+        collection = collection_of(make_elements())
+        assert plan_filter(collection, where('index > 10 and visible')).access == VECTOR
+
+        columns = vectorized.element_columns(collection)
+        assert columns.has_overrides('selector_cost')  # int costs are not floats
+        assert not columns.has_overrides('index')
+        assert vectorized.split_condition(columns, where('selector_cost < 2'))[0] == []
+
+    def test_columns_follow_changes(self):
+        elements = make_elements()
+        collection = collection_of(elements)
+        assert len(filter_layer(collection, where('index >= 299'))) == 1
+        columns = vectorized.element_columns(collection)
+        assert vectorized.element_columns(collection) is columns
+
+        collection.remove(elements[299])
+        assert filter_layer(collection, where('index >= 299')) == []
+        collection.add(Element(index=500, uuid='00000000-0000-4000-8000-000000000500', tag='a'))
+        assert [e.index for e in filter_layer(collection, where('index >= 299'))] == [500]
+
+    @pytest.mark.asyncio
+    async def test_keep_on_loaded_workspace(self, tmp_path):
+        executor, context = CommandExecutor(), Context(enable_history_file=False)
+        executor.storage = StorageManager(str(tmp_path))
+        for elem in make_elements():
+            context.workspace.add(elem)
+        parse = Parser().parse
+        await executor.execute(parse('save big'), context)
+        await executor.execute(parse('clear'), context)
+        await executor.execute(parse('load big'), context)
+
+        assert plan_filter(context.workspace, where('index >= 100 and visible')).access == VECTOR
+        await executor.execute(parse('keep where index >= 100 and visible'), context)
+        assert [e.index for e in context.workspace] == \
+            [e.index for e in make_elements() if e.index >= 100 and e.visible]
@@ -0,0 +1,109 @@
+"""
+Tests for the compiled WHERE-clause evaluator
+"""
+import re
+
+import pytest
+from selector_cli.core.candidate_table import CandidateTable
+from selector_cli.core.element import Element
+from selector_cli.parser.parser import Parser
+from selector_cli.query.compiler import (
+    compile_condition, filter_elements, TEXT, NATIVE
+)
+
+
+def make_elements():
+    return [
+        Element(index=0, uuid='a', tag='input', type='email', name='email',
+                attributes={'type': 'email', 'name': 'email', 'required': ''},
+                selector_cost=0.1),
+        Element(index=1, uuid='b', tag='input', type='text', name='q',
+                attributes={'type': 'text', 'name': 'q', 'role': 'searchbox'},
+                selector_cost=0.5, visible=False),
+        Element(index=2, uuid='c', tag='button', text='Submit order',
+                attributes={'data-testid': 'submit'}, selector_cost=0.3, enabled=False),
+    ]
+
+
+def where(clause):
+    return Parser().parse(f"add where {clause}").condition_tree
+
+
+def matching(clause, elements=None, dialect=TEXT):
+    elements = make_elements() if elements is None else elements
+    return [e.index for e in filter_elements(elements, where(clause), dialect)]
+
+
+class TestTextDialect:
+    """CommandExecutor semantics"""
+
+    @pytest.mark.parametrize('clause, expected', [
+        ('type = "email"', [0]),
+        ('tag != "input"', [2]),
+        ('index > 0', [1, 2]),
+        ('index <= 1', [0, 1]),
+        ('selector_cost < 1', [0, 1, 2]),
+        ('text contains "order"', [2]),
+        ('text starts "Sub"', [2]),
+        ('name ends "ail"', [0]),
+        ('type matches "^e.a"', [0]),
+        ('visible', [0, 2]),
+        ('not enabled', [2]),
+        ('role = "searchbox"', [1]),
+        ('data-testid = "submit"', [2]),
+        ('tag = "input" and (visible or name = "q")', [0, 1]),
+        ('type = "email" or text contains "order"', [0, 2]),
+    ])
+    def test_operators(self, clause, expected):
+        assert matching(clause) == expected
+
+    def test_non_numeric_values_compare_as_zero(self):
+        assert matching('name >= 0') == [0, 1, 2]
+        assert matching('name > 0') == []
+
+    def test_same_rows_from_candidate_table(self):
+        elements = make_elements()
+        table = CandidateTable.from_elements(elements)
+        for clause in ('visible and tag = "input"', 'text contains "order"',
+                       'role = "searchbox" or index >= 2', 'required'):
+            assert matching(clause, table) == matching(clause, elements)
+
+
+class TestNativeDialect:
+    """ExecutorV2 semantics"""
+
+    def test_raw_comparisons(self):
+        assert matching('visible', dialect=NATIVE) == [0, 2]
+        assert matching('type = "text"', dialect=NATIVE) == [1]
+        assert matching('text contains "Sub"', dialect=NATIVE) == [2]
+
+    def test_unsupported_operators_match_nothing(self):
+        assert matching('text starts "Sub"', dialect=NATIVE) == []
+
+
+class TestCompilation:
+    """Work done once per tree, not per element"""
+
+    def test_regex_compiled_once(self, monkeypatch):
+        calls = []
+        original = re.compile
+        monkeypatch.setattr(re, 'compile', lambda *a: calls.append(a) or original(*a))
+
+        predicate = compile_condition(where('name matches "^e"'))
+        assert [predicate(e) for e in make_elements()] == [True, False, False]
+        assert len(calls) == 1
+
+    def test_invalid_regex_fails_on_evaluation(self):
+        predicate = compile_condition(where('name matches "("'))
+        with pytest.raises(re.error):
+            predicate(make_elements()[0])
+
+    def test_and_short_circuits(self):
+        seen = []
+
+        def getter(field):
+            return lambda elem: seen.append(field) or getattr(elem, field)
+
+        predicate = compile_condition(where('visible and enabled'), TEXT, getter)
+        assert predicate(make_elements()[1]) is False
+        assert seen == ['visible']